@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+"""
+Benchmark the header-only EXIF reader against exifread stopped at DateTimeOriginal.
+
+The header reads are also timed one at a time and through the HeaderPrefetcher.
+--latency adds a delay to every header read, to see how the prefetcher behaves on a
+network share without one.
+
+Usage:
+    python benchmarks/bench_exif.py <photo_folder> [--repeat N] [--latency MS]
+"""
+
+import argparse
+import sys
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(abspath(__file__)), '..'))
+
+import exifread
+import header_prefetch
+from flight_separator import getPhotos, readExifDate, EXIF_HEAD_BYTES
+from header_prefetch import HeaderPrefetcher
+
+
+def exifreadDate(filepath):
+    # the call getDateExif made before the header-only reader
+    with open(filepath, 'rb') as fh:
+        tags = exifread.process_file(fh, stop_tag="EXIF DateTimeOriginal")
+        return str(tags.get("EXIF DateTimeOriginal"))
+
+def fastDate(filepath):
+    date = readExifDate(filepath)
+    return None if date is None else date.strftime('%Y:%m:%d %H:%M:%S')
+
+def delayedReads(latency):
+    """
+    Make every header read wait latency seconds first, like a round trip to a file server.
+    """
+
+    readHead = header_prefetch.readHead
+
+    def slowReadHead(filepath, nbytes):
+        time.sleep(latency)
+        return readHead(filepath, nbytes)
+
+    header_prefetch.readHead = slowReadHead
+
+def timeHeads(photos, repeat, max_inflight):
+    best = None
+    limit = 0
+    for _ in range(repeat):
+        prefetcher = HeaderPrefetcher(EXIF_HEAD_BYTES, max_inflight)
+        start = time.perf_counter()
+        for _ in prefetcher.heads(photos):
+            pass
+        elapsed = time.perf_counter() - start
+        prefetcher.close()
+        best = elapsed if best is None else min(best, elapsed)
+        limit = max(limit, prefetcher.limit)
+    return best, limit
+
+def timeReader(reader, photos, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        values = [reader(p) for p in photos]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, values
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the header-only EXIF reader against exifread.")
+    parser.add_argument('folder', help='folder containing JPEG photos')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per reader, best is reported')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='milliseconds added to every header read (default: 0)')
+    args = parser.parse_args()
+
+    photos = getPhotos(args.folder, ('.jpg', '.jpeg'))
+    if not photos:
+        sys.exit('No photo found.')
+
+    # warm up the page cache so both readers see the same conditions
+    for p in photos:
+        with open(p, 'rb') as fh:
+            fh.read(1 << 16)
+
+    t_full, full = timeReader(exifreadDate, photos, args.repeat)
+    t_fast, fast = timeReader(fastDate, photos, args.repeat)
+
+    undecided = sum(1 for v in fast if v is None)
+    mismatch = sum(1 for a, b in zip(fast, full) if a is not None and a != b)
+
+    print("photos             : {0}".format(len(photos)))
+    print("exifread           : {0:.3f} s  {1:.0f} photos/s".format(t_full, len(photos) / t_full))
+    print("header-only reader : {0:.3f} s  {1:.0f} photos/s".format(t_fast, len(photos) / t_fast))
+    print("speed-up           : {0:.1f}x".format(t_full / t_fast))
+    print("fallbacks needed   : {0}".format(undecided))
+    print("mismatches         : {0}".format(mismatch))
+
+    if args.latency > 0:
+        delayedReads(args.latency / 1000.0)
+    t_serial, _ = timeHeads(photos, args.repeat, 1)
+    t_prefetch, limit = timeHeads(photos, args.repeat, header_prefetch.PREFETCH_MAX_INFLIGHT)
+    print("header reads       : {0:.3f} s one at a time, {1:.3f} s prefetched ({2:.1f}x, up to {3:.0f} "
+          "in flight)".format(t_serial, t_prefetch, t_serial / t_prefetch, limit))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+"""
+Time reading photo dates on a cold cache in listing, inode and physical (extent) order.
+
+The photos of each run are evicted from the page cache first with
+posix_fadvise(DONTNEED), so every read goes to the device. The gain only shows on
+rotational devices (USB hard disks, card readers); on SSDs and tmpfs all orders take
+about the same time. Without a folder, a synthetic one is generated in --target,
+written in shuffled order so that the listing order is not the disk order.
+
+Each order is read the way planSeparation reads it: listing order by --workers
+processes (one per CPU by default), sorted orders by a single process.
+
+Usage:
+    python benchmarks/bench_scan_order.py [<photo_folder>] [--size 5000] [--target .]
+                                          [--repeat N] [--workers N] [--drop-caches]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(abspath(__file__)), '..'))
+
+from flight_separator import extractDates, iterPhotos
+from scan_order import isRotational, scanOrder, scanWorkers
+from synthetic_photos import generateCorpus
+
+ORDERS = ('none', 'inode', 'extent')
+
+
+def evict(paths, drop_caches=False):
+    """
+    Remove the photos from the page cache, and all caches with drop_caches (root only).
+    """
+
+    os.sync()
+    if drop_caches:
+        with open('/proc/sys/vm/drop_caches', 'w') as fh:
+            fh.write('3\n')
+        return
+    for p in paths:
+        fd = os.open(p, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+def timeOrder(folder, mode, workers, drop_caches):
+    """
+    Seconds to order and read the dates of the photos of folder on a cold cache.
+    """
+
+    entries = list(iterPhotos(folder, ('.jpg', '.jpeg')))
+    evict([e.path for e in entries], drop_caches)
+    start = time.perf_counter()
+    order = scanOrder(entries, mode)
+    ordered = time.perf_counter()
+    extractDates([entries[i].path for i in order], scanWorkers(mode, workers))
+    end = time.perf_counter()
+    return ordered - start, end - start
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time reading photo dates on a cold cache in listing, inode and physical (extent) order.")
+    parser.add_argument('folder', nargs='?', help='folder containing JPEG photos (default: a synthetic one)')
+    parser.add_argument('--size', type=int, default=5000, help='photos of the synthetic folder (default: 5000)')
+    parser.add_argument('--target', default='.', help='where the synthetic folder is generated (default: .)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per order, best is reported (default: 3)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='date extraction processes in listing order (default: one per CPU)')
+    parser.add_argument('--drop-caches', action='store_true',
+                        help='also drop the inode and directory caches, needs root')
+    args = parser.parse_args()
+
+    folder = args.folder
+    if folder is None:
+        folder = tempfile.mkdtemp(prefix='fs_bench_', dir=args.target)
+        generateCorpus(folder, args.size, 0)
+    try:
+        print("folder     : {0}".format(folder))
+        print("rotational : {0}".format({True: 'yes', False: 'no', None: 'unknown'}[isRotational(folder)]))
+        baseline = None
+        for mode in ORDERS:
+            best = None
+            for _ in range(args.repeat):
+                t_order, t_total = timeOrder(folder, mode, args.workers, args.drop_caches)
+                if best is None or t_total < best[1]:
+                    best = (t_order, t_total)
+            baseline = best[1] if baseline is None else baseline
+            print("{0:<10} : {1:.3f} s ({2:.3f} s ordering)  {3:.1f}x".format(
+                mode, best[1], best[0], baseline / best[1]))
+    finally:
+        if args.folder is None:
+            shutil.rmtree(folder, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+"""
+Time each stage of flightSeparator on synthetic photo folders, and compare with a baseline.
+
+For every size and target folder (e.g. a tmpfs and a disk), a synthetic corpus is
+generated, separated, and the best time of each stage over the repeats is kept. The
+results can be saved as a JSON baseline, and later runs report their change from it.
+With --pipeline, streamSeparation is timed instead: the stages run at the same time, so
+each stage time is its busy time and the total is the wall time of the run.
+With --dated-names, the photos carry their capture time in their names, so the
+exif stage times the file name fast path.
+
+Usage:
+    python benchmarks/bench_separation.py [--sizes 1000,10000,100000] [--target tmpfs=/dev/shm]
+                                          [--target disk=.] [--repeat N] [--save baseline.json]
+                                          [--baseline baseline.json] [--tolerance 0.10] [--pipeline]
+                                          [--dated-names]
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+from os import cpu_count
+from os.path import abspath, dirname, isdir, join
+
+sys.path.insert(0, join(dirname(abspath(__file__)), '..'))
+
+from flight_separator import flightSeparator, streamSeparation
+from stage_metrics import peakMemory
+from synthetic_photos import generateCorpus
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_TARGETS = ('tmpfs=/dev/shm', 'disk=.')
+# flight separation time (seconds), below the smallest gap of the synthetic flights
+FSTIME = 60
+STAGES = ('discovery', 'exif', 'cluster', 'transfer', 'report')
+
+
+def runOnce(target, size, seed, workers, pipeline=False, dated_names=False):
+    """
+    Generate a corpus in a temporary folder of target, separate it, and return its stage
+    times, total time and peak memory.
+    """
+
+    folder = tempfile.mkdtemp(prefix='fs_bench_', dir=target)
+    try:
+        sizes = generateCorpus(folder, size, seed, dated_names=dated_names)
+        if pipeline:
+            result = streamSeparation(folder, ('.jpg',), FSTIME, False, workers=workers,
+                                      report_path=join(folder, 'report.txt'))
+        else:
+            result = flightSeparator(folder, ('.jpg',), FSTIME, False, None, workers=workers,
+                                     report_path=join(folder, 'report.txt'))
+        n_flights = result['msg'].split('\n')[0]
+        if n_flights != "Number of flights detected: {0}".format(len(sizes)):
+            raise Exception('Wrong separation of {0} photos: {1}, expected {2} flights'.format(
+                size, n_flights, len(sizes)))
+        if pipeline:
+            stats = result['pipeline']
+            return ({s['name']: s['busy_seconds'] for s in stats['stages']}, stats['total_seconds'],
+                    peakMemory() or 0)
+        times = {s['name']: s['seconds'] for s in result['metrics']['stages']}
+        return times, sum(times.values()), result['metrics']['peak_memory']
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+def bench(sizes, targets, repeat, seed, workers, pipeline=False, dated_names=False):
+    """
+    Best time of each stage for each target and size.
+
+    Returns
+    -------
+    results : dict
+        'target/size' -> {'photos', 'stages': {stage: seconds}, 'total', 'photos_per_sec', 'peak_memory'},
+        'target/size/pipeline' with pipeline, '/dated' appended with dated_names.
+
+    """
+
+    results = dict()
+    for name, path in targets:
+        for size in sizes:
+            best = dict()
+            total = None
+            peak = 0
+            for _ in range(repeat):
+                times, seconds, memory = runOnce(path, size, seed, workers, pipeline, dated_names)
+                for stage, t in times.items():
+                    best[stage] = min(t, best.get(stage, t))
+                total = seconds if total is None else min(total, seconds)
+                peak = max(peak, memory)
+            if not pipeline:
+                total = sum(best.values())
+            key = '{0}/{1}{2}{3}'.format(name, size, '/pipeline' if pipeline else '',
+                                         '/dated' if dated_names else '')
+            results[key] = {
+                'photos': size,
+                'stages': best,
+                'total': total,
+                'photos_per_sec': size / total if total > 0 else 0.0,
+                'peak_memory': peak,
+            }
+            printResult(name, size, results[key])
+    return results
+
+def printResult(target, size, result):
+    line = "{0:>6} {1:>7} photos".format(target, size)
+    for stage in STAGES:
+        if stage in result['stages']:
+            line = line + "  {0} {1:.3f}s".format(stage, result['stages'][stage])
+    line = line + "  total {0:.3f}s  {1:.0f} photos/s".format(result['total'], result['photos_per_sec'])
+    print(line)
+    sys.stdout.flush()
+
+def compare(results, baseline, tolerance):
+    """
+    Print the change of each stage from the baseline.
+
+    Returns
+    -------
+    regressions : int
+        Number of stages slower than the baseline by more than tolerance (a fraction).
+
+    """
+
+    regressions = 0
+    for key, result in sorted(results.items()):
+        if key not in baseline['results']:
+            print("{0}: not in baseline".format(key))
+            continue
+        old = baseline['results'][key]
+        for stage in STAGES + ('total',):
+            new_t = result['total'] if stage == 'total' else result['stages'].get(stage)
+            old_t = old['total'] if stage == 'total' else old['stages'].get(stage)
+            if not new_t or not old_t:
+                continue
+            change = new_t / old_t - 1.0
+            # stages under a millisecond are noise
+            slower = change > tolerance and new_t - old_t > 0.001
+            regressions = regressions + (1 if slower else 0)
+            print("{0:>14} {1:>9}: {2:8.3f}s -> {3:8.3f}s  {4:+6.1%}{5}".format(
+                key, stage, old_t, new_t, change, '  SLOWER' if slower else ''))
+    return regressions
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpus': cpu_count(),
+    }
+
+def parseTargets(values):
+    targets = list()
+    for value in values:
+        name, _, path = value.partition('=')
+        if not path:
+            name, path = value, value
+        if not isdir(path):
+            print("skipping {0}: {1} is not a folder".format(name, path))
+            continue
+        targets.append((name, path))
+    return targets
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time each stage of flightSeparator on synthetic photo folders.")
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='comma-separated numbers of photos (default: 1000,10000,100000)')
+    parser.add_argument('--target', action='append', dest='targets',
+                        help='name=folder where corpora are generated, can be repeated '
+                             '(default: tmpfs=/dev/shm and disk=.)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per size, best is kept (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the synthetic corpora (default: 0)')
+    parser.add_argument('--workers', type=int, default=None, help='date extraction processes (default: one per CPU)')
+    parser.add_argument('--save', help='write the results as a JSON baseline')
+    parser.add_argument('--baseline', help='compare with a JSON baseline written by --save')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='slowdown from the baseline reported as a regression (default: 0.10)')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='time the pipelined streamSeparation, stage times are busy times')
+    parser.add_argument('--dated-names', action='store_true',
+                        help='put capture times in the photo names, to time the file name fast path')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    targets = parseTargets(args.targets or DEFAULT_TARGETS)
+    if not targets:
+        sys.exit('No target folder.')
+
+    results = bench(sizes, targets, args.repeat, args.seed, args.workers, args.pipeline, args.dated_names)
+
+    if args.save:
+        with open(args.save, 'w') as fh:
+            json.dump({'environment': environment(), 'seed': args.seed, 'repeat': args.repeat,
+                       'results': results}, fh, indent=1)
+        print("Baseline written to {0}".format(args.save))
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        if baseline.get('environment') != environment():
+            print("warning: baseline recorded on another environment: {0}".format(baseline.get('environment')))
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            sys.exit("{0} stage(s) slower than the baseline".format(regressions))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+"""
+Measure the time from process start to the main window being shown.
+
+Modes:
+    precompiled : main_ui.py form, engine imported lazily (current startup)
+    parsed      : main.ui parsed with loadUiType at startup
+    eager       : parsed form, and the separation engine and exifread imported at startup
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N]
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_startup.py    (no display)
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from os.path import abspath, dirname, exists, join
+
+ROOT = join(dirname(abspath(__file__)), '..')
+
+SHOW_WINDOW = """
+import sys
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
+app = QApplication(sys.argv)
+import main
+window = main.Main()
+window.show()
+QTimer.singleShot(0, app.quit)
+app.exec_()
+"""
+
+MODES = {
+    'precompiled': SHOW_WINDOW,
+    # a None entry makes "import main_ui" fail, so main.ui is parsed
+    'parsed': "import sys\nsys.modules['main_ui'] = None\n" + SHOW_WINDOW,
+    'eager': "import sys\nsys.modules['main_ui'] = None\nimport exifread, flight_separator\n" + SHOW_WINDOW,
+}
+
+
+def timeStartup(code, runs):
+    times = list()
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the time from process start to the main window being shown.")
+    parser.add_argument('--runs', type=int, default=10, help='launches per mode, the median is reported')
+    args = parser.parse_args()
+
+    if not exists(join(ROOT, 'main_ui.py')):
+        sys.path.insert(0, ROOT)
+        from build_ui import buildUi
+        buildUi()
+
+    # warm up the file system cache and bytecode
+    timeStartup(MODES['eager'], 1)
+
+    for mode, code in MODES.items():
+        times = timeStartup(code, args.runs)
+        print("{0:<12} median {1:.3f} s  min {2:.3f} s".format(mode, statistics.median(times), min(times)))
+
+if __name__ == '__main__':
+    main()
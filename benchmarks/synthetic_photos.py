@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+"""
+Generate folders of tiny valid JPEG photos with realistic DateTimeOriginal patterns.
+
+Each photo is an 8x8 grey baseline JPEG of a few hundred bytes, with an EXIF APP1
+segment holding DateTimeOriginal, like a drone photo header. The capture times form
+flights separated by gaps, with steady intervals and occasional bursts, and are fully
+determined by the seed.
+
+Usage:
+    python benchmarks/synthetic_photos.py <folder> [--photos N] [--seed S]
+"""
+
+import argparse
+import json
+import random
+import struct
+from datetime import datetime, timedelta
+from os import makedirs
+from os.path import join
+
+EXIF_DATE_FORMAT = '%Y:%m:%d %H:%M:%S'
+
+# smallest gap between two flights (seconds), benchmarks separate with a shorter time
+MIN_FLIGHT_GAP = 600
+
+# 8x8 grey image: one quantization table, single-symbol Huffman tables, one all-zero block
+_JPEG_BODY = b''.join([
+    b'\xff\xdb\x00\x43\x00' + b'\x01' * 64,                                   # DQT
+    b'\xff\xc0\x00\x0b\x08\x00\x08\x00\x08\x01\x01\x11\x00',                  # SOF0 8x8, 1 component
+    b'\xff\xc4\x00\x14\x00\x01' + b'\x00' * 15 + b'\x00',                     # DHT DC: category 0
+    b'\xff\xc4\x00\x14\x10\x01' + b'\x00' * 15 + b'\x00',                     # DHT AC: EOB
+    b'\xff\xda\x00\x08\x01\x01\x00\x00\x3f\x00',                              # SOS
+    b'\x3f',                                                                  # DC 0, EOB, padding
+    b'\xff\xd9',                                                              # EOI
+])
+
+
+def exifSegment(date):
+    """
+    Build an APP1 segment with IFD0 -> Exif IFD -> DateTimeOriginal, little-endian TIFF.
+    """
+
+    value = date.strftime(EXIF_DATE_FORMAT).encode('ascii') + b'\x00'
+    # TIFF header (8), IFD0 with 1 entry (18), Exif IFD with 1 entry (18), then the date
+    tiff = b'II*\x00' + struct.pack('<I', 8)
+    tiff = tiff + struct.pack('<HHHII', 1, 0x8769, 4, 1, 26) + struct.pack('<I', 0)
+    tiff = tiff + struct.pack('<HHHII', 1, 0x9003, 2, len(value), 44) + struct.pack('<I', 0)
+    tiff = tiff + value
+    payload = b'Exif\x00\x00' + tiff
+    return b'\xff\xe1' + struct.pack('>H', len(payload) + 2) + payload
+
+def jpegBytes(date):
+    """
+    Bytes of a valid JPEG photo taken at date.
+    """
+
+    return b'\xff\xd8' + exifSegment(date) + _JPEG_BODY
+
+def captureTimes(n_photos, seed=0, start=datetime(2021, 6, 1, 8, 0, 0), flight_size=(150, 900),
+                 interval=(2, 5), gap=(MIN_FLIGHT_GAP, 4 * 3600), burst=0.03):
+    """
+    Capture times of n_photos drone photos, grouped in flights.
+
+    Parameters
+    ----------
+    n_photos : int
+        Number of photos.
+    seed : int, optional
+        Seed of the random generator, the same seed gives the same times. The default is 0.
+    start : datetime, optional
+        Capture time of the first photo.
+    flight_size : tuple, optional
+        Range of the number of photos per flight.
+    interval : tuple, optional
+        Range of the seconds between consecutive photos of a flight.
+    gap : tuple, optional
+        Range of the seconds between two flights.
+    burst : float, optional
+        Probability that a photo starts a burst of 2-5 photos taken within the same second.
+
+    Returns
+    -------
+    times : 1D list
+        Capture time of each photo, in capture order.
+    sizes : 1D list
+        Number of photos of each flight.
+
+    """
+
+    rng = random.Random(seed)
+    times = list()
+    sizes = list()
+    t = start
+    while len(times) < n_photos:
+        size = min(rng.randint(*flight_size), n_photos - len(times))
+        sizes.append(size)
+        n = 0
+        while n < size:
+            shots = min(rng.randint(2, 5) if rng.random() < burst else 1, size - n)
+            times.extend([t] * shots)
+            n = n + shots
+            t = t + timedelta(seconds=rng.randint(*interval))
+        t = t + timedelta(seconds=rng.randint(*gap))
+
+    return times, sizes
+
+def generateCorpus(folder, n_photos, seed=0, prefix='DJI_', dated_names=False, **kwargs):
+    """
+    Write n_photos synthetic photos to folder, with the capture times of captureTimes.
+
+    The files are written in a shuffled order, so directory order does not follow
+    capture order, as after copying from several memory cards. With dated_names, the
+    capture time is also in the name, as newer DJI cameras do: DJI_20210601080000_0001_W.JPG.
+
+    Returns
+    -------
+    sizes : 1D list
+        Number of photos of each flight, the expected result of a separation.
+
+    """
+
+    times, sizes = captureTimes(n_photos, seed, **kwargs)
+    if not folder:
+        return sizes
+    makedirs(folder, exist_ok=True)
+
+    order = list(range(n_photos))
+    random.Random(seed + 1).shuffle(order)
+    for i in order:
+        if dated_names:
+            name = '{0}{1:%Y%m%d%H%M%S}_{2:04d}_W.JPG'.format(prefix, times[i], i % 10000)
+        else:
+            name = '{0}{1:06d}.JPG'.format(prefix, i)
+        with open(join(folder, name), 'wb') as fh:
+            fh.write(jpegBytes(times[i]))
+
+    return sizes
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a folder of tiny JPEG photos with realistic capture times.")
+    parser.add_argument('folder', help='output folder, created if needed')
+    parser.add_argument('--photos', type=int, default=1000, help='number of photos (default: 1000)')
+    parser.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    parser.add_argument('--dated-names', action='store_true',
+                        help='put the capture time in the file names, as newer DJI cameras')
+    args = parser.parse_args()
+
+    sizes = generateCorpus(args.folder, args.photos, args.seed, dated_names=args.dated_names)
+    print(json.dumps({'photos': args.photos, 'flights': len(sizes), 'flight_sizes': sizes}))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+"""
+Precompile main.ui into main_ui.py, so the application does not parse the XML form at startup.
+
+Usage:
+    python build_ui.py
+
+main.spec runs it before building the executable.
+"""
+
+from os.path import abspath, dirname, join
+
+from PyQt5.uic import compileUi
+
+HERE = dirname(abspath(__file__))
+
+
+def buildUi(ui_path=join(HERE, 'main.ui'), py_path=join(HERE, 'main_ui.py')):
+    """
+    Compile a Qt Designer form to Python code.
+
+    Parameters
+    ----------
+    ui_path : string, optional
+        Full path to the form. The default is main.ui next to this script.
+    py_path : string, optional
+        Full path to the generated module. The default is main_ui.py next to this script.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    with open(py_path, 'w', encoding='utf-8') as fh:
+        compileUi(ui_path, fh)
+
+if __name__ == '__main__':
+    buildUi()
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+"""
+Command-line interface of Flight Separator, runs without PyQt5 or a display.
+
+Usage:
+    python cli.py <photo_folder> [-t MINUTES] [-k] [-w WORKERS] [-f {txt,csv,jsonl}]
+    python cli.py <photo_folder> --plan plan.json      (dry run)
+    python cli.py --execute plan.json
+    python cli.py <photo_folder> --undo
+    python cli.py <photo_folder> --watch               (separate photos as they arrive)
+    python cli.py <photo_folder> --stream              (move each flight as soon as it is read)
+"""
+
+import argparse
+import sys
+import time
+from multiprocessing import freeze_support
+from os.path import join, splitext
+
+from flight_separator import (flightSeparator, planSeparation, savePlan, loadPlan, formatPlan, executePlan,
+                              undoSeparation, streamSeparation, REPORT_NAME)
+from file_transfer import TRANSFER_WORKERS
+from folder_watcher import FlightWatch
+from report_writer import REPORT_FORMATS
+from scan_order import SCAN_ORDERS
+from filename_dates import FILENAME_MODES
+from timestamp_cache import defaultCachePath
+
+
+class _Emitter(object):
+    """
+    Stand-in for a Qt signal: emit(value) calls func(value).
+    """
+
+    def __init__(self, func):
+        self.emit = func
+
+
+class TextProgress(object):
+    '''
+    Text progress bar replacing the Qt progress and status signals.
+
+    The engine already limits how often it emits (see ProgressTracker), so every
+    update is drawn.
+
+    :param stream: Where the bar is drawn, e.g. sys.stderr.
+    :type stream: file
+    :param width: Number of characters of the bar.
+    :type width: int
+
+    '''
+
+    def __init__(self, stream=sys.stderr, width=40):
+        self.stream = stream
+        self.width = width
+        self.percent = -1
+        self.text = ""
+        self._decile = -1
+        self.progress = _Emitter(self.setPercent)
+        self.status = _Emitter(self.setText)
+        self._interactive = hasattr(stream, 'isatty') and stream.isatty()
+
+    def setPercent(self, percent):
+        percent = int(percent)
+        if percent != self.percent:
+            self.percent = percent
+            self._draw()
+
+    def setText(self, text):
+        self.text = text
+        if self._interactive:
+            self._draw()
+
+    def _draw(self):
+        filled = self.width * max(self.percent, 0) // 100
+        line = "[{0}{1}] {2:3d}% {3}".format("#" * filled, " " * (self.width - filled), max(self.percent, 0), self.text)
+        if self._interactive:
+            self.stream.write("\r" + line[:200].ljust(80))
+        else:
+            # redirected (e.g. cron), one line per 10%, updates may skip the exact multiple
+            if self.percent // 10 == self._decile:
+                return
+            self._decile = self.percent // 10
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+    def finish(self):
+        if self._interactive and self.percent >= 0:
+            self.stream.write("\n")
+            self.stream.flush()
+
+
+def parseArgs(argv=None):
+    parser = argparse.ArgumentParser(description="Detect and separate drone photos taken in different flights.")
+    parser.add_argument('folder', nargs='?', help='folder containing the photos')
+    parser.add_argument('-e', '--ext', action='append', dest='exts',
+                        help='photo extension, can be repeated (default: .jpg)')
+    parser.add_argument('-t', '--time', type=float, default=1.0,
+                        help='flight separation time in minutes (default: 1)')
+    parser.add_argument('-k', '--keep', action='store_true', help='keep a copy of the photos in the folder')
+    parser.add_argument('--keep-strategy', default='auto', choices=('auto', 'reflink', 'hardlink', 'copy'),
+                        help='how kept photos are copied (default: auto)')
+    parser.add_argument('-r', '--recursive', action='store_true', help='also separate photos in subfolders')
+    parser.add_argument('-i', '--incremental', action='store_true',
+                        help='only separate photos added since the last incremental run, '
+                             'adding them to its flights when close enough')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='processes extracting photo dates (default: one per CPU)')
+    parser.add_argument('--transfer-workers', type=int, default=TRANSFER_WORKERS,
+                        help='photos moved at the same time (default: {0})'.format(TRANSFER_WORKERS))
+    parser.add_argument('--scan-order', default='auto', choices=SCAN_ORDERS,
+                        help='order in which photos are read: by physical position (extent) or inode '
+                             'number to avoid seeks, or as listed (none). auto uses extent on hard '
+                             'disks and card readers, none elsewhere (default: auto)')
+    parser.add_argument('--filename-dates', default='auto', choices=FILENAME_MODES,
+                        help='take dates from file names such as DJI_20240512093015_0001_W.JPG without '
+                             'opening the photos: auto after checking a sample against EXIF, trust '
+                             'without checking, off never (default: auto)')
+    parser.add_argument('--filename-pattern', action='append', dest='filename_patterns',
+                        help='regular expression of the file name dates, with the named groups year, '
+                             'month, day, hour, minute and second, can be repeated')
+    parser.add_argument('-f', '--format', default='txt', choices=REPORT_FORMATS, help='report format (default: txt)')
+    parser.add_argument('--report', help='report file (default: {0}.<format> in the folder)'.format(
+        splitext(REPORT_NAME)[0]))
+    parser.add_argument('--cache', default=defaultCachePath(), help='timestamp cache database')
+    parser.add_argument('--no-cache', action='store_true', help='do not use the timestamp cache')
+    parser.add_argument('--perf-report', action='store_true', help='write stage metrics to the folder')
+    parser.add_argument('--plan', metavar='PLAN', help='only write the separation plan to this JSON file')
+    parser.add_argument('--execute', metavar='PLAN', help='apply a plan written with --plan')
+    parser.add_argument('--undo', action='store_true',
+                        help='revert the last separation in the folder, a whole --stream or --watch session included')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running and separate photos as they arrive, until Ctrl+C')
+    parser.add_argument('--poll', action='store_true', help='with --watch, poll the folder instead of inotify')
+    parser.add_argument('--stream', action='store_true',
+                        help='move each flight as soon as it is read, photos read in name order')
+    parser.add_argument('-q', '--quiet', action='store_true', help='no progress bar')
+
+    args = parser.parse_args(argv)
+    if args.folder is None and args.execute is None:
+        parser.error('folder is required')
+    if args.exts is None:
+        args.exts = ['.jpg']
+    return args
+
+def watch(args, cache_path):
+    """
+    Run a FlightWatch on the folder until Ctrl+C, printing each separation.
+    """
+
+    def printResult(result):
+        sys.stdout.write(result['msg'])
+        sys.stdout.flush()
+
+    status = None if args.quiet else _Emitter(lambda text: sys.stderr.write(text + "\n"))
+    printed = _Emitter(printResult)
+    watcher = FlightWatch(args.folder, tuple(args.exts), int(round(args.time * 60)), args.keep,
+                          args.keep_strategy, args.workers, cache_path, args.transfer_workers,
+                          status_callback=status, result_callback=printed, polling=args.poll)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        sys.stderr.write("Error: {0}\n".format(e))
+        return 1
+
+    sys.stdout.write("Stopped, {0} photos separated\n".format(watcher.n_separated))
+    return 0
+
+def main(argv=None):
+    args = parseArgs(argv)
+    report_name = splitext(REPORT_NAME)[0] + '.' + args.format
+    reporter = TextProgress(sys.stderr)
+    progress = _Emitter(lambda percent: None) if args.quiet else reporter.progress
+    status = None if args.quiet else reporter.status
+    cache_path = None if args.no_cache else args.cache
+    start = time.perf_counter()
+
+    if args.watch:
+        return watch(args, cache_path)
+
+    try:
+        if args.undo:
+            result = undoSeparation(args.folder)
+        elif args.execute is not None:
+            plan = loadPlan(args.execute)
+            result = executePlan(plan, progress, args.transfer_workers, status,
+                                 report_path=args.report or join(plan['folder'], report_name),
+                                 report_format=args.format)
+        elif args.plan is not None:
+            plan = planSeparation(args.folder, tuple(args.exts), int(round(args.time * 60)), args.keep, progress,
+                                  args.workers, cache_path, args.recursive, args.keep_strategy,
+                                  status_callback=status, incremental=args.incremental,
+                                  scan_order=args.scan_order, filename_dates=args.filename_dates,
+                                  filename_patterns=args.filename_patterns)
+            savePlan(plan, args.plan)
+            result = {'msg': formatPlan(plan) + "Plan written to {0}\n".format(args.plan)}
+        elif args.stream:
+            result = streamSeparation(args.folder, tuple(args.exts), int(round(args.time * 60)), args.keep, progress,
+                                      args.workers, args.recursive, args.keep_strategy, args.transfer_workers,
+                                      status_callback=status,
+                                      report_path=args.report or join(args.folder, report_name),
+                                      report_format=args.format, perf_report=args.perf_report)
+        else:
+            result = flightSeparator(args.folder, tuple(args.exts), int(round(args.time * 60)), args.keep, progress,
+                                     workers=args.workers, cache_path=cache_path, recursive=args.recursive,
+                                     keep_strategy=args.keep_strategy, transfer_workers=args.transfer_workers,
+                                     status_callback=status, perf_report=args.perf_report,
+                                     report_path=args.report or join(args.folder, report_name),
+                                     report_format=args.format, incremental=args.incremental,
+                                     scan_order=args.scan_order, filename_dates=args.filename_dates,
+                                     filename_patterns=args.filename_patterns)
+    except Exception as e:
+        reporter.finish()
+        sys.stderr.write("Error: {0}\n".format(e))
+        return 1
+
+    reporter.finish()
+    sys.stdout.write(result['msg'])
+    sys.stdout.write("Done in {0:.1f} s\n".format(time.perf_counter() - start))
+    return 0
+
+if __name__ == '__main__':
+    freeze_support()
+    sys.exit(main())
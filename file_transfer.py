@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import errno
+import os
+import shutil
+import sys
+import threading
+import time
+from os import link, remove, rename
+from concurrent.futures import ThreadPoolExecutor, wait as waitFutures
+
+try:
+    import fcntl
+except ImportError:
+    # not available on Windows
+    fcntl = None
+
+# ioctl request cloning a whole file, shares the data blocks on btrfs/XFS
+FICLONE = 0x40049409
+
+# ways to keep a copy of a photo, cheapest first
+KEEP_STRATEGIES = ('reflink', 'hardlink', 'copy')
+
+# bytes copied per system call or read/write, also the progress granularity
+COPY_BUFFER = 8 * 1024 * 1024
+
+# files copied at the same time by a TransferEngine
+TRANSFER_WORKERS = 4
+
+# errors of a kernel copy fast path meaning "not possible here, use the next one"
+_FALLBACK_ERRNOS = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP,
+                    errno.EBADF, errno.ENOTSOCK)
+
+
+def _copyRange(fsrc, fdst, progress):
+    """
+    Copy with os.copy_file_range, the data never leaves the kernel. Returns False if unsupported
+    or if nothing was copied.
+    """
+
+    if not hasattr(os, 'copy_file_range'):
+        return False
+
+    copied = 0
+    while True:
+        try:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_BUFFER)
+        except OSError as e:
+            if copied == 0 and e.errno in _FALLBACK_ERRNOS:
+                return False
+            raise
+        if n == 0:
+            # nothing copied at all: some filesystems (e.g. procfs, FUSE, older kernels across
+            # filesystems) report end of file without copying, let the next method check
+            return copied > 0
+        copied = copied + n
+        if progress is not None:
+            progress(n)
+
+def _sendFile(fsrc, fdst, progress):
+    """
+    Copy with os.sendfile, file to file works on Linux. Returns False if unsupported.
+    """
+
+    if not hasattr(os, 'sendfile') or not sys.platform.startswith('linux'):
+        return False
+
+    offset = 0
+    while True:
+        try:
+            n = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, COPY_BUFFER)
+        except OSError as e:
+            if offset == 0 and e.errno in _FALLBACK_ERRNOS:
+                return False
+            raise
+        if n == 0:
+            return True
+        offset = offset + n
+        if progress is not None:
+            progress(n)
+
+def _readWrite(fsrc, fdst, progress):
+    """
+    Copy through a large user space buffer.
+    """
+
+    buf = bytearray(COPY_BUFFER)
+    view = memoryview(buf)
+    while True:
+        n = fsrc.readinto(buf)
+        if not n:
+            return True
+        fdst.write(view[:n])
+        if progress is not None:
+            progress(n)
+
+def copyFileData(src, dst, progress=None):
+    """
+    Copy the content of src to dst, with the fastest method available.
+
+    Parameters
+    ----------
+    src : string
+        Fullpath of the source file.
+    dst : string
+        Fullpath of the destination file.
+    progress : function, optional
+        Called with the number of bytes copied by each step.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        for method in (_copyRange, _sendFile, _readWrite):
+            if method(fsrc, fdst, progress):
+                break
+
+def copyFile(src, dst, progress=None):
+    """
+    Copy src to dst with its permission bits, like shutil.copy.
+    """
+
+    copyFileData(src, dst, progress)
+    shutil.copymode(src, dst)
+
+def moveFile(src, dst, progress=None):
+    """
+    Move src to dst, like shutil.move for files.
+
+    A rename is used on the same device, otherwise the file is copied with its metadata
+    and the source removed once the copy has the size of the source.
+
+    Parameters
+    ----------
+    src : string
+        Fullpath of the source file.
+    dst : string
+        Fullpath of the destination file.
+    progress : function, optional
+        Called with the number of bytes moved by each step.
+
+    Raises
+    ------
+    OSError
+        The copy on another device is shorter or longer than the source, which is kept.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    size = os.stat(src).st_size
+    try:
+        rename(src, dst)
+        if progress is not None:
+            progress(size)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    copyFileData(src, dst, progress)
+    shutil.copystat(src, dst)
+    copied = os.stat(dst).st_size
+    if copied != size:
+        remove(dst)
+        raise OSError(errno.EIO, "Copy of {0} has {1} bytes instead of {2}, source kept".format(
+            src, copied, size), dst)
+    remove(src)
+
+
+def reflinkFile(src, dst):
+    """
+    Clone src to dst, sharing the data blocks (copy-on-write).
+
+    Parameters
+    ----------
+    src : string
+        Fullpath of the source file.
+    dst : string
+        Fullpath of the destination file, must not exist.
+
+    Raises
+    ------
+    OSError
+        The platform or filesystem does not support reflinks.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    if fcntl is None or not sys.platform.startswith('linux'):
+        raise OSError(errno.EOPNOTSUPP, "reflink is not supported on this platform", dst)
+
+    with open(src, 'rb') as fsrc, open(dst, 'xb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            remove(dst)
+            raise
+    shutil.copymode(src, dst)
+
+def keepFile(src, dst, strategy, progress=None):
+    """
+    Keep a copy of src at dst with one strategy.
+
+    Parameters
+    ----------
+    src : string
+        Fullpath of the source file.
+    dst : string
+        Fullpath of the destination file.
+    strategy : string
+        'reflink': copy-on-write clone, as cheap as a link but independent of the source.
+        'hardlink': second name for the same file, editing one also changes the other.
+        'copy': full byte copy.
+    progress : function, optional
+        Called with the number of bytes kept by each step.
+
+    Returns
+    -------
+    None.
+
+    """
+
+    if strategy == 'reflink':
+        reflinkFile(src, dst)
+    elif strategy == 'hardlink':
+        link(src, dst)
+    elif strategy == 'copy':
+        copyFile(src, dst, progress)
+        return
+    else:
+        raise ValueError("Unknown keep strategy: {0}".format(strategy))
+
+    if progress is not None:
+        progress(os.stat(dst).st_size)
+
+def keepFileAuto(src, dst, strategy='auto', progress=None):
+    """
+    Keep a copy of src at dst with the cheapest strategy that works.
+
+    Parameters
+    ----------
+    src : string
+        Fullpath of the source file.
+    dst : string
+        Fullpath of the destination file.
+    strategy : string, optional
+        Strategy to try first, falling back to the next ones in KEEP_STRATEGIES.
+        The default is 'auto', try all of them.
+    progress : function, optional
+        Called with the number of bytes kept by each step.
+
+    Returns
+    -------
+    strategy : string
+        Strategy that succeeded.
+
+    """
+
+    if strategy == 'auto':
+        candidates = KEEP_STRATEGIES
+    else:
+        candidates = KEEP_STRATEGIES[KEEP_STRATEGIES.index(strategy):]
+
+    for candidate in candidates[:-1]:
+        try:
+            keepFile(src, dst, candidate, progress)
+            return candidate
+        except OSError as e:
+            # anything but "not supported here" is a real error
+            if e.errno not in (errno.EOPNOTSUPP, errno.ENOTSUP, errno.EXDEV, errno.EINVAL,
+                               errno.ENOTTY, errno.EPERM, errno.EACCES, errno.EMLINK, errno.ENOSYS):
+                raise
+
+    keepFile(src, dst, candidates[-1], progress)
+    return candidates[-1]
+
+
+class TransferEngine(object):
+    '''
+    Bounded thread pool moving or copying files.
+
+    At most 2 * workers files are queued or in flight, submit() blocks beyond that.
+
+    :param workers: Number of files transferred at the same time.
+    :type workers: int
+    :param progress: Receives advance(nbytes=...) as data is copied and advance(1) per file done.
+    :type progress: ProgressTracker
+    :param cancel_token: Checked before each file, queued files are skipped once cancelled.
+    :type cancel_token: CancelToken
+
+    '''
+
+    def __init__(self, workers=TRANSFER_WORKERS, progress=None, cancel_token=None):
+        self.progress = progress
+        self.cancel_token = cancel_token
+        self.done_bytes = 0
+        self.done_files = 0
+
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._slots = threading.BoundedSemaphore(workers * 2)
+        self._lock = threading.Lock()
+        self._futures = list()
+        self._start = time.perf_counter()
+
+    def submit(self, func, src, dst, *args):
+        """
+        Run func(src, dst, *args, progress=...) on the pool, e.g. with moveFile or keepFileAuto.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Holds the return value of func.
+
+        """
+
+        if self.cancel_token is not None:
+            self.cancel_token.checkpoint()
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(self._run, func, src, dst, *args)
+        except:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._finished)
+        self._futures.append(future)
+        return future
+
+    def _run(self, func, src, dst, *args):
+        if self.cancel_token is not None:
+            self.cancel_token.checkpoint()
+        return func(src, dst, *args, progress=self._advance)
+
+    def _finished(self, future):
+        self._slots.release()
+        with self._lock:
+            self.done_files = self.done_files + 1
+        if self.progress is not None and not future.cancelled() and future.exception() is None:
+            self.progress.advance(1)
+
+    def _advance(self, nbytes):
+        with self._lock:
+            self.done_bytes = self.done_bytes + nbytes
+        if self.progress is not None:
+            self.progress.advance(0, nbytes)
+
+    def throughput(self):
+        """
+        Average transfer rate since the engine was created, in bytes per second.
+        """
+
+        elapsed = time.perf_counter() - self._start
+        return self.done_bytes / elapsed if elapsed > 0 else 0.0
+
+    def wait(self):
+        """
+        Wait for all submitted transfers, then raise the first error if any.
+
+        Returns
+        -------
+        results : 1D list
+            Return value of each transfer, in submission order.
+
+        """
+
+        waitFutures(self._futures)
+        results = [f.result() for f in self._futures]
+        self._futures = list()
+        return results
+
+    def close(self):
+        self._pool.shutdown(wait=True)
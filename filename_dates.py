@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import random
+import re
+from datetime import datetime
+from os.path import basename
+
+# filename patterns of capture times, named groups year, month, day, hour, minute and second
+FILENAME_PATTERNS = (
+    # DJI_20240512093015_0001_W.JPG
+    r'^DJI_(?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})(?P<hour>\d{2})(?P<minute>\d{2})(?P<second>\d{2})_',
+    # IMG_20240512_093015.jpg, 20240512-093015.jpg
+    r'(?<!\d)(?P<year>(?:19|20)\d{2})(?P<month>\d{2})(?P<day>\d{2})[_-]?'
+    r'(?P<hour>\d{2})(?P<minute>\d{2})(?P<second>\d{2})(?!\d)',
+)
+# how filename dates are used, see filenameDates
+FILENAME_MODES = ('auto', 'off', 'trust')
+
+# share of the decoded photos checked against EXIF, within the bounds below
+VERIFY_FRACTION = 0.01
+VERIFY_MIN = 20
+VERIFY_MAX = 200
+# seconds a filename time may differ from DateTimeOriginal, some cameras name the file when it is written
+VERIFY_TOLERANCE = 2
+
+
+class FilenameDecoder(object):
+    '''
+    Capture time of photos from their file name, e.g. DJI_20240512093015_0001_W.JPG.
+
+    The first pattern matching the name gives the time. Names matching no pattern,
+    or giving an impossible date, decode to None.
+
+    :param patterns: Regular expressions with the named groups year, month, day, hour, minute and second.
+    :type patterns: tuple
+
+    '''
+
+    def __init__(self, patterns=FILENAME_PATTERNS):
+        self.patterns = [re.compile(p) if isinstance(p, str) else p for p in patterns]
+        for p in self.patterns:
+            missing = {'year', 'month', 'day', 'hour', 'minute', 'second'} - set(p.groupindex)
+            if missing:
+                raise ValueError('Filename pattern {0} lacks the groups {1}'.format(
+                    p.pattern, ', '.join(sorted(missing))))
+
+    def decode(self, name):
+        """
+        Get the capture time from a file name, None if no pattern gives one.
+        """
+
+        for p in self.patterns:
+            m = p.search(name)
+            if m is None:
+                continue
+            try:
+                return datetime(int(m.group('year')), int(m.group('month')), int(m.group('day')),
+                                int(m.group('hour')), int(m.group('minute')), int(m.group('second')))
+            except ValueError:
+                # e.g. a serial number looking like a date
+                continue
+        return None
+
+
+def verifySample(paths, dates, read_dates, fraction=VERIFY_FRACTION, seed=0):
+    """
+    Spot-check dates decoded from file names against EXIF.
+
+    Parameters
+    ----------
+    paths : 1D list
+        Full path of the photos.
+    dates : 1D list
+        Date decoded from the name of each photo.
+    read_dates : callable
+        Called with a list of paths, returns their EXIF dates.
+    fraction : float, optional
+        Share of the photos checked, at least VERIFY_MIN and at most VERIFY_MAX. The default is VERIFY_FRACTION.
+    seed : int, optional
+        Seed of the sample. The default is 0.
+
+    Returns
+    -------
+    trusted : boolean
+        True if every sampled photo has its EXIF date within VERIFY_TOLERANCE seconds of its name.
+    n_checked : int
+        Number of photos read.
+
+    """
+
+    n = min(max(int(len(paths) * fraction), VERIFY_MIN), VERIFY_MAX, len(paths))
+    sample = sorted(random.Random(seed).sample(range(len(paths)), n))
+    exif = read_dates([paths[i] for i in sample])
+    for i, date in zip(sample, exif):
+        if abs((date - dates[i]).total_seconds()) > VERIFY_TOLERANCE:
+            return False, n
+    return True, n
+
+def filenameDates(entries, mode='auto', read_dates=None, decoder=None):
+    """
+    Dates of the photos that can be taken from their file names, without opening them.
+
+    Parameters
+    ----------
+    entries : 1D list
+        os.DirEntry or full path of the photos.
+    mode : string, optional
+        'off' decodes nothing. 'trust' uses every decoded name, with zero file opens.
+        'auto' uses them once a sample agrees with EXIF, see verifySample. The default is 'auto'.
+    read_dates : callable, optional
+        Called with a list of paths, returns their EXIF dates. Required in 'auto' mode.
+    decoder : FilenameDecoder, optional
+        The default is None, FilenameDecoder with FILENAME_PATTERNS.
+
+    Returns
+    -------
+    dates : 1D list
+        Date of each photo, None where the name gives none or is not trusted.
+    n_checked : int
+        Number of photos read to verify the names.
+
+    """
+
+    if mode not in FILENAME_MODES:
+        raise ValueError('Unknown filename date mode: {0}'.format(mode))
+    dates = [None] * len(entries)
+    if mode == 'off' or not entries:
+        return dates, 0
+
+    if decoder is None:
+        decoder = FilenameDecoder()
+    decoded = list()
+    for i, e in enumerate(entries):
+        date = decoder.decode(e.name if hasattr(e, 'name') else basename(e))
+        if date is not None:
+            dates[i] = date
+            decoded.append(i)
+    if not decoded or mode == 'trust':
+        return dates, 0
+
+    paths = [entries[i].path if hasattr(entries[i], 'path') else entries[i] for i in decoded]
+    trusted, n_checked = verifySample(paths, [dates[i] for i in decoded], read_dates)
+    if not trusted:
+        return [None] * len(entries), n_checked
+    return dates, n_checked
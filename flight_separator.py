@@ -29,183 +29,1857 @@
  ******************************************************************************************/
 """
 
-from os import listdir, makedirs
-from os.path import isfile, join, basename, exists
-import shutil
-import exifread
+from os import makedirs, cpu_count, scandir, stat, fspath, remove, rmdir, listdir
+from os.path import join, basename, exists, abspath, splitext, relpath, dirname
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import groupby
+from array import array
+import json
+import struct
+import numpy as np
 from datetime import datetime
+from timestamp_cache import TimestampCache, dateToSeconds
+from journal import SeparationJournal, jsonDefault
+from separation_state import SeparationState, STATE_NAME
+from stage_metrics import StageMetrics
+from report_writer import ReportWriter
+from job_control import SeparationCancelled
+from header_prefetch import HeaderPrefetcher, readHead
+from scan_order import scanOrder, scanWorkers, resolveScanOrder
+from filename_dates import FilenameDecoder, filenameDates
+from file_transfer import keepFileAuto, moveFile, TransferEngine, TRANSFER_WORKERS
+from photo_records import PhotoRecords
+from online_clusterer import OnlineClusterer
+from pipeline import Pipeline
+from progress_tracker import (ProgressTracker, asTracker, STAGES, PLAN_STAGES, TRANSFER_STAGES, STREAM_STAGES,
+                              UNDO_STAGES)
 
+# bytes read from the start of a photo by the fast EXIF reader. DateTimeOriginal
+# normally sits within the first few KB, the second limit covers large APP segments.
+EXIF_HEAD_BYTES = 16 * 1024
+EXIF_MAX_BYTES = 128 * 1024
+
+EXIF_DATE_FORMAT = '%Y:%m:%d %H:%M:%S'
+
+# name prefix of the flight folders
+FLIGHT_PREFIX = 'FL_'
+
+# performance report written in the input folder
+PERF_REPORT_NAME = 'flight_separator_perf.json'
+
+# default name of the report file written in the input folder
+REPORT_NAME = 'flight_separator_report.txt'
+
+# format version of separation plans
+PLAN_VERSION = 2
+
+# photos read per chunk by streamSeparation, small so the first flights close early
+STREAM_CHUNK = 64
+
+# chunks of photos queued per exif worker in streamSeparation
+STREAM_AHEAD = 2
+
+# closed flights waiting to be moved while streamSeparation reads on
+STREAM_PENDING = 2
+
+_TAG_EXIF_IFD = 0x8769
+_TAG_DATETIME_ORIGINAL = 0x9003
+
+# header reader of this process, its read concurrency adapts to the file system
+_PREFETCHER = HeaderPrefetcher(EXIF_HEAD_BYTES)
+
+
+def _findIfdEntry(tiff, ifd_offset, tag, endian):
+    """
+    Find an entry in a TIFF IFD.
+
+    Parameters
+    ----------
+    tiff : bytes
+        TIFF block, starting at the byte order mark.
+    ifd_offset : int
+        Offset of the IFD within the TIFF block.
+    tag : int
+        Tag to look for.
+    endian : string
+        struct byte order character, '<' or '>'.
+
+    Returns
+    -------
+    entry : tuple or None
+        (type, count, value_offset) of the entry, None if not found.
+
+    """
+
+    if ifd_offset + 2 > len(tiff):
+        return None
+    n_entries = struct.unpack_from(endian + 'H', tiff, ifd_offset)[0]
+    end = ifd_offset + 2 + n_entries * 12
+    if end > len(tiff):
+        return None
+
+    for pos in range(ifd_offset + 2, end, 12):
+        e_tag, e_type, e_count, e_value = struct.unpack_from(endian + 'HHII', tiff, pos)
+        if e_tag == tag:
+            return e_type, e_count, e_value
+
+    return None
+
+def parseExifDate(head):
+    """
+    Extract DateTimeOriginal from the first bytes of a JPEG file.
+
+    Only the APP1/TIFF header is walked: IFD0 -> Exif SubIFD -> DateTimeOriginal.
+
+    Parameters
+    ----------
+    head : bytes
+        First bytes of the JPEG file.
+
+    Returns
+    -------
+    str_date : string or None
+        DateTimeOriginal as stored in the file, None if it cannot be found within head.
+
+    """
+
+    if head[:2] != b'\xff\xd8':
+        return None
+
+    pos = 2
+    while pos + 4 <= len(head):
+        if head[pos] != 0xFF:
+            return None
+        marker = head[pos + 1]
+        if marker == 0xFF:
+            # fill byte
+            pos += 1
+            continue
+        # start of scan or end of image, no metadata after this point
+        if marker in (0xDA, 0xD9):
+            return None
+        length = struct.unpack_from('>H', head, pos + 2)[0]
+        if marker == 0xE1 and head[pos + 4:pos + 10] == b'Exif\x00\x00':
+            tiff = head[pos + 10:pos + 2 + length]
+            return _parseTiffDate(tiff)
+        pos += 2 + length
+
+    return None
+
+def _parseTiffDate(tiff):
+    """
+    Extract DateTimeOriginal from a TIFF block.
+
+    Parameters
+    ----------
+    tiff : bytes
+        TIFF block of the APP1 Exif segment.
+
+    Returns
+    -------
+    str_date : string or None
+        DateTimeOriginal, None if it cannot be found.
+
+    """
+
+    if len(tiff) < 8:
+        return None
+    if tiff[:2] == b'II':
+        endian = '<'
+    elif tiff[:2] == b'MM':
+        endian = '>'
+    else:
+        return None
+
+    magic, ifd0 = struct.unpack_from(endian + 'HI', tiff, 2)
+    if magic != 42:
+        return None
+
+    entry = _findIfdEntry(tiff, ifd0, _TAG_EXIF_IFD, endian)
+    if entry is None:
+        return None
+    entry = _findIfdEntry(tiff, entry[2], _TAG_DATETIME_ORIGINAL, endian)
+    # ASCII 'YYYY:MM:DD HH:MM:SS' plus the terminating NUL
+    if entry is None or entry[0] != 2 or entry[1] < 19:
+        return None
+
+    offset = entry[2]
+    if offset + 19 > len(tiff):
+        return None
+
+    return tiff[offset:offset + 19].decode('ascii', 'replace')
+
+def _exifDate(str_date):
+    """
+    Turn an EXIF date 'YYYY:MM:DD HH:MM:SS' into a datetime, None if malformed.
+
+    Sliced by hand, datetime.strptime would take more time than reading and parsing the header.
+    """
+
+    # separators at 4, 7, 10, 13 and 16
+    if str_date[4::3] != ':: ::':
+        return None
+    try:
+        return datetime(int(str_date[0:4]), int(str_date[5:7]), int(str_date[8:10]),
+                        int(str_date[11:13]), int(str_date[14:16]), int(str_date[17:19]))
+    except ValueError:
+        return None
+
+def _headDate(head):
+    """
+    Parse DateTimeOriginal of a photo header into a datetime, None if undecided.
+    """
+
+    str_date = parseExifDate(head)
+    if str_date is None:
+        return None
+
+    return _exifDate(str_date)
+
+def _readHeaderDate(fh):
+    """
+    Extract DateTimeOriginal from an open photo with a bounded read of its header, None if undecided.
+    """
+
+    head = fh.read(EXIF_HEAD_BYTES)
+    str_date = parseExifDate(head)
+    if str_date is None and len(head) == EXIF_HEAD_BYTES:
+        str_date = parseExifDate(head + fh.read(EXIF_MAX_BYTES - EXIF_HEAD_BYTES))
+
+    return None if str_date is None else _exifDate(str_date)
+
+def readExifDate(filepath):
+    """
+    Extract DateTimeOriginal of the photo with a bounded read of the file header.
+
+    Parameters
+    ----------
+    filepath : string
+        Full path to the photo.
+
+    Returns
+    -------
+    date : datetime or None
+        Date of the photo, None if the fast reader cannot decide.
+
+    """
+
+    head = readHead(filepath, EXIF_HEAD_BYTES)
+    str_date = parseExifDate(head)
+    if str_date is None and len(head) == EXIF_HEAD_BYTES:
+        str_date = parseExifDate(readHead(filepath, EXIF_MAX_BYTES))
+
+    return None if str_date is None else _exifDate(str_date)
+
+def _readDateExif(filepath):
+    """
+    Extract datetime of the photo, see getDateExif.
+
+    Returns
+    -------
+    date : datetime
+        Date of the photo.
+    n_bytes : int
+        Position reached in the file, about the number of bytes read.
+
+    """
+
+    with open(filepath, 'rb') as fh:
+        date = _readHeaderDate(fh)
+        if date is None:
+            # imported on first use, most photos never need it
+            import exifread
+
+            fh.seek(0)
+            tags = exifread.process_file(fh, stop_tag="EXIF DateTimeOriginal", details=False)
+            str_date = str(tags["EXIF DateTimeOriginal"])
+            date = datetime.strptime(str_date , EXIF_DATE_FORMAT)
+
+        return date, fh.tell()
 
 def getDateExif(filepath):
     """
-    Extract datetime of the photo and format it.
+    Extract datetime of the photo and format it.
+
+    The header-only reader is tried first, exifread is used when it cannot decide.
+
+    Parameters
+    ----------
+    filepath : string
+        Full path to the photo.
+
+    Returns
+    -------
+    date : string
+        Formatted date of the photo. The format is '%Y:%m:%d %H:%M:%S'
+
+    """
+
+    return _readDateExif(filepath)[0]
+
+def _getDatesExif(filepaths):
+    """
+    Extract datetime of a chunk of photos, runs in a worker process.
+
+    The headers are read by the HeaderPrefetcher of the process, with several reads in
+    flight on high-latency file systems. Photos they do not decide are read again in full.
+
+    Parameters
+    ----------
+    filepaths : 1D list
+        Contains fullpath to photos.
+
+    Returns
+    -------
+    dates : 1D list
+        Date of each photo, in input order.
+    n_bytes : int
+        Number of bytes read.
+
+    """
+
+    dates = list()
+    n_bytes = 0
+    for path, head in _PREFETCHER.heads(filepaths):
+        date = _headDate(head)
+        if date is None:
+            # large APP segments, or no date the fast parser can find
+            date, n = _readDateExif(path)
+        else:
+            n = len(head)
+        dates.append(date)
+        n_bytes = n_bytes + n
+
+    return dates, n_bytes
+
+def _scanTracker(progress_callback, n_photos):
+    """
+    ProgressTracker of the date extraction, wrapping progress_callback if it is a plain emitter.
+    """
+
+    if progress_callback is None:
+        return None
+    progress = asTracker(progress_callback, stages=PLAN_STAGES[1:2])
+    if progress is not progress_callback:
+        progress.stage('scan', n_photos)
+    return progress
+
+def extractDates(photos, workers=None, chunksize=None, progress_callback=None, stats=None, cancel_token=None):
+    """
+    Extract datetime of the photos, in parallel over a process pool.
+
+    Parameters
+    ----------
+    photos : 1D list
+        Contains fullpath to photos.
+    workers : int, optional
+        Number of worker processes. The default is None, one per CPU.
+        With 1 worker the photos are processed in the calling process.
+    chunksize : int, optional
+        Number of photos sent to a worker at once. The default is None, chosen from
+        the number of photos and workers.
+    progress_callback : object, optional
+        ProgressTracker advanced once per chunk, or object to update progress to the main UI.
+    stats : dict, optional
+        Its 'bytes_read' element is increased by the number of bytes read.
+    cancel_token : CancelToken, optional
+        Checked before each chunk is handed out. At most two chunks per worker are in
+        flight, so a pause holds the pool back too. The default is None.
+
+    Raises
+    ------
+    SeparationCancelled
+        The token was cancelled, chunks not handed out yet are dropped.
+
+    Returns
+    -------
+    dates : 1D list
+        Date of each photo, in input order.
+
+    """
+
+    n_photos = len(photos)
+    if workers is None:
+        workers = cpu_count() or 1
+    if chunksize is None:
+        # a few chunks per worker keeps the pool busy, bounds keep progress smooth
+        chunksize = min(max(n_photos // (workers * 4), 16), 512)
+
+    chunks = [photos[i:i + chunksize] for i in range(0, n_photos, chunksize)]
+    dates = [None] * len(chunks)
+    n_bytes = 0
+    progress = _scanTracker(progress_callback, n_photos)
+
+    if workers <= 1 or len(chunks) <= 1:
+        for i, chunk in enumerate(chunks):
+            if cancel_token is not None:
+                cancel_token.checkpoint()
+            dates[i], n = _getDatesExif(chunk)
+            n_bytes = n_bytes + n
+            if progress is not None:
+                progress.advance(len(chunk))
+    else:
+        workers = min(workers, len(chunks))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = dict()
+            next_chunk = 0
+            try:
+                while futures or next_chunk < len(chunks):
+                    while next_chunk < len(chunks) and len(futures) < 2 * workers:
+                        if cancel_token is not None:
+                            cancel_token.checkpoint()
+                        futures[pool.submit(_getDatesExif, chunks[next_chunk])] = next_chunk
+                        next_chunk = next_chunk + 1
+                    finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        i = futures.pop(future)
+                        dates[i], n = future.result()
+                        n_bytes = n_bytes + n
+                        if progress is not None:
+                            progress.advance(len(chunks[i]))
+            except SeparationCancelled:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+
+    if stats is not None:
+        stats['bytes_read'] = stats.get('bytes_read', 0) + n_bytes
+
+    return [d for chunk in dates for d in chunk]
+
+def extractDatesCached(photos, cache, workers=None, progress_callback=None, stats=None, cancel_token=None):
+    """
+    Extract datetime of the photos, reading only those missing from the cache.
+
+    Parameters
+    ----------
+    photos : 1D list
+        Contains fullpath or os.DirEntry of photos, the stat() of a DirEntry is reused.
+    cache : TimestampCache
+        Cache of photo dates, updated with the newly read photos.
+    workers : int, optional
+        Number of worker processes. The default is None, one per CPU.
+    progress_callback : object, optional
+        ProgressTracker or object to update progress to the main UI. Cache hits count as done at once.
+    stats : dict, optional
+        Its 'bytes_read' element is increased by the number of bytes read.
+    cancel_token : CancelToken, optional
+        Checked between chunks. The default is None.
+
+    Returns
+    -------
+    dates : 1D list
+        Date of each photo, in input order.
+
+    """
+
+    progress = _scanTracker(progress_callback, len(photos))
+    keys = list()
+    for i in photos:
+        st = i.stat() if hasattr(i, 'stat') else stat(i)
+        keys.append((abspath(fspath(i)), st.st_size, st.st_mtime_ns))
+
+    cached = cache.lookup(keys)
+    missing = [k for k in keys if k[0] not in cached]
+    if progress is not None:
+        progress.advance(len(keys) - len(missing))
+    if missing:
+        missing_dates = extractDates([k[0] for k in missing], workers, progress_callback=progress,
+                                     stats=stats, cancel_token=cancel_token)
+        cache.store([k + (d,) for k, d in zip(missing, missing_dates)])
+        cached.update((k[0], d) for k, d in zip(missing, missing_dates))
+
+    return [cached[k[0]] for k in keys]
+
+def normalizeExts(exts):
+    """
+    Turn photo extensions into a lower-case set, e.g. ('.JPG', 'jpeg') -> {'.jpg', '.jpeg'}.
+    """
+
+    if isinstance(exts, str):
+        exts = (exts,)
+
+    return {e.lower() if e.startswith('.') else '.' + e.lower() for e in exts}
+
+def iterPhotos(folder, exts=('.jpg',), recursive=False):
+    """
+    Iterate over the photos within the folder, as they are found.
+
+    Parameters
+    ----------
+    folder : string
+        Full path to the folder containing photos.
+    exts : tuple, optional
+        Supported photo extensions, case-insensitive. The default is ('.jpg',).
+    recursive : boolean, optional
+        Also search subfolders (e.g. DCIM/100MEDIA), except flight folders created
+        by a previous run. The default is False.
+
+    Yields
+    ------
+    entry : os.DirEntry
+        Directory entry of each photo. Its stat() result is cached.
+
+    """
+
+    exts = normalizeExts(exts)
+    pending = [str(folder)]
+    while pending:
+        try:
+            it = scandir(pending.pop())
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_file():
+                    if splitext(entry.name)[1].lower() in exts:
+                        yield entry
+                elif recursive and entry.is_dir() and not entry.name.startswith(FLIGHT_PREFIX):
+                    pending.append(entry.path)
+
+def getPhotos(folder, exts=('.jpg',), recursive=False):
+    """
+    Get a list of photos within the folder.
+
+    Parameters
+    ----------
+    folder : string
+        Full path to the folder containing photos.
+    exts : tuple, optional
+        Supported photo extensions, case-insensitive. The default is ('.jpg',).
+    recursive : boolean, optional
+        Also search subfolders. The default is False.
+
+    Returns
+    -------
+    imgs : list
+        A list of photos matched with the search criteria.
+
+    """
+
+    return [e.path for e in iterPhotos(folder, exts, recursive)]
+
+def clusterIndices(timestamps, maxdiff):
+    """
+    Cluster photos into flights based on time difference, vectorized with NumPy.
+
+    Parameters
+    ----------
+    timestamps : 1D list or array
+        Timestamp (seconds) of each photo.
+    maxdiff : int
+        Maximum allowable time difference between consecutive photos within the same flight.
+
+    Returns
+    -------
+    order : 1D array
+        Photo indices sorted by timestamp. Photos with the same timestamp keep their input order.
+    ranges : 2D array
+        One (start, stop) row per flight, the flight's photos are order[start:stop].
+
+    """
+
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    n_photos = len(timestamps)
+    if n_photos == 0:
+        return np.empty(0, dtype=np.int64), np.empty((0, 2), dtype=np.int64)
+
+    order = np.argsort(timestamps, kind='stable')
+    breaks = np.flatnonzero(np.diff(timestamps[order]) > maxdiff) + 1
+    starts = np.concatenate(([0], breaks))
+    stops = np.concatenate((breaks, [n_photos]))
+
+    return order, np.column_stack((starts, stops))
+
+def clusterIntervals(starts, stops, maxdiff):
+    """
+    Cluster time intervals into flights: intervals overlapping or closer than maxdiff share a flight.
+
+    A photo is an interval with start == stop, a flight folder of an earlier run is the
+    interval between its first and last photo, which may be longer than maxdiff.
+
+    Parameters
+    ----------
+    starts, stops : 1D list or array
+        Start and stop (seconds) of each interval.
+    maxdiff : int
+        Maximum allowable time difference between consecutive photos within the same flight.
+
+    Returns
+    -------
+    order : 1D array
+        Interval indices sorted by start. Intervals with the same start keep their input order.
+    ranges : 2D array
+        One (start, stop) row per flight, the flight's intervals are order[start:stop].
+
+    """
+
+    starts = np.asarray(starts, dtype=np.int64)
+    stops = np.asarray(stops, dtype=np.int64)
+    n = len(starts)
+    if n == 0:
+        return np.empty(0, dtype=np.int64), np.empty((0, 2), dtype=np.int64)
+
+    order = np.argsort(starts, kind='stable')
+    # latest stop reached so far, a long interval bridges the points inside it
+    reach = np.maximum.accumulate(stops[order])
+    breaks = np.flatnonzero(starts[order][1:] - reach[:-1] > maxdiff) + 1
+    starts = np.concatenate(([0], breaks))
+    stops = np.concatenate((breaks, [n]))
+
+    return order, np.column_stack((starts, stops))
+
+def clusterList(X, maxdiff):
+    """
+    Cluster photos into flights based on time difference
+
+    Parameters
+    ----------
+    X : 2D list
+        Contains photo name, date, timestamp for each photo.
+    maxdiff : int
+        Maximum allowable time difference between consecutive photos within the same flight.
+
+    Returns
+    -------
+    result : 2D list
+        Each sublist contains photos of the same flight.
+
+    """
+
+    names, dates, timestamps = X
+    order, ranges = clusterIndices(timestamps, maxdiff)
+    order = order.tolist()
+
+    return [[[names[j], dates[j], timestamps[j]] for j in order[start:stop]] for start, stop in ranges.tolist()]
+
+class ThresholdSweep(object):
+    '''
+    Flight partitions for every separation time, from one pass over the photos.
+
+    Gap-based clustering of timestamps is fully determined by the sorted gaps between
+    consecutive photos: a threshold T breaks exactly the gaps larger than T. The gaps
+    are sorted once, then each threshold is answered with a binary search.
+
+    :param timestamps: Timestamp (seconds) of each photo.
+    :type timestamps: 1D list or array
+
+    '''
+
+    def __init__(self, timestamps):
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.n_photos = len(timestamps)
+        self.order = np.argsort(timestamps, kind='stable')
+        gaps = np.diff(timestamps[self.order])
+        self.sorted_gaps = np.sort(gaps)
+        # gap positions, largest gap first
+        self.gap_rank = np.argsort(-gaps, kind='stable')
+
+    def countFlights(self, maxdiff):
+        """
+        Number of flights for a separation time, O(log n).
+
+        Parameters
+        ----------
+        maxdiff : int or 1D array
+            Maximum allowable time difference between consecutive photos within the same flight.
+
+        Returns
+        -------
+        n_flights : int or 1D array
+
+        """
+
+        if self.n_photos == 0:
+            return np.zeros_like(maxdiff) if np.ndim(maxdiff) else 0
+        n_breaks = len(self.sorted_gaps) - np.searchsorted(self.sorted_gaps, maxdiff, side='right')
+        return 1 + n_breaks
+
+    def breaks(self, maxdiff):
+        """
+        Flight breaks for a separation time.
+
+        Parameters
+        ----------
+        maxdiff : int
+            Maximum allowable time difference between consecutive photos within the same flight.
+
+        Returns
+        -------
+        breaks : 1D array
+            Positions in order where a new flight starts, ascending.
+
+        """
+
+        if self.n_photos == 0:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(self.gap_rank[:self.countFlights(maxdiff) - 1]) + 1
+
+    def ranges(self, maxdiff):
+        """
+        Flights for a separation time, same as clusterIndices(timestamps, maxdiff)[1].
+
+        Returns
+        -------
+        ranges : 2D array
+            One (start, stop) row per flight, the flight's photos are order[start:stop].
+
+        """
+
+        if self.n_photos == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        breaks = self.breaks(maxdiff)
+        return np.column_stack((np.concatenate(([0], breaks)), np.concatenate((breaks, [self.n_photos]))))
+
+    def curve(self):
+        """
+        Number of flights against separation time.
+
+        Returns
+        -------
+        thresholds : 1D array
+            Distinct gaps between consecutive photos, ascending.
+        n_flights : 1D array
+            Number of flights for a separation time in [thresholds[i], thresholds[i + 1]).
+            Separation times below thresholds[0] give one flight per photo.
+
+        """
+
+        thresholds = np.unique(self.sorted_gaps)
+        return thresholds, self.countFlights(thresholds)
+
+def _freeName(folder, name, taken=None):
+    """
+    Get a destination path in folder that does not overwrite an existing photo.
+
+    Photos from different subfolders may share a name, e.g. DJI_0001.JPG, the later
+    ones get a numbered suffix: DJI_0001_1.JPG. Names in taken are treated as existing,
+    the returned one is added to it.
+    """
+
+    outname = "{0}/{1}".format(folder, name)
+    stem, ext = splitext(name)
+    n = 0
+    while (taken is not None and outname in taken) or exists(outname):
+        n = n + 1
+        outname = "{0}/{1}_{2}{3}".format(folder, stem, n, ext)
+
+    if taken is not None:
+        taken.add(outname)
+    return outname
+
+def _transferFlight(pairs, iskeep, strategy='auto', engine=None, on_done=None):
+    """
+    Move or copy photos of the same flight to their destinations.
+
+    Parameters
+    ----------
+    pairs : 1D list
+        Contains (source, destination) fullpaths of the photos.
+    iskeep : boolean
+        Copy the photos with strategy instead of moving them.
+    strategy : string, optional
+        Keep strategy, detected on the first photo when 'auto'. The default is 'auto'.
+    engine : TransferEngine, optional
+        Engine running the transfers in parallel, the caller waits for it. The default
+        is None, transfer one photo at a time.
+    on_done : function, optional
+        Called with the position in pairs of each photo transferred successfully.
+
+    Returns
+    -------
+    strategy : string or None
+        Keep strategy used, None when moving.
+
+    """
+
+    def transfer(k, func, *args):
+        if engine is None:
+            value = func(*args)
+            if on_done is not None:
+                on_done(k)
+            return value
+        future = engine.submit(func, *args)
+        if on_done is not None:
+            future.add_done_callback(lambda f: f.exception() is None and on_done(k))
+        return future
+
+    if not iskeep:
+        for k, (src, dst) in enumerate(pairs):
+            transfer(k, moveFile, src, dst)
+        return None
+
+    if not pairs:
+        return None
+
+    # the first copy tells which strategy the destination supports
+    used = transfer(0, keepFileAuto, pairs[0][0], pairs[0][1], strategy)
+    if engine is not None:
+        used = used.result()
+    for k, (src, dst) in enumerate(pairs[1:], 1):
+        transfer(k, keepFileAuto, src, dst, used)
+
+    return used
+
+def moveFlight(flist, folder, engine=None):
+    """
+    Move photos of the same flight to a folder.
+
+    Parameters
+    ----------
+    flist : 1D list
+        Contains fullpath to photos.
+    folder : string
+        Fullpath of the destination folder.
+    engine : TransferEngine, optional
+        Engine running the moves in parallel, the caller waits for it. The default
+        is None, move one photo at a time.
+
+    Returns
+    -------
+    None.
+
+    """
+    if not exists(folder):
+        makedirs(folder)
+
+    taken = set()
+    _transferFlight([(i, _freeName(folder, basename(i), taken)) for i in flist], False, engine=engine)
+
+def copyFlight(flist, folder, strategy='auto', engine=None):
+    """
+    Copy photos of the same flight to a folder.
+
+    Parameters
+    ----------
+    flist : 1D list
+        Contains fullpath to photos.
+    folder : string
+        Fullpath of the destination folder.
+    strategy : string, optional
+        How copies are made: 'reflink', 'hardlink' or 'copy', see file_transfer.keepFile.
+        The default is 'auto', the cheapest one supported by the destination, detected
+        on the first photo.
+    engine : TransferEngine, optional
+        Engine running the copies in parallel, the caller waits for it. The default
+        is None, copy one photo at a time.
+
+    Returns
+    -------
+    strategy : string
+        Strategy used for the flight. When it stops working for some photo, e.g. too
+        many links, that photo falls back to the next strategy.
+
+    """
+    if not exists(folder):
+        makedirs(folder)
+
+    taken = set()
+    return _transferFlight([(i, _freeName(folder, basename(i), taken)) for i in flist], True, strategy, engine)
+
+def _flightName(index, date):
+    return "{0}{1}.{2}".format(FLIGHT_PREFIX, str(index), date.strftime("%Y_%m_%d.%I_%M"))
+
+def _nextFlightIndex(folder, flights=None):
+    """
+    Number following the largest flight folder number in folder, e.g. 3 after FL_2.2021_06_01.08_00.
+
+    The flights of a separation state, which records every flight folder once it exists,
+    spare listing a folder that may hold many photos.
+    """
+
+    if flights:
+        names = [f['folder'] for f in flights]
+    else:
+        with scandir(folder) as it:
+            names = [e.name for e in it if e.name.startswith(FLIGHT_PREFIX) and e.is_dir()]
+
+    last = -1
+    for name in names:
+        number = name[len(FLIGHT_PREFIX):].split('.', 1)[0]
+        if name.startswith(FLIGHT_PREFIX) and number.isdigit():
+            last = max(last, int(number))
+    return last + 1
+
+def _newFlights(records, order, ranges):
+    """
+    Flight folder name and photo indices of each flight from clusterIndices.
+    """
+
+    order = order.tolist()
+    return [(_flightName(i, records.date(order[start])), order[start:stop])
+            for i, (start, stop) in enumerate(ranges.tolist())]
+
+def _incrementalFlights(records, flights, maxdiff, first_index):
+    """
+    Group new photos with the flight folders of earlier runs.
+
+    New photos within maxdiff of an earlier flight join its folder, the others form
+    new flights numbered from first_index. When new photos bridge several earlier
+    flights, each photo joins the nearest of them: folders are never merged.
+
+    Parameters
+    ----------
+    records : PhotoRecords
+        The new photos and their capture times.
+    flights : 1D list
+        Earlier flights, with 'folder', 'start' and 'stop' elements, see SeparationState.
+    maxdiff : int
+        Maximum allowable time difference between consecutive photos within the same flight.
+    first_index : int
+        Number of the first new flight folder.
+
+    Returns
+    -------
+    groups : 1D list
+        Contains (flight folder name, photo indices in time order) of each flight receiving photos.
+
+    """
+
+    n_photos = len(records)
+    timestamps = np.array(records.timestamps, dtype=np.int64)
+    f_starts = np.array([f['start'] for f in flights], dtype=np.int64)
+    f_stops = np.array([f['stop'] for f in flights], dtype=np.int64)
+    order, ranges = clusterIntervals(np.concatenate((timestamps, f_starts)),
+                                     np.concatenate((timestamps, f_stops)), maxdiff)
+
+    groups = list()
+    index = first_index
+    for start, stop in ranges.tolist():
+        members = order[start:stop]
+        photos = members[members < n_photos]
+        if not len(photos):
+            continue
+        earlier = members[members >= n_photos] - n_photos
+        if len(earlier) == 0:
+            groups.append((_flightName(index, records.date(photos[0])), photos.tolist()))
+            index = index + 1
+        elif len(earlier) == 1:
+            groups.append((flights[earlier[0]]['folder'], photos.tolist()))
+        else:
+            t = timestamps[photos][:, None]
+            distance = np.maximum(np.maximum(f_starts[earlier][None, :] - t, t - f_stops[earlier][None, :]), 0)
+            nearest = earlier[np.argmin(distance, axis=1)]
+            for k in np.unique(nearest).tolist():
+                groups.append((flights[k]['folder'], photos[nearest == k].tolist()))
+
+    return groups
+
+def _buildPlan(folder, records, groups, iskeep, keep_strategy):
+    """
+    Decide the flight folder and destination of every photo, without touching any file.
+
+    Parameters
+    ----------
+    folder : string
+        Full path to the folder containing photos.
+    records : PhotoRecords
+        The photos and their capture times.
+    groups : 1D list
+        Contains (flight folder name, photo indices in time order) of each flight.
+    iskeep : boolean
+        Keep one copy of the photos in the input folder or not.
+    keep_strategy : string
+        How photos are kept when iskeep is True.
+
+    Returns
+    -------
+    plan : dict
+        Plan with one column per photo attribute, see planSeparation.
+
+    """
+
+    folder = str(folder)
+    # source folders relative to folder, one relpath per distinct subfolder
+    rel_folders = [relpath(f, folder) for f in records.folders()]
+    rel_folders = ['' if f == '.' else f for f in rel_folders]
+    flights = list()
+    for name, idx in groups:
+        out_folder = join(folder, name)
+        taken = set()
+        # the names are shared with records, only the few renamed photos get a new string
+        names = [records.name(j) for j in idx]
+        renamed = list()
+        for k, photo_name in enumerate(names):
+            free_name = basename(_freeName(out_folder, photo_name, taken))
+            if free_name != photo_name:
+                renamed.append([k, free_name])
+        flights.append({
+            'folder': name,
+            'subfolder': array('I', (records.folderIndex(j) for j in idx)),
+            'names': names,
+            'renamed': renamed,
+            'timestamps': array('q', (records.timestamps[j] for j in idx)),
+        })
+
+    return {'version': PLAN_VERSION, 'folder': folder, 'iskeep': bool(iskeep), 'keep_strategy': keep_strategy,
+            'subfolders': rel_folders, 'flights': flights}
+
+def _flightPaths(plan, flight):
+    """
+    Iterate over (source, destination) of the photos of one plan flight, relative to the plan folder.
+    """
+
+    subfolders = plan['subfolders']
+    renamed = dict(flight['renamed'])
+    for k, (i, name) in enumerate(zip(flight['subfolder'], flight['names'])):
+        yield join(subfolders[i], name), join(flight['folder'], renamed.get(k, name))
+
+def _planSize(plan):
+    return sum(len(f['names']) for f in plan['flights'])
+
+def _columnarPlan(plan):
+    """
+    Plan with its columns as arrays, as built by planSeparation, from one read back from JSON.
+    """
+
+    if all(isinstance(f['timestamps'], array) for f in plan['flights']):
+        return plan
+
+    flights = [dict(f, subfolder=array('I', f['subfolder']), timestamps=array('q', f['timestamps']))
+               for f in plan['flights']]
+    return dict(plan, flights=flights)
+
+def _runPlan(plan, engine, journal=None, resumed=False):
+    """
+    Move or copy the photos of a plan into their flight folders.
+
+    Parameters
+    ----------
+    plan : dict
+        Plan from planSeparation.
+    engine : TransferEngine
+        Engine running the transfers, waited for before returning.
+    journal : SeparationJournal, optional
+        Journal recording finished photos. Photos it already lists as done or skipped are left alone.
+    resumed : boolean, optional
+        The journal belongs to an interrupted run of this plan. A photo found at its destination
+        but not at its source then counts as done, and a photo found at neither place, e.g.
+        deleted since, is recorded as skipped. The default is False.
+
+    Returns
+    -------
+    keep_strategies : 1D list
+        Keep strategy used for each flight folder, None when moving.
+
+    """
+
+    base = plan['folder']
+    keep_strategies = list()
+    first = 0
+    for flight in plan['flights']:
+        out_folder = join(base, flight['folder'])
+        if not exists(out_folder):
+            makedirs(out_folder)
+
+        todo = list()
+        for k, (src, dst) in enumerate(_flightPaths(plan, flight), first):
+            if journal is not None and (k in journal.done or k in journal.skipped):
+                continue
+            src, dst = join(base, src), join(base, dst)
+            if resumed and not exists(src):
+                if exists(dst):
+                    journal.markDone(k)
+                else:
+                    journal.markSkipped(k)
+                if engine.progress is not None:
+                    engine.progress.advance(1)
+                continue
+            if resumed and exists(dst):
+                # left over by an interrupted copy
+                remove(dst)
+            todo.append((k, src, dst))
+        first = first + len(flight['names'])
+
+        on_done = None if journal is None else (lambda n, todo=todo: journal.markDone(todo[n][0]))
+        keep_strategies.append(_transferFlight([(src, dst) for _, src, dst in todo], plan['iskeep'],
+                                               plan['keep_strategy'], engine, on_done))
+
+    engine.wait()
+    return keep_strategies
+
+def formatResult(flights, photos):
+    """
+    Format the processing result of function flightSeparator to be displayed as log in the main UI.
 
     Parameters
     ----------
-    filepath : string
-        Full path to the photo.
+    flights : 1D list
+        Contains fullpath of the flight folders which photos will be moved to.
+    photos : 2D list
+        Each sublist contains (fullpath, date) of the photos of the same flight, or
+        is the PhotoRecords of the flight.
 
     Returns
     -------
-    date : string
-        Formatted date of the photo. The format is '%Y:%m:%d %H:%M:%S'
+    log : string
+        Formatted string as log.
 
     """
 
-    with open(filepath, 'rb') as fh:
-        tags = exifread.process_file(fh, stop_tag="EXIF DateTimeOriginal")
-        str_date = str(tags["EXIF DateTimeOriginal"])
-        date = datetime.strptime(str_date , '%Y:%m:%d %H:%M:%S')
+    log = list()
+    # a resumed plan whose photos are all gone has no flight left
+    len_s = len(flights[0]) if flights else 0
 
-    return date
+    n_flights = len(flights)
+    log.append("Number of flights detected: {0}".format(n_flights))
+    for i in range(0, n_flights):
+        log.append("-" * len_s)
+        log.append(flights[i])
+        if isinstance(photos[i], PhotoRecords):
+            log.extend("{0}: {1}".format(n, d) for n, d in photos[i].namesAndDates())
+        else:
+            log.extend("{0}: {1}".format(basename(p), d) for p, d in photos[i])
+
+    log = "\n".join(str(x) for x in log)
+    log = log + "\n"
+    return log
 
-def getPhotos(folder, exts=('.jpg')):
+def loadState(folder, exts, iskeep, workers=None, cache_path=None, cancel_token=None):
     """
-    Get a list of photos within the folder.
+    Load the incremental state of the folder, or build it from the flight folders already there.
+
+    Without a state file, the photos of every flight folder are read once to get the
+    span of each flight. When photos are kept, the (name, size) of those photos is
+    also returned, so that their originals in the folder count as known.
+
+    Returns
+    -------
+    state : SeparationState
+    kept : set
+        (file name, size) of the photos found in flight folders, empty if the state was loaded.
+
+    """
+
+    state = SeparationState(folder)
+    kept = set()
+    if state.load():
+        return state, kept
+
+    with scandir(folder) as it:
+        flight_folders = sorted(e.name for e in it if e.name.startswith(FLIGHT_PREFIX) and e.is_dir())
+    for name in flight_folders:
+        entries = list(iterPhotos(join(folder, name), exts))
+        if not entries:
+            continue
+        if cache_path is None:
+            dates = extractDates([e.path for e in entries], workers, cancel_token=cancel_token)
+        else:
+            cache = TimestampCache(cache_path)
+            try:
+                dates = extractDatesCached(entries, cache, workers, cancel_token=cancel_token)
+            finally:
+                cache.close()
+        seconds = [dateToSeconds(d) for d in dates]
+        state.addFlight(name, min(seconds), max(seconds), len(seconds))
+        if iskeep:
+            kept.update((e.name, e.stat().st_size) for e in entries)
+
+    return state, kept
+
+def _recordState(plan, state=None):
+    """
+    Add the flights and, when photos are kept, the source photos of a finished plan to the folder state.
+
+    A state given, kept in memory by a SeparationSession, only gets the changes appended
+    to its file. Otherwise the state is loaded and saved again.
+    """
+
+    base = plan['folder']
+    session = state is not None
+    if not session:
+        state = SeparationState(base)
+        state.load()
+    for f in plan['flights']:
+        seconds = f['timestamps']
+        if not seconds:
+            continue
+        state.addFlight(f['folder'], min(seconds), max(seconds), len(seconds))
+        if plan['iskeep']:
+            for src, _ in _flightPaths(plan, f):
+                try:
+                    state.addKnown(src, stat(join(base, src)))
+                except FileNotFoundError:
+                    pass
+    if session:
+        state.saveChanges()
+    else:
+        state.save()
+
+def _iterNew(folder, exts, recursive, state, kept, known, cancel_token):
+    """
+    Photos not separated before, as found. Kept originals not in the state yet are
+    appended to known as (relpath, stat), for the caller to add to the state.
+    """
+
+    for e in iterPhotos(folder, exts, recursive):
+        if cancel_token is not None:
+            cancel_token.checkpoint()
+        if state is not None and (state.known or kept):
+            # originals of kept photos stay in the folder, skip those separated before
+            rel = relpath(e.path, folder)
+            if state.isKnown(rel, e.stat()):
+                continue
+            if (e.name, e.stat().st_size) in kept:
+                known.append((rel, e.stat()))
+                continue
+        yield e
+
+def _discover(folder, exts, recursive, state, kept, progress, cancel_token):
+    """
+    Directory entries of the photos to separate, without those an incremental state knows.
+    """
+
+    known = list()
+    entries = list()
+    for e in _iterNew(folder, exts, recursive, state, kept, known, cancel_token):
+        entries.append(e)
+        progress.advance(1)
+    for rel, st in known:
+        state.addKnown(rel, st)
+    return entries
+
+def _discoverChunks(folder, exts, recursive, state, kept, known, progress, cancel_token, chunksize=STREAM_CHUNK):
+    """
+    Paths of the photos to separate in chunks, in name order within each folder (DCIM order).
+    """
+
+    for _, entries in groupby(_iterNew(folder, exts, recursive, state, kept, known, cancel_token),
+                              key=lambda e: dirname(e.path)):
+        paths = sorted(e.path for e in entries)
+        progress.setTotal(progress.total + len(paths))
+        for i in range(0, len(paths), chunksize):
+            yield paths[i:i + chunksize]
+
+def planSeparation(folder, exts, fstime, iskeep, progress_callback=None, workers=None, cache_path=None,
+                   recursive=False, keep_strategy='auto', metrics=None, cancel_token=None, status_callback=None,
+                   incremental=False, scan_order='auto', filename_dates='auto', filename_patterns=None):
+    """
+    Group photos into flights and decide where each photo goes, without touching any file.
 
     Parameters
     ----------
     folder : string
         Full path to the folder containing photos.
-    exts : tuple, optional
-        Supported photo extensions. The default is ('.jpg').
+    exts : tuple
+        Supported photo extensions.
+    fstime : int
+        Maximum allowable time difference (in seconds) between consecutive photos within the same flight.
+    iskeep: boolean
+        Keep one copy of the photos in the input folder or not
+    progress_callback : object, optional
+        ProgressTracker, or object to update progress to the main UI.
+    workers : int, optional
+        Number of processes used to extract photo dates. The default is None, one per CPU.
+    cache_path : string, optional
+        Full path to the timestamp cache database. The default is None, no cache.
+    recursive : boolean, optional
+        Also separate photos in subfolders. The default is False.
+    keep_strategy : string, optional
+        How photos are kept when iskeep is True: 'reflink', 'hardlink', 'copy' or 'auto'.
+        The default is 'auto', the cheapest one supported by each flight folder.
+    metrics : StageMetrics, optional
+        Records the discovery, exif and cluster stages. The default is None.
+    cancel_token : CancelToken, optional
+        Checked for each photo found and each chunk of photos read. The default is None.
+    status_callback : object, optional
+        Object to show the stage, photos/s and time left in the main UI. The default is None.
+    incremental : boolean, optional
+        Only separate photos not separated by an earlier incremental run, and add those
+        close to an existing flight to its folder. See SeparationState. The default is False.
+    scan_order : string, optional
+        Order in which photos are read, one of SCAN_ORDERS, see scanOrder. The default
+        is 'auto', by physical position on rotational devices and as listed elsewhere.
+        Photos read in a sorted order are read by a single process, see scanWorkers.
+    filename_dates : string, optional
+        Take the dates from the file names where they hold one (e.g. DJI_20240512093015_0001_W.JPG),
+        without opening the photos: 'auto' once a sample agrees with EXIF, 'trust' without
+        checking, 'off' never. See filenameDates. The default is 'auto'.
+    filename_patterns : tuple, optional
+        Regular expressions of the file name dates, see FilenameDecoder. The default is
+        None, FILENAME_PATTERNS.
+
+    Raises
+    ------
+    Exception
+        1. No photo found in the folder -> cannot proceed.
+        2. No new photo found in incremental mode.
+    SeparationCancelled
+        The token was cancelled.
 
     Returns
     -------
-    imgs : list
-        A list of photos matched with the search criteria.
+    plan : dict
+        Plan written to JSON by savePlan, with the elements:
+            - version: PLAN_VERSION.
+            - folder: full path to the folder containing photos.
+            - iskeep, keep_strategy: as given.
+            - subfolders: source folders of the photos, relative to folder ('' for folder itself).
+            - flights: one dict per flight, with the flight folder name 'folder' and one
+              column per photo attribute: 'subfolder' (index in subfolders, array),
+              'names' (file names) and 'timestamps' (capture times in seconds, array,
+              see dateToSeconds). 'renamed' lists the [position, name] of the photos
+              renamed in the flight folder to not overwrite one another.
+            - stats: cache_hits and cache_misses when cache_path is set, filename_dates
+              (photos dated by name) and filename_checked (photos read to check the
+              names) when names were decoded.
+            - incremental: True in incremental mode, the folder state is then updated
+              once the plan is executed.
 
     """
+    if metrics is None:
+        metrics = StageMetrics()
+    progress = asTracker(progress_callback, status_callback, PLAN_STAGES)
 
-    folder = str(folder)
+    with metrics.stage('discovery') as stage:
+        progress.stage('discovery')
+        state, kept = None, set()
+        if incremental:
+            state, kept = loadState(folder, exts, iskeep, workers, cache_path, cancel_token)
+        entries = _discover(folder, exts, recursive, state, kept, progress, cancel_token)
+        photos = [e.path for e in entries]
+        stage['files'] = len(photos)
+        if state is not None:
+            state.save()
+
+    if not photos:
+        raise Exception('No new photo found.' if incremental else 'No photo found.')
 
-    imgs = []
-    if exists(folder):
-        imgs = [join(folder, f) for f in listdir(folder) if (isfile(join(folder, f)) and f.lower().endswith(exts))]
+    # first, get date and time stamps
+    stats = dict()
+    with metrics.stage('exif') as stage:
+        progress.stage('scan', len(photos))
+        # photos dated by their names are not opened
+        decoder = None if filename_patterns is None else FilenameDecoder(filename_patterns)
+        photo_dates, n_checked = filenameDates(entries, filename_dates, lambda paths: _getDatesExif(paths)[0],
+                                               decoder)
+        todo = [i for i, d in enumerate(photo_dates) if d is None]
+        if len(todo) < len(photos):
+            stats = {'filename_dates': len(photos) - len(todo), 'filename_checked': n_checked}
+            progress.advance(len(photos) - len(todo))
 
-    return imgs
+        # read in disk order by a single reader, the dates are put back in listing order
+        mode = resolveScanOrder(folder, scan_order)
+        order = scanOrder([entries[i] for i in todo], mode)
+        scan = [entries[todo[k]] for k in order]
+        scan_workers = scanWorkers(mode, workers)
+        if not scan:
+            scan_dates = list()
+        elif cache_path is None:
+            scan_dates = extractDates([e.path for e in scan], scan_workers, progress_callback=progress,
+                                      stats=stage, cancel_token=cancel_token)
+        else:
+            cache = TimestampCache(cache_path)
+            try:
+                scan_dates = extractDatesCached(scan, cache, scan_workers, progress_callback=progress,
+                                                stats=stage, cancel_token=cancel_token)
+                stats.update(cache_hits=cache.hits, cache_misses=cache.misses)
+            finally:
+                cache.close()
+        for k, date in zip(order, scan_dates):
+            photo_dates[todo[k]] = date
+        del scan, scan_dates, order, todo
+        stage['files'] = len(photos)
+        stage['bytes'] = stage.pop('bytes_read', 0)
 
-def clusterList(X, maxdiff):
+    # then, separate
+    with metrics.stage('cluster') as stage:
+        progress.stage('cluster', len(photos))
+        records = PhotoRecords()
+        records.extend(photos, map(dateToSeconds, photo_dates))
+        del photos, photo_dates, entries
+        if state is None:
+            order, ranges = clusterIndices(records.timestamps, fstime)
+            groups = _newFlights(records, order, ranges)
+        else:
+            groups = _incrementalFlights(records, state.flights, fstime, _nextFlightIndex(folder, state.flights))
+        plan = _buildPlan(folder, records, groups, iskeep, keep_strategy)
+        stage['files'] = len(records)
+        progress.finish()
+    if stats:
+        plan['stats'] = stats
+    if incremental:
+        plan['incremental'] = True
+
+    return plan
+
+def savePlan(plan, path):
     """
-    Cluster photos into flights based on time difference
+    Write a separation plan to a JSON file.
+    """
+
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(plan, fh, indent=1, default=jsonDefault)
+
+def loadPlan(path):
+    """
+    Read a separation plan written by savePlan.
+
+    Raises
+    ------
+    Exception
+        1. The file holds a plan of another format version.
+
+    """
+
+    with open(path, 'r', encoding='utf-8') as fh:
+        plan = json.load(fh)
+
+    if plan.get('version') != PLAN_VERSION:
+        raise Exception('Unsupported plan version: {0}'.format(plan.get('version')))
+
+    return _columnarPlan(plan)
+
+def _flightRecords(plan, flight):
+    """
+    PhotoRecords of the photos of one plan flight, at their source paths, sharing the flight columns.
+    """
+
+    base = plan['folder']
+    folders = [join(base, f) if f else base for f in plan['subfolders']]
+    return PhotoRecords.fromColumns(folders, flight['subfolder'], flight['names'], flight['timestamps'])
+
+def _withoutSkipped(plan, skipped):
+    """
+    Copy of the plan without the photos recorded as skipped. Flights left empty are dropped,
+    and their folders removed.
+    """
+
+    if not skipped:
+        return plan
+
+    flights = list()
+    first = 0
+    for flight in plan['flights']:
+        keep = [k for k in range(len(flight['names'])) if first + k not in skipped]
+        first = first + len(flight['names'])
+        if keep:
+            renamed = dict(flight['renamed'])
+            flights.append(dict(flight,
+                                subfolder=array('I', (flight['subfolder'][k] for k in keep)),
+                                names=[flight['names'][k] for k in keep],
+                                renamed=[[i, renamed[k]] for i, k in enumerate(keep) if k in renamed],
+                                timestamps=array('q', (flight['timestamps'][k] for k in keep))))
+        else:
+            try:
+                rmdir(join(plan['folder'], flight['folder']))
+            except OSError:
+                # not empty or already gone
+                pass
+
+    return dict(plan, flights=flights)
+
+def formatPlan(plan):
+    """
+    Format a separation plan as log, like the result of flightSeparator.
+    """
+
+    base = plan['folder']
+    out_folders = [join(base, f['folder']) for f in plan['flights']]
+    photos = [_flightRecords(plan, f) for f in plan['flights']]
+    return formatResult(out_folders, photos)
+
+def writeReport(plan, path, fmt='txt'):
+    """
+    Write the flights of a plan to a report file, one flight at a time.
 
     Parameters
     ----------
-    X : 2D list
-        Contains photo name, date, timestamp for each photo.
-    maxdiff : int
-        Maximum allowable time difference between consecutive photos within the same flight.
+    plan : dict
+        Plan from planSeparation or loadPlan.
+    path : string
+        Full path to the report file.
+    fmt : string, optional
+        'txt', 'csv' or 'jsonl', see ReportWriter. The default is 'txt'.
 
     Returns
     -------
-    result : 2D list
-        Each sublist contains photos of the same flight.
+    summary : string
+        Short log for the main UI.
 
     """
 
-    X = [list(i) for i in zip(*X)]
-    X.sort(key=lambda x : x[2] , reverse = False)
-    X_time = [i[2] for i in X]
-    breaks = list()
-    seed = X_time[0]
-    i = 0
-    result = list()
-    for i in range(0, len(X_time)):
-        if (X_time[i] - seed) > maxdiff:
-            result.append(breaks)
-            breaks = list()
-            breaks.append(X[i])
-        else:
-            breaks.append(X[i])
-        seed = X_time[i]
+    base = plan['folder']
+    writer = ReportWriter(path, len(plan['flights']), fmt)
+    try:
+        for f in plan['flights']:
+            writer.writeFlight(join(base, f['folder']), _flightRecords(plan, f))
+    finally:
+        writer.close()
 
-    if breaks:
-        result.append(breaks)
+    return writer.summary()
 
-    return result
+def _missingSources(plan):
+    """
+    Source paths of the plan, relative to its folder, that are no longer there.
+    """
 
-def moveFlight(flist, folder):
+    base = plan['folder']
+    return [src for f in plan['flights'] for src, _ in _flightPaths(plan, f) if not exists(join(base, src))]
+
+def executePlan(plan, progress_callback=None, transfer_workers=TRANSFER_WORKERS, status_callback=None,
+                metrics=None, report_path=None, report_format='txt', cancel_token=None, check_sources=True,
+                session=None):
     """
-    Move photos of the same flight to a folder.
+    Move or copy photos into flight folders as decided by a plan, without reading them again.
+
+    A journal of the separation is kept in the folder. If the journal holds this same
+    plan, interrupted, the photos already done are skipped, and photos found at neither
+    their source nor their destination are left out of the state and the report.
 
     Parameters
     ----------
-    flist : 1D list
-        Contains fullpath to photos.
-    folder : string
-        Fullpath of the destination folder.
+    plan : dict
+        Plan from planSeparation or loadPlan.
+    progress_callback : object, optional
+        ProgressTracker, or object to update progress to the main UI.
+    transfer_workers : int, optional
+        Number of photos moved or copied at the same time. The default is TRANSFER_WORKERS.
+    status_callback : object, optional
+        Object to show photos/s, throughput and time left in the main UI. The default is None.
+    metrics : StageMetrics, optional
+        Records the transfer and report stages. The default is None.
+    report_path : string, optional
+        Full path to a report file listing every photo. msg then only holds a short
+        summary. The default is None, the full list is in msg.
+    report_format : string, optional
+        'txt', 'csv' or 'jsonl'. The default is 'txt'.
+    cancel_token : CancelToken, optional
+        Checked before each photo is moved. Once cancelled, the photos being moved are
+        finished and the journal is left unfinished, so a later run resumes it.
+    check_sources : boolean, optional
+        Check that every photo of a new plan is still in the folder before the journal of
+        the last separation is replaced. The default is True, callers that just listed the
+        photos can skip it.
+    session : SeparationSession, optional
+        Session the plan is one flight of. Its journal and state are used instead of
+        reading the files again, and the plan is appended to the journal of the flights
+        before it, so that they are undone together. The default is None, the journal is replaced.
+
+    Raises
+    ------
+    Exception
+        1. The folder has an unfinished separation of another plan -> resume or undo it first.
+        2. Photos of the plan are no longer in the folder -> the plan is out of date.
 
     Returns
     -------
-    None.
+    dict
+        Contains the elements:
+            - msg: log to be displayed in the main UI.
+            - resumed: True if an interrupted separation was finished.
+            - cancelled: True if the separation was cancelled, the other elements below are then missing.
+            - skipped: number of photos of the plan that were gone on resume.
+            - keep_strategies: strategy used for each flight folder, only when iskeep is True.
+            - transfer_bytes, transfer_throughput: bytes moved or copied, and bytes per second.
 
     """
-    if not exists(folder):
-        makedirs(folder)
 
-    for i in flist:
-        outname = "{0}/{1}".format(folder, basename(i))
-        shutil.move(i, outname)
+    plan = _columnarPlan(plan)
+    if session is None:
+        journal = SeparationJournal(plan['folder'])
+        journal.load()
+    else:
+        journal = session.journal
+    resumed = journal.isUnfinished() and _columnarPlan(journal.plan) == plan
+    if resumed:
+        journal.resume()
+    else:
+        if journal.isUnfinished():
+            raise Exception('The folder has an unfinished separation of another plan. '
+                            'Run the separation again to finish it, or undo it, before executing this plan.')
+        if check_sources:
+            missing = _missingSources(plan)
+            if missing:
+                raise Exception('The plan is out of date: {0} of its photos are no longer in the folder '
+                                '(e.g. {1}). Plan the separation again.'.format(len(missing), missing[0]))
+        journal.begin(plan, session is not None and session.started and not journal.undone)
+    if session is not None:
+        session.started = True
+
+    if metrics is None:
+        metrics = StageMetrics()
+
+    progress = asTracker(progress_callback, status_callback, TRANSFER_STAGES)
+    progress.stage('transfer', _planSize(plan) - len(journal.done) - len(journal.skipped))
+    engine = TransferEngine(transfer_workers, progress, cancel_token)
+    cancelled = False
+    with metrics.stage('transfer') as stage:
+        try:
+            keep_strategies = _runPlan(plan, engine, journal, resumed)
+            journal.flush()
+            done_plan = _withoutSkipped(plan, journal.skipped)
+            if session is not None and session.state is not None:
+                _recordState(done_plan, session.state)
+            elif plan.get('incremental') or exists(join(plan['folder'], STATE_NAME)):
+                _recordState(done_plan)
+            journal.markComplete()
+            progress.finish()
+        except SeparationCancelled:
+            cancelled = True
+        finally:
+            engine.close()
+            journal.close()
+        stage['files'] = len(journal.done)
+        stage['bytes'] = engine.done_bytes
+
+    if cancelled:
+        log = ("Separation cancelled: {0} of {1} photos {2}.\n"
+               "Run again on the same folder to finish it, or undo it (Undo button, cli.py --undo).\n").format(
+            len(journal.done), _planSize(plan),
+            'copied' if plan['iskeep'] else 'moved')
+        return {'msg': log, 'resumed': resumed, 'cancelled': True}
+
+    with metrics.stage('report') as stage:
+        if report_path is None:
+            log = formatPlan(done_plan)
+        else:
+            log = writeReport(done_plan, report_path, report_format)
+        stage['files'] = _planSize(done_plan)
+    if journal.skipped:
+        log = "{0} photos of the plan were no longer in the folder and were skipped.\n".format(
+            len(journal.skipped)) + log
+    if resumed:
+        log = "Resumed an interrupted separation.\n" + log
+
+    result = {'msg': log, 'resumed': resumed, 'cancelled': False, 'skipped': len(journal.skipped)}
+    if plan['iskeep']:
+        result['keep_strategies'] = keep_strategies
+    result['transfer_bytes'] = engine.done_bytes
+    result['transfer_throughput'] = engine.throughput()
+    return result
 
-def copyFlight(flist, folder):
+def flightSeparator(folder, exts, fstime, iskeep, progress_callback, workers=None, cache_path=None,
+                    recursive=False, keep_strategy='auto', transfer_workers=TRANSFER_WORKERS,
+                    status_callback=None, perf_report=False, report_path=None, report_format='txt',
+                    cancel_token=None, incremental=False, scan_order='auto', filename_dates='auto',
+                    filename_patterns=None):
     """
-    Copy photos of the same flight to a folder.
+    Group photos into flights and move to separate folders
 
     Parameters
     ----------
-    flist : 1D list
-        Contains fullpath to photos.
     folder : string
-        Fullpath of the destination folder.
+        Full path to the folder containing photos.
+    exts : tuple
+        Supported photo extensions.
+    fstime : int
+        Maximum allowable time difference (in seconds) between consecutive photos within the same flight.
+    iskeep: boolean
+        Keep one copy of the photos in the input folder or not
+    progress_callback : object
+        Object to update progress to the main UI.
+    workers : int, optional
+        Number of processes used to extract photo dates. The default is None, one per CPU.
+    cache_path : string, optional
+        Full path to the timestamp cache database. The default is None, no cache.
+    recursive : boolean, optional
+        Also separate photos in subfolders. The default is False.
+    keep_strategy : string, optional
+        How photos are kept when iskeep is True: 'reflink', 'hardlink', 'copy' or 'auto'.
+        The default is 'auto', the cheapest one supported by each flight folder.
+    transfer_workers : int, optional
+        Number of photos moved or copied at the same time. The default is TRANSFER_WORKERS.
+    status_callback : object, optional
+        Object to show the stage, photos/s and time left in the main UI. The default is None.
+    perf_report : boolean, optional
+        Write the stage metrics to PERF_REPORT_NAME in the folder. The default is False.
+    report_path : string, optional
+        Full path to a report file listing every photo. msg then only holds a short
+        summary. The default is None, the full list is in msg.
+    report_format : string, optional
+        'txt', 'csv' or 'jsonl'. The default is 'txt'.
+    cancel_token : CancelToken, optional
+        Cancels or pauses the separation from another thread. The default is None.
+    incremental : boolean, optional
+        Only separate photos added since the last incremental run, adding them to its
+        flight folders when close enough. The default is False.
+    scan_order : string, optional
+        Order in which photos are read, see planSeparation. The default is 'auto'.
+    filename_dates : string, optional
+        Whether dates are taken from the file names, see planSeparation. The default is 'auto'.
+    filename_patterns : tuple, optional
+        Regular expressions of the file name dates. The default is None, FILENAME_PATTERNS.
+
+    If the previous run in the folder was interrupted, its plan is resumed instead and
+    the other settings are not applied, which msg and settings_ignored tell. Photos of
+    that plan deleted since are skipped. See planSeparation and executePlan.
+
+    Raises
+    ------
+    Exception
+        1. No photo found in the folder -> cannot proceed.
+        2. No new photo found in incremental mode.
 
     Returns
     -------
-    None.
+    dict
+        Contains the elements:
+            - msg: log to be displayed in the main UI.
+            - resumed: True if an interrupted separation was finished.
+            - settings_ignored: True if the plan of an interrupted separation was resumed
+              instead of one built with the settings given.
+            - cancelled: True if the separation was cancelled.
+            - skipped: number of photos of a resumed plan that were gone.
+            - cache_hits, cache_misses: timestamp cache counters, only when cache_path is set.
+            - filename_dates, filename_checked: photos dated by their names and photos read
+              to check the names, only when names were decoded.
+            - keep_strategies: strategy used for each flight folder, only when iskeep is True.
+            - transfer_bytes, transfer_throughput: bytes moved or copied, and bytes per second.
+            - metrics: time, files, bytes, throughput and peak memory of each stage, see StageMetrics.
 
     """
-    if not exists(folder):
-        makedirs(folder)
+    metrics = StageMetrics()
+    journal = SeparationJournal(folder)
+    settings_ignored = journal.load() and journal.isUnfinished()
+    if settings_ignored:
+        # an earlier run was interrupted, finish its plan instead of scanning again
+        plan = journal.plan
+        stats = dict()
+        progress = ProgressTracker(progress_callback, status_callback, TRANSFER_STAGES)
+    else:
+        progress = ProgressTracker(progress_callback, status_callback, STAGES)
+        try:
+            plan = planSeparation(folder, exts, fstime, iskeep, progress, workers, cache_path, recursive,
+                                  keep_strategy, metrics, cancel_token, incremental=incremental,
+                                  scan_order=scan_order, filename_dates=filename_dates,
+                                  filename_patterns=filename_patterns)
+        except SeparationCancelled:
+            return {'msg': "Separation cancelled before any photo was moved.\n", 'resumed': False,
+                    'cancelled': True, 'metrics': metrics.report()}
+        stats = plan.get('stats', dict())
 
-    for i in flist:
-        outname = "{0}/{1}".format(folder, basename(i))
-        shutil.copy(i, outname)
+    result = executePlan(plan, progress, transfer_workers, status_callback, metrics, report_path, report_format,
+                         cancel_token, check_sources=False)
+    result.update(stats)
+    result['settings_ignored'] = settings_ignored
+    result['metrics'] = metrics.report()
+    result['msg'] = result['msg'] + "\n" + metrics.summary()
+    if settings_ignored:
+        result['msg'] = ("The settings of this run were not applied: an interrupted separation of the "
+                         "folder was resumed with its own settings.\n") + result['msg']
+    if perf_report:
+        metrics.writeReport(join(str(folder), PERF_REPORT_NAME))
+    return result
 
-def formatResult(flights, photos):
+class SeparationSession(object):
+    '''
+    Journal and state shared by the flights that streamSeparation or FlightWatch separate one at a time.
+
+    The journal is read once. The first flight of the session begins it, unless an
+    interrupted separation is resumed first, and the next flights are appended to it,
+    so that undoSeparation reverts the whole session. Once state is set, the folder
+    state is kept in memory and each flight appends its changes to the state file.
+    The cost of a flight then does not grow with the length of the session.
+
+    :param folder: Full path to the folder containing photos.
+    :type folder: string
+
+    '''
+
+    def __init__(self, folder):
+        self.folder = str(folder)
+        self.journal = SeparationJournal(self.folder)
+        self.journal.load()
+        self.state = None
+        self.started = False
+        self.next_index = None
+
+    def resume(self, transfer_workers=TRANSFER_WORKERS, cancel_token=None):
+        """
+        Finish the separation a crash or a cancel interrupted, if any, as part of the session.
+
+        Returns
+        -------
+        resumed : boolean
+            True if an interrupted separation was found.
+
+        """
+
+        if not self.journal.isUnfinished():
+            return False
+        executePlan(self.journal.plan, None, transfer_workers, cancel_token=cancel_token, session=self)
+        return True
+
+def separatePhotos(folder, photos, seconds, fstime, iskeep, keep_strategy='auto', transfer_workers=TRANSFER_WORKERS,
+                   status_callback=None, cancel_token=None, session=None):
     """
-    Format the processing result of function flightSeparator to be displayed as log in the main UI.
+    Separate photos whose capture times are already known, incrementally.
+
+    The photos are grouped with the flights of earlier incremental runs as in
+    planSeparation with incremental=True, then moved or copied with executePlan.
 
     Parameters
     ----------
-    flights : 1D list
-        Contains fullpath of the flight folders which photos will be moved to.
+    folder : string
+        Full path to the folder containing photos.
     photos : 1D list
-        Contains photo names.
+        Contains fullpath to photos within folder.
+    seconds : 1D list
+        Capture time of each photo, see dateToSeconds.
+    fstime : int
+        Maximum allowable time difference (in seconds) between consecutive photos within the same flight.
+    iskeep: boolean
+        Keep one copy of the photos in the input folder or not
+    keep_strategy : string, optional
+        How photos are kept when iskeep is True. The default is 'auto'.
+    transfer_workers : int, optional
+        Number of photos moved or copied at the same time. The default is TRANSFER_WORKERS.
+    status_callback : object, optional
+        Object to show the transfer progress in the main UI. The default is None.
+    cancel_token : CancelToken, optional
+        Checked before each photo is moved. The default is None.
+    session : SeparationSession, optional
+        Session the photos are one flight of, see executePlan. The default is None.
 
     Returns
     -------
-    log : string
-        Formatted string as log.
+    dict
+        Result of executePlan, and the executed plan as 'plan'.
 
     """
 
-    log = list()
-    len_s = len(flights[0])
-
-    n_flights = len(flights)
-    log.append("Number of flights detected: {0}".format(n_flights))
-    for i in range(0, n_flights):
-        log.append("-" * len_s)
-        log.append(flights[i])
-        r_ = ["{0}: {1}".format(basename(e[0]), e[1]) for e in photos[i]]
-        log = log + r_
+    folder = str(folder)
+    records = PhotoRecords()
+    records.extend(photos, seconds)
+    if session is not None and session.state is not None:
+        state = session.state
+    else:
+        state = SeparationState(folder)
+        state.load()
+    if session is None or session.next_index is None:
+        first_index = _nextFlightIndex(folder, state.flights)
+    else:
+        first_index = session.next_index
+    # flights farther than fstime from all the photos cannot take any of them
+    low, high = min(seconds) - fstime, max(seconds) + fstime
+    nearby = [f for f in state.flights if f['stop'] >= low and f['start'] <= high]
+    groups = _incrementalFlights(records, nearby, fstime, first_index)
+    if session is not None:
+        session.next_index = max(first_index, _nextFlightIndex(folder, [{'folder': g[0]} for g in groups]))
+    plan = _buildPlan(folder, records, groups, iskeep, keep_strategy)
+    plan['incremental'] = True
 
-    log = "\n".join(str(x) for x in log)
-    log = log + "\n"
-    return log
+    result = executePlan(plan, None, transfer_workers, status_callback, cancel_token=cancel_token,
+                         check_sources=False, session=session)
+    result['plan'] = plan
+    return result
 
-def flightSeparator(folder, exts, fstime, iskeep, progress_callback):
+def streamSeparation(folder, exts, fstime, iskeep, progress_callback=None, workers=None, recursive=False,
+                     keep_strategy='auto', transfer_workers=TRANSFER_WORKERS, status_callback=None,
+                     report_path=None, report_format='txt', window=None, cancel_token=None, perf_report=False):
     """
-    Group photos into flights and move to separate folders
+    Separate photos while they are read: each flight is moved as soon as it is closed.
+
+    Photos are read in name order within each folder (DCIM order), which mostly
+    follows capture order, and fed to an OnlineClusterer. A closed flight is handed to
+    separatePhotos, so it joins the flight folder of an earlier incremental run when
+    close enough and the folder state is kept up to date.
+
+    Discovery, date extraction, clustering and transfer run at the same time as the
+    stages of a Pipeline. Each has its own threads, the exif stage one per worker
+    process, and bounded queues between them: STREAM_AHEAD chunks of STREAM_CHUNK photos
+    per worker before the exif and cluster stages, STREAM_PENDING flights before the
+    transfer. The run then takes about the time of its slowest stage.
 
     Parameters
     ----------
@@ -217,8 +1891,30 @@ def flightSeparator(folder, exts, fstime, iskeep, progress_callback):
         Maximum allowable time difference (in seconds) between consecutive photos within the same flight.
     iskeep: boolean
         Keep one copy of the photos in the input folder or not
-    progress_callback : object
+    progress_callback : object, optional
         Object to update progress to the main UI.
+    workers : int, optional
+        Number of processes used to extract photo dates. The default is None, one per CPU.
+    recursive : boolean, optional
+        Also separate photos in subfolders. The default is False.
+    keep_strategy : string, optional
+        How photos are kept when iskeep is True. The default is 'auto'.
+    transfer_workers : int, optional
+        Number of photos moved or copied at the same time. The default is TRANSFER_WORKERS.
+    status_callback : object, optional
+        Object to show the stage, photos/s and time left in the main UI. The default is None.
+    report_path : string, optional
+        Full path to a report file listing every photo. msg then only holds a short
+        summary. The default is None, the full list is in msg.
+    report_format : string, optional
+        'txt', 'csv' or 'jsonl'. The default is 'txt'.
+    window : int, optional
+        How late (capture seconds) a photo may come in name order and still be
+        clustered as if sorted, see OnlineClusterer. The default is None, fstime.
+    cancel_token : CancelToken, optional
+        Checked between chunks of photos read and before each photo moved. The default is None.
+    perf_report : boolean, optional
+        Write the pipeline statistics to PERF_REPORT_NAME in the folder. The default is False.
 
     Raises
     ------
@@ -228,44 +1924,192 @@ def flightSeparator(folder, exts, fstime, iskeep, progress_callback):
     Returns
     -------
     dict
-        Contains one element:
+        Contains the elements:
             - msg: log to be displayed in the main UI.
+            - resumed: True if an interrupted separation was finished first.
+            - cancelled: True if the separation was cancelled.
+            - flights: number of flight folders receiving photos.
+            - pipeline: busy and blocked time, items and queue depths of each stage,
+              see Pipeline.stats.
 
     """
-    photos = getPhotos(folder, exts)
 
-    if not photos:
-        raise Exception('No photo found.')
+    folder = str(folder)
+    # all flights go to one journal, undone together; a resumed run continues its session
+    session = SeparationSession(folder)
+    resumed = session.resume(transfer_workers, cancel_token)
 
-    # first, get date and time stamps
-    photo_dates = [getDateExif(i) for i in photos]
-    photo_timestamps = [int(x.timestamp()) for x in photo_dates]
+    if workers is None:
+        workers = cpu_count() or 1
+    progress = ProgressTracker(progress_callback, status_callback, STREAM_STAGES)
+    progress.stage('discovery')
+    state, kept = loadState(folder, exts, iskeep, workers, cancel_token=cancel_token)
+    # a state rebuilt from the flight folders is saved before the session loads it
+    state.save()
+    # the transfer stage has its own copy, discovery reads state meanwhile
+    session.state = SeparationState(folder)
+    session.state.load()
+    # the transfer stage updates the state file meanwhile, kept originals are added after
+    known = list()
+    progress.stage('scan')
 
-    # then, separate
-    flights = list()
-    flights.append(photos)
-    flights.append(photo_dates)
-    flights.append(photo_timestamps)
-    flights = clusterList(flights, fstime)
-
-    # finally, move photos into separate folders
-    n_processed = 0
-    n_photos = float(len(photos))
-    out_folders = list()
-    for i in range(0, len(flights)):
-        out_folder = join("{0}".format(folder), "FL_{0}.{1}".format(str(i), datetime.fromtimestamp(int(flights[i][0][2])).strftime("%Y_%m_%d.%I_%M")))
-        flist = [j[0] for j in flights[i]]
-        if iskeep is True:
-            copyFlight(flist, out_folder)
+    writer = None if report_path is None else ReportWriter(report_path, None, report_format)
+    out_folders, photos = list(), list()
+    clusterer = OnlineClusterer(fstime, window)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def readDates(paths):
+        if pool is None:
+            dates, n_bytes = _getDatesExif(paths)
         else:
-            moveFlight(flist, out_folder)
-        out_folders.append(out_folder)
+            dates, n_bytes = pool.submit(_getDatesExif, paths).result()
+        progress.advance(len(paths), n_bytes)
+        return [[(p, dateToSeconds(d)) for p, d in zip(paths, dates)]]
+
+    def cluster(chunk):
+        flights = list()
+        for path, seconds in chunk:
+            flights.extend(clusterer.push(path, seconds))
+        return flights
+
+    def separate(flight):
+        result = separatePhotos(folder, [r.path for r in flight], flight.timestamps, fstime, iskeep,
+                                keep_strategy, transfer_workers, None, cancel_token, session)
+        for f in result['plan']['flights']:
+            if writer is None:
+                out_folders.append(join(folder, f['folder']))
+                photos.append(_flightRecords(result['plan'], f))
+            else:
+                writer.writeFlight(join(folder, f['folder']), _flightRecords(result['plan'], f))
+        if result['cancelled']:
+            raise SeparationCancelled()
+        return []
+
+    pipeline = Pipeline(cancel_token)
+    pipeline.addStage('exif', readDates, workers, STREAM_AHEAD * workers)
+    pipeline.addStage('cluster', cluster, 1, STREAM_AHEAD * workers, finish=clusterer.flush)
+    pipeline.addStage('transfer', separate, 1, STREAM_PENDING)
+    cancelled = False
+    try:
+        pipeline.run('discovery', _discoverChunks(folder, exts, recursive, state, kept, known, progress,
+                                                  cancel_token))
+    except SeparationCancelled:
+        cancelled = True
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if writer is not None:
+            writer.close()
+        if known:
+            for rel, st in known:
+                session.state.addKnown(rel, st)
+            session.state.save()
+
+    if not cancelled and progress.total == 0:
+        raise Exception('No photo found.')
+    if cancelled:
+        log = "Separation cancelled, run again on the same folder to finish it.\n"
+    elif writer is not None:
+        log = writer.summary()
+    else:
+        log = formatResult(out_folders, photos)
+    if resumed:
+        log = "Resumed an interrupted separation.\n" + log
+    progress.finish()
+
+    n_flights = len(out_folders) if writer is None else writer.n_written
+    if perf_report:
+        with open(join(folder, PERF_REPORT_NAME), 'w', encoding='utf-8') as fh:
+            json.dump(pipeline.stats(), fh, indent=1)
+    return {'msg': log + "\n" + pipeline.summary(), 'resumed': resumed, 'cancelled': cancelled,
+            'flights': n_flights, 'pipeline': pipeline.stats()}
+
+def _undoPlan(plan, done, progress):
+    """
+    Revert the photos of a plan listed in done, last first, and remove the flight folders left empty.
+
+    Returns
+    -------
+    n_restored : int
+        Number of photos put back.
+
+    """
+
+    base = plan['folder']
+    n_restored = 0
+    # last photos first, in the reverse order of the separation
+    first = _planSize(plan)
+    for f in reversed(plan['flights']):
+        first = first - len(f['names'])
+        paths = list(_flightPaths(plan, f))
+        for k in range(len(paths) - 1, -1, -1):
+            if first + k not in done:
+                continue
+            progress.advance(1)
+            src, dst = join(base, paths[k][0]), join(base, paths[k][1])
+            if not exists(dst):
+                continue
+            if plan['iskeep']:
+                remove(dst)
+            elif not exists(src):
+                if not exists(dirname(src)):
+                    makedirs(dirname(src))
+                moveFile(dst, src)
+            n_restored = n_restored + 1
+
+    for f in plan['flights']:
+        out_folder = join(base, f['folder'])
+        if exists(out_folder) and not listdir(out_folder):
+            rmdir(out_folder)
+
+    return n_restored
+
+def undoSeparation(folder, progress_callback=None, status_callback=None):
+    """
+    Revert the last separation in the folder, using its journal.
+
+    Moved photos go back to where they were, kept copies are deleted and flight
+    folders left empty are removed. An interrupted separation is reverted as far
+    as it went. A streamSeparation or FlightWatch session is reverted as a whole,
+    every flight it moved. The incremental state of the folder is deleted.
+
+    Parameters
+    ----------
+    folder : string
+        Full path to the folder containing photos.
+    progress_callback : object, optional
+        Object to update progress to the main UI. The default is None.
+    status_callback : object, optional
+        Object to show photos/s and time left in the main UI. The default is None.
+
+    Raises
+    ------
+    Exception
+        1. No separation journal in the folder, or it was already undone.
+
+    Returns
+    -------
+    dict
+        Contains one element:
+            - msg: log to be displayed in the main UI.
+
+    """
+
+    journal = SeparationJournal(folder)
+    if not journal.load(all_parts=True) or journal.undone:
+        raise Exception('No separation to undo.')
+
+    progress = ProgressTracker(progress_callback, status_callback, UNDO_STAGES)
+    progress.stage('undo', sum(len(done) for _, done, _ in journal.parts))
+    n_restored = 0
+    for plan, done, _ in reversed(journal.parts):
+        n_restored = n_restored + _undoPlan(plan, done, progress)
 
-        # set progress
-        n_processed = n_processed + float(len(flist))
-        percent = (n_processed/n_photos) * 100
-        progress_callback.emit(percent)
+    journal.markUndone()
+    journal.close()
+    # the next incremental run rebuilds the state from the flight folders left
+    SeparationState(journal.plan['folder']).clear()
+    progress.finish()
 
-    log = formatResult(out_folders, flights)
+    return {'msg': "Separation undone: {0} photos restored.\n".format(n_restored)}
 
-    return {'msg': log}
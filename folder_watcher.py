@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from os.path import join, splitext
+
+from flight_separator import (extractDates, getDateExif, loadState, separatePhotos, normalizeExts,
+                              SeparationSession)
+from file_transfer import TRANSFER_WORKERS
+from job_control import SeparationCancelled
+from online_clusterer import OnlineClusterer
+from timestamp_cache import dateToSeconds
+
+# seconds between two scans of the polling watcher, also the longest wait between two checks
+POLL_INTERVAL = 1.0
+
+# photos held in the open flight at most, it is separated in parts beyond that
+MAX_OPEN_PHOTOS = 5000
+
+# inotify events of a file fully written in the folder, or moved into it
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher(object):
+    '''
+    New photos of a folder from Linux inotify, through ctypes.
+
+    Only files closed after writing or moved into the folder are reported, so a photo
+    being copied is reported once complete. Subfolders are not watched.
+
+    :param folder: Full path to the watched folder.
+    :type folder: string
+    :param exts: Supported photo extensions, case-insensitive.
+    :type exts: tuple
+
+    '''
+
+    def __init__(self, folder, exts=('.jpg',)):
+        self.folder = str(folder)
+        self.exts = normalizeExts(exts)
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            e = ctypes.get_errno()
+            raise OSError(e, os.strerror(e))
+        if libc.inotify_add_watch(self._fd, os.fsencode(self.folder), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+            e = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(e, os.strerror(e), self.folder)
+
+    def read(self, timeout):
+        """
+        Wait up to timeout seconds for new photos.
+
+        Returns
+        -------
+        names : 1D list
+            File names of the new photos.
+        rescan : boolean
+            True if events were lost (queue overflow), the folder must be listed again.
+
+        """
+
+        names = list()
+        rescan = False
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return names, rescan
+
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+            pos = 0
+            while pos < len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, pos)
+                pos = pos + _EVENT_HEADER.size
+                name = os.fsdecode(data[pos:pos + length].rstrip(b'\0'))
+                pos = pos + length
+                if mask & _IN_Q_OVERFLOW:
+                    rescan = True
+                elif name and splitext(name)[1].lower() in self.exts:
+                    names.append(name)
+
+        return names, rescan
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher(object):
+    '''
+    New photos of a folder by listing it again at each call, for systems without inotify.
+
+    A photo is reported once its size and modification time are the same in two
+    listings, so photos being copied are not read early. Only the current listing is
+    kept, memory follows the number of files in the folder, not the run time.
+
+    :param folder: Full path to the watched folder.
+    :type folder: string
+    :param exts: Supported photo extensions, case-insensitive.
+    :type exts: tuple
+
+    '''
+
+    def __init__(self, folder, exts=('.jpg',)):
+        self.folder = str(folder)
+        self.exts = normalizeExts(exts)
+        # name -> (size, mtime_ns, reported), photos there at start are left to the caller
+        self._files = {name: sig + (True,) for name, sig in self._list().items()}
+
+    def _list(self):
+        found = dict()
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if splitext(entry.name)[1].lower() in self.exts and entry.is_file():
+                    st = entry.stat()
+                    found[entry.name] = (st.st_size, st.st_mtime_ns)
+        return found
+
+    def read(self, timeout):
+        """
+        Wait timeout seconds, then report the photos added and settled since the last call.
+
+        Returns
+        -------
+        names : 1D list
+            File names of the new photos.
+        rescan : boolean
+            Always False.
+
+        """
+
+        time.sleep(timeout)
+        names = list()
+        files = dict()
+        for name, sig in self._list().items():
+            old = self._files.get(name)
+            reported = old is not None and old[2]
+            if not reported and old is not None and old[:2] == sig:
+                names.append(name)
+                reported = True
+            files[name] = sig + (reported,)
+        self._files = files
+        return names, False
+
+    def close(self):
+        self._files = dict()
+
+
+def openWatcher(folder, exts=('.jpg',), polling=False):
+    """
+    Watch a folder with inotify when available, by polling otherwise.
+    """
+
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(folder, exts)
+        except (OSError, AttributeError):
+            # e.g. inotify_init1 missing or the watch limit reached
+            pass
+    return PollingWatcher(folder, exts)
+
+
+class FlightWatch(object):
+    '''
+    Separate photos continuously as they land in a folder.
+
+    Arrived photos are read in batches and fed to an OnlineClusterer, which closes a
+    flight once a photo is taken more than fstime (plus the out-of-order window) after
+    it. fstime seconds of wall-clock time without any new photo also close it. A closed
+    flight is moved (or copied) at once with separatePhotos, so it joins the flight
+    folder of an earlier run when close enough. Only the open flight is held in
+    memory, at most MAX_OPEN_PHOTOS photos of it.
+
+    Photos already in the folder when the watch starts are separated first. When the
+    watch stops, photos of the open flight stay in the folder for the next start. The
+    flights separated during one watch share a journal and are undone together.
+
+    :param folder: Full path to the watched folder.
+    :type folder: string
+    :param exts: Supported photo extensions.
+    :type exts: tuple
+    :param fstime: Maximum time difference (seconds) between consecutive photos of a flight.
+    :type fstime: int
+    :param iskeep: Keep one copy of the photos in the folder or not.
+    :type iskeep: boolean
+    :param keep_strategy: How photos are kept when iskeep is True.
+    :type keep_strategy: string
+    :param workers: Processes reading photo dates of a large batch. None is one per CPU.
+    :type workers: int
+    :param cache_path: Timestamp cache database, used for photos found at start.
+    :type cache_path: string
+    :param transfer_workers: Number of photos moved or copied at the same time.
+    :type transfer_workers: int
+    :param status_callback: Object with an emit(text) method, receives what the watch is doing.
+    :type status_callback: object
+    :param result_callback: Object with an emit(result) method, receives the result of each separation.
+    :type result_callback: object
+    :param cancel_token: Stops (or pauses) the watch from another thread.
+    :type cancel_token: CancelToken
+    :param polling: Poll the folder even where inotify is available.
+    :type polling: boolean
+    :param window: How late (capture seconds) a photo may arrive and still be ordered. None is fstime.
+    :type window: int
+
+    '''
+
+    def __init__(self, folder, exts, fstime, iskeep, keep_strategy='auto', workers=None, cache_path=None,
+                 transfer_workers=TRANSFER_WORKERS, status_callback=None, result_callback=None,
+                 cancel_token=None, polling=False, window=None):
+        self.folder = str(folder)
+        self.exts = exts
+        self.fstime = fstime
+        self.iskeep = iskeep
+        self.keep_strategy = keep_strategy
+        self.workers = workers
+        self.cache_path = cache_path
+        self.transfer_workers = transfer_workers
+        self.status_callback = status_callback
+        self.result_callback = result_callback
+        self.cancel_token = cancel_token
+        self.polling = polling
+
+        self.n_separated = 0
+        self._session = SeparationSession(self.folder)
+        self._clusterer = OnlineClusterer(fstime, window, MAX_OPEN_PHOTOS)
+        self._last_arrival = None
+
+    def _status(self, text):
+        if self.status_callback is not None:
+            self.status_callback.emit(text)
+
+    def _readDates(self, paths):
+        """
+        Capture times of newly arrived photos, photos without a readable date are skipped.
+        """
+
+        try:
+            dates = extractDates(paths, self.workers)
+            return list(zip(paths, dates))
+        except Exception:
+            pass
+
+        # one bad photo fails the batch, read them one by one to find it
+        found = list()
+        for p in paths:
+            try:
+                found.append((p, getDateExif(p)))
+            except Exception as e:
+                self._status("Skipped {0}: no capture date ({1})".format(p, e))
+        return found
+
+    def _separate(self, flights):
+        for flight in flights:
+            self._status("Separating {0} photos".format(len(flight)))
+            # the flights of one watch go to one journal, undone together
+            result = separatePhotos(self.folder, [r.path for r in flight], flight.timestamps, self.fstime,
+                                    self.iskeep, self.keep_strategy, self.transfer_workers,
+                                    session=self._session)
+            self.n_separated = self.n_separated + len(flight)
+            if self.result_callback is not None:
+                self.result_callback.emit(result)
+
+    def closeFlight(self):
+        """
+        Separate the photos of the open flight now.
+        """
+
+        self._separate(self._clusterer.flush())
+
+    def add(self, names):
+        """
+        Read newly arrived photos and feed them to the open flight, in capture order.
+        """
+
+        paths = [join(self.folder, n) for n in names if os.path.isfile(join(self.folder, n))]
+        if not paths:
+            return
+        self._last_arrival = time.monotonic()
+        for t, p in sorted((dateToSeconds(d), p) for p, d in self._readDates(paths)):
+            self._separate(self._clusterer.push(p, t))
+        self._status("Watching {0}: {1} photos in the open flight, {2} separated".format(
+            self.folder, len(self._clusterer), self.n_separated))
+
+    def _existing(self):
+        """
+        Names of the photos already in the folder and not separated yet.
+        """
+
+        state, kept = loadState(self.folder, self.exts, self.iskeep, self.workers, self.cache_path)
+        exts = normalizeExts(self.exts)
+        names = list()
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if splitext(entry.name)[1].lower() not in exts or not entry.is_file():
+                    continue
+                st = entry.stat()
+                if state.isKnown(entry.name, st):
+                    continue
+                if (entry.name, st.st_size) in kept:
+                    state.addKnown(entry.name, st)
+                    continue
+                names.append(entry.name)
+        state.save()
+        # the flights of the watch update this state in memory, see SeparationSession
+        self._session.state = state
+        return names
+
+    def run(self):
+        """
+        Watch the folder until the cancel token is cancelled.
+
+        Returns
+        -------
+        n_separated : int
+            Number of photos separated.
+
+        """
+
+        if self._session.journal.isUnfinished():
+            # finish the separation a crash interrupted
+            self._status("Resuming an interrupted separation")
+            self._session.resume(self.transfer_workers)
+
+        watcher = openWatcher(self.folder, self.exts, self.polling)
+        try:
+            self.add(self._existing())
+            self.closeFlight()
+            self._status("Watching {0}".format(self.folder))
+            while True:
+                if self.cancel_token is not None:
+                    self.cancel_token.checkpoint()
+                timeout = POLL_INTERVAL
+                if len(self._clusterer):
+                    idle = time.monotonic() - self._last_arrival
+                    if idle >= self.fstime:
+                        self.closeFlight()
+                    else:
+                        timeout = min(timeout, self.fstime - idle)
+                names, rescan = watcher.read(timeout)
+                if rescan:
+                    # photos held by the clusterer are still in the folder, do not add them twice
+                    self.closeFlight()
+                    names = self._existing()
+                if names:
+                    self.add(names)
+        except SeparationCancelled:
+            pass
+        finally:
+            watcher.close()
+
+        return self.n_separated
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# reads faster than this (seconds) are local or cached, they are done inline
+PREFETCH_MIN_LATENCY = 0.0005
+# header reads in flight at most, per process
+PREFETCH_MAX_INFLIGHT = 32
+# weight of a new latency sample in the recent and long-term moving averages
+LATENCY_SMOOTHING = 0.1
+LATENCY_BASELINE_SMOOTHING = 0.01
+# share of the way to the new limit taken at each sample
+LIMIT_SMOOTHING = 0.5
+
+_O_BINARY = getattr(os, 'O_BINARY', 0)
+
+
+def readHead(filepath, nbytes):
+    """
+    Read the first bytes of a file with a single read.
+
+    Parameters
+    ----------
+    filepath : string
+        Full path to the file.
+    nbytes : int
+        Number of bytes to read at most.
+
+    Returns
+    -------
+    head : bytes
+        The first nbytes of the file, fewer if the file is smaller.
+
+    """
+
+    fd = os.open(filepath, os.O_RDONLY | _O_BINARY)
+    try:
+        if hasattr(os, 'pread'):
+            return os.pread(fd, nbytes, 0)
+        return os.read(fd, nbytes)
+    finally:
+        os.close(fd)
+
+
+class HeaderPrefetcher(object):
+    '''
+    Read the headers of many files with several reads in flight, for network shares.
+
+    On SMB/NFS mounts each open and small read waits a round trip of a few milliseconds,
+    so reading headers one after the other mostly waits. While reads stay faster than
+    min_latency (local disks, page cache) they are done inline, as threads would only add
+    overhead. Slower reads go to a thread pool, the number in flight following the
+    observed latency: it grows while the recent latency stays near its long-term
+    average, and shrinks in proportion when the recent latency rises above it, i.e.
+    when the server starts queueing the reads.
+
+    Usage:
+
+        prefetcher = HeaderPrefetcher(16 * 1024)
+        for path, head in prefetcher.heads(paths):
+            parse(head)
+
+    :param nbytes: Number of bytes read from the start of each file.
+    :type nbytes: int
+    :param max_inflight: Reads in flight at most.
+    :type max_inflight: int
+    :param min_latency: Reads faster than this (seconds) on average are done inline.
+    :type min_latency: float
+
+    '''
+
+    def __init__(self, nbytes, max_inflight=PREFETCH_MAX_INFLIGHT, min_latency=PREFETCH_MIN_LATENCY):
+        self.nbytes = nbytes
+        self.max_inflight = max(1, max_inflight)
+        self.min_latency = min_latency
+        self.limit = 1
+        self.latency = None
+        self.baseline = None
+        self._pool = None
+        self._pid = None
+
+    def heads(self, paths):
+        """
+        Yield (path, head) of each file, in input order.
+
+        Raises
+        ------
+        OSError
+            A file cannot be read, when its turn comes.
+
+        """
+
+        paths = iter(paths)
+        inflight = deque()
+        try:
+            while True:
+                if not inflight and (self.max_inflight <= 1 or self.latency is None
+                                     or self.latency < self.min_latency):
+                    path = next(paths, None)
+                    if path is None:
+                        return
+                    latency, head = self._timedRead(path)
+                    self._adapt(latency)
+                    yield path, head
+                    continue
+
+                while len(inflight) < int(self.limit):
+                    path = next(paths, None)
+                    if path is None:
+                        break
+                    inflight.append((path, self._submit(path)))
+                if not inflight:
+                    return
+                path, future = inflight.popleft()
+                latency, head = future.result()
+                self._adapt(latency)
+                yield path, head
+        finally:
+            for _, future in inflight:
+                future.cancel()
+
+    def close(self):
+        if self._pool is not None and self._pid == os.getpid():
+            self._pool.shutdown(wait=True)
+        self._pool = None
+
+    def _submit(self, path):
+        # threads do not survive a fork, e.g. into the workers of a process pool
+        if self._pool is None or self._pid != os.getpid():
+            self._pool = ThreadPoolExecutor(max_workers=self.max_inflight, thread_name_prefix='prefetch')
+            self._pid = os.getpid()
+        return self._pool.submit(self._timedRead, path)
+
+    def _timedRead(self, path):
+        start = time.perf_counter()
+        head = readHead(path, self.nbytes)
+        return time.perf_counter() - start, head
+
+    def _adapt(self, latency):
+        if self.latency is None:
+            self.latency = self.baseline = latency
+        else:
+            self.latency = self.latency + LATENCY_SMOOTHING * (latency - self.latency)
+            self.baseline = self.baseline + LATENCY_BASELINE_SMOOTHING * (latency - self.baseline)
+        if self.latency < self.min_latency:
+            self.limit = 1
+            return
+
+        # 1 while the share keeps up, down to 0.5 as reads queue on the server
+        gradient = min(max(self.baseline / self.latency, 0.5), 1.0)
+        # 2 more reads than the share handled at the baseline latency, to probe for more
+        target = self.limit * gradient + 2
+        self.limit = min(max(self.limit + LIMIT_SMOOTHING * (target - self.limit), 2), self.max_inflight)
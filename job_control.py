@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import threading
+
+
+class SeparationCancelled(Exception):
+    """
+    Raised at a checkpoint of a cancelled separation.
+    """
+
+
+class CancelToken(object):
+    '''
+    Cancel or pause a running separation from another thread.
+
+    The separation calls checkpoint() between units of work, e.g. before each photo
+    is read or moved: it blocks there while paused, and raises SeparationCancelled
+    once cancelled.
+
+    '''
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    def cancel(self):
+        self._cancelled.set()
+        # a paused separation must wake up to stop
+        self._running.set()
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def isCancelled(self):
+        return self._cancelled.is_set()
+
+    def isPaused(self):
+        return not self._running.is_set()
+
+    def checkpoint(self):
+        """
+        Wait while paused, raise SeparationCancelled if cancelled.
+        """
+
+        self._running.wait()
+        if self._cancelled.is_set():
+            raise SeparationCancelled('Cancelled by user.')
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import json
+import threading
+from array import array
+from os import fsync
+from os.path import exists, join
+
+# journal file written in the input folder
+JOURNAL_NAME = '.flight_separator.journal'
+
+# number of finished photos recorded at once
+JOURNAL_BATCH = 256
+
+
+def jsonDefault(obj):
+    """
+    Serialize the array columns of a plan as JSON lists, for json.dump.
+    """
+
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError('{0} is not JSON serializable'.format(type(obj).__name__))
+
+
+class SeparationJournal(object):
+    '''
+    Append-only write-ahead journal of a separation, one JSON record per line.
+
+    The plan is written and synced before any photo is moved, then finished photos
+    are recorded in batches:
+
+        {"plan": {...}}
+        {"done": [0, 1, 2, ...]}
+        ...
+        {"complete": true}
+
+    A journal without its "complete" record belongs to an interrupted run, which can
+    be resumed from the plan. Photos of the plan found at neither their source nor their
+    destination on resume are recorded as {"skipped": [...]}. An {"undone": true} record
+    marks a reverted separation.
+
+    A session moving one flight at a time (streamSeparation, FlightWatch) appends the
+    plan of each further flight as {"plan": {...}, "append": true}, followed by its own
+    records. plan, done, skipped and complete are those of the last plan. load(all_parts=True)
+    also fills parts with (plan, done, skipped) of every plan of the session, so that it
+    is undone as a whole; otherwise only the last plan is held in memory. A session keeps
+    one journal object for all its flights, so the file is read once.
+
+    :param folder: Full path to the folder containing photos.
+    :type folder: string
+
+    '''
+
+    def __init__(self, folder):
+        self.path = join(folder, JOURNAL_NAME)
+        self.plan = None
+        self.done = set()
+        self.skipped = set()
+        self.complete = False
+        self.undone = False
+        self.parts = list()
+
+        self._fh = None
+        self._pending = list()
+        self._pending_skipped = list()
+        self._lock = threading.Lock()
+
+    def load(self, all_parts=False):
+        """
+        Read the journal of the last separation in the folder, if any.
+
+        Parameters
+        ----------
+        all_parts : boolean, optional
+            Keep every plan of a session in parts, e.g. to undo it. The default is False,
+            only the last one is kept.
+
+        Returns
+        -------
+        found : boolean
+            True if a journal with a plan was found.
+
+        """
+
+        if not exists(self.path):
+            return False
+
+        with open(self.path, 'r', encoding='utf-8') as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # last line cut by a crash, the records before it are valid
+                    break
+                if 'plan' in record:
+                    if not record.get('append') or not all_parts:
+                        self.parts = list()
+                    if not record.get('append'):
+                        self.undone = False
+                    self._startPart(record['plan'])
+                elif 'done' in record:
+                    self.done.update(record['done'])
+                elif 'skipped' in record:
+                    self.skipped.update(record['skipped'])
+                elif record.get('complete'):
+                    self.complete = True
+                elif record.get('undone'):
+                    self.undone = True
+
+        return self.plan is not None
+
+    def isUnfinished(self):
+        return self.plan is not None and not self.complete and not self.undone
+
+    def _startPart(self, plan):
+        self.plan = plan
+        self.done = set()
+        self.skipped = set()
+        self.complete = False
+        self.parts.append((self.plan, self.done, self.skipped))
+
+    def begin(self, plan, append=False):
+        """
+        Start a new journal with the plan, synced to disk before returning.
+
+        With append, the plan is added to the session of the journal loaded with load() instead.
+        """
+
+        if append:
+            self._fh = open(self.path, 'a', encoding='utf-8')
+            record = {'plan': plan, 'append': True}
+        else:
+            self.undone = False
+            self._fh = open(self.path, 'w', encoding='utf-8')
+            record = {'plan': plan}
+        # the plans before are not needed in memory, load(all_parts=True) reads them back
+        self.parts = list()
+        self._startPart(plan)
+        self._write(record)
+
+    def resume(self):
+        """
+        Continue appending to the journal loaded with load().
+        """
+
+        self._fh = open(self.path, 'a', encoding='utf-8')
+
+    def markDone(self, index):
+        """
+        Record a finished photo, written with the next batch. Thread-safe.
+
+        Parameters
+        ----------
+        index : int
+            Position of the photo in the plan, counting over all flights.
+
+        """
+
+        with self._lock:
+            self.done.add(index)
+            self._pending.append(index)
+            if len(self._pending) >= JOURNAL_BATCH:
+                self._flushPending()
+
+    def markSkipped(self, index):
+        """
+        Record a photo of the plan that can no longer be moved, written with the next batch. Thread-safe.
+        """
+
+        with self._lock:
+            self.skipped.add(index)
+            self._pending_skipped.append(index)
+
+    def flush(self):
+        with self._lock:
+            self._flushPending()
+
+    def _flushPending(self):
+        if self._pending:
+            self._write({'done': self._pending})
+            self._pending = list()
+        if self._pending_skipped:
+            self._write({'skipped': self._pending_skipped})
+            self._pending_skipped = list()
+
+    def markComplete(self):
+        self.flush()
+        self.complete = True
+        self._write({'complete': True})
+
+    def markUndone(self):
+        if self._fh is None:
+            self.resume()
+        self.undone = True
+        self._write({'undone': True})
+
+    def _write(self, record):
+        self._fh.write(json.dumps(record, separators=(',', ':'), default=jsonDefault) + '\n')
+        self._fh.flush()
+        fsync(self._fh.fileno())
+
+    def close(self):
+        if self._fh is not None:
+            self.flush()
+            self._fh.close()
+            self._fh = None
@@ -29,19 +29,20 @@
  ******************************************************************************************/
 """
 
-from PyQt5.QtWidgets import QMainWindow, QFileDialog, QApplication, QMessageBox, QLineEdit
+from PyQt5.QtWidgets import QMainWindow, QFileDialog, QApplication, QMessageBox, QLineEdit, QDialogButtonBox
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, pyqtSlot, QThreadPool, QDateTime, Qt
-from PyQt5.uic import loadUiType
 
 import traceback, sys
-from os.path import abspath, join
+from multiprocessing import freeze_support
+from os.path import abspath, join, exists, getmtime
 
-import resources_rc
 import folder_edit
-from flight_separator import flightSeparator
+from job_control import CancelToken
 
 MAX_THREADS = 2
+# processes used to extract photo dates, None uses one per CPU
+EXTRACT_WORKERS = None
 
 
 def resourcePath(relative_path):
@@ -55,7 +56,30 @@ def resourcePath(relative_path):
     return join(base_path, relative_path)
 
 
-FORM_CLASS,_ = loadUiType(resourcePath('main.ui'))
+def loadFormClass():
+    """
+    Get the main window form class.
+
+    The form precompiled by build_ui.py (main_ui.py) is used, main.ui is only parsed
+    when it is missing or older than main.ui.
+    """
+
+    ui_path = resourcePath('main.ui')
+    try:
+        import main_ui
+    except ImportError:
+        main_ui = None
+
+    if main_ui is not None:
+        # the frozen executable ships only the precompiled form
+        if getattr(sys, 'frozen', False) or not exists(ui_path) or getmtime(ui_path) <= getmtime(main_ui.__file__):
+            return main_ui.Ui_MainWindow
+
+    from PyQt5.uic import loadUiType
+    return loadUiType(ui_path)[0]
+
+
+FORM_CLASS = loadFormClass()
 
 
 class WorkerSignals(QObject):
@@ -74,13 +98,17 @@ class WorkerSignals(QObject):
         object data returned from processing, anything
 
     progress
-        int indicating % progress
+        float indicating % progress
+
+    status
+        str describing the current work, e.g. transfer throughput
 
     '''
     finished = pyqtSignal()
     error = pyqtSignal(tuple)
     result = pyqtSignal(object)
-    progress = pyqtSignal(int)
+    progress = pyqtSignal(float)
+    status = pyqtSignal(str)
 
 
 class Worker(QRunnable):
@@ -106,8 +134,9 @@ class Worker(QRunnable):
         self.kwargs = kwargs
         self.signals = WorkerSignals()
 
-        # Add the callback to our kwargs
+        # Add the callbacks to our kwargs
         self.kwargs['progress_callback'] = self.signals.progress
+        self.kwargs['status_callback'] = self.signals.status
 
     @pyqtSlot()
     def run(self):
@@ -117,7 +146,7 @@ class Worker(QRunnable):
 
         # Retrieve args/kwargs here; and fire processing using them
         try:
-            result = self.func(self.args[0], self.args[1], self.args[2], self.args[3], **self.kwargs)
+            result = self.func(*self.args, **self.kwargs)
         except:
             exctype, value = sys.exc_info()[:2]
             self.signals.error.emit((exctype, value, traceback.format_exc()))
@@ -139,6 +168,7 @@ class Main(QMainWindow, FORM_CLASS):
         # initialize input variables
         self.fs_folder_name = None
         self.fs_stime = 1
+        self.cancel_token = None
         self.threadpool = QThreadPool()
         self.threadpool.setMaxThreadCount(MAX_THREADS)
 
@@ -151,6 +181,9 @@ class Main(QMainWindow, FORM_CLASS):
         self.fs_clearlog.clicked.connect(self.onClearLog)
         self.fs_copylog.clicked.connect(self.onCopyLog)
         self.fs_savelog.clicked.connect(self.onSaveLog)
+        self.fs_pause.clicked.connect(self.onPause)
+        self.fs_cancel.clicked.connect(self.onCancel)
+        self.fs_undo.clicked.connect(self.onUndo)
         self.fs_clearlog.setIcon(QIcon(join(resourcePath('icon'), 'erase.png')))
         self.fs_copylog.setIcon(QIcon(join(resourcePath('icon'), 'copypaste.png')))
         self.fs_savelog.setIcon(QIcon(join(resourcePath('icon'), 'save2file.png')))
@@ -211,14 +244,129 @@ class Main(QMainWindow, FORM_CLASS):
         """
 
         if self.fs_folder_name is not None:
+            # the separation engine is imported on first use to keep startup fast
+            from flight_separator import flightSeparator, REPORT_NAME
+            from timestamp_cache import defaultCachePath
+
             c_fs_stime = self.fs_stime * 60
             iskeep = self.fs_checkbox.isChecked()
-            worker = Worker(flightSeparator, self.fs_folder_name, (".jpg"), c_fs_stime, iskeep)
+            self.cancel_token = CancelToken()
+            worker = Worker(flightSeparator, self.fs_folder_name, (".jpg",), c_fs_stime, iskeep,
+                            workers=EXTRACT_WORKERS, cache_path=defaultCachePath(),
+                            report_path=join(self.fs_folder_name, REPORT_NAME), cancel_token=self.cancel_token,
+                            incremental=self.fs_incremental.isChecked())
             worker.signals.result.connect(self.onWriteLog)
             worker.signals.progress.connect(self.onProgressUpdate)
+            worker.signals.status.connect(self.statusbar.showMessage)
             worker.signals.error.connect(self.onError)
+            worker.signals.finished.connect(self.onFinished)
+            self.setRunning(True)
             self.threadpool.start(worker)
 
+    def setRunning(self, running):
+        """
+        Enable the job controls while a separation runs, and the OK and Undo buttons otherwise.
+
+        Parameters
+        ----------
+        running : boolean
+            A separation is running.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.fs_button_box.button(QDialogButtonBox.Ok).setEnabled(not running)
+        self.fs_undo.setEnabled(not running)
+        self.fs_pause.setEnabled(running)
+        self.fs_cancel.setEnabled(running)
+        self.fs_pause.setText("Pause")
+
+    def onPause(self):
+        """
+        Pause the running separation, or resume it if paused.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        if self.cancel_token is None:
+            return
+        if self.cancel_token.isPaused():
+            self.cancel_token.resume()
+            self.fs_pause.setText("Pause")
+            self.statusbar.showMessage("Resumed")
+        else:
+            self.cancel_token.pause()
+            self.fs_pause.setText("Resume")
+            self.statusbar.showMessage("Paused")
+
+    def onCancel(self):
+        """
+        Cancel the running separation. Photos being moved are finished first.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+            self.fs_pause.setEnabled(False)
+            self.fs_cancel.setEnabled(False)
+            self.statusbar.showMessage("Cancelling...")
+
+    def onUndo(self):
+        """
+        Revert the last separation in the folder, finished, cancelled or interrupted.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        if not self.fs_folder_name:
+            return
+
+        answer = QMessageBox.question(self, "Undo separation",
+                                      "Put the photos of the last separation in\n{0}\nback where they were?".format(
+                                          self.fs_folder_name))
+        if answer != QMessageBox.Yes:
+            return
+
+        from flight_separator import undoSeparation
+
+        worker = Worker(undoSeparation, self.fs_folder_name)
+        worker.signals.result.connect(self.onWriteLog)
+        worker.signals.progress.connect(self.onProgressUpdate)
+        worker.signals.status.connect(self.statusbar.showMessage)
+        worker.signals.error.connect(self.onError)
+        worker.signals.finished.connect(self.onFinished)
+        self.setRunning(True)
+        # an undo cannot be paused or cancelled halfway
+        self.fs_pause.setEnabled(False)
+        self.fs_cancel.setEnabled(False)
+        self.threadpool.start(worker)
+
+    def onFinished(self):
+        """
+        Separation finished, successfully or not.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        self.cancel_token = None
+        self.setRunning(False)
+
     def onProgressUpdate(self, n):
         """
         Update processing progress.
@@ -331,4 +479,6 @@ def main():
     app.exec_()
 
 if __name__=='__main__':
+    # required by the process pool in the PyInstaller executable
+    freeze_support()
     main()
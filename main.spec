@@ -1,9 +1,15 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+import sys
+sys.path.insert(0, SPECPATH)
+from build_ui import buildUi
+
 block_cipher = None
 
+# precompile the form, main.ui is not shipped
+buildUi()
+
 added_files = [
-         ( 'main.ui', '.' ),
          ( 'icon/app.png', 'icon/' ),
 		 ( 'icon/copypaste.png', 'icon/' ),
 		 ( 'icon/erase.png', 'icon/' ),
@@ -14,7 +20,7 @@ a = Analysis(['main.py'],
              pathex=['your_path_to_FlightSeparator_folder'],
              binaries=[],
              datas=added_files,
-             hiddenimports=[],
+             hiddenimports=['main_ui', 'flight_separator', 'timestamp_cache'],
              hookspath=[],
              runtime_hooks=[],
              excludes=[],
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import heapq
+
+import numpy as np
+
+from photo_records import PhotoRecords
+
+
+class _OpenFlight(object):
+    '''
+    Photos of a flight not closed yet, with the span of their capture times.
+    '''
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.records = PhotoRecords()
+        self.first = None
+        self.last = None
+        self.sorted = True
+
+    def __len__(self):
+        return len(self.records)
+
+    def near(self, seconds, maxdiff):
+        return self.first - maxdiff <= seconds <= self.last + maxdiff
+
+    def append(self, path, seconds):
+        if len(self.records) and seconds < self.last:
+            self.sorted = False
+        self.records.append(path, seconds)
+        self.first = seconds if self.first is None else min(self.first, seconds)
+        self.last = seconds if self.last is None else max(self.last, seconds)
+
+    def close(self):
+        """
+        Return the photos in time order and start over empty.
+        """
+
+        flight = self.records
+        if not self.sorted:
+            order = np.argsort(np.asarray(flight.timestamps), kind='stable').tolist()
+            flight = PhotoRecords()
+            flight.extend((self.records.path(j) for j in order), (self.records.timestamps[j] for j in order))
+        self._reset()
+        return flight
+
+
+class OnlineClusterer(object):
+    '''
+    Gap clustering of photos arriving one at a time, closing each flight as soon as it is final.
+
+    Photos may arrive out of capture order by up to window seconds: they wait in a
+    buffer until no photo older than them can still arrive (the watermark, newest
+    time seen minus window), then join the open flight in time order. The open flight
+    closes once the watermark is more than maxdiff past its last photo. For photos
+    within the window the flights are the same as clusterIndices on all of them.
+
+    A photo later than the window joins the open flight if within maxdiff of it.
+    Otherwise it is gathered with the other late photos within maxdiff of one another,
+    returned together as one flight. Memory holds the open flight, the late photos
+    and the photos of the last window seconds. flush() starts over, so photos older
+    than the ones flushed, e.g. from another memory card, are clustered as usual.
+
+    :param maxdiff: Maximum allowable time difference between consecutive photos within the same flight.
+    :type maxdiff: int
+    :param window: How late (seconds) a photo may arrive. None is maxdiff.
+    :type window: int
+    :param max_photos: Close the open flight at this size, to bound memory. None is no limit.
+    :type max_photos: int
+
+    '''
+
+    def __init__(self, maxdiff, window=None, max_photos=None):
+        self.maxdiff = maxdiff
+        self.window = maxdiff if window is None else window
+        self.max_photos = max_photos
+        self.newest = None
+
+        self._buffer = list()
+        self._count = 0
+        self._open = _OpenFlight()
+        self._late = _OpenFlight()
+
+    def __len__(self):
+        """
+        Number of photos not returned in a flight yet.
+        """
+
+        return len(self._buffer) + len(self._open) + len(self._late)
+
+    def push(self, path, seconds):
+        """
+        Add a photo.
+
+        Returns
+        -------
+        flights : 1D list
+            PhotoRecords of the flights closed by this photo, in time order, often empty.
+
+        """
+
+        closed = list()
+        if self.newest is not None and seconds < self.newest - self.window:
+            # too late for the buffer
+            if len(self._open) and self._open.near(seconds, self.maxdiff):
+                self._join(path, seconds, closed)
+                return closed
+            if len(self._late) and not self._late.near(seconds, self.maxdiff):
+                closed.append(self._late.close())
+            self._late.append(path, seconds)
+            if self.max_photos is not None and len(self._late) >= self.max_photos:
+                closed.append(self._late.close())
+            return closed
+
+        # the counter keeps photos of the same time in arrival order
+        heapq.heappush(self._buffer, (seconds, self._count, path))
+        self._count = self._count + 1
+        self.newest = seconds if self.newest is None else max(self.newest, seconds)
+
+        watermark = self.newest - self.window
+        while self._buffer and self._buffer[0][0] <= watermark:
+            t, _, p = heapq.heappop(self._buffer)
+            self._join(p, t, closed)
+        if len(self._open) and watermark > self._open.last + self.maxdiff:
+            closed.append(self._open.close())
+        return closed
+
+    def flush(self):
+        """
+        Close everything held, e.g. at the end of the input or when no photo came for a while.
+
+        Returns
+        -------
+        flights : 1D list
+            PhotoRecords of the remaining flights, in time order.
+
+        """
+
+        # late photos are older than the others
+        closed = [self._late.close()] if len(self._late) else list()
+        while self._buffer:
+            t, _, p = heapq.heappop(self._buffer)
+            self._join(p, t, closed)
+        if len(self._open):
+            closed.append(self._open.close())
+        # nothing is held any more, the next photo may be of any time
+        self.newest = None
+        return closed
+
+    def _join(self, path, seconds, closed):
+        if len(self._open) and seconds > self._open.last + self.maxdiff:
+            closed.append(self._open.close())
+        self._open.append(path, seconds)
+        if self.max_photos is not None and len(self._open) >= self.max_photos:
+            closed.append(self._open.close())
+
+
+def streamFlights(photos, maxdiff, window=None, max_photos=None):
+    """
+    Cluster a stream of photos into flights, yielding each flight as soon as it is closed.
+
+    Parameters
+    ----------
+    photos : iterable
+        Yields (path, seconds) of each photo, roughly in capture order, e.g. in DCIM order.
+    maxdiff : int
+        Maximum allowable time difference between consecutive photos within the same flight.
+    window : int, optional
+        How late (seconds) a photo may arrive, see OnlineClusterer. The default is None, maxdiff.
+    max_photos : int, optional
+        Split flights at this size. The default is None, no limit.
+
+    Yields
+    ------
+    flight : PhotoRecords
+        The photos of one flight, in time order.
+
+    """
+
+    clusterer = OnlineClusterer(maxdiff, window, max_photos)
+    for path, seconds in photos:
+        for flight in clusterer.push(path, seconds):
+            yield flight
+    for flight in clusterer.flush():
+        yield flight
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+from array import array
+from os.path import join, split
+
+from timestamp_cache import secondsToDate
+
+
+class PhotoRecord(object):
+    '''
+    Row view of one photo in a PhotoRecords, nothing is copied.
+
+    Unpacks as (path, date) like the tuples used before, the date is only built when asked.
+
+    '''
+
+    __slots__ = ('records', 'index')
+
+    def __init__(self, records, index):
+        self.records = records
+        self.index = index
+
+    @property
+    def folder(self):
+        return self.records.folder(self.index)
+
+    @property
+    def name(self):
+        return self.records.name(self.index)
+
+    @property
+    def path(self):
+        return self.records.path(self.index)
+
+    @property
+    def seconds(self):
+        return self.records.timestamps[self.index]
+
+    @property
+    def date(self):
+        return secondsToDate(self.records.timestamps[self.index])
+
+    def __iter__(self):
+        yield self.path
+        yield self.date
+
+    def __repr__(self):
+        return "PhotoRecord({0!r}, {1})".format(self.path, self.date)
+
+
+class PhotoRecords(object):
+    '''
+    Compact column store of photos: folder, name and capture time.
+
+    Capture times are int64 seconds (see timestamp_cache.dateToSeconds) in an array,
+    usable by NumPy without a copy (no photo can be appended while such a view is
+    alive). Each folder is stored once and photos keep its
+    index, so a photo costs its name plus 12 bytes instead of a path string, a
+    datetime and a list.
+
+    '''
+
+    __slots__ = ('timestamps', '_names', '_folder_index', '_folders', '_folder_ids')
+
+    def __init__(self):
+        self.timestamps = array('q')
+        self._names = list()
+        self._folder_index = array('I')
+        self._folders = list()
+        self._folder_ids = dict()
+
+    @classmethod
+    def fromColumns(cls, folders, folder_index, names, timestamps):
+        """
+        Records sharing the given columns, e.g. those of a plan flight, nothing is copied.
+
+        Parameters
+        ----------
+        folders : 1D list
+            Distinct folders.
+        folder_index : array
+            Index in folders of the folder of each photo.
+        names : 1D list
+            File name of each photo.
+        timestamps : array
+            Capture time of each photo in seconds.
+
+        """
+
+        records = cls()
+        records._folders = list(folders)
+        records._folder_ids = {f: i for i, f in enumerate(records._folders)}
+        records._folder_index = folder_index
+        records._names = names
+        records.timestamps = timestamps
+        return records
+
+    def append(self, path, seconds):
+        folder, name = split(path)
+        i = self._folder_ids.get(folder)
+        if i is None:
+            i = self._folder_ids[folder] = len(self._folders)
+            self._folders.append(folder)
+        self._folder_index.append(i)
+        self._names.append(name)
+        self.timestamps.append(seconds)
+
+    def extend(self, paths, seconds, base=None):
+        """
+        Append many photos, with paths relative to base if given.
+        """
+
+        folder_ids, folders = self._folder_ids, self._folders
+        folder_index, names, timestamps = self._folder_index, self._names, self.timestamps
+        # folder of the path as given -> folder index, joins base once per folder
+        known = dict()
+        for p, s in zip(paths, seconds):
+            folder, name = split(p)
+            i = known.get(folder)
+            if i is None:
+                full = folder if base is None else join(base, folder) if folder else base
+                i = folder_ids.get(full)
+                if i is None:
+                    i = folder_ids[full] = len(folders)
+                    folders.append(full)
+                known[folder] = i
+            folder_index.append(i)
+            names.append(name)
+            timestamps.append(s)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index = index + len(self.timestamps)
+        if not 0 <= index < len(self.timestamps):
+            raise IndexError('photo index out of range')
+        return PhotoRecord(self, index)
+
+    def __iter__(self):
+        return (PhotoRecord(self, i) for i in range(len(self.timestamps)))
+
+    def rows(self, indices):
+        """
+        Row views of the photos at indices, e.g. one flight.
+        """
+
+        return [PhotoRecord(self, i) for i in indices]
+
+    def folder(self, index):
+        return self._folders[self._folder_index[index]]
+
+    def folders(self):
+        """
+        Distinct folders, each photo refers to one of them.
+        """
+
+        return list(self._folders)
+
+    def folderIndex(self, index):
+        return self._folder_index[index]
+
+    def name(self, index):
+        return self._names[index]
+
+    def path(self, index):
+        return join(self._folders[self._folder_index[index]], self._names[index])
+
+    def date(self, index):
+        return secondsToDate(self.timestamps[index])
+
+    def namesAndDates(self):
+        """
+        Iterate over (file name, date) of the photos, building each date as it is reached.
+        """
+
+        return zip(self._names, map(secondsToDate, self.timestamps))
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import queue
+import threading
+import time
+
+# how often blocked workers look for an aborted pipeline, in seconds
+POLL_INTERVAL = 0.1
+
+_END = object()
+
+
+class PipelineStage(object):
+    '''
+    One stage of a Pipeline: a function run by its own worker threads on the items of a bounded queue.
+
+    The function takes an item and returns the items for the next stage, a list that may
+    be empty (e.g. a flight not closed yet) or hold several items. With more than one worker
+    the outputs are still passed on in input order. finish, if given, is called once after
+    the last item and returns the last outputs, e.g. the flights still open.
+
+    :param name: Name of the stage in the statistics.
+    :type name: str
+    :param function: Called with each item, returns a list of outputs.
+    :type function: callable
+    :param workers: Number of threads running function.
+    :type workers: int
+    :param queue_size: Number of items waiting for the stage at most, the producer blocks beyond.
+        0 is no queue, for the source of a pipeline.
+    :type queue_size: int
+    :param finish: Called without argument after the last item, returns a list of outputs.
+    :type finish: callable
+
+    '''
+
+    def __init__(self, name, function, workers=1, queue_size=1, finish=None):
+        self.name = name
+        self.function = function
+        self.workers = max(1, workers)
+        self.finish = finish
+        self.queue = queue.Queue(queue_size) if queue_size > 0 else None
+
+        self.items = 0
+        self.busy = 0.0
+        self.blocked = 0.0
+        self.max_depth = 0
+        self._depth_sum = 0
+        self._lock = threading.Lock()
+        self._turn = threading.Condition()
+        self._next_in = 0
+        self._next_out = 0
+        self._running = self.workers
+
+    def depth(self):
+        """
+        Number of items waiting for the stage now.
+        """
+
+        return self.queue.qsize() if self.queue is not None else 0
+
+    def stats(self, wall):
+        """
+        Statistics of the stage after wall seconds of pipeline run.
+        """
+
+        capacity = wall * self.workers
+        return {'name': self.name,
+                'workers': self.workers,
+                'items': self.items,
+                'busy_seconds': self.busy,
+                'utilization': self.busy / capacity if capacity > 0 else 0.0,
+                'blocked': self.blocked / capacity if capacity > 0 else 0.0,
+                'queue_size': self.queue.maxsize if self.queue is not None else 0,
+                'max_depth': self.max_depth,
+                'mean_depth': self._depth_sum / float(self.items) if self.items else 0.0}
+
+
+class Pipeline(object):
+    '''
+    Stages running at the same time on a stream of items, linked by bounded queues.
+
+    Every stage has its own threads, so a slow stage only slows down the stages before
+    it once its queue is full (backpressure), and the run takes about the time of the
+    slowest stage instead of the sum of all. The first error of any stage, or a
+    cancellation, stops all stages and is raised by run().
+
+    Usage:
+
+        pipeline = Pipeline(cancel_token)
+        pipeline.addStage('exif', readChunk, workers=4, queue_size=8)
+        pipeline.addStage('cluster', clusterChunk, queue_size=8, finish=flushFlights)
+        pipeline.addStage('transfer', moveFlight, queue_size=2)
+        pipeline.run('discovery', chunks)
+        print(pipeline.summary())
+
+    :param cancel_token: Checked before each item of each stage.
+    :type cancel_token: CancelToken
+
+    '''
+
+    def __init__(self, cancel_token=None):
+        self.cancel_token = cancel_token
+        self.stages = list()
+        self.source = None
+        self.wall = 0.0
+        self._abort = threading.Event()
+        self._error = None
+        self._error_lock = threading.Lock()
+
+    def addStage(self, name, function, workers=1, queue_size=1, finish=None):
+        """
+        Append a stage, see PipelineStage. Outputs of the last stage are dropped.
+        """
+
+        stage = PipelineStage(name, function, workers, queue_size, finish)
+        self.stages.append(stage)
+        return stage
+
+    def depths(self):
+        """
+        Number of items waiting for each stage now, by stage name.
+        """
+
+        return dict((s.name, s.depth()) for s in self.stages)
+
+    def run(self, source_name, source):
+        """
+        Feed the items of source through the stages, until all are done.
+
+        Parameters
+        ----------
+        source_name : str
+            Name of the source in the statistics, e.g. 'discovery'.
+        source : iterable
+            Items for the first stage. It is iterated in its own thread, with the time
+            spent in it counted as the source busy time.
+
+        Raises
+        ------
+        SeparationCancelled
+            The cancel token was cancelled.
+        Exception
+            The first error raised by a stage or the source.
+
+        """
+
+        self.source = PipelineStage(source_name, None, queue_size=0)
+        start = time.perf_counter()
+        threads = [threading.Thread(target=self._feed, args=(source,), name=source_name, daemon=True)]
+        for k, stage in enumerate(self.stages):
+            target = self.stages[k + 1] if k + 1 < len(self.stages) else None
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(target=self._work, args=(stage, target), name=stage.name,
+                                                daemon=True))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.wall = time.perf_counter() - start
+
+        if self._error is not None:
+            raise self._error
+
+    def stats(self):
+        """
+        Get the statistics of the last run as a JSON serializable dict.
+
+        Returns
+        -------
+        report : dict
+            Contains the elements:
+                - stages: one dict per stage, the source first, with name, workers, items,
+                  busy_seconds, utilization (busy share of the workers time), blocked (share
+                  of the workers time waiting for room in the next queue), queue_size,
+                  max_depth and mean_depth (items waiting in the queue of the stage).
+                - total_seconds: duration of the run.
+
+        """
+
+        stages = [self.source] if self.source is not None else list()
+        return {'stages': [s.stats(self.wall) for s in stages + self.stages],
+                'total_seconds': self.wall}
+
+    def summary(self):
+        """
+        Format the statistics as a log section.
+        """
+
+        report = self.stats()
+        log = ["Pipeline summary:"]
+        for s in report['stages']:
+            line = "  {0:<10} {1:2d} workers  {2:8d} items  {3:5.0%} busy  {4:5.0%} blocked".format(
+                s['name'], s['workers'], s['items'], s['utilization'], s['blocked'])
+            if s['queue_size']:
+                line = line + "  queue {0:5.1f} mean {1:3d} max of {2}".format(
+                    s['mean_depth'], s['max_depth'], s['queue_size'])
+            log.append(line)
+        log.append("  {0:<10} {1:8.3f} s".format('total', report['total_seconds']))
+
+        return "\n".join(log) + "\n"
+
+    def _fail(self, error):
+        with self._error_lock:
+            if self._error is None:
+                self._error = error
+        self._abort.set()
+
+    def _put(self, stage, target, item):
+        # blocks while the next queue is full, unless the pipeline is aborted
+        if target is None:
+            return
+        start = time.perf_counter()
+        while not self._abort.is_set():
+            try:
+                target.queue.put(item, timeout=POLL_INTERVAL)
+                break
+            except queue.Full:
+                pass
+        stage.blocked = stage.blocked + (time.perf_counter() - start)
+
+    def _get(self, stage):
+        while not self._abort.is_set():
+            try:
+                return stage.queue.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                pass
+        return _END
+
+    def _feed(self, source):
+        target = self.stages[0] if self.stages else None
+        stage = self.source
+        try:
+            items = iter(source)
+            while not self._abort.is_set():
+                start = time.perf_counter()
+                item = next(items, _END)
+                stage.busy = stage.busy + (time.perf_counter() - start)
+                if item is _END:
+                    break
+                stage.items = stage.items + 1
+                self._put(stage, target, (self._count(target), item))
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            self._put(stage, target, _END)
+
+    def _work(self, stage, target):
+        try:
+            while True:
+                entry = self._get(stage)
+                if entry is _END:
+                    # let the other workers of the stage see the end too
+                    try:
+                        stage.queue.put_nowait(_END)
+                    except queue.Full:
+                        pass
+                    break
+                if self.cancel_token is not None:
+                    self.cancel_token.checkpoint()
+                seq, item = entry
+                depth = stage.queue.qsize() + 1
+                with stage._lock:
+                    stage.items = stage.items + 1
+                    stage._depth_sum = stage._depth_sum + depth
+                    stage.max_depth = max(stage.max_depth, depth)
+
+                start = time.perf_counter()
+                outputs = stage.function(item)
+                elapsed = time.perf_counter() - start
+
+                # pass the outputs on in input order
+                with stage._turn:
+                    stage.busy = stage.busy + elapsed
+                    while stage._next_out != seq and not self._abort.is_set():
+                        stage._turn.wait(POLL_INTERVAL)
+                    for output in outputs:
+                        self._put(stage, target, (self._count(target), output))
+                    stage._next_out = seq + 1
+                    stage._turn.notify_all()
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            with stage._lock:
+                stage._running = stage._running - 1
+                last = stage._running == 0
+            if last:
+                if stage.finish is not None and not self._abort.is_set():
+                    try:
+                        for output in stage.finish():
+                            self._put(stage, target, (self._count(target), output))
+                    except BaseException as e:
+                        self._fail(e)
+                self._put(stage, target, _END)
+
+    def _count(self, stage):
+        # sequence number of the next item of the stage, called in output order
+        if stage is None:
+            return 0
+        seq = stage._next_in
+        stage._next_in = seq + 1
+        return seq
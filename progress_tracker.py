@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import threading
+import time
+
+# (name, label, weight) of each stage, weights are rough shares of the runtime
+STAGES = (('discovery', 'Finding photos', 5),
+          ('scan', 'Reading dates', 45),
+          ('cluster', 'Grouping flights', 5),
+          ('transfer', 'Transferring photos', 45))
+PLAN_STAGES = STAGES[:3]
+TRANSFER_STAGES = STAGES[3:]
+# streaming moves flights while reading dates, the scan stage covers both
+STREAM_STAGES = STAGES[:2]
+UNDO_STAGES = (('undo', 'Restoring photos', 1),)
+# at most 10 updates per second reach the UI, whatever the number of photos
+EMIT_INTERVAL = 0.1
+
+
+def _formatBytes(n):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if n < 1024.0:
+            return "{0:.1f} {1}".format(n, unit)
+        n = n / 1024.0
+    return "{0:.1f} TB".format(n)
+
+def _formatDuration(seconds):
+    seconds = int(seconds + 0.5)
+    if seconds >= 3600:
+        return "{0}:{1:02d}:{2:02d}".format(seconds // 3600, seconds // 60 % 60, seconds % 60)
+    return "{0}:{1:02d}".format(seconds // 60, seconds % 60)
+
+
+class ProgressTracker(object):
+    '''
+    Overall progress of a separation, across its weighted stages.
+
+    The stages report every unit of work with advance(), from any thread. The tracker
+    coalesces them and emits at most once per interval: the overall % to progress_callback,
+    and the stage, files/s and remaining time of the stage to status_callback. Entering or
+    finishing a stage always emits.
+
+    :param progress_callback: Object with an emit(percent) method, e.g. WorkerSignals.progress.
+    :type progress_callback: object
+    :param status_callback: Object with an emit(text) method, e.g. WorkerSignals.status.
+    :type status_callback: object
+    :param stages: (name, label, weight) of the stages, in running order.
+    :type stages: tuple
+    :param interval: Minimum time between two emissions, in seconds.
+    :type interval: float
+
+    '''
+
+    def __init__(self, progress_callback=None, status_callback=None, stages=STAGES, interval=EMIT_INTERVAL):
+        self.progress_callback = progress_callback
+        self.status_callback = status_callback
+        self.interval = interval
+
+        total_weight = float(sum(w for _, _, w in stages)) or 1.0
+        self._spans = dict()
+        start = 0.0
+        for name, label, weight in stages:
+            span = weight * 100.0 / total_weight
+            self._spans[name] = (label, start, span)
+            start = start + span
+
+        self._lock = threading.Lock()
+        self._last_emit = 0.0
+        self.name = None
+        self.total = 0
+        self.done = 0
+        self.nbytes = 0
+        self._start = time.perf_counter()
+
+    def stage(self, name, total=0):
+        """
+        Enter a stage, with total units of work to do, 0 if not known yet.
+        """
+
+        with self._lock:
+            self.name = name
+            self.total = total
+            self.done = 0
+            self.nbytes = 0
+            self._start = time.perf_counter()
+            self._emit()
+
+    def setTotal(self, total):
+        with self._lock:
+            self.total = total
+
+    def advance(self, n=1, nbytes=0):
+        """
+        Count n more units of work and nbytes more bytes done in the current stage.
+        """
+
+        with self._lock:
+            self.done = self.done + n
+            self.nbytes = self.nbytes + nbytes
+            if time.perf_counter() - self._last_emit >= self.interval:
+                self._emit()
+
+    def emit(self, percent):
+        """
+        Set the % done of the current stage, for code reporting percents only.
+        """
+
+        with self._lock:
+            if self.total > 0:
+                self.done = int(round(percent * self.total / 100.0))
+            else:
+                self.total, self.done = 100, int(percent)
+            if time.perf_counter() - self._last_emit >= self.interval:
+                self._emit()
+
+    def finish(self):
+        """
+        Mark the current stage as done.
+        """
+
+        with self._lock:
+            self.done = max(self.done, self.total)
+            self._emit()
+
+    def percent(self):
+        """
+        Overall progress, in %.
+        """
+
+        if self.name is None:
+            return 0.0
+        _, start, span = self._spans[self.name]
+        fraction = min(self.done / float(self.total), 1.0) if self.total > 0 else 0.0
+        return start + fraction * span
+
+    def rate(self):
+        """
+        Units of work done per second in the current stage.
+        """
+
+        elapsed = time.perf_counter() - self._start
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def eta(self):
+        """
+        Estimated seconds left in the current stage, None if unknown.
+        """
+
+        rate = self.rate()
+        if self.total <= 0 or rate <= 0:
+            return None
+        return max(self.total - self.done, 0) / rate
+
+    def statusText(self):
+        label = self._spans[self.name][0]
+        if self.total <= 0:
+            return "{0}: {1} found".format(label, self.done) if self.done else label + "..."
+
+        text = "{0}: {1} of {2} photos".format(label, self.done, self.total)
+        if not self.done:
+            return text
+        elapsed = time.perf_counter() - self._start
+        text = text + ", {0:.0f} photos/s".format(self.rate())
+        if self.nbytes and elapsed > 0:
+            text = text + ", {0}/s".format(_formatBytes(self.nbytes / elapsed))
+        eta = self.eta()
+        if eta is not None and self.done < self.total:
+            text = text + ", {0} left".format(_formatDuration(eta))
+        return text
+
+    def _emit(self):
+        # called with the lock held, so emissions are ordered
+        self._last_emit = time.perf_counter()
+        if self.status_callback is not None and self.name is not None:
+            self.status_callback.emit(self.statusText())
+        if self.progress_callback is not None:
+            self.progress_callback.emit(self.percent())
+
+
+def asTracker(progress_callback, status_callback=None, stages=STAGES):
+    """
+    Wrap progress and status emitters in a ProgressTracker, unless progress_callback already is one.
+    """
+
+    if isinstance(progress_callback, ProgressTracker):
+        return progress_callback
+    return ProgressTracker(progress_callback, status_callback, stages)
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import csv
+import json
+from os.path import basename
+from photo_records import PhotoRecords
+
+# formats of the report file
+REPORT_FORMATS = ('txt', 'csv', 'jsonl')
+
+# flights listed in the summary sent to the main UI, the rest is only in the report file
+SUMMARY_FLIGHTS = 100
+
+
+class ReportWriter(object):
+    '''
+    Write the separation result to a file one flight at a time, and keep a short
+    summary for the main UI.
+
+    Formats:
+        txt: same layout as formatResult.
+        csv: one row per photo with flight, folder, photo and date columns.
+        jsonl: one JSON object per photo with the same fields.
+
+    :param path: Full path to the report file.
+    :type path: string
+    :param n_flights: Number of flights that will be written, None if not known yet (streaming):
+        the txt report then gives the number of flights on its last line.
+    :type n_flights: int
+    :param fmt: One of REPORT_FORMATS.
+    :type fmt: string
+
+    '''
+
+    def __init__(self, path, n_flights, fmt='txt'):
+        if fmt not in REPORT_FORMATS:
+            raise ValueError("Unknown report format: {0}".format(fmt))
+
+        self.path = path
+        self.fmt = fmt
+        self.n_flights = n_flights
+        self.n_written = 0
+        self.n_photos = 0
+        self._summary = list()
+        self._fh = open(path, 'w', encoding='utf-8', newline='')
+        self._len_s = None
+
+        if fmt == 'txt' and n_flights is not None:
+            self._fh.write("Number of flights detected: {0}\n".format(n_flights))
+        elif fmt == 'csv':
+            self._csv = csv.writer(self._fh)
+            self._csv.writerow(['flight', 'folder', 'photo', 'date'])
+
+    def writeFlight(self, folder, photos):
+        """
+        Write the photos of one flight.
+
+        Parameters
+        ----------
+        folder : string
+            Fullpath of the flight folder.
+        photos : 1D list or PhotoRecords
+            Contains (fullpath, date) of the photos, in time order. Dates of
+            PhotoRecords are only built here, as each line is written.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        i = self.n_written
+        if isinstance(photos, PhotoRecords):
+            named = photos.namesAndDates()
+        else:
+            named = ((basename(p), d) for p, d in photos)
+        if self.fmt == 'txt':
+            # separator as long as the first flight folder, as in formatResult
+            if self._len_s is None:
+                self._len_s = len(folder)
+            lines = ["-" * self._len_s, folder]
+            lines.extend("{0}: {1}".format(n, d) for n, d in named)
+            self._fh.write("\n".join(lines) + "\n")
+        elif self.fmt == 'csv':
+            self._csv.writerows([i, folder, n, str(d)] for n, d in named)
+        else:
+            self._fh.writelines(json.dumps({'flight': i, 'folder': folder, 'photo': n, 'date': str(d)}) + "\n"
+                                for n, d in named)
+
+        if i < SUMMARY_FLIGHTS and len(photos):
+            (_, first), (_, last) = photos[0], photos[-1]
+            self._summary.append("{0}: {1} photos, {2} - {3}".format(folder, len(photos), first, last))
+        self.n_written = i + 1
+        self.n_photos = self.n_photos + len(photos)
+
+    def summary(self):
+        """
+        Short log for the main UI, at most SUMMARY_FLIGHTS flights.
+        """
+
+        n_flights = self.n_written if self.n_flights is None else self.n_flights
+        log = ["Number of flights detected: {0}".format(n_flights)] + self._summary
+        if self.n_written > SUMMARY_FLIGHTS:
+            log.append("... {0} more flights".format(self.n_written - SUMMARY_FLIGHTS))
+        log.append("Full report: {0}".format(self.path))
+        return "\n".join(log) + "\n"
+
+    def close(self):
+        if self.fmt == 'txt' and self.n_flights is None and not self._fh.closed:
+            self._fh.write("Number of flights detected: {0}\n".format(self.n_written))
+        self._fh.close()
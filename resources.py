@@ -1,2250 +0,0 @@
-# -*- coding: utf-8 -*-
-"""
-/******************************************************************************************
- Flight Separator
-                                 A Standalone Desktop Application
- This tool detects and separates drone photos in a folder taken in
- different flights based on timestamps.
-                              -------------------
-        begin                : 2020-09-01
-        copyright            : (C) 2019-2021 by Chubu University and
-               National Research Institute for Earth Science and Disaster Resilience (NIED)
-        email                : chuc92man@gmail.com
- ******************************************************************************************/
-
-/******************************************************************************************
- *   This file is part of Flight Separator.                                               *
- *                                                                                        *
- *   This program is free software; you can redistribute it and/or modify                 *
- *   it under the terms of the GNU General Public License as published by                 *
- *   the Free Software Foundation, version 3 of the License.                              *
- *                                                                                        *
- *   Flight Separator is distributed in the hope that it will be useful,                  *
- *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
- *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
- *   See the GNU General Public License for more details.                                 *
- *                                                                                        *
- *   You should have received a copy of the GNU General Public License along with         *
- *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
- ******************************************************************************************/
-"""
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.9.6)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x1d\x41\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\xc8\x00\x00\x00\xc8\x08\x06\x00\x00\x00\xad\x58\xae\x9e\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x1c\xd6\x49\x44\x41\x54\x78\x5e\xed\x9d\x09\x9c\
-\x5b\x55\xbd\xc7\x5b\xaa\xa2\x6c\xed\x24\x99\x96\xcd\x07\x6a\x81\
-\x76\x92\xb4\x3c\xea\x52\x7d\x2a\xf2\x10\x41\x9e\x2c\x02\xc5\x8d\
-\x55\x81\xe7\x53\xdb\xd2\x4e\x6e\x5a\x36\xe3\x9b\xe6\x66\x0a\x88\
-\x15\x41\xa4\x85\xd2\xa7\xb4\xa0\x83\x08\x68\x5d\xa0\x6a\x41\x84\
-\x76\x72\x6f\xda\x99\xe4\xce\x74\x53\x28\xb2\x23\xa8\x54\x40\x5b\
-\x4b\xe7\xfd\xfe\x37\xff\xa4\x59\x4e\xee\x64\xb9\xc9\x64\x66\xfe\
-\xdf\xcf\xe7\xff\x99\xc9\xbd\xe7\x9c\x7b\xee\x39\xff\xff\xd9\xee\
-\x59\xc6\x08\x82\x20\x08\x82\x20\x08\x82\x20\x08\x82\x20\x08\x82\
-\x20\x08\x82\x20\x08\x82\x20\x08\x82\x30\x52\x68\x8b\x59\x93\xfd\
-\x7a\xea\xb3\x90\x6f\xf8\x63\xa9\x55\x01\x3d\xd5\x8d\xbf\x5b\xfd\
-\x31\xeb\xc5\x7c\x49\x3d\x11\x88\x59\x8f\xc1\x5d\x17\xfe\xef\x0c\
-\xc6\xac\x0b\xa7\x2e\xee\xf3\x8f\x19\x33\x30\x96\x83\x12\x6a\x21\
-\x12\xd9\x87\xd2\xd3\x1f\x4d\x5d\x80\x74\xd6\x91\xc6\xf7\x20\xdd\
-\x0d\xbf\x6e\xfd\x51\x91\x17\x5b\x91\x4f\x8f\xc2\xed\x2a\xe4\x47\
-\x47\x50\xb7\x3e\xef\x5f\x94\x7a\x0f\x87\x24\xd4\xc2\xac\xae\x81\
-\x71\x30\x8a\x53\x90\x09\xb7\x23\x91\x9f\xc7\xdf\x81\x9a\x44\x4f\
-\xbd\xe2\xd7\xfb\x56\xb6\xe9\xd6\x39\x47\x44\x9e\x7c\x3b\x3f\x46\
-\x28\x83\x19\x11\x73\x3f\x4a\x37\xa4\xe1\x5d\x50\xf4\xbf\x29\xd3\
-\xb7\x02\x81\x31\x3d\x1d\xd0\xad\xdb\xda\x16\xf5\x9c\x42\xf9\xcc\
-\x8f\x19\xfe\xb4\x45\xac\x03\x50\x2a\x7c\x25\x23\x81\x68\x72\x0e\
-\x5e\x38\x52\xab\x20\xf1\xe7\xe5\x85\x8b\x6b\x28\x81\x9e\xc1\x5f\
-\x65\x02\xd7\x2a\x78\xc6\x73\xc1\xa8\x75\x11\xbf\xd6\xb0\xe4\x98\
-\x48\xe2\xd0\xdc\x34\x83\x5c\x8e\x77\x53\xa6\x6f\x65\xd2\x37\x27\
-\x37\xdc\x80\x9e\xbc\x0e\x0a\xfd\x17\xdc\x53\xa6\x65\xad\x42\xc6\
-\xe2\xef\xdc\x74\x1a\xbf\xd6\xf0\xa7\x6d\x91\xf5\x61\xbb\xf9\xa2\
-\x5b\x6f\xa8\x5e\xb8\x7a\x49\xbd\x89\xbf\x5b\xb3\xbf\x75\x6b\x2d\
-\x3f\xb2\x88\x63\xae\xdd\x74\xe0\xb1\xfa\x86\x56\x27\x99\x1e\xd9\
-\x38\x81\x9d\x8f\x4c\xd0\xd4\x69\x8b\xf5\x9e\x0e\x25\xfe\x05\x0a\
-\x93\x5d\x7b\xd3\xb1\x76\xa1\xf0\xa8\xc9\x94\xfd\xad\xa7\x56\xf0\
-\x53\xb3\xb4\xdd\x60\x79\x54\xe9\xee\x24\x23\x3e\x4f\x72\x99\x11\
-\x79\x76\x3f\xb4\x2d\x4f\x83\x7c\x07\xca\xbd\x11\xb2\x33\x37\x91\
-\xcb\x94\x3f\xc0\xff\x9d\xa8\x89\xbe\x88\x92\x6a\x12\x4a\xaf\x53\
-\xb3\xf7\x1c\x0c\x44\xc8\x87\x14\x0f\xcd\xd1\xcf\x41\x91\x97\x22\
-\xdd\xfa\xa1\xe0\xff\xca\x49\xe3\xc1\x45\xb7\x76\x93\x3f\xe4\xc1\
-\x6d\x14\x0e\x85\x67\xd7\x1e\x7c\x5f\x65\x20\x42\x85\x1c\x1f\x19\
-\x78\x4b\x40\xdf\x3c\xc5\xbf\x38\x75\x32\x12\xf9\x42\x45\xf3\x6b\
-\x3e\x12\xfa\x4b\x48\xf8\x4f\x05\xa3\xfd\xc7\x51\xbb\x96\xbd\x66\
-\x11\x03\x71\x87\xc9\x37\x6e\xdd\x17\xca\x3e\xcd\x4e\x4f\x14\x3e\
-\xd4\x84\xcd\xc9\x87\x08\xf2\x61\x6e\xb0\xd3\xba\x28\x18\xed\xfb\
-\x64\xb0\xa3\x37\x48\xee\xd9\x6b\x16\x31\x90\x26\x44\x0c\xa4\x79\
-\x10\x03\x69\x42\xc4\x40\x9a\x07\x31\x90\x26\x44\x0c\xa4\x79\x10\
-\x03\x69\x42\xf2\x0c\x24\x66\xfd\x9e\x46\x3e\x66\x2c\x35\xdf\xca\
-\xb7\x85\x06\x22\x06\xd2\x24\xd0\xb7\x15\xd4\x16\xdf\x0d\xe8\xa9\
-\x97\x73\x8c\x23\x4f\x90\x41\x26\x3a\x9d\x27\xb1\x17\xa1\x4e\x04\
-\xf4\x3f\x4e\x42\x5a\xaf\x44\x9a\xbf\x5a\x98\x07\x69\x49\xed\xf4\
-\xeb\xd6\x1a\x7f\x47\x6a\x3a\x7b\x11\xea\xca\xac\xae\x71\x48\xf8\
-\xdf\x16\x67\x44\xb1\xd0\xd0\xe5\x54\xbd\xf7\x44\xf6\x29\xb8\xcc\
-\xb4\xf6\x9e\xfd\x51\x50\xf5\xab\xd2\xbe\x48\x74\x6b\x87\x7f\x71\
-\x6a\x2a\x7b\x15\xea\x45\x5b\xcc\x3a\x5d\x99\x01\xa5\x44\xb7\xe2\
-\xec\x55\x70\x19\x34\x6f\x69\x58\x5e\x9d\xee\x2a\xe9\xb4\x7e\xc8\
-\x5e\x85\x7a\x11\x88\x5a\x8b\x94\x89\x5f\x42\xa8\x16\x61\xaf\x82\
-\xcb\xd8\x1f\x6c\x15\x69\x5e\x4a\xd0\x14\xdb\xc6\x5e\x85\x7a\x81\
-\x1a\xe1\x3a\x55\xe2\x3b\x09\x7b\x15\x5c\x06\x0a\xdf\xa5\x4a\xef\
-\x52\x02\xf7\x4f\xb2\x57\xa1\x5e\x88\x81\x34\x0f\x62\x20\x4d\x88\
-\x18\x48\xf3\x20\x06\xd2\x84\x88\x81\x34\x0f\x62\x20\x4d\x88\x18\
-\x48\xf3\x20\x06\xd2\x84\x88\x81\x34\x0f\x62\x20\x4d\x88\x18\x48\
-\xf3\x20\x06\xd2\x84\x54\x63\x20\xc8\x98\x64\x20\x96\x9c\xdf\x16\
-\xb1\x0e\xe6\x60\x86\x0c\x5a\x55\xd7\x16\xb3\x26\xb7\xe9\x56\x5b\
-\x2d\x12\xec\x4c\xbe\x7b\xa8\xd6\x66\x4f\x8b\xf4\x4c\xb4\x3f\x12\
-\xea\xd6\xb3\xaa\xf4\x2e\x25\x62\x20\x0d\xa0\x1a\x03\xc9\x08\x7d\
-\x34\x84\xac\x0e\x46\x93\xb3\x1a\xb5\x09\x03\x29\x71\x30\xfd\xf5\
-\xff\x6e\x7f\x2c\xe5\xf2\x9a\xf9\xd4\x4e\xa4\xc7\x5a\xfc\x3f\x7f\
-\xea\xa2\xbe\x23\xf8\x91\x75\x81\x26\x80\x06\x3a\x93\x9f\x86\x92\
-\xdf\x8f\x34\xac\x6a\xb9\xae\x18\x48\x03\xa8\xc5\x40\x72\x85\x36\
-\x15\x80\x7c\x2f\x18\xed\x9f\xc9\x41\xbb\x0e\x4a\xfa\x73\xa0\x4c\
-\xb4\xa5\x90\x32\x0e\x6e\x0a\x94\x6f\x97\x3f\x9a\xba\x99\x4a\x77\
-\x7e\xbc\x2b\x4c\x89\xf6\x1f\x47\x4b\xa4\xf1\x1e\x2f\xa9\x9e\x5b\
-\x89\x88\x81\x34\x00\xb7\x0c\x24\x57\x90\x71\x9b\xa1\x04\x57\x05\
-\x17\xf7\x1e\xce\x8f\xa9\x89\xc9\x91\xad\x07\x21\xcc\x07\x54\xcf\
-\xaa\xbb\xe8\xa9\x57\x82\x8b\x92\x1f\xe7\xa8\x54\x05\x35\x45\xa9\
-\x49\x8a\x77\x40\xd3\x54\xf1\x8c\x2a\x45\x0c\xa4\x01\xd4\xc3\x40\
-\xf6\x4a\xea\x4d\x7b\x6a\x76\x2c\x75\x3e\x6d\x30\xc1\x8f\xac\x08\
-\x2a\xc1\x51\xda\xa6\xd4\xe1\x37\x46\xa8\x09\x84\xda\xeb\x52\x8e\
-\x52\x59\xc0\x28\xde\x46\x35\x5e\x40\x4f\xfe\x0c\xfe\x2b\xdb\xc0\
-\xa1\x4c\x11\x03\x69\x00\x7e\xbd\xef\x1b\xaa\xc4\x77\x5d\x68\x7a\
-\xb6\x9e\xba\x23\xa0\xf7\x1f\x5f\xee\x0e\x8b\xe9\x3d\xc0\x86\xd6\
-\x38\xf6\x0a\x8c\x3d\x9a\x1a\x74\xef\x28\x14\x06\xef\x43\x87\xfb\
-\x66\xaa\x79\xd4\xe1\xb8\x27\x48\xcf\x2d\xfc\x58\xa1\x5e\x20\x91\
-\x4f\x50\x25\x7e\x3d\x85\x4a\x3e\x28\xd2\xff\x0e\xb6\x05\x26\x6a\
-\x9f\xe5\x2a\xff\x43\x26\x30\xf2\x63\x3b\x36\x1c\xc5\xd1\xcb\x82\
-\x7e\xc5\x21\x30\x1e\x0d\x46\x61\x29\xfd\xd5\x49\x90\x8e\xcb\x39\
-\x0a\x42\x3d\xf1\x77\x56\x36\xfe\xee\x9a\xe8\xa9\x3d\x90\x47\xfd\
-\x9d\xfd\x97\x50\x3f\x83\xa3\x63\x13\x5c\xd4\xfb\x51\xa5\x9f\x21\
-\x16\x18\xf6\x7d\x14\x3f\x1a\xb5\x43\xf3\xe9\x5c\xfc\xa6\x4d\xe3\
-\xea\xd2\x84\x72\x96\xd4\x73\x6e\xf5\xf1\x84\x41\xa0\xa1\x53\x64\
-\xf4\xe5\x28\x91\xd6\x43\x2c\x85\x24\x71\xbf\x57\x9d\x51\xee\x08\
-\x94\xec\x75\x3c\xe7\xae\x60\xb4\xf7\x0c\x6a\x86\xc1\x70\xd6\xa9\
-\xdc\x35\x89\xdc\x8d\xb8\xfe\x55\x71\xdd\x35\x41\xf8\x5b\x38\xed\
-\x8b\xf2\x02\xf7\x6f\xa1\x5a\x8b\xb3\x4f\x68\x16\x68\x89\x27\x0c\
-\xa5\x13\x4d\x9f\xa7\x0b\x33\x54\xc4\x15\xf9\x13\x6a\xa5\xe8\x94\
-\x58\xcf\xd1\x9c\xe4\xc2\xb0\x64\x56\xd7\xb8\x60\x67\xf2\xe3\x28\
-\xf5\xef\x84\xb1\xbc\xa6\xc8\x68\x91\x32\xc5\xae\x39\x91\x8e\x94\
-\x9e\x94\xae\x9c\xc2\xc2\x48\x81\x36\xb1\x46\x46\x5f\x8c\x0e\xec\
-\x5a\xbb\x4f\xa1\x50\x02\x91\x02\xc9\xf4\xbd\xa2\xa9\x4b\x28\xfd\
-\x38\x29\x85\x91\xce\x31\x91\x8d\x47\x42\x01\xae\x41\xe6\x6f\x2b\
-\x52\x0a\x11\x32\x8c\xed\xe8\x43\x74\xc8\x01\x36\x42\xe6\x88\x86\
-\xa5\x90\x9a\x0f\x7b\x19\xde\x92\xfa\x3b\x6a\xd7\xef\x23\x1d\x4e\
-\xa0\xe3\x12\x38\x79\x04\x21\xcd\xcc\x1b\x1e\x7f\x07\x3a\xf6\x9f\
-\x19\xba\xe1\xd0\x21\x10\x34\xa1\xf0\xae\x0f\xe3\xff\x8b\xe9\x63\
-\x27\x27\x85\x20\x38\x33\x25\x6a\x1c\x12\xd0\x93\xed\x3c\x54\xa9\
-\x56\xae\x61\x2c\x28\x04\x68\x22\x65\x64\x7a\xe7\xa6\x23\xf9\x95\
-\x05\xa1\x3a\xda\xa2\xd6\xb1\x50\xa6\x6f\xc3\x58\x5e\xcc\x55\xb2\
-\x61\x27\xf6\x14\x1a\x6b\x79\x25\x53\x68\x04\xa1\x6c\xe8\xd0\x9f\
-\xb6\x8e\xde\xd3\xd1\x56\xbf\x07\xc6\xa2\xfa\x30\xd6\xac\xb2\xc6\
-\x1f\x4d\x5d\x30\xed\xfa\x9e\xfd\xf9\x55\x04\x41\x10\x04\x41\x10\
-\x04\x41\x10\x04\x41\x10\x84\x11\x8d\x3d\x92\xa5\x5b\x0b\x03\x39\
-\xc7\x24\x97\x27\xa9\x6f\x41\x6e\xae\xb7\xf8\xf5\xbe\x3b\xfc\x7a\
-\xaa\x4b\x25\x74\x9c\x36\xbf\x86\x20\xd4\x87\x40\x34\x79\x3d\x14\
-\x5e\xfd\x9d\xa1\xc9\x85\x3e\x0e\x4e\x5f\xf2\xe4\x04\x7e\x15\x41\
-\x70\x97\x80\xde\x77\xa6\x3d\xbb\x55\xa1\x7c\xc3\x45\x50\x93\x3c\
-\x20\x1f\x09\x05\xd7\xa1\x59\xad\xfe\x98\x55\xd7\x95\x79\x0d\x13\
-\x34\x11\xf9\xb5\x04\xa1\x76\x68\x12\x23\x6a\x8e\x0d\x4a\x65\x1b\
-\x86\x62\x4f\xc4\xb4\xa7\x9b\x08\x82\x0b\xa0\xe3\xbb\x54\xa5\x68\
-\xc3\x5a\xf4\xd4\xf3\x34\x21\x93\x5f\x51\x10\xaa\xa3\x2d\x66\x5d\
-\xa8\x54\xb0\x11\x20\x34\xcd\x7d\xa8\x36\xc1\x16\x46\x00\x01\x3d\
-\x39\x0d\x4a\xf4\xba\x4a\xb9\x46\x90\x5c\xcb\xaf\x2b\x08\xe5\xc3\
-\x7b\xec\x6e\x56\x28\x94\x5a\x74\x6b\xb7\xf2\x7a\xb3\x8b\x9e\xda\
-\x43\xe7\xcf\xf3\x6b\x0b\x42\x39\x0c\x8c\x45\xcd\xf1\x23\xa5\x42\
-\xa9\x44\xb7\x1e\x0b\xe8\x7d\xe7\x29\xef\x0d\x9d\xdc\xaf\xb8\xa6\
-\x14\x3f\xed\x76\x2f\x6b\xcf\x85\x72\x41\xcd\x31\x57\xa5\x48\x2a\
-\x81\x21\xbd\x38\x3d\xba\xe5\x30\xf6\xb7\x46\xe5\xa6\xe1\xa2\xa7\
-\x2c\xda\x96\xa7\x4d\xb7\xbe\xaf\xbc\xaf\x10\x7f\x2c\x95\xa0\xd1\
-\x3a\x3b\x01\x04\xa1\x14\x81\x58\xff\x07\x03\x74\x38\x8d\x42\x89\
-\x8a\x84\x9a\x55\x7a\xf2\x24\xf6\x4a\xbb\xbb\x1f\x0d\xe5\xfc\xa7\
-\xd2\x6d\x03\x25\x18\xed\x3b\xc3\x8e\x4f\x7b\xcf\xfe\x30\xe0\xb2\
-\x77\x99\xa4\xd1\x3a\xfb\x45\x04\x41\xc5\xb1\xfa\x86\x56\x28\xf8\
-\x53\x2a\xe5\x29\x21\xd7\xb0\xd7\x2c\x6d\xd1\xe4\x22\x85\xbb\xc6\
-\x89\x9e\x8c\xe7\x7e\x29\x0f\x76\xf4\x1e\x83\x77\xda\xa1\x74\xab\
-\x10\x1a\xb5\x63\xaf\x82\x90\x43\x24\xb2\x0f\x6a\x84\x5f\xa9\x94\
-\x46\x29\x70\xab\xda\x1a\xc7\xfe\xa8\x18\xb3\xfe\x50\xe4\xbe\x51\
-\x92\x53\xa3\x65\x08\xd2\xd9\x1f\x2a\xb7\x0a\xb1\x47\xed\xf4\xe4\
-\x34\xf6\x2a\x08\x69\xa0\x1c\x34\xeb\x56\xa9\x34\x45\x82\x5a\x86\
-\x0e\xe4\x64\xaf\x45\x04\xa3\xbd\x9f\x54\xfa\xab\xb7\xe8\xd6\x5a\
-\x8e\x42\x11\xb8\xb7\x44\xe9\x47\x21\xe8\x4b\x6d\x29\xdc\xc1\x5e\
-\x18\xc5\x04\xf4\xfe\x93\xec\xfe\x84\x42\x59\x8a\x25\xb5\x73\x6a\
-\xac\xef\x03\xec\xb5\x24\x70\x7b\x6f\xb1\xdf\xfa\x8a\x7f\x51\xea\
-\x43\xfc\xf8\x22\xe8\x14\x29\xbc\xe3\x63\x2a\x7f\x2a\x41\xa7\xfd\
-\x1e\x99\xd4\x28\x8c\x09\x46\x7a\x0f\xa7\x91\x28\x95\x92\x28\x45\
-\xb7\x66\xb3\x57\x47\xe8\x3c\x0c\x18\xd3\xdf\x95\x61\xd4\x43\x74\
-\xeb\x67\xfc\xe8\x92\xc0\x80\xde\x59\xc9\xbb\xc2\x48\x2e\x67\xaf\
-\xc2\x68\x84\x16\x3f\x55\x52\xaa\x06\x3a\xad\x1f\xb2\xd7\xb2\x68\
-\x5b\xd4\x7b\x21\x9a\x2b\x45\x0b\x97\x02\xb1\xe4\xbd\x68\xa6\xe5\
-\x4f\x9b\xd7\x53\x7f\xc6\xbd\x9b\xda\x74\xeb\xab\xf8\x7d\x05\x94\
-\x93\x76\x3b\xcc\x7f\x7e\x2c\xb5\x1d\xf1\x5d\x6b\x4b\xcc\xfa\x3d\
-\xdc\x67\xb7\xf6\xa1\xbd\xbb\xf8\xb1\x8e\xf8\x63\xfd\x9f\x80\xff\
-\xb2\x6a\x4b\x18\xd3\x2e\x1a\xd5\x63\xaf\xc2\x68\x03\x8a\x52\x49\
-\xbb\x7c\xb3\x5b\x5b\x73\xa2\xd3\x7c\x69\x5e\xd8\x31\xeb\x47\xd3\
-\x23\x1b\x8b\x16\x32\x4d\xed\xec\x3b\x23\xf7\xc8\x06\xc4\x61\x2b\
-\x9d\x59\xce\xb7\xab\x06\x61\x95\xdd\xdf\x42\xdc\x9e\xa1\xd1\x3d\
-\xf6\x2a\x8c\x16\xa6\x75\xa6\xce\x2e\x2a\xc5\x4b\x08\x29\xe9\xf4\
-\x8e\x3e\x3f\x7b\xad\x19\x3c\x37\x3b\x85\x05\x0a\xf8\x88\x93\xd2\
-\xc3\x28\xce\xca\x8f\x4b\xea\x2c\xbe\x55\x3d\x15\x8e\xd8\xe1\x99\
-\x6b\xe4\x3c\x90\x51\xc4\xd4\x8e\xbe\xa3\x90\xe9\xaf\xaa\x94\x41\
-\x29\x7a\xdf\x79\xec\xb5\x66\x82\x91\xe4\xbb\x73\xc3\x9e\xaa\xf7\
-\x7d\x84\x6f\x95\x04\x71\x5d\x9f\x71\x8f\xff\x57\xf0\xe5\x9a\x38\
-\x3a\xb2\xd9\x47\xa3\x71\xb9\x71\x71\x92\xa0\xde\xd7\xc1\x5e\x85\
-\x91\x4c\x7a\xf1\x53\x5f\x8f\x4a\x09\x54\xe2\x8f\xf5\xdd\xca\x5e\
-\x5d\x21\x10\xeb\x3b\x35\x1b\xbe\x9e\xdc\x59\xce\x74\x73\x18\xc5\
-\xe2\x6c\x7c\x74\xeb\x71\xbe\x5c\x33\x53\xa2\xfd\x33\xcb\x9e\x35\
-\x10\x4b\xbd\xd9\x16\xb3\x4e\x61\xaf\xc2\x48\x85\x4a\x60\xb5\x02\
-\x14\x0b\xcd\x4f\x9a\x7c\xe3\xd6\x7d\xd9\xab\x2b\x04\x3a\xfb\x3f\
-\x9d\x0d\x3f\x9a\x7a\x81\x2f\x3b\x02\x43\x6a\xcf\xfa\xd1\x53\x1b\
-\xf8\xb2\x2b\x04\x62\xc9\x39\x99\xb0\x07\x15\x3d\xf5\x32\x8d\x84\
-\xb1\x57\x61\xa4\x11\x88\x26\xb3\xca\x39\x98\xd0\x0c\xd7\x7a\x1c\
-\x0d\x40\xdf\x2a\xb2\xcf\xd1\xad\xdd\x53\x62\xdd\x5e\xbe\x55\x12\
-\x94\xde\xcb\x72\xfc\x0c\x3a\x9c\x5b\x29\x34\x48\x90\x0d\x7f\x10\
-\x69\xd3\x93\x3f\x65\x6f\xc2\x48\x03\x8a\xa0\x18\x3a\x55\x08\x1d\
-\x2a\x13\x4d\x9d\xc6\xde\x5c\x65\xe6\x0d\x7f\x7a\x47\xee\xc8\x14\
-\xd5\x0e\x7c\x4b\x09\x6d\xd3\x43\x25\x77\xd6\x7d\x34\x79\x05\xdf\
-\x72\x0d\x1a\x9d\x43\xcd\x54\xde\xda\x17\xa4\x8d\x1c\xeb\x3c\x42\
-\x81\x12\x94\x75\xc4\x1a\xb5\xf9\xd9\x4b\x5d\x80\xf1\xdd\xb9\xf7\
-\x59\xd6\x6b\x68\xca\xbd\x8f\x6f\xe5\x41\xa3\x5b\xb8\x77\x5f\xd6\
-\x6d\xcc\xda\x55\xaf\x75\x1b\xd3\xf4\x9e\x40\x9e\xe1\x3a\x08\x3a\
-\xec\x83\x0e\x2c\x08\xc3\x10\x28\xdb\x73\xaa\x0c\xcf\x15\xaa\x65\
-\xea\xbd\x4e\x3b\xd8\xb1\xe9\x18\x18\xe1\xae\x9c\x67\xbe\xee\x8f\
-\xf6\x69\x99\xef\x0d\xf4\x7c\x7f\x67\xea\x63\x70\xb3\x2e\x37\x6e\
-\xe8\x2f\xdc\x62\x07\x50\x27\xca\x5d\xf4\x15\xec\xdc\x14\x64\x2f\
-\xc2\x48\x22\xaf\x2d\xaf\x12\x3d\xf5\x3c\x9a\x1b\x07\xb3\xf3\xba\
-\x82\xe7\x5d\x5c\xf4\xfc\x74\x1c\x5e\x86\x14\xad\x29\x81\x71\xf7\
-\x36\xe2\x00\x1c\x1a\xb5\x2b\x7c\x76\xae\xa0\x96\xd9\x22\x07\x7c\
-\x8e\x50\x8e\x8a\x6e\x39\x2c\xaf\x3d\x9f\x27\xa9\x7f\x04\x17\xf5\
-\x7e\x94\x9d\x36\x84\xb6\x58\xf2\xe2\xdc\x9a\xa4\x94\xc0\xcd\x23\
-\x8d\xfa\x9a\x4d\xa3\x76\x78\xa6\x72\xfa\x0d\xc5\x75\xaa\xde\x77\
-\x22\x3b\x15\x46\x22\x6d\xba\xd5\x06\x63\xf8\x5d\x41\xc6\x3f\x01\
-\x39\x81\x9d\x34\x94\x29\xb1\x9e\xa3\x11\x9f\x55\xca\xf6\xbf\x6e\
-\xf5\xd3\x01\xfe\x8d\xfe\x8a\x6d\x77\xda\xed\x8d\xb0\xf3\xa6\xb9\
-\x74\x4b\xdf\x63\x14\xe1\x5f\x9c\x9a\x4a\xbb\x79\xd8\x1d\xe4\x26\
-\x98\x46\x31\x23\x62\xee\x47\x13\x03\xa1\x88\x67\xc1\x28\x4e\x6e\
-\x86\xd3\x67\x8f\x88\xac\x7d\x7b\x40\x4f\x4e\x51\xcd\x13\x13\x04\
-\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\
-\xa8\x88\x48\x64\x1f\xaf\xd6\x7d\xa2\x4f\x8b\x7f\xdd\x13\x36\x17\
-\xfb\x34\xe3\x92\x03\x17\x0e\x3e\x1d\x5e\x10\x46\x3c\xad\x0b\x13\
-\x93\x7d\x21\xc3\xf0\x85\xcd\x81\x02\x79\xd5\xab\x19\x5f\x66\x67\
-\x82\x30\xfa\xf0\x5c\xb9\xf1\x30\x5f\xd8\x78\xd6\x36\x08\xcd\xd8\
-\xe3\x0d\x1b\x1b\x61\x14\x8f\xe0\xf7\x8e\xbd\x86\x62\xcc\x61\xe7\
-\x82\x30\xba\x80\xf2\xaf\x64\x23\xd8\x01\x03\x39\x95\x2f\x8f\x99\
-\x38\x67\xdd\x24\xaf\x16\x7f\x88\xee\x79\xc3\xe6\x1b\xbe\xcb\x1f\
-\x91\x85\x4a\xc2\xe8\xc2\x33\x7b\xfd\x41\x30\x8a\x9d\xb6\x11\x68\
-\xf1\xaf\xf0\xe5\x2c\xe3\xe7\x6e\x9c\x80\x1a\xe5\x45\x36\xa0\xf9\
-\x7c\x59\x10\x46\x07\x30\x8e\xe3\xd2\xca\x6f\x0e\x1c\x70\x85\x7a\
-\x4a\x3b\xdc\xac\x4a\x1b\x50\x62\x19\x5f\x12\x84\xd1\x81\x4f\xdb\
-\x70\x7c\xc6\x40\x0e\x89\x98\xfb\xf1\xe5\x3c\xd0\x1f\x59\x91\x36\
-\x10\xc3\x95\x3d\xb1\x04\x61\xd8\x20\x06\x22\x08\x0e\x88\x81\x08\
-\x82\x03\x62\x20\x82\xe0\x80\x18\x88\x20\x38\x20\x06\x22\x08\x0e\
-\x88\x81\x08\x82\x03\x62\x20\x82\xe0\x80\x18\x88\x20\x38\x20\x06\
-\x22\x08\x0e\x88\x81\x08\x82\x03\x62\x20\x82\xe0\x80\x18\x88\x20\
-\x38\x20\x06\x22\x08\x0e\x88\x81\x08\x82\x03\x62\x20\x82\xe0\x80\
-\x18\x88\x20\x38\x20\x06\x22\x08\x0e\x88\x81\x08\x82\x03\x62\x20\
-\x82\xe0\x80\x18\x88\x20\x38\x20\x06\x22\x08\x0e\x88\x81\x08\x82\
-\x03\x62\x20\x82\xe0\x80\x18\x88\x20\x38\x20\x06\x22\x08\x0e\x88\
-\x81\x08\xa3\x12\xdf\xc2\xc4\x0c\x6f\xd8\xfc\xb1\x4f\x33\x5e\x65\
-\xe5\x7e\xce\x17\x36\xbe\xdb\x32\x3f\xfe\x4e\x76\x62\x53\x93\x81\
-\xcc\xea\x1a\xe7\x0b\x77\x5f\x8a\x7b\x71\x9f\x66\xfe\x0b\x7f\x77\
-\x7b\x35\x73\x83\x27\x9c\xf8\xda\x98\xcb\xcc\xb7\xda\x6e\x22\x91\
-\x7d\x3c\xed\xeb\x3e\x80\xb8\x2c\xf2\x6a\xf1\xef\x78\x34\xf3\x4a\
-\xc4\xe9\x16\xda\x08\x7b\x52\x7b\xcf\xbb\x6c\x37\x82\xd0\x48\x7c\
-\x5a\xfc\x8b\x50\xc0\x5d\x19\xc5\xcf\x15\x6f\xd8\xf8\xb3\x27\x6c\
-\xce\x64\xa7\x55\x1b\xc8\xa4\xf6\x07\xf7\xc7\xef\xd5\x19\xbf\x45\
-\xa2\x99\x6b\x7d\x21\xe3\x9b\x30\x96\x9b\x3d\x21\xe3\x82\x83\xe6\
-\x3d\xee\x61\xaf\x36\x3e\x6d\xdd\x51\x30\x26\x0d\x06\x73\x2b\xc2\
-\xe9\xf0\x84\x8d\xf7\x8f\x19\x33\x30\x96\x6f\x0b\x42\x7d\xa0\xd2\
-\x9a\x4b\x73\x52\xe8\x6d\x2d\x9a\x71\x89\x57\x4b\x9c\x88\xd2\x5b\
-\xc3\xef\xbf\xb2\xf2\xbe\x9a\x31\x92\x6a\x0c\x84\x8c\xc3\x36\x00\
-\xf6\x87\xeb\x3f\x81\xb2\x9f\xe9\x6d\x8f\x9f\x06\xc3\xfc\x41\xf6\
-\x7a\xd8\xb8\xcd\x0e\x60\x10\x5a\x43\xdd\x07\xfb\x42\xdd\x97\x22\
-\x9c\x65\x90\x25\xad\xa1\xc4\x29\x63\x22\xd6\xdb\xf8\xb6\x20\xb8\
-\x07\x14\xf5\xc7\x69\xe5\x34\x9f\xf0\x6a\x9b\x0e\xe4\xcb\x36\x93\
-\x16\x6c\x3c\x12\x0a\xf8\xa4\xad\xc0\x6c\x24\x95\x1a\x48\x9e\x71\
-\x68\xc6\x1e\x4f\x7b\x77\xd1\xc9\x53\xb8\x7e\x35\xdf\x7f\x13\xc6\
-\x79\x28\x5f\x2e\x8b\xd6\x88\x75\x00\x6a\x95\x59\x88\xdb\xf7\xf0\
-\x0e\x4b\xf1\x3e\x5f\xa0\x33\x4a\xf8\xb6\x20\xd4\x06\x14\xea\x6f\
-\xb6\x32\x87\x8c\xff\xe1\x4b\x79\x1c\x7c\x55\xe2\x88\x5c\x23\xf1\
-\x86\xcc\x85\xf6\xff\x90\xc1\x0d\xc4\xec\xca\x35\x0e\x6f\x28\xfe\
-\x55\x76\x92\x0f\xfa\x1f\xa8\x3d\xfe\x6e\xfb\x09\x1b\xbf\x6b\x0d\
-\x9b\x27\xf3\x9d\xca\x40\x38\x68\x7a\x9d\x84\xe7\x2f\xa1\x38\x78\
-\x42\x89\xd9\x13\xda\x13\x47\xf0\x5d\x41\xa8\x90\xc8\xda\xb7\x64\
-\x94\xbd\xc5\x41\x29\xf3\x8d\xc4\xd8\x93\xf1\x33\x98\x81\x64\xdd\
-\x3a\x19\x07\x03\x3f\xfd\x99\x70\x49\xf0\xbb\x07\x7e\xce\xa3\x38\
-\xb2\x93\x0a\x19\x18\x8b\xda\xe8\xbd\x30\xd2\x28\xc2\xa3\x66\x5c\
-\xc4\xb7\x20\xfe\xef\x7c\x53\x10\xca\x03\x8a\xf8\x5c\x5a\x29\x8d\
-\xab\xf8\x92\x92\x3c\x23\x61\x19\xd4\x40\x48\xca\x30\x0e\xfb\xd8\
-\x36\x4d\x3d\x48\x00\xff\x4f\x41\xd1\xcf\xa7\xd1\x2d\x76\x5e\x15\
-\xad\x21\xe3\x3d\xa8\xfd\x42\x1e\xcd\x58\x85\xda\xf2\xdb\x54\xd3\
-\x54\x6f\x7c\xc2\xa8\x81\x86\x72\xd3\xca\x68\xec\x18\x6c\x18\xb5\
-\xd0\x48\xca\xa9\x41\x06\x33\x0e\x2a\xe9\xf1\x6c\x3e\x14\xd4\xdc\
-\xe1\xd1\xba\x67\xc1\x7f\x5f\xe6\x19\x59\xd1\x8c\x75\x9e\x76\xe3\
-\x03\xec\xa9\x26\xf0\x9e\x13\xf1\xcc\x2f\xa1\xdf\xf2\x03\xd4\x30\
-\xb7\x23\xfc\x73\xe9\xec\x45\xbe\x2d\x08\x7b\xa1\xef\x1c\x34\x94\
-\x4b\x4a\x48\xca\x4f\x46\xc0\xb7\x94\xe4\x1a\x89\xa3\x81\x94\x6b\
-\x1c\x9a\x79\x53\xc6\x08\xe0\x6f\x81\x7d\x99\x9a\x7e\x9a\x31\x0f\
-\xbf\x5f\xcf\xdc\xb3\x85\xc2\xd4\xe2\x37\x1d\x11\x59\xfb\x76\xdb\
-\x9d\x0b\xc0\x58\xf6\xf7\x84\xe2\x67\x93\xa1\xe0\x79\x77\x43\xbe\
-\xec\x99\xb7\xf1\x30\xbe\x2d\x08\x34\x8a\x64\x7e\x04\x46\xf2\x1a\
-\x2b\x69\xd9\x46\xe2\x60\x20\x77\x54\x6e\x1c\xe6\xed\x85\xdf\x35\
-\xbc\xf3\x1f\x9b\x02\xa3\x30\xb3\x06\x92\x75\x6b\x24\x5b\xc2\xdd\
-\x7e\x76\xe6\x1e\x30\xcc\xf4\x10\xb7\x71\x23\x84\x3e\x9a\x5e\x3d\
-\x21\xb4\x6e\x1a\xdf\x15\x46\x33\xde\x76\xe3\x63\x95\x1a\x49\xf6\
-\xeb\x77\x01\xf4\x51\x8f\xff\x2d\x41\x81\x71\x84\xcc\xe5\x25\xfb\
-\x18\xb3\xb7\xee\x8b\xfb\x77\x65\xdc\x66\xfd\x84\xcd\x37\x3c\xa1\
-\xc4\xd9\xec\xaa\x2e\xf8\xda\x13\x33\x90\x16\x1d\x1e\x2d\x7e\x3f\
-\x0c\xf8\x06\x1a\xe2\x1e\xd3\x35\x30\x8e\x6f\x0b\xa3\x05\x6a\x66\
-\xb5\x86\x8d\xaf\xa1\x5d\x6e\x90\xe2\xd9\x0a\x58\x86\x91\x54\x47\
-\x05\xc6\x91\x65\x60\x2c\x94\xf4\xda\x8c\x9f\xac\x68\xc6\x9b\xad\
-\xe1\xf8\xc5\xec\xa8\xae\x50\xff\x0c\xe9\x33\xdf\x17\x8e\xdf\x87\
-\xb4\xb9\xc3\x13\x8e\x9f\x45\xcd\x33\xbe\x2d\x8c\x34\x26\x2c\xd8\
-\x30\x1d\x19\x7e\x0d\x32\x7b\xb5\x37\x1c\xbf\xcd\xd7\x6e\xfc\x97\
-\x5d\x5a\x57\x58\x93\x54\x46\x35\xc6\xb1\x17\xc4\x6b\x69\xd6\x38\
-\x32\x42\x46\xa2\x99\xb3\xd8\x49\x43\x38\x64\xbe\xe9\x6b\x0d\x27\
-\x2e\x46\xad\xd2\x85\x3e\xd1\x3d\xf4\x55\xdf\x77\xb9\x71\x08\xdf\
-\x16\x86\x25\x76\xfb\xda\x38\x01\xb2\xc4\x13\x36\x7e\x0d\xc5\xba\
-\xbe\x35\x64\xfc\x07\x4d\x20\x64\x17\x59\xea\x63\x24\xb5\x19\x87\
-\x0d\x9a\x37\x88\xd7\xc3\x59\xe3\xc8\x84\x85\xb8\x7a\xda\x37\xb4\
-\xb1\xab\x86\x42\xfd\x30\x18\xca\x99\x48\xa7\x3b\x50\xd0\xfc\xdc\
-\x1b\x4e\x84\xbd\xf3\xcd\x29\x7c\x5b\x68\x66\xec\x69\x18\xa1\xf8\
-\xd9\x34\x9c\x09\xe5\x7c\x08\x35\xc6\x55\x93\xda\xe3\x01\xbe\xed\
-\x88\xbb\x46\xe2\x82\x71\x30\xd4\x39\xc7\x7b\x28\xbe\x99\x18\x86\
-\xca\xd8\x1b\x0a\x19\x30\x15\x42\x61\xfa\xce\x62\x1a\x76\x21\xb4\
-\xc0\xfc\xf0\x90\xc7\x4b\xd8\x0b\x55\xf5\x50\x98\x4b\xd1\x97\xf8\
-\x39\x32\xc8\xa4\xbe\x45\xe1\x94\xf5\x72\x71\xc7\x48\xdc\x33\x8e\
-\x0c\xde\x90\xb1\x3c\x13\x5e\xae\x78\x17\x24\xce\x63\x27\x43\xc6\
-\xf8\xb9\x6b\x27\xe0\x7d\x6f\x45\xda\x67\x67\x1c\x20\xed\x5e\x42\
-\x7e\x2c\x47\xfc\x4e\x3b\xe4\x32\xf5\xc8\x9f\x50\x47\xa8\x4a\x87\
-\xe2\x2d\x44\x46\xac\xa7\x36\x79\x8e\xd2\xbc\xe2\xd3\x1e\x3f\x8e\
-\x9d\x55\x45\x6d\x46\xe2\xbe\x71\x10\xa8\x15\x3f\x9e\x09\x33\x5f\
-\x50\x8b\x0c\x21\x76\xbc\x34\xf3\x69\x75\xdc\x28\xfd\xcc\x7b\x60\
-\x28\xbf\x44\x1e\xfd\x84\xfa\x30\x07\x5f\xb1\xa1\x95\xbd\x0a\xae\
-\x82\x2a\x9b\xaa\x6e\xaa\xc2\x91\xe0\x0f\x43\x81\x57\x64\x94\x58\
-\x21\xaf\xb4\x50\x5f\xa3\x06\xaa\x33\x92\xfa\x18\x87\x4d\xba\x3f\
-\x95\xff\x11\x91\x84\x4a\xed\x2b\x1b\xdf\x59\xa6\x59\xd0\x85\xb5\
-\x46\xae\xd8\x35\x88\x96\x38\x9d\x9d\x8f\x21\xc3\x20\x03\xb1\x87\
-\x8f\xc3\xc6\x83\x48\x9b\xd0\xe0\x43\xe3\x82\x23\x54\x35\x53\x15\
-\x6d\x57\xd5\x9a\xf1\x28\x32\xe4\x5a\xb4\x73\x67\x66\x94\x8e\x46\
-\xa1\x70\x5d\xbd\xe8\x09\xca\x44\x8b\x90\xec\x80\xaa\xa4\x32\x23\
-\xa9\xa3\x71\x30\x78\xf7\xcd\x99\xf0\xf3\x44\x33\x4e\x65\x27\x0d\
-\xc1\xa7\x75\x7f\x0a\xcf\x7c\x4a\x19\x17\x08\xf2\x6b\x8d\xd3\x08\
-\x97\xfd\x25\x3f\x1c\x3f\xcb\xab\xc5\xbf\x8f\x70\x1e\x43\xda\xc6\
-\x68\x8d\x8e\xdb\xe9\x35\x22\x39\x74\x61\xb7\x17\x35\xc5\x45\x50\
-\x36\x2a\x69\x1e\x86\x52\x5c\xe1\x09\x27\xa6\xf2\xed\x22\x68\xe1\
-\x10\x32\xc4\xfe\x8e\xa1\x12\x94\x62\xcb\x0a\xd7\x7c\x54\x42\x79\
-\x46\x52\x7f\xe3\x20\xd0\x5c\x29\x9e\xaf\x45\xcf\x0b\x27\xfe\x9b\
-\x9d\xd4\x95\x96\x05\xe6\xbf\x41\xa9\xbb\x54\x71\x48\x8b\xb1\x0b\
-\x69\xb4\xa0\xa2\x77\xa7\x9a\xb1\xdd\xfc\x4f\xbc\xdb\x77\x10\xf6\
-\x7a\xf8\x5f\xe6\x0b\xc7\x3f\x29\x8b\xc1\x14\xd8\xab\xed\x34\x63\
-\x27\x12\x7b\x33\xcd\x44\xe5\xcb\x83\x02\x7f\xef\x83\x82\x3e\x53\
-\x9c\x61\x69\x41\xa2\x6f\xf7\x86\xd6\x9f\xc1\xce\x2b\xa6\xd0\x48\
-\xf2\x0c\xf6\x32\xf3\xad\x88\xf3\x2d\xd9\x67\xd5\xc9\x38\x08\xc4\
-\xc1\x9e\x3f\x56\x28\xb8\xae\x5c\xd7\xe2\x16\x34\xf3\x18\x05\xd5\
-\x62\xa7\x82\x08\xc6\xd1\x8b\x74\xa8\xa9\xef\x47\x78\xda\xa9\x66\
-\xa1\xa6\xa4\xf1\xac\xf4\x57\x0a\xa0\x59\xad\x99\x04\x47\x89\xb2\
-\x85\x14\x93\x6f\x0d\x0a\x55\xe9\x48\xd8\x07\xf3\x33\xad\x40\x68\
-\x21\x53\x95\x99\x98\x6b\x24\x64\xc4\x78\xd6\x6a\xfc\xa6\x09\x8a\
-\x7f\xca\x84\x5f\x17\xe3\xe8\x1a\x18\x77\x00\x14\xc5\xa7\xc5\xb3\
-\xab\x1a\x0b\x05\xb5\xe4\x97\xd9\xb5\xab\x50\x8d\x01\x45\xfd\x26\
-\xde\xd1\xde\xd4\x42\x25\xac\xcc\xd7\xd4\x5c\xe2\xd3\xe6\x16\x9a\
-\x39\x17\x61\xee\xb0\xc3\xb6\x27\x69\xfe\xbe\xea\x9a\x7f\x44\x82\
-\x04\x39\x14\x09\xbe\x3d\x9b\x01\x94\x48\x61\x63\xf9\xf8\x85\xc9\
-\x16\x76\xe2\x0c\x94\x93\x26\x0c\x22\x8c\xf4\xba\x72\x95\xd8\x09\
-\x6f\xfe\x82\x46\x5f\xd8\x57\xd9\xd0\xd4\xf3\xbc\xf8\xed\x95\xdd\
-\x50\xe0\x6b\xdd\x30\x0e\x6a\x9f\xe3\x9d\x3f\x6f\xf7\xbb\xc2\x66\
-\x0a\xff\xff\x53\xf1\xbc\x42\x59\xec\xd6\x50\x2a\x3d\x1f\x69\xf4\
-\x39\x84\xf9\x53\x28\xac\xbd\x6e\x5f\x29\x48\x47\xa4\xe1\x4a\x4f\
-\x78\xfd\xe1\xec\xb5\x6a\x26\xcc\x5b\x3f\x1d\xe9\xd7\x5d\x10\xfe\
-\x4f\xf9\xb6\x90\x0b\xf5\x17\x3c\x9a\x71\x33\x12\x28\x3b\x74\x0b\
-\xa5\x7c\x01\x09\xf8\x19\x76\x32\x28\x54\x35\x93\x82\xe5\x86\xa1\
-\x12\x84\x9b\x84\x9b\x79\x95\x8c\x02\x1d\x3e\xef\xf1\x77\x50\xe7\
-\x1f\xca\x43\x23\x38\xab\x20\x57\xfb\xe6\x77\x1f\xcd\xb7\xab\x86\
-\xd6\x66\x78\x43\x09\x1d\xc6\x6b\x2f\xc3\xad\x58\xa8\x94\xd7\xcc\
-\x6b\xcb\x2e\x4c\x32\xd0\x92\x5d\x32\x7c\x1a\x55\x0a\x1b\x0f\x64\
-\x6b\xc9\x52\x02\xa3\x41\xba\xdd\x4d\xd3\x76\x38\x84\xaa\xa1\x29\
-\xfc\xc8\xeb\x4e\x3c\x37\x67\xa0\xc5\xd8\xe1\xd3\x12\x97\x51\xbf\
-\x8e\x9d\x09\x2a\x7c\xed\xdd\x1f\x45\x46\x6c\xcb\xcd\x1c\xfc\x5e\
-\x3d\xa1\xfd\xb1\xb2\xbf\x49\x4c\x0c\xad\x9b\x86\x04\x5f\xe9\x58\
-\x12\xa6\x85\xf6\xaa\x7a\x08\xee\xe6\x0e\xc5\x94\x09\xfa\xa8\x89\
-\x78\x6e\x52\xc4\xcb\x16\x18\xfb\x2b\xb8\xff\x5b\xfc\xed\x82\x21\
-\xac\x81\x12\x3f\xaf\x72\x47\x82\x34\x7a\xae\x35\x6c\x9c\x63\x6f\
-\x34\x91\x23\x30\xea\x4f\xe0\xfe\xb9\xf8\x3b\x1b\x61\x90\x52\xae\
-\x44\x38\x09\x84\xe9\xd0\xaf\xd8\x2b\x14\x07\xea\x48\x4f\x5c\x18\
-\x7f\x37\x47\xbb\x26\xd2\x1d\xf3\xfc\xfc\xa5\x77\xab\x24\x7f\x47\
-\x3d\xbc\xaf\xd4\x8d\x48\xb8\xbd\xb5\x49\xd8\x2e\x61\x2f\xaf\x64\
-\x2a\xc3\xf8\xf6\xf5\xef\xa2\x70\xa0\x10\xca\x4e\x6e\xa1\xc0\xed\
-\x93\xb6\x61\x85\x8d\x39\x68\x87\x7f\xb8\xd4\x1a\x10\xb7\x40\xbc\
-\x7e\xa6\x8a\x07\xde\x7b\x8f\x27\x6c\x7c\x8d\x46\x7a\xd8\x69\x16\
-\x5a\xc3\x01\x37\xd9\xfe\x4f\x5d\x84\x36\xac\x08\x9b\x77\x79\x42\
-\xe6\xa7\xdd\x5a\xb0\x75\xd0\x3c\xcb\x83\xf4\xbd\x83\xde\x2d\xf3\
-\x1c\xfc\xfe\x2b\xde\xf3\x42\x76\x22\x54\x8a\xaa\x36\x41\x02\xc7\
-\xa9\xed\xca\x4e\xca\x03\x1d\x49\x1a\x7f\x47\x73\xed\x7e\x84\xa7\
-\x5e\x0f\x5e\x4a\x68\xdc\x5f\x33\x7e\x03\x7f\xb4\x2f\xd5\x02\x84\
-\xf1\x45\xaf\x16\x3f\x9d\xbe\xcb\xd0\xa4\x41\x28\xec\xa1\xd4\x99\
-\x56\x09\x35\xc1\x26\x84\x12\xd3\xec\x92\x3c\x9c\x38\x8b\x76\x5a\
-\x44\x93\x66\x21\x0c\x90\x96\xfe\x3e\x50\x2a\x2e\x50\xce\xed\x4e\
-\xfd\x1a\x1a\x02\x57\xf9\xab\x5e\x8c\x67\x61\x14\xf7\x43\x59\xaf\
-\x6a\x09\x25\x3e\xa8\x32\xcc\x5a\xf0\x86\xa8\x6f\x65\xbc\x98\xfb\
-\x4c\xbc\xfb\x6a\x4a\x3b\x76\x22\x54\x0b\x95\x60\xc8\xc0\xeb\x90\
-\xa8\xbb\xf7\x26\xb0\xb1\x8b\xda\xb0\xd4\x2f\x60\x67\x65\x43\x23\
-\x24\xc8\xb0\x33\xbc\x0b\x12\xcb\xa0\xf8\x25\x87\x88\x87\x5a\x60\
-\x24\x5d\x13\x61\x5c\x1c\xed\x34\xb3\xb7\xee\x4b\x7d\x32\x28\x57\
-\x9e\xb2\xe5\x0a\xfc\x6d\x45\x93\xc8\xca\x17\x1a\x8a\x35\xd7\xe2\
-\xef\x8f\x61\xdc\xb7\x23\xfd\xae\xa2\x92\xbb\x25\x1c\xff\xd0\xf8\
-\x85\x8f\x56\xd6\x77\xa9\x00\x6a\x36\xe1\x99\xbf\xc8\x8b\x9f\xd4\
-\x1a\xf5\xc1\x13\x5e\x3f\x13\x0a\x9d\xd7\x5e\x47\x62\x6f\xf3\x6a\
-\xdd\x27\xb2\x93\xaa\x80\xc2\x1c\xe3\x0d\xc5\xcf\xc3\xdf\x9b\x10\
-\xde\x7a\x94\x74\xe5\x8c\x1e\x35\x4e\xd0\x09\x47\xbc\xfa\xa1\xe8\
-\x7f\x1c\x2c\x6e\x78\x87\x07\x9b\x62\x36\xad\x3d\x74\x6b\xcc\x43\
-\x7c\xf3\x3a\xfe\x78\x8f\x7b\x87\x62\x7a\xcc\xa8\x41\x59\x9b\xd8\
-\x6d\x5a\x63\xc5\x81\x0b\xbb\xbd\xec\xac\x36\xba\x06\xc6\x8d\x6f\
-\xef\x79\x17\x7d\xa9\xa7\x7e\x00\x32\x75\x09\x4a\xdf\x7b\xf1\xf7\
-\x51\x32\x50\x64\x7a\x59\xfd\x99\x02\xd9\x8d\x92\xfd\x79\x84\x91\
-\xc4\xff\xb4\x3e\x65\x95\xfd\x1e\x34\x38\x90\x5e\x5f\x41\x3b\xa3\
-\xe4\xd4\x90\x95\x09\xfc\xef\x42\x5c\xaf\x6b\x86\xaf\xd0\xad\xf6\
-\xe2\x34\x33\x9e\x17\x3f\x4a\xb3\xf6\xf8\x67\xd9\x89\x50\x6f\xec\
-\xda\x84\xbe\xe0\xe6\x67\xc2\x8b\x50\xb6\x2f\xb0\x93\xfa\x82\xfe\
-\x41\x6e\x5f\xe3\xa0\x90\xf1\x1e\xea\x8f\xe4\x0a\x7d\x6c\xa3\x7b\
-\xe5\xae\xeb\xb6\x3f\xce\x85\x8c\x6b\x60\x3c\x50\xae\x32\xfa\x49\
-\xf4\x5d\x27\x6c\x6c\x84\x91\x7d\xbd\xda\x29\xfe\x6e\x42\xdf\x63\
-\xd2\x4b\x85\xf3\xe3\x0e\xe3\xbd\x77\xe2\x9c\x75\x93\xd8\x99\xd0\
-\x30\x50\x5a\x22\xf1\x3b\x14\x19\xf2\xcb\x09\x15\x4d\x53\x6f\x3e\
-\xec\xc9\x9a\x9a\x11\xcb\x7d\xaf\x22\x41\x1f\x8c\x9d\x0f\x39\xf4\
-\xf1\x15\xf1\x2d\x1c\x9a\x7f\x01\x7f\xcf\x65\x27\xc2\x50\x01\x45\
-\x39\x4e\x51\x9b\xa0\xed\x6b\xcc\x6f\x8a\xf6\x78\x15\xb4\xb4\xc7\
-\x03\x78\x8f\xf4\xd4\x0b\x95\x68\xc6\x9a\x72\x6b\xa6\x7a\x42\xcd\
-\x5a\x9f\x16\xff\xbf\xc2\xf8\xd1\x10\xb1\x6b\x4d\x5e\xc1\x05\x4a\
-\xd4\x26\x10\x63\xb8\xed\x51\x3b\x3e\xb2\x71\x02\x8d\x44\x15\xbc\
-\x47\x56\xa8\x2f\xd3\x0c\x4d\x16\x6a\xce\x22\xcd\x5f\xca\x8b\x1b\
-\x6a\x0d\xfa\x76\xc2\x4e\x84\x66\x63\x42\xd8\x08\xa2\x74\x2d\xd8\
-\x7c\x8d\x8c\xc6\xb8\x8e\x3e\x3e\xb2\xb3\x26\x66\x60\x2c\x0c\xe0\
-\xe7\xf9\xf1\xcf\x11\xf4\x3b\x5a\xe8\x7c\x90\x21\x84\x8e\x89\x40\
-\x3c\x7e\xa5\x88\xdf\x0f\xa4\xd6\x18\x0e\x44\xec\xad\x3c\xaf\x86\
-\xd0\xf4\xf9\x6c\x06\xa2\xd9\xf5\x07\x0f\x6d\xe2\xdc\xc4\xd0\x84\
-\xcb\xdc\x38\x17\x0a\xde\x61\x29\x3b\x6d\x3c\x68\xae\xa2\x86\x68\
-\x4f\x37\x5f\x73\xe3\x65\x3c\x83\xb4\x6e\xe8\xc2\x2d\xc1\x05\xd4\
-\xb5\x89\x9d\xa1\x4d\x59\xd2\xd1\xd6\xa3\x50\xc0\xe2\xa5\xb5\x19\
-\xd1\x8c\xa7\x5b\x16\x98\xe3\xd9\x79\x43\xa1\x66\x6a\x89\xb4\x5c\
-\x41\x1b\x37\xb0\x33\x61\xd8\x81\xda\xa4\xd5\xde\xe0\xc1\xfc\x47\
-\x6e\xc6\xa2\x14\xfc\xb3\x57\x8b\x9f\xcf\xae\x86\x1e\x74\xb8\x11\
-\xaf\xbc\x6f\x07\x85\x82\xda\xef\x1c\x76\xdd\x30\xec\x13\xb3\xec\
-\xef\x4e\x05\x7d\x3b\xda\xac\x41\x6a\x8d\x91\x03\x6f\x0c\xbd\x2e\
-\x2f\x93\xed\x8c\x36\x1e\xa4\x6d\x36\xd9\xd9\x90\xd1\x1a\xea\x9e\
-\x5d\x14\xb7\x5c\xd1\x8c\xdf\xb0\xd3\x86\x41\xb3\x80\xe9\xeb\x7d\
-\x41\x3c\xf6\xc0\x38\x6e\xad\x65\x29\xb3\xd0\xac\xd8\x6d\x68\x3a\
-\xac\xb3\xa8\x36\x79\x8d\xae\xbb\x3d\x41\xaf\x5c\x68\x6b\x4f\x34\
-\xad\xfe\x92\x1b\xa7\x3c\x21\xa5\x6c\x4f\xcc\x60\xe7\x75\xc7\x1e\
-\xba\xcd\x39\x6c\x34\x23\x88\xe3\xf6\x6a\x16\x9b\x09\xc3\x8c\x52\
-\xb5\x09\x0c\x25\x81\xeb\x35\xaf\xad\xae\x14\x9f\x16\xbf\xb5\x30\
-\x2e\xb9\x82\x92\xfc\x3e\x76\x5a\x77\xa8\xd9\x49\xcd\xcf\xbc\x38\
-\x48\xad\x31\x0a\x89\x44\xf6\xa1\x05\x44\xc5\x23\x32\xb4\x84\xd6\
-\xb8\xbe\x51\x43\xc2\x34\x1d\xde\x7e\x66\x7e\x1c\xf2\xa5\x01\x46\
-\x4b\xcd\x4c\x3c\xa7\x68\x5d\x3f\x6a\x8d\x6d\x95\xec\x0f\x20\x8c\
-\x30\xec\xb3\xfc\x34\xe3\x11\x85\x62\x3c\x89\x7e\x41\xdd\xbf\x37\
-\xe0\x39\xcb\x0a\x9f\x9d\x2f\xc6\x6f\xd9\x69\x7d\x40\xb3\xd2\x6e\
-\x76\x16\x16\x14\x1a\x1d\x51\x6d\xdc\x38\x3c\xbe\x1d\x09\xf5\xa5\
-\x74\x6d\x02\x45\x31\xef\xac\xd7\x16\x34\x34\xed\x1b\x4a\x58\xf8\
-\xe5\x3f\x5f\xb4\x44\xd9\xeb\xf1\x2b\x85\x6a\x26\xbb\x59\x59\xf0\
-\x4c\xc4\x69\x1b\x2d\x54\x63\x67\x82\x90\x86\x6a\x13\x18\xc4\x9a\
-\x22\x85\x41\x9b\x1c\x06\x74\x81\xdb\x9b\x09\x78\xd3\x47\x36\xe7\
-\x3d\x2b\x4f\xd0\x71\xaf\xc7\xf4\x75\x7b\xe8\x16\xcd\x48\x3c\xa3\
-\xb0\x69\xd7\xd0\xe6\xa5\x30\x2c\xa1\x9d\x12\x13\x97\xa1\x69\x53\
-\x3c\x51\x10\xc6\x53\xc9\xa6\x76\x8e\xa0\xd6\x42\x49\x5d\x72\x0b\
-\x4f\x12\xdc\x5f\xc1\xae\x5d\xa3\x65\xbe\x79\x32\x0c\xf3\x89\xa2\
-\xe7\x69\xc6\x26\x5a\x42\xc0\xce\x04\xc1\x19\x5a\x2a\x0a\xa5\x51\
-\xd4\x26\xe6\x1b\x30\x92\x70\xad\x43\xc2\xb4\xb3\x47\x61\xd8\x85\
-\x02\x45\x3e\x93\x9d\xd7\x0c\x35\x13\xa9\xb9\xa8\x78\x0e\x6a\x11\
-\xe3\x3a\x37\x4f\xd2\x15\x46\x0d\xa5\x6b\x13\x34\xbb\x36\x7a\xb5\
-\xc4\x7b\xd9\x61\xc5\x40\xf9\xe9\xbc\xf2\xbc\x30\xf3\x44\x33\xff\
-\xe5\xd6\x59\xe6\xd4\x3c\xa4\x66\x62\xf1\x33\x8c\xa4\xd4\x1a\x42\
-\xcd\xd0\xce\x1b\x68\xee\xac\x2e\x52\x30\x94\xbe\xa8\x51\xbe\x45\
-\x3b\x12\xb2\xd3\xb2\x41\x78\xf6\xd9\xeb\xa5\x04\xf7\x7b\xd8\x69\
-\xd5\xa4\xfb\x54\xc5\xb5\x20\x0c\x9e\x36\x9a\xee\x68\x86\xe5\xb9\
-\xc2\x08\x82\x76\xe2\x80\x62\x15\x6d\x6d\x8a\x6b\xdb\xed\x5d\xc9\
-\xcb\x64\xfc\xdc\x75\x47\x16\x86\x51\x28\x08\xb3\xfa\xfe\x87\x3d\
-\xff\xcc\x08\x23\x0c\xc5\xc4\x47\x77\x36\x9a\x16\x04\x25\x0e\xb5\
-\x09\x35\x59\x56\x95\xb3\x90\xa9\x55\x8b\x9f\xaf\xf4\x9f\x2b\x5a\
-\xfc\x4a\x76\x5e\x11\xd4\xec\xa3\xe6\x5f\x71\x78\xf6\xa6\xdb\x52\
-\x6b\x08\x8d\xa1\x64\xbb\x3e\x6c\xbc\xe2\xb1\xcf\x32\x2f\x3d\x24\
-\x4c\xfb\xf0\x16\xfb\xcb\x97\x4a\x67\x1a\xd3\xd0\x2c\xfa\x35\x37\
-\xc0\x6f\xf1\x57\x79\xcd\x30\x69\xea\x3f\x3b\x15\x84\xc6\x40\xb5\
-\x05\x4a\xe5\x7b\x8b\x14\x32\xad\x94\xbf\x69\x9d\x97\x98\xcc\x4e\
-\xf3\x80\x22\x3b\x1c\x44\xc3\xa2\x99\x9f\x62\xe7\x83\x42\x5f\xfc\
-\x11\x8f\xe2\x9d\xe7\x69\xc1\x98\x66\x5c\x3d\x54\x93\x30\x05\xc1\
-\x86\xf6\x7b\x52\xd5\x26\x30\x84\x7f\xd0\x5a\x94\x42\x05\xa5\x12\
-\xbd\xd0\x6d\x91\x94\xb1\xd6\x82\x0c\x14\x35\xd6\xca\x12\xfe\xa5\
-\xd6\x10\x9a\x07\xc7\xda\x04\x1d\x63\x3a\x66\x80\x9d\x96\x3e\x6f\
-\x30\x47\x68\x97\x76\x76\xae\x60\x60\xac\x27\x64\x5e\x04\x03\x7c\
-\xb9\xd0\x1f\x19\xa5\x3d\x75\x7f\x98\xee\xe6\x22\x8c\x70\x68\x47\
-\x0f\x18\x0a\xed\x07\x95\xa7\xb8\x90\xdd\xde\x90\xf1\x6d\x9a\x32\
-\x0e\x05\x76\xfc\x82\x4e\xd2\xaa\x25\x94\x7d\x10\x7b\xe8\x36\x6c\
-\xfc\x5a\xe5\x07\xb5\xc6\x3a\x9a\xca\xcf\x4e\x05\xa1\x39\xa1\x05\
-\x47\xde\xb0\x79\x57\x09\x25\x7e\x8a\xbe\xc6\x2b\xef\xe5\x89\x31\
-\x87\x83\x4b\x43\x43\xb7\x9a\xb1\x80\x6a\x88\x42\xb7\x52\x6b\x08\
-\xc3\x12\x87\xda\x64\x50\x81\xd2\xdf\xce\xc1\xd0\xf7\x97\xf7\x23\
-\x9c\x1e\xb5\x3b\xe3\x11\x37\x4e\xb9\x12\x84\x21\xc1\x5e\xbe\x4a\
-\x67\x82\x2b\x94\xdb\x51\x34\x23\xde\x1a\xb1\x0e\x80\x01\x2c\xc1\
-\xef\xa2\xa1\x5b\x6f\xd8\x78\x8d\xa6\xe8\x3b\x9d\x21\x22\x08\xc3\
-\x06\x1a\x95\x42\xb3\xa9\xec\xb3\x48\xa8\x19\x06\xe3\x50\x1d\x1a\
-\x6a\xd7\x1a\xae\xcd\x2a\x16\x84\x66\x81\xf6\x8f\x82\x91\xd0\x31\
-\x07\x45\x4a\x5f\x9e\x18\x3b\x68\x63\x39\xa9\x35\x84\x11\x8d\x5d\
-\x9b\xe4\x9c\xb1\x5e\x96\xc8\x21\x97\xc2\x68\x82\x86\x7b\x7d\xe9\
-\xe3\xa4\xb3\x07\x5a\xaa\x45\x8e\x46\x16\x46\x31\x7c\xae\x86\xb2\
-\xaf\x81\xce\xfd\x43\x52\x6b\x08\xa3\x9e\xec\x1a\x71\xcd\xfc\x1b\
-\x19\x86\x97\x76\x33\x0c\x99\x97\x4a\xad\x21\x08\x05\x54\xb3\xf8\
-\x4a\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\
-\x10\x04\x41\x10\x04\x41\xb0\x19\x33\xe6\xff\x01\x4d\xb4\x5d\xfc\
-\x02\x21\xc5\x0a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x1d\x41\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\xc8\x00\x00\x00\xc8\x08\x06\x00\x00\x00\xad\x58\xae\x9e\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x1c\xd6\x49\x44\x41\x54\x78\x5e\xed\x9d\x09\x9c\
-\x5b\x55\xbd\xc7\x5b\xaa\xa2\x6c\xed\x24\x99\x96\xcd\x07\x6a\x81\
-\x76\x92\xb4\x3c\xea\x52\x7d\x2a\xf2\x10\x41\x9e\x2c\x02\xc5\x8d\
-\x55\x81\xe7\x53\xdb\xd2\x4e\x6e\x5a\x36\xe3\x9b\xe6\x66\x0a\x88\
-\x15\x41\xa4\x85\xd2\xa7\xb4\xa0\x83\x08\x68\x5d\xa0\x6a\x41\x84\
-\x76\x72\x6f\xda\x99\xe4\xce\x74\x53\x28\xb2\x23\xa8\x54\x40\x5b\
-\x4b\xe7\xfd\xfe\x37\xff\xa4\x59\x4e\xee\x64\xb9\xc9\x64\x66\xfe\
-\xdf\xcf\xe7\xff\x99\xc9\xbd\xe7\x9c\x7b\xee\x39\xff\xff\xd9\xee\
-\x59\xc6\x08\x82\x20\x08\x82\x20\x08\x82\x20\x08\x82\x20\x08\x82\
-\x20\x08\x82\x20\x08\x82\x20\x08\x82\x30\x52\x68\x8b\x59\x93\xfd\
-\x7a\xea\xb3\x90\x6f\xf8\x63\xa9\x55\x01\x3d\xd5\x8d\xbf\x5b\xfd\
-\x31\xeb\xc5\x7c\x49\x3d\x11\x88\x59\x8f\xc1\x5d\x17\xfe\xef\x0c\
-\xc6\xac\x0b\xa7\x2e\xee\xf3\x8f\x19\x33\x30\x96\x83\x12\x6a\x21\
-\x12\xd9\x87\xd2\xd3\x1f\x4d\x5d\x80\x74\xd6\x91\xc6\xf7\x20\xdd\
-\x0d\xbf\x6e\xfd\x51\x91\x17\x5b\x91\x4f\x8f\xc2\xed\x2a\xe4\x47\
-\x47\x50\xb7\x3e\xef\x5f\x94\x7a\x0f\x87\x24\xd4\xc2\xac\xae\x81\
-\x71\x30\x8a\x53\x90\x09\xb7\x23\x91\x9f\xc7\xdf\x81\x9a\x44\x4f\
-\xbd\xe2\xd7\xfb\x56\xb6\xe9\xd6\x39\x47\x44\x9e\x7c\x3b\x3f\x46\
-\x28\x83\x19\x11\x73\x3f\x4a\x37\xa4\xe1\x5d\x50\xf4\xbf\x29\xd3\
-\xb7\x02\x81\x31\x3d\x1d\xd0\xad\xdb\xda\x16\xf5\x9c\x42\xf9\xcc\
-\x8f\x19\xfe\xb4\x45\xac\x03\x50\x2a\x7c\x25\x23\x81\x68\x72\x0e\
-\x5e\x38\x52\xab\x20\xf1\xe7\xe5\x85\x8b\x6b\x28\x81\x9e\xc1\x5f\
-\x65\x02\xd7\x2a\x78\xc6\x73\xc1\xa8\x75\x11\xbf\xd6\xb0\xe4\x98\
-\x48\xe2\xd0\xdc\x34\x83\x5c\x8e\x77\x53\xa6\x6f\x65\xd2\x37\x27\
-\x37\xdc\x80\x9e\xbc\x0e\x0a\xfd\x17\xdc\x53\xa6\x65\xad\x42\xc6\
-\xe2\xef\xdc\x74\x1a\xbf\xd6\xf0\xa7\x6d\x91\xf5\x61\xbb\xf9\xa2\
-\x5b\x6f\xa8\x5e\xb8\x7a\x49\xbd\x89\xbf\x5b\xb3\xbf\x75\x6b\x2d\
-\x3f\xb2\x88\x63\xae\xdd\x74\xe0\xb1\xfa\x86\x56\x27\x99\x1e\xd9\
-\x38\x81\x9d\x8f\x4c\xd0\xd4\x69\x8b\xf5\x9e\x0e\x25\xfe\x05\x0a\
-\x93\x5d\x7b\xd3\xb1\x76\xa1\xf0\xa8\xc9\x94\xfd\xad\xa7\x56\xf0\
-\x53\xb3\xb4\xdd\x60\x79\x54\xe9\xee\x24\x23\x3e\x4f\x72\x99\x11\
-\x79\x76\x3f\xb4\x2d\x4f\x83\x7c\x07\xca\xbd\x11\xb2\x33\x37\x91\
-\xcb\x94\x3f\xc0\xff\x9d\xa8\x89\xbe\x88\x92\x6a\x12\x4a\xaf\x53\
-\xb3\xf7\x1c\x0c\x44\xc8\x87\x14\x0f\xcd\xd1\xcf\x41\x91\x97\x22\
-\xdd\xfa\xa1\xe0\xff\xca\x49\xe3\xc1\x45\xb7\x76\x93\x3f\xe4\xc1\
-\x6d\x14\x0e\x85\x67\xd7\x1e\x7c\x5f\x65\x20\x42\x85\x1c\x1f\x19\
-\x78\x4b\x40\xdf\x3c\xc5\xbf\x38\x75\x32\x12\xf9\x42\x45\xf3\x6b\
-\x3e\x12\xfa\x4b\x48\xf8\x4f\x05\xa3\xfd\xc7\x51\xbb\x96\xbd\x66\
-\x11\x03\x71\x87\xc9\x37\x6e\xdd\x17\xca\x3e\xcd\x4e\x4f\x14\x3e\
-\xd4\x84\xcd\xc9\x87\x08\xf2\x61\x6e\xb0\xd3\xba\x28\x18\xed\xfb\
-\x64\xb0\xa3\x37\x48\xee\xd9\x6b\x16\x31\x90\x26\x44\x0c\xa4\x79\
-\x10\x03\x69\x42\xc4\x40\x9a\x07\x31\x90\x26\x44\x0c\xa4\x79\x10\
-\x03\x69\x42\xf2\x0c\x24\x66\xfd\x9e\x46\x3e\x66\x2c\x35\xdf\xca\
-\xb7\x85\x06\x22\x06\xd2\x24\xd0\xb7\x15\xd4\x16\xdf\x0d\xe8\xa9\
-\x97\x73\x8c\x23\x4f\x90\x41\x26\x3a\x9d\x27\xb1\x17\xa1\x4e\x04\
-\xf4\x3f\x4e\x42\x5a\xaf\x44\x9a\xbf\x5a\x98\x07\x69\x49\xed\xf4\
-\xeb\xd6\x1a\x7f\x47\x6a\x3a\x7b\x11\xea\xca\xac\xae\x71\x48\xf8\
-\xdf\x16\x67\x44\xb1\xd0\xd0\xe5\x54\xbd\xf7\x44\xf6\x29\xb8\xcc\
-\xb4\xf6\x9e\xfd\x51\x50\xf5\xab\xd2\xbe\x48\x74\x6b\x87\x7f\x71\
-\x6a\x2a\x7b\x15\xea\x45\x5b\xcc\x3a\x5d\x99\x01\xa5\x44\xb7\xe2\
-\xec\x55\x70\x19\x34\x6f\x69\x58\x5e\x9d\xee\x2a\xe9\xb4\x7e\xc8\
-\x5e\x85\x7a\x11\x88\x5a\x8b\x94\x89\x5f\x42\xa8\x16\x61\xaf\x82\
-\xcb\xd8\x1f\x6c\x15\x69\x5e\x4a\xd0\x14\xdb\xc6\x5e\x85\x7a\x81\
-\x1a\xe1\x3a\x55\xe2\x3b\x09\x7b\x15\x5c\x06\x0a\xdf\xa5\x4a\xef\
-\x52\x02\xf7\x4f\xb2\x57\xa1\x5e\x88\x81\x34\x0f\x62\x20\x4d\x88\
-\x18\x48\xf3\x20\x06\xd2\x84\x88\x81\x34\x0f\x62\x20\x4d\x88\x18\
-\x48\xf3\x20\x06\xd2\x84\x88\x81\x34\x0f\x62\x20\x4d\x88\x18\x48\
-\xf3\x20\x06\xd2\x84\x54\x63\x20\xc8\x98\x64\x20\x96\x9c\xdf\x16\
-\xb1\x0e\xe6\x60\x86\x0c\x5a\x55\xd7\x16\xb3\x26\xb7\xe9\x56\x5b\
-\x2d\x12\xec\x4c\xbe\x7b\xa8\xd6\x66\x4f\x8b\xf4\x4c\xb4\x3f\x12\
-\xea\xd6\xb3\xaa\xf4\x2e\x25\x62\x20\x0d\xa0\x1a\x03\xc9\x08\x7d\
-\x34\x84\xac\x0e\x46\x93\xb3\x1a\xb5\x09\x03\x29\x71\x30\xfd\xf5\
-\xff\x6e\x7f\x2c\xe5\xf2\x9a\xf9\xd4\x4e\xa4\xc7\x5a\xfc\x3f\x7f\
-\xea\xa2\xbe\x23\xf8\x91\x75\x81\x26\x80\x06\x3a\x93\x9f\x86\x92\
-\xdf\x8f\x34\xac\x6a\xb9\xae\x18\x48\x03\xa8\xc5\x40\x72\x85\x36\
-\x15\x80\x7c\x2f\x18\xed\x9f\xc9\x41\xbb\x0e\x4a\xfa\x73\xa0\x4c\
-\xb4\xa5\x90\x32\x0e\x6e\x0a\x94\x6f\x97\x3f\x9a\xba\x99\x4a\x77\
-\x7e\xbc\x2b\x4c\x89\xf6\x1f\x47\x4b\xa4\xf1\x1e\x2f\xa9\x9e\x5b\
-\x89\x88\x81\x34\x00\xb7\x0c\x24\x57\x90\x71\x9b\xa1\x04\x57\x05\
-\x17\xf7\x1e\xce\x8f\xa9\x89\xc9\x91\xad\x07\x21\xcc\x07\x54\xcf\
-\xaa\xbb\xe8\xa9\x57\x82\x8b\x92\x1f\xe7\xa8\x54\x05\x35\x45\xa9\
-\x49\x8a\x77\x40\xd3\x54\xf1\x8c\x2a\x45\x0c\xa4\x01\xd4\xc3\x40\
-\xf6\x4a\xea\x4d\x7b\x6a\x76\x2c\x75\x3e\x6d\x30\xc1\x8f\xac\x08\
-\x2a\xc1\x51\xda\xa6\xd4\xe1\x37\x46\xa8\x09\x84\xda\xeb\x52\x8e\
-\x52\x59\xc0\x28\xde\x46\x35\x5e\x40\x4f\xfe\x0c\xfe\x2b\xdb\xc0\
-\xa1\x4c\x11\x03\x69\x00\x7e\xbd\xef\x1b\xaa\xc4\x77\x5d\x68\x7a\
-\xb6\x9e\xba\x23\xa0\xf7\x1f\x5f\xee\x0e\x8b\xe9\x3d\xc0\x86\xd6\
-\x38\xf6\x0a\x8c\x3d\x9a\x1a\x74\xef\x28\x14\x06\xef\x43\x87\xfb\
-\x66\xaa\x79\xd4\xe1\xb8\x27\x48\xcf\x2d\xfc\x58\xa1\x5e\x20\x91\
-\x4f\x50\x25\x7e\x3d\x85\x4a\x3e\x28\xd2\xff\x0e\xb6\x05\x26\x6a\
-\x9f\xe5\x2a\xff\x43\x26\x30\xf2\x63\x3b\x36\x1c\xc5\xd1\xcb\x82\
-\x7e\xc5\x21\x30\x1e\x0d\x46\x61\x29\xfd\xd5\x49\x90\x8e\xcb\x39\
-\x0a\x42\x3d\xf1\x77\x56\x36\xfe\xee\x9a\xe8\xa9\x3d\x90\x47\xfd\
-\x9d\xfd\x97\x50\x3f\x83\xa3\x63\x13\x5c\xd4\xfb\x51\xa5\x9f\x21\
-\x16\x18\xf6\x7d\x14\x3f\x1a\xb5\x43\xf3\xe9\x5c\xfc\xa6\x4d\xe3\
-\xea\xd2\x84\x72\x96\xd4\x73\x6e\xf5\xf1\x84\x41\xa0\xa1\x53\x64\
-\xf4\xe5\x28\x91\xd6\x43\x2c\x85\x24\x71\xbf\x57\x9d\x51\xee\x08\
-\x94\xec\x75\x3c\xe7\xae\x60\xb4\xf7\x0c\x6a\x86\xc1\x70\xd6\xa9\
-\xdc\x35\x89\xdc\x8d\xb8\xfe\x55\x71\xdd\x35\x41\xf8\x5b\x38\xed\
-\x8b\xf2\x02\xf7\x6f\xa1\x5a\x8b\xb3\x4f\x68\x16\x68\x89\x27\x0c\
-\xa5\x13\x4d\x9f\xa7\x0b\x33\x54\xc4\x15\xf9\x13\x6a\xa5\xe8\x94\
-\x58\xcf\xd1\x9c\xe4\xc2\xb0\x64\x56\xd7\xb8\x60\x67\xf2\xe3\x28\
-\xf5\xef\x84\xb1\xbc\xa6\xc8\x68\x91\x32\xc5\xae\x39\x91\x8e\x94\
-\x9e\x94\xae\x9c\xc2\xc2\x48\x81\x36\xb1\x46\x46\x5f\x8c\x0e\xec\
-\x5a\xbb\x4f\xa1\x50\x02\x91\x02\xc9\xf4\xbd\xa2\xa9\x4b\x28\xfd\
-\x38\x29\x85\x91\xce\x31\x91\x8d\x47\x42\x01\xae\x41\xe6\x6f\x2b\
-\x52\x0a\x11\x32\x8c\xed\xe8\x43\x74\xc8\x01\x36\x42\xe6\x88\x86\
-\xa5\x90\x9a\x0f\x7b\x19\xde\x92\xfa\x3b\x6a\xd7\xef\x23\x1d\x4e\
-\xa0\xe3\x12\x38\x79\x04\x21\xcd\xcc\x1b\x1e\x7f\x07\x3a\xf6\x9f\
-\x19\xba\xe1\xd0\x21\x10\x34\xa1\xf0\xae\x0f\xe3\xff\x8b\xe9\x63\
-\x27\x27\x85\x20\x38\x33\x25\x6a\x1c\x12\xd0\x93\xed\x3c\x54\xa9\
-\x56\xae\x61\x2c\x28\x04\x68\x22\x65\x64\x7a\xe7\xa6\x23\xf9\x95\
-\x05\xa1\x3a\xda\xa2\xd6\xb1\x50\xa6\x6f\xc3\x58\x5e\xcc\x55\xb2\
-\x61\x27\xf6\x14\x1a\x6b\x79\x25\x53\x68\x04\xa1\x6c\xe8\xd0\x9f\
-\xb6\x8e\xde\xd3\xd1\x56\xbf\x07\xc6\xa2\xfa\x30\xd6\xac\xb2\xc6\
-\x1f\x4d\x5d\x30\xed\xfa\x9e\xfd\xf9\x55\x04\x41\x10\x04\x41\x10\
-\x04\x41\x10\x04\x41\x10\x84\x11\x8d\x3d\x92\xa5\x5b\x0b\x03\x39\
-\xc7\x24\x97\x27\xa9\x6f\x41\x6e\xae\xb7\xf8\xf5\xbe\x3b\xfc\x7a\
-\xaa\x4b\x25\x74\x9c\x36\xbf\x86\x20\xd4\x87\x40\x34\x79\x3d\x14\
-\x5e\xfd\x9d\xa1\xc9\x85\x3e\x0e\x4e\x5f\xf2\xe4\x04\x7e\x15\x41\
-\x70\x97\x80\xde\x77\xa6\x3d\xbb\x55\xa1\x7c\xc3\x45\x50\x93\x3c\
-\x20\x1f\x09\x05\xd7\xa1\x59\xad\xfe\x98\x55\xd7\x95\x79\x0d\x13\
-\x34\x11\xf9\xb5\x04\xa1\x76\x68\x12\x23\x6a\x8e\x0d\x4a\x65\x1b\
-\x86\x62\x4f\xc4\xb4\xa7\x9b\x08\x82\x0b\xa0\xe3\xbb\x54\xa5\x68\
-\xc3\x5a\xf4\xd4\xf3\x34\x21\x93\x5f\x51\x10\xaa\xa3\x2d\x66\x5d\
-\xa8\x54\xb0\x11\x20\x34\xcd\x7d\xa8\x36\xc1\x16\x46\x00\x01\x3d\
-\x39\x0d\x4a\xf4\xba\x4a\xb9\x46\x90\x5c\xcb\xaf\x2b\x08\xe5\xc3\
-\x7b\xec\x6e\x56\x28\x94\x5a\x74\x6b\xb7\xf2\x7a\xb3\x8b\x9e\xda\
-\x43\xe7\xcf\xf3\x6b\x0b\x42\x39\x0c\x8c\x45\xcd\xf1\x23\xa5\x42\
-\xa9\x44\xb7\x1e\x0b\xe8\x7d\xe7\x29\xef\x0d\x9d\xdc\xaf\xb8\xa6\
-\x14\x3f\xed\x76\x2f\x6b\xcf\x85\x72\x41\xcd\x31\x57\xa5\x48\x2a\
-\x81\x21\xbd\x38\x3d\xba\xe5\x30\xf6\xb7\x46\xe5\xa6\xe1\xa2\xa7\
-\x2c\xda\x96\xa7\x4d\xb7\xbe\xaf\xbc\xaf\x10\x7f\x2c\x95\xa0\xd1\
-\x3a\x3b\x01\x04\xa1\x14\x81\x58\xff\x07\x03\x74\x38\x8d\x42\x89\
-\x8a\x84\x9a\x55\x7a\xf2\x24\xf6\x4a\xbb\xbb\x1f\x0d\xe5\xfc\xa7\
-\xd2\x6d\x03\x25\x18\xed\x3b\xc3\x8e\x4f\x7b\xcf\xfe\x30\xe0\xb2\
-\x77\x99\xa4\xd1\x3a\xfb\x45\x04\x41\xc5\xb1\xfa\x86\x56\x28\xf8\
-\x53\x2a\xe5\x29\x21\xd7\xb0\xd7\x2c\x6d\xd1\xe4\x22\x85\xbb\xc6\
-\x89\x9e\x8c\xe7\x7e\x29\x0f\x76\xf4\x1e\x83\x77\xda\xa1\x74\xab\
-\x10\x1a\xb5\x63\xaf\x82\x90\x43\x24\xb2\x0f\x6a\x84\x5f\xa9\x94\
-\x46\x29\x70\xab\xda\x1a\xc7\xfe\xa8\x18\xb3\xfe\x50\xe4\xbe\x51\
-\x92\x53\xa3\x65\x08\xd2\xd9\x1f\x2a\xb7\x0a\xb1\x47\xed\xf4\xe4\
-\x34\xf6\x2a\x08\x69\xa0\x1c\x34\xeb\x56\xa9\x34\x45\x82\x5a\x86\
-\x0e\xe4\x64\xaf\x45\x04\xa3\xbd\x9f\x54\xfa\xab\xb7\xe8\xd6\x5a\
-\x8e\x42\x11\xb8\xb7\x44\xe9\x47\x21\xe8\x4b\x6d\x29\xdc\xc1\x5e\
-\x18\xc5\x04\xf4\xfe\x93\xec\xfe\x84\x42\x59\x8a\x25\xb5\x73\x6a\
-\xac\xef\x03\xec\xb5\x24\x70\x7b\x6f\xb1\xdf\xfa\x8a\x7f\x51\xea\
-\x43\xfc\xf8\x22\xe8\x14\x29\xbc\xe3\x63\x2a\x7f\x2a\x41\xa7\xfd\
-\x1e\x99\xd4\x28\x8c\x09\x46\x7a\x0f\xa7\x91\x28\x95\x92\x28\x45\
-\xb7\x66\xb3\x57\x47\xe8\x3c\x0c\x18\xd3\xdf\x95\x61\xd4\x43\x74\
-\xeb\x67\xfc\xe8\x92\xc0\x80\xde\x59\xc9\xbb\xc2\x48\x2e\x67\xaf\
-\xc2\x68\x84\x16\x3f\x55\x52\xaa\x06\x3a\xad\x1f\xb2\xd7\xb2\x68\
-\x5b\xd4\x7b\x21\x9a\x2b\x45\x0b\x97\x02\xb1\xe4\xbd\x68\xa6\xe5\
-\x4f\x9b\xd7\x53\x7f\xc6\xbd\x9b\xda\x74\xeb\xab\xf8\x7d\x05\x94\
-\x93\x76\x3b\xcc\x7f\x7e\x2c\xb5\x1d\xf1\x5d\x6b\x4b\xcc\xfa\x3d\
-\xdc\x67\xb7\xf6\xa1\xbd\xbb\xf8\xb1\x8e\xf8\x63\xfd\x9f\x80\xff\
-\xb2\x6a\x4b\x18\xd3\x2e\x1a\xd5\x63\xaf\xc2\x68\x03\x8a\x52\x49\
-\xbb\x7c\xb3\x5b\x5b\x73\xa2\xd3\x7c\x69\x5e\xd8\x31\xeb\x47\xd3\
-\x23\x1b\x8b\x16\x32\x4d\xed\xec\x3b\x23\xf7\xc8\x06\xc4\x61\x2b\
-\x9d\x59\xce\xb7\xab\x06\x61\x95\xdd\xdf\x42\xdc\x9e\xa1\xd1\x3d\
-\xf6\x2a\x8c\x16\xa6\x75\xa6\xce\x2e\x2a\xc5\x4b\x08\x29\xe9\xf4\
-\x8e\x3e\x3f\x7b\xad\x19\x3c\x37\x3b\x85\x05\x0a\xf8\x88\x93\xd2\
-\xc3\x28\xce\xca\x8f\x4b\xea\x2c\xbe\x55\x3d\x15\x8e\xd8\xe1\x99\
-\x6b\xe4\x3c\x90\x51\xc4\xd4\x8e\xbe\xa3\x90\xe9\xaf\xaa\x94\x41\
-\x29\x7a\xdf\x79\xec\xb5\x66\x82\x91\xe4\xbb\x73\xc3\x9e\xaa\xf7\
-\x7d\x84\x6f\x95\x04\x71\x5d\x9f\x71\x8f\xff\x57\xf0\xe5\x9a\x38\
-\x3a\xb2\xd9\x47\xa3\x71\xb9\x71\x71\x92\xa0\xde\xd7\xc1\x5e\x85\
-\x91\x4c\x7a\xf1\x53\x5f\x8f\x4a\x09\x54\xe2\x8f\xf5\xdd\xca\x5e\
-\x5d\x21\x10\xeb\x3b\x35\x1b\xbe\x9e\xdc\x59\xce\x74\x73\x18\xc5\
-\xe2\x6c\x7c\x74\xeb\x71\xbe\x5c\x33\x53\xa2\xfd\x33\xcb\x9e\x35\
-\x10\x4b\xbd\xd9\x16\xb3\x4e\x61\xaf\xc2\x48\x85\x4a\x60\xb5\x02\
-\x14\x0b\xcd\x4f\x9a\x7c\xe3\xd6\x7d\xd9\xab\x2b\x04\x3a\xfb\x3f\
-\x9d\x0d\x3f\x9a\x7a\x81\x2f\x3b\x02\x43\x6a\xcf\xfa\xd1\x53\x1b\
-\xf8\xb2\x2b\x04\x62\xc9\x39\x99\xb0\x07\x15\x3d\xf5\x32\x8d\x84\
-\xb1\x57\x61\xa4\x11\x88\x26\xb3\xca\x39\x98\xd0\x0c\xd7\x7a\x1c\
-\x0d\x40\xdf\x2a\xb2\xcf\xd1\xad\xdd\x53\x62\xdd\x5e\xbe\x55\x12\
-\x94\xde\xcb\x72\xfc\x0c\x3a\x9c\x5b\x29\x34\x48\x90\x0d\x7f\x10\
-\x69\xd3\x93\x3f\x65\x6f\xc2\x48\x03\x8a\xa0\x18\x3a\x55\x08\x1d\
-\x2a\x13\x4d\x9d\xc6\xde\x5c\x65\xe6\x0d\x7f\x7a\x47\xee\xc8\x14\
-\xd5\x0e\x7c\x4b\x09\x6d\xd3\x43\x25\x77\xd6\x7d\x34\x79\x05\xdf\
-\x72\x0d\x1a\x9d\x43\xcd\x54\xde\xda\x17\xa4\x8d\x1c\xeb\x3c\x42\
-\x81\x12\x94\x75\xc4\x1a\xb5\xf9\xd9\x4b\x5d\x80\xf1\xdd\xb9\xf7\
-\x59\xd6\x6b\x68\xca\xbd\x8f\x6f\xe5\x41\xa3\x5b\xb8\x77\x5f\xd6\
-\x6d\xcc\xda\x55\xaf\x75\x1b\xd3\xf4\x9e\x40\x9e\xe1\x3a\x08\x3a\
-\xec\x83\x0e\x2c\x08\xc3\x10\x28\xdb\x73\xaa\x0c\xcf\x15\xaa\x65\
-\xea\xbd\x4e\x3b\xd8\xb1\xe9\x18\x18\xe1\xae\x9c\x67\xbe\xee\x8f\
-\xf6\x69\x99\xef\x0d\xf4\x7c\x7f\x67\xea\x63\x70\xb3\x2e\x37\x6e\
-\xe8\x2f\xdc\x62\x07\x50\x27\xca\x5d\xf4\x15\xec\xdc\x14\x64\x2f\
-\xc2\x48\x22\xaf\x2d\xaf\x12\x3d\xf5\x3c\x9a\x1b\x07\xb3\xf3\xba\
-\x82\xe7\x5d\x5c\xf4\xfc\x74\x1c\x5e\x86\x14\xad\x29\x81\x71\xf7\
-\x36\xe2\x00\x1c\x1a\xb5\x2b\x7c\x76\xae\xa0\x96\xd9\x22\x07\x7c\
-\x8e\x50\x8e\x8a\x6e\x39\x2c\xaf\x3d\x9f\x27\xa9\x7f\x04\x17\xf5\
-\x7e\x94\x9d\x36\x84\xb6\x58\xf2\xe2\xdc\x9a\xa4\x94\xc0\xcd\x23\
-\x8d\xfa\x9a\x4d\xa3\x76\x78\xa6\x72\xfa\x0d\xc5\x75\xaa\xde\x77\
-\x22\x3b\x15\x46\x22\x6d\xba\xd5\x06\x63\xf8\x5d\x41\xc6\x3f\x01\
-\x39\x81\x9d\x34\x94\x29\xb1\x9e\xa3\x11\x9f\x55\xca\xf6\xbf\x6e\
-\xf5\xd3\x01\xfe\x8d\xfe\x8a\x6d\x77\xda\xed\x8d\xb0\xf3\xa6\xb9\
-\x74\x4b\xdf\x63\x14\xe1\x5f\x9c\x9a\x4a\xbb\x79\xd8\x1d\xe4\x26\
-\x98\x46\x31\x23\x62\xee\x47\x13\x03\xa1\x88\x67\xc1\x28\x4e\x6e\
-\x86\xd3\x67\x8f\x88\xac\x7d\x7b\x40\x4f\x4e\x51\xcd\x13\x13\x04\
-\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\
-\xa8\x88\x48\x64\x1f\xaf\xd6\x7d\xa2\x4f\x8b\x7f\xdd\x13\x36\x17\
-\xfb\x34\xe3\x92\x03\x17\x0e\x3e\x1d\x5e\x10\x46\x3c\xad\x0b\x13\
-\x93\x7d\x21\xc3\xf0\x85\xcd\x81\x02\x79\xd5\xab\x19\x5f\x66\x67\
-\x82\x30\xfa\xf0\x5c\xb9\xf1\x30\x5f\xd8\x78\xd6\x36\x08\xcd\xd8\
-\xe3\x0d\x1b\x1b\x61\x14\x8f\xe0\xf7\x8e\xbd\x86\x62\xcc\x61\xe7\
-\x82\x30\xba\x80\xf2\xaf\x64\x23\xd8\x01\x03\x39\x95\x2f\x8f\x99\
-\x38\x67\xdd\x24\xaf\x16\x7f\x88\xee\x79\xc3\xe6\x1b\xbe\xcb\x1f\
-\x91\x85\x4a\xc2\xe8\xc2\x33\x7b\xfd\x41\x30\x8a\x9d\xb6\x11\x68\
-\xf1\xaf\xf0\xe5\x2c\xe3\xe7\x6e\x9c\x80\x1a\xe5\x45\x36\xa0\xf9\
-\x7c\x59\x10\x46\x07\x30\x8e\xe3\xd2\xca\x6f\x0e\x1c\x70\x85\x7a\
-\x4a\x3b\xdc\xac\x4a\x1b\x50\x62\x19\x5f\x12\x84\xd1\x81\x4f\xdb\
-\x70\x7c\xc6\x40\x0e\x89\x98\xfb\xf1\xe5\x3c\xd0\x1f\x59\x91\x36\
-\x10\xc3\x95\x3d\xb1\x04\x61\xd8\x20\x06\x22\x08\x0e\x88\x81\x08\
-\x82\x03\x62\x20\x82\xe0\x80\x18\x88\x20\x38\x20\x06\x22\x08\x0e\
-\x88\x81\x08\x82\x03\x62\x20\x82\xe0\x80\x18\x88\x20\x38\x20\x06\
-\x22\x08\x0e\x88\x81\x08\x82\x03\x62\x20\x82\xe0\x80\x18\x88\x20\
-\x38\x20\x06\x22\x08\x0e\x88\x81\x08\x82\x03\x62\x20\x82\xe0\x80\
-\x18\x88\x20\x38\x20\x06\x22\x08\x0e\x88\x81\x08\x82\x03\x62\x20\
-\x82\xe0\x80\x18\x88\x20\x38\x20\x06\x22\x08\x0e\x88\x81\x08\x82\
-\x03\x62\x20\x82\xe0\x80\x18\x88\x20\x38\x20\x06\x22\x08\x0e\x88\
-\x81\x08\xa3\x12\xdf\xc2\xc4\x0c\x6f\xd8\xfc\xb1\x4f\x33\x5e\x65\
-\xe5\x7e\xce\x17\x36\xbe\xdb\x32\x3f\xfe\x4e\x76\x62\x53\x93\x81\
-\xcc\xea\x1a\xe7\x0b\x77\x5f\x8a\x7b\x71\x9f\x66\xfe\x0b\x7f\x77\
-\x7b\x35\x73\x83\x27\x9c\xf8\xda\x98\xcb\xcc\xb7\xda\x6e\x22\x91\
-\x7d\x3c\xed\xeb\x3e\x80\xb8\x2c\xf2\x6a\xf1\xef\x78\x34\xf3\x4a\
-\xc4\xe9\x16\xda\x08\x7b\x52\x7b\xcf\xbb\x6c\x37\x82\xd0\x48\x7c\
-\x5a\xfc\x8b\x50\xc0\x5d\x19\xc5\xcf\x15\x6f\xd8\xf8\xb3\x27\x6c\
-\xce\x64\xa7\x55\x1b\xc8\xa4\xf6\x07\xf7\xc7\xef\xd5\x19\xbf\x45\
-\xa2\x99\x6b\x7d\x21\xe3\x9b\x30\x96\x9b\x3d\x21\xe3\x82\x83\xe6\
-\x3d\xee\x61\xaf\x36\x3e\x6d\xdd\x51\x30\x26\x0d\x06\x73\x2b\xc2\
-\xe9\xf0\x84\x8d\xf7\x8f\x19\x33\x30\x96\x6f\x0b\x42\x7d\xa0\xd2\
-\x9a\x4b\x73\x52\xe8\x6d\x2d\x9a\x71\x89\x57\x4b\x9c\x88\xd2\x5b\
-\xc3\xef\xbf\xb2\xf2\xbe\x9a\x31\x92\x6a\x0c\x84\x8c\xc3\x36\x00\
-\xf6\x87\xeb\x3f\x81\xb2\x9f\xe9\x6d\x8f\x9f\x06\xc3\xfc\x41\xf6\
-\x7a\xd8\xb8\xcd\x0e\x60\x10\x5a\x43\xdd\x07\xfb\x42\xdd\x97\x22\
-\x9c\x65\x90\x25\xad\xa1\xc4\x29\x63\x22\xd6\xdb\xf8\xb6\x20\xb8\
-\x07\x14\xf5\xc7\x69\xe5\x34\x9f\xf0\x6a\x9b\x0e\xe4\xcb\x36\x93\
-\x16\x6c\x3c\x12\x0a\xf8\xa4\xad\xc0\x6c\x24\x95\x1a\x48\x9e\x71\
-\x68\xc6\x1e\x4f\x7b\x77\xd1\xc9\x53\xb8\x7e\x35\xdf\x7f\x13\xc6\
-\x79\x28\x5f\x2e\x8b\xd6\x88\x75\x00\x6a\x95\x59\x88\xdb\xf7\xf0\
-\x0e\x4b\xf1\x3e\x5f\xa0\x33\x4a\xf8\xb6\x20\xd4\x06\x14\xea\x6f\
-\xb6\x32\x87\x8c\xff\xe1\x4b\x79\x1c\x7c\x55\xe2\x88\x5c\x23\xf1\
-\x86\xcc\x85\xf6\xff\x90\xc1\x0d\xc4\xec\xca\x35\x0e\x6f\x28\xfe\
-\x55\x76\x92\x0f\xfa\x1f\xa8\x3d\xfe\x6e\xfb\x09\x1b\xbf\x6b\x0d\
-\x9b\x27\xf3\x9d\xca\x40\x38\x68\x7a\x9d\x84\xe7\x2f\xa1\x38\x78\
-\x42\x89\xd9\x13\xda\x13\x47\xf0\x5d\x41\xa8\x90\xc8\xda\xb7\x64\
-\x94\xbd\xc5\x41\x29\xf3\x8d\xc4\xd8\x93\xf1\x33\x98\x81\x64\xdd\
-\x3a\x19\x07\x03\x3f\xfd\x99\x70\x49\xf0\xbb\x07\x7e\xce\xa3\x38\
-\xb2\x93\x0a\x19\x18\x8b\xda\xe8\xbd\x30\xd2\x28\xc2\xa3\x66\x5c\
-\xc4\xb7\x20\xfe\xef\x7c\x53\x10\xca\x03\x8a\xf8\x5c\x5a\x29\x8d\
-\xab\xf8\x92\x92\x3c\x23\x61\x19\xd4\x40\x48\xca\x30\x0e\xfb\xd8\
-\x36\x4d\x3d\x48\x00\xff\x4f\x41\xd1\xcf\xa7\xd1\x2d\x76\x5e\x15\
-\xad\x21\xe3\x3d\xa8\xfd\x42\x1e\xcd\x58\x85\xda\xf2\xdb\x54\xd3\
-\x54\x6f\x7c\xc2\xa8\x81\x86\x72\xd3\xca\x68\xec\x18\x6c\x18\xb5\
-\xd0\x48\xca\xa9\x41\x06\x33\x0e\x2a\xe9\xf1\x6c\x3e\x14\xd4\xdc\
-\xe1\xd1\xba\x67\xc1\x7f\x5f\xe6\x19\x59\xd1\x8c\x75\x9e\x76\xe3\
-\x03\xec\xa9\x26\xf0\x9e\x13\xf1\xcc\x2f\xa1\xdf\xf2\x03\xd4\x30\
-\xb7\x23\xfc\x73\xe9\xec\x45\xbe\x2d\x08\x7b\xa1\xef\x1c\x34\x94\
-\x4b\x4a\x48\xca\x4f\x46\xc0\xb7\x94\xe4\x1a\x89\xa3\x81\x94\x6b\
-\x1c\x9a\x79\x53\xc6\x08\xe0\x6f\x81\x7d\x99\x9a\x7e\x9a\x31\x0f\
-\xbf\x5f\xcf\xdc\xb3\x85\xc2\xd4\xe2\x37\x1d\x11\x59\xfb\x76\xdb\
-\x9d\x0b\xc0\x58\xf6\xf7\x84\xe2\x67\x93\xa1\xe0\x79\x77\x43\xbe\
-\xec\x99\xb7\xf1\x30\xbe\x2d\x08\x34\x8a\x64\x7e\x04\x46\xf2\x1a\
-\x2b\x69\xd9\x46\xe2\x60\x20\x77\x54\x6e\x1c\xe6\xed\x85\xdf\x35\
-\xbc\xf3\x1f\x9b\x02\xa3\x30\xb3\x06\x92\x75\x6b\x24\x5b\xc2\xdd\
-\x7e\x76\xe6\x1e\x30\xcc\xf4\x10\xb7\x71\x23\x84\x3e\x9a\x5e\x3d\
-\x21\xb4\x6e\x1a\xdf\x15\x46\x33\xde\x76\xe3\x63\x95\x1a\x49\xf6\
-\xeb\x77\x01\xf4\x51\x8f\xff\x2d\x41\x81\x71\x84\xcc\xe5\x25\xfb\
-\x18\xb3\xb7\xee\x8b\xfb\x77\x65\xdc\x66\xfd\x84\xcd\x37\x3c\xa1\
-\xc4\xd9\xec\xaa\x2e\xf8\xda\x13\x33\x90\x16\x1d\x1e\x2d\x7e\x3f\
-\x0c\xf8\x06\x1a\xe2\x1e\xd3\x35\x30\x8e\x6f\x0b\xa3\x05\x6a\x66\
-\xb5\x86\x8d\xaf\xa1\x5d\x6e\x90\xe2\xd9\x0a\x58\x86\x91\x54\x47\
-\x05\xc6\x91\x65\x60\x2c\x94\xf4\xda\x8c\x9f\xac\x68\xc6\x9b\xad\
-\xe1\xf8\xc5\xec\xa8\xae\x50\xff\x0c\xe9\x33\xdf\x17\x8e\xdf\x87\
-\xb4\xb9\xc3\x13\x8e\x9f\x45\xcd\x33\xbe\x2d\x8c\x34\x26\x2c\xd8\
-\x30\x1d\x19\x7e\x0d\x32\x7b\xb5\x37\x1c\xbf\xcd\xd7\x6e\xfc\x97\
-\x5d\x5a\x57\x58\x93\x54\x46\x35\xc6\xb1\x17\xc4\x6b\x69\xd6\x38\
-\x32\x42\x46\xa2\x99\xb3\xd8\x49\x43\x38\x64\xbe\xe9\x6b\x0d\x27\
-\x2e\x46\xad\xd2\x85\x3e\xd1\x3d\xf4\x55\xdf\x77\xb9\x71\x08\xdf\
-\x16\x86\x25\x76\xfb\xda\x38\x01\xb2\xc4\x13\x36\x7e\x0d\xc5\xba\
-\xbe\x35\x64\xfc\x07\x4d\x20\x64\x17\x59\xea\x63\x24\xb5\x19\x87\
-\x0d\x9a\x37\x88\xd7\xc3\x59\xe3\xc8\x84\x85\xb8\x7a\xda\x37\xb4\
-\xb1\xab\x86\x42\xfd\x30\x18\xca\x99\x48\xa7\x3b\x50\xd0\xfc\xdc\
-\x1b\x4e\x84\xbd\xf3\xcd\x29\x7c\x5b\x68\x66\xec\x69\x18\xa1\xf8\
-\xd9\x34\x9c\x09\xe5\x7c\x08\x35\xc6\x55\x93\xda\xe3\x01\xbe\xed\
-\x88\xbb\x46\xe2\x82\x71\x30\xd4\x39\xc7\x7b\x28\xbe\x99\x18\x86\
-\xca\xd8\x1b\x0a\x19\x30\x15\x42\x61\xfa\xce\x62\x1a\x76\x21\xb4\
-\xc0\xfc\xf0\x90\xc7\x4b\xd8\x0b\x55\xf5\x50\x98\x4b\xd1\x97\xf8\
-\x39\x32\xc8\xa4\xbe\x45\xe1\x94\xf5\x72\x71\xc7\x48\xdc\x33\x8e\
-\x0c\xde\x90\xb1\x3c\x13\x5e\xae\x78\x17\x24\xce\x63\x27\x43\xc6\
-\xf8\xb9\x6b\x27\xe0\x7d\x6f\x45\xda\x67\x67\x1c\x20\xed\x5e\x42\
-\x7e\x2c\x47\xfc\x4e\x3b\xe4\x32\xf5\xc8\x9f\x50\x47\xa8\x4a\x87\
-\xe2\x2d\x44\x46\xac\xa7\x36\x79\x8e\xd2\xbc\xe2\xd3\x1e\x3f\x8e\
-\x9d\x55\x45\x6d\x46\xe2\xbe\x71\x10\xa8\x15\x3f\x9e\x09\x33\x5f\
-\x50\x8b\x0c\x21\x76\xbc\x34\xf3\x69\x75\xdc\x28\xfd\xcc\x7b\x60\
-\x28\xbf\x44\x1e\xfd\x84\xfa\x30\x07\x5f\xb1\xa1\x95\xbd\x0a\xae\
-\x82\x2a\x9b\xaa\x6e\xaa\xc2\x91\xe0\x0f\x43\x81\x57\x64\x94\x58\
-\x21\xaf\xb4\x50\x5f\xa3\x06\xaa\x33\x92\xfa\x18\x87\x4d\xba\x3f\
-\x95\xff\x11\x91\x84\x4a\xed\x2b\x1b\xdf\x59\xa6\x59\xd0\x85\xb5\
-\x46\xae\xd8\x35\x88\x96\x38\x9d\x9d\x8f\x21\xc3\x20\x03\xb1\x87\
-\x8f\xc3\xc6\x83\x48\x9b\xd0\xe0\x43\xe3\x82\x23\x54\x35\x53\x15\
-\x6d\x57\xd5\x9a\xf1\x28\x32\xe4\x5a\xb4\x73\x67\x66\x94\x8e\x46\
-\xa1\x70\x5d\xbd\xe8\x09\xca\x44\x8b\x90\xec\x80\xaa\xa4\x32\x23\
-\xa9\xa3\x71\x30\x78\xf7\xcd\x99\xf0\xf3\x44\x33\x4e\x65\x27\x0d\
-\xc1\xa7\x75\x7f\x0a\xcf\x7c\x4a\x19\x17\x08\xf2\x6b\x8d\xd3\x08\
-\x97\xfd\x25\x3f\x1c\x3f\xcb\xab\xc5\xbf\x8f\x70\x1e\x43\xda\xc6\
-\x68\x8d\x8e\xdb\xe9\x35\x22\x39\x74\x61\xb7\x17\x35\xc5\x45\x50\
-\x36\x2a\x69\x1e\x86\x52\x5c\xe1\x09\x27\xa6\xf2\xed\x22\x68\xe1\
-\x10\x32\xc4\xfe\x8e\xa1\x12\x94\x62\xcb\x0a\xd7\x7c\x54\x42\x79\
-\x46\x52\x7f\xe3\x20\xd0\x5c\x29\x9e\xaf\x45\xcf\x0b\x27\xfe\x9b\
-\x9d\xd4\x95\x96\x05\xe6\xbf\x41\xa9\xbb\x54\x71\x48\x8b\xb1\x0b\
-\x69\xb4\xa0\xa2\x77\xa7\x9a\xb1\xdd\xfc\x4f\xbc\xdb\x77\x10\xf6\
-\x7a\xf8\x5f\xe6\x0b\xc7\x3f\x29\x8b\xc1\x14\xd8\xab\xed\x34\x63\
-\x27\x12\x7b\x33\xcd\x44\xe5\xcb\x83\x02\x7f\xef\x83\x82\x3e\x53\
-\x9c\x61\x69\x41\xa2\x6f\xf7\x86\xd6\x9f\xc1\xce\x2b\xa6\xd0\x48\
-\xf2\x0c\xf6\x32\xf3\xad\x88\xf3\x2d\xd9\x67\xd5\xc9\x38\x08\xc4\
-\xc1\x9e\x3f\x56\x28\xb8\xae\x5c\xd7\xe2\x16\x34\xf3\x18\x05\xd5\
-\x62\xa7\x82\x08\xc6\xd1\x8b\x74\xa8\xa9\xef\x47\x78\xda\xa9\x66\
-\xa1\xa6\xa4\xf1\xac\xf4\x57\x0a\xa0\x59\xad\x99\x04\x47\x89\xb2\
-\x85\x14\x93\x6f\x0d\x0a\x55\xe9\x48\xd8\x07\xf3\x33\xad\x40\x68\
-\x21\x53\x95\x99\x98\x6b\x24\x64\xc4\x78\xd6\x6a\xfc\xa6\x09\x8a\
-\x7f\xca\x84\x5f\x17\xe3\xe8\x1a\x18\x77\x00\x14\xc5\xa7\xc5\xb3\
-\xab\x1a\x0b\x05\xb5\xe4\x97\xd9\xb5\xab\x50\x8d\x01\x45\xfd\x26\
-\xde\xd1\xde\xd4\x42\x25\xac\xcc\xd7\xd4\x5c\xe2\xd3\xe6\x16\x9a\
-\x39\x17\x61\xee\xb0\xc3\xb6\x27\x69\xfe\xbe\xea\x9a\x7f\x44\x82\
-\x04\x39\x14\x09\xbe\x3d\x9b\x01\x94\x48\x61\x63\xf9\xf8\x85\xc9\
-\x16\x76\xe2\x0c\x94\x93\x26\x0c\x22\x8c\xf4\xba\x72\x95\xd8\x09\
-\x6f\xfe\x82\x46\x5f\xd8\x57\xd9\xd0\xd4\xf3\xbc\xf8\xed\x95\xdd\
-\x50\xe0\x6b\xdd\x30\x0e\x6a\x9f\xe3\x9d\x3f\x6f\xf7\xbb\xc2\x66\
-\x0a\xff\xff\x53\xf1\xbc\x42\x59\xec\xd6\x50\x2a\x3d\x1f\x69\xf4\
-\x39\x84\xf9\x53\x28\xac\xbd\x6e\x5f\x29\x48\x47\xa4\xe1\x4a\x4f\
-\x78\xfd\xe1\xec\xb5\x6a\x26\xcc\x5b\x3f\x1d\xe9\xd7\x5d\x10\xfe\
-\x4f\xf9\xb6\x90\x0b\xf5\x17\x3c\x9a\x71\x33\x12\x28\x3b\x74\x0b\
-\xa5\x7c\x01\x09\xf8\x19\x76\x32\x28\x54\x35\x93\x82\xe5\x86\xa1\
-\x12\x84\x9b\x84\x9b\x79\x95\x8c\x02\x1d\x3e\xef\xf1\x77\x50\xe7\
-\x1f\xca\x43\x23\x38\xab\x20\x57\xfb\xe6\x77\x1f\xcd\xb7\xab\x86\
-\xd6\x66\x78\x43\x09\x1d\xc6\x6b\x2f\xc3\xad\x58\xa8\x94\xd7\xcc\
-\x6b\xcb\x2e\x4c\x32\xd0\x92\x5d\x32\x7c\x1a\x55\x0a\x1b\x0f\x64\
-\x6b\xc9\x52\x02\xa3\x41\xba\xdd\x4d\xd3\x76\x38\x84\xaa\xa1\x29\
-\xfc\xc8\xeb\x4e\x3c\x37\x67\xa0\xc5\xd8\xe1\xd3\x12\x97\x51\xbf\
-\x8e\x9d\x09\x2a\x7c\xed\xdd\x1f\x45\x46\x6c\xcb\xcd\x1c\xfc\x5e\
-\x3d\xa1\xfd\xb1\xb2\xbf\x49\x4c\x0c\xad\x9b\x86\x04\x5f\xe9\x58\
-\x12\xa6\x85\xf6\xaa\x7a\x08\xee\xe6\x0e\xc5\x94\x09\xfa\xa8\x89\
-\x78\x6e\x52\xc4\xcb\x16\x18\xfb\x2b\xb8\xff\x5b\xfc\xed\x82\x21\
-\xac\x81\x12\x3f\xaf\x72\x47\x82\x34\x7a\xae\x35\x6c\x9c\x63\x6f\
-\x34\x91\x23\x30\xea\x4f\xe0\xfe\xb9\xf8\x3b\x1b\x61\x90\x52\xae\
-\x44\x38\x09\x84\xe9\xd0\xaf\xd8\x2b\x14\x07\xea\x48\x4f\x5c\x18\
-\x7f\x37\x47\xbb\x26\xd2\x1d\xf3\xfc\xfc\xa5\x77\xab\x24\x7f\x47\
-\x3d\xbc\xaf\xd4\x8d\x48\xb8\xbd\xb5\x49\xd8\x2e\x61\x2f\xaf\x64\
-\x2a\xc3\xf8\xf6\xf5\xef\xa2\x70\xa0\x10\xca\x4e\x6e\xa1\xc0\xed\
-\x93\xb6\x61\x85\x8d\x39\x68\x87\x7f\xb8\xd4\x1a\x10\xb7\x40\xbc\
-\x7e\xa6\x8a\x07\xde\x7b\x8f\x27\x6c\x7c\x8d\x46\x7a\xd8\x69\x16\
-\x5a\xc3\x01\x37\xd9\xfe\x4f\x5d\x84\x36\xac\x08\x9b\x77\x79\x42\
-\xe6\xa7\xdd\x5a\xb0\x75\xd0\x3c\xcb\x83\xf4\xbd\x83\xde\x2d\xf3\
-\x1c\xfc\xfe\x2b\xde\xf3\x42\x76\x22\x54\x8a\xaa\x36\x41\x02\xc7\
-\xa9\xed\xca\x4e\xca\x03\x1d\x49\x1a\x7f\x47\x73\xed\x7e\x84\xa7\
-\x5e\x0f\x5e\x4a\x68\xdc\x5f\x33\x7e\x03\x7f\xb4\x2f\xd5\x02\x84\
-\xf1\x45\xaf\x16\x3f\x9d\xbe\xcb\xd0\xa4\x41\x28\xec\xa1\xd4\x99\
-\x56\x09\x35\xc1\x26\x84\x12\xd3\xec\x92\x3c\x9c\x38\x8b\x76\x5a\
-\x44\x93\x66\x21\x0c\x90\x96\xfe\x3e\x50\x2a\x2e\x50\xce\xed\x4e\
-\xfd\x1a\x1a\x02\x57\xf9\xab\x5e\x8c\x67\x61\x14\xf7\x43\x59\xaf\
-\x6a\x09\x25\x3e\xa8\x32\xcc\x5a\xf0\x86\xa8\x6f\x65\xbc\x98\xfb\
-\x4c\xbc\xfb\x6a\x4a\x3b\x76\x22\x54\x0b\x95\x60\xc8\xc0\xeb\x90\
-\xa8\xbb\xf7\x26\xb0\xb1\x8b\xda\xb0\xd4\x2f\x60\x67\x65\x43\x23\
-\x24\xc8\xb0\x33\xbc\x0b\x12\xcb\xa0\xf8\x25\x87\x88\x87\x5a\x60\
-\x24\x5d\x13\x61\x5c\x1c\xed\x34\xb3\xb7\xee\x4b\x7d\x32\x28\x57\
-\x9e\xb2\xe5\x0a\xfc\x6d\x45\x93\xc8\xca\x17\x1a\x8a\x35\xd7\xe2\
-\xef\x8f\x61\xdc\xb7\x23\xfd\xae\xa2\x92\xbb\x25\x1c\xff\xd0\xf8\
-\x85\x8f\x56\xd6\x77\xa9\x00\x6a\x36\xe1\x99\xbf\xc8\x8b\x9f\xd4\
-\x1a\xf5\xc1\x13\x5e\x3f\x13\x0a\x9d\xd7\x5e\x47\x62\x6f\xf3\x6a\
-\xdd\x27\xb2\x93\xaa\x80\xc2\x1c\xe3\x0d\xc5\xcf\xc3\xdf\x9b\x10\
-\xde\x7a\x94\x74\xe5\x8c\x1e\x35\x4e\xd0\x09\x47\xbc\xfa\xa1\xe8\
-\x7f\x1c\x2c\x6e\x78\x87\x07\x9b\x62\x36\xad\x3d\x74\x6b\xcc\x43\
-\x7c\xf3\x3a\xfe\x78\x8f\x7b\x87\x62\x7a\xcc\xa8\x41\x59\x9b\xd8\
-\x6d\x5a\x63\xc5\x81\x0b\xbb\xbd\xec\xac\x36\xba\x06\xc6\x8d\x6f\
-\xef\x79\x17\x7d\xa9\xa7\x7e\x00\x32\x75\x09\x4a\xdf\x7b\xf1\xf7\
-\x51\x32\x50\x64\x7a\x59\xfd\x99\x02\xd9\x8d\x92\xfd\x79\x84\x91\
-\xc4\xff\xb4\x3e\x65\x95\xfd\x1e\x34\x38\x90\x5e\x5f\x41\x3b\xa3\
-\xe4\xd4\x90\x95\x09\xfc\xef\x42\x5c\xaf\x6b\x86\xaf\xd0\xad\xf6\
-\xe2\x34\x33\x9e\x17\x3f\x4a\xb3\xf6\xf8\x67\xd9\x89\x50\x6f\xec\
-\xda\x84\xbe\xe0\xe6\x67\xc2\x8b\x50\xb6\x2f\xb0\x93\xfa\x82\xfe\
-\x41\x6e\x5f\xe3\xa0\x90\xf1\x1e\xea\x8f\xe4\x0a\x7d\x6c\xa3\x7b\
-\xe5\xae\xeb\xb6\x3f\xce\x85\x8c\x6b\x60\x3c\x50\xae\x32\xfa\x49\
-\xf4\x5d\x27\x6c\x6c\x84\x91\x7d\xbd\xda\x29\xfe\x6e\x42\xdf\x63\
-\xd2\x4b\x85\xf3\xe3\x0e\xe3\xbd\x77\xe2\x9c\x75\x93\xd8\x99\xd0\
-\x30\x50\x5a\x22\xf1\x3b\x14\x19\xf2\xcb\x09\x15\x4d\x53\x6f\x3e\
-\xec\xc9\x9a\x9a\x11\xcb\x7d\xaf\x22\x41\x1f\x8c\x9d\x0f\x39\xf4\
-\xf1\x15\xf1\x2d\x1c\x9a\x7f\x01\x7f\xcf\x65\x27\xc2\x50\x01\x45\
-\x39\x4e\x51\x9b\xa0\xed\x6b\xcc\x6f\x8a\xf6\x78\x15\xb4\xb4\xc7\
-\x03\x78\x8f\xf4\xd4\x0b\x95\x68\xc6\x9a\x72\x6b\xa6\x7a\x42\xcd\
-\x5a\x9f\x16\xff\xbf\xc2\xf8\xd1\x10\xb1\x6b\x4d\x5e\xc1\x05\x4a\
-\xd4\x26\x10\x63\xb8\xed\x51\x3b\x3e\xb2\x71\x02\x8d\x44\x15\xbc\
-\x47\x56\xa8\x2f\xd3\x0c\x4d\x16\x6a\xce\x22\xcd\x5f\xca\x8b\x1b\
-\x6a\x0d\xfa\x76\xc2\x4e\x84\x66\x63\x42\xd8\x08\xa2\x74\x2d\xd8\
-\x7c\x8d\x8c\xc6\xb8\x8e\x3e\x3e\xb2\xb3\x26\x66\x60\x2c\x0c\xe0\
-\xe7\xf9\xf1\xcf\x11\xf4\x3b\x5a\xe8\x7c\x90\x21\x84\x8e\x89\x40\
-\x3c\x7e\xa5\x88\xdf\x0f\xa4\xd6\x18\x0e\x44\xec\xad\x3c\xaf\x86\
-\xd0\xf4\xf9\x6c\x06\xa2\xd9\xf5\x07\x0f\x6d\xe2\xdc\xc4\xd0\x84\
-\xcb\xdc\x38\x17\x0a\xde\x61\x29\x3b\x6d\x3c\x68\xae\xa2\x86\x68\
-\x4f\x37\x5f\x73\xe3\x65\x3c\x83\xb4\x6e\xe8\xc2\x2d\xc1\x05\xd4\
-\xb5\x89\x9d\xa1\x4d\x59\xd2\xd1\xd6\xa3\x50\xc0\xe2\xa5\xb5\x19\
-\xd1\x8c\xa7\x5b\x16\x98\xe3\xd9\x79\x43\xa1\x66\x6a\x89\xb4\x5c\
-\x41\x1b\x37\xb0\x33\x61\xd8\x81\xda\xa4\xd5\xde\xe0\xc1\xfc\x47\
-\x6e\xc6\xa2\x14\xfc\xb3\x57\x8b\x9f\xcf\xae\x86\x1e\x74\xb8\x11\
-\xaf\xbc\x6f\x07\x85\x82\xda\xef\x1c\x76\xdd\x30\xec\x13\xb3\xec\
-\xef\x4e\x05\x7d\x3b\xda\xac\x41\x6a\x8d\x91\x03\x6f\x0c\xbd\x2e\
-\x2f\x93\xed\x8c\x36\x1e\xa4\x6d\x36\xd9\xd9\x90\xd1\x1a\xea\x9e\
-\x5d\x14\xb7\x5c\xd1\x8c\xdf\xb0\xd3\x86\x41\xb3\x80\xe9\xeb\x7d\
-\x41\x3c\xf6\xc0\x38\x6e\xad\x65\x29\xb3\xd0\xac\xd8\x6d\x68\x3a\
-\xac\xb3\xa8\x36\x79\x8d\xae\xbb\x3d\x41\xaf\x5c\x68\x6b\x4f\x34\
-\xad\xfe\x92\x1b\xa7\x3c\x21\xa5\x6c\x4f\xcc\x60\xe7\x75\xc7\x1e\
-\xba\xcd\x39\x6c\x34\x23\x88\xe3\xf6\x6a\x16\x9b\x09\xc3\x8c\x52\
-\xb5\x09\x0c\x25\x81\xeb\x35\xaf\xad\xae\x14\x9f\x16\xbf\xb5\x30\
-\x2e\xb9\x82\x92\xfc\x3e\x76\x5a\x77\xa8\xd9\x49\xcd\xcf\xbc\x38\
-\x48\xad\x31\x0a\x89\x44\xf6\xa1\x05\x44\xc5\x23\x32\xb4\x84\xd6\
-\xb8\xbe\x51\x43\xc2\x34\x1d\xde\x7e\x66\x7e\x1c\xf2\xa5\x01\x46\
-\x4b\xcd\x4c\x3c\xa7\x68\x5d\x3f\x6a\x8d\x6d\x95\xec\x0f\x20\x8c\
-\x30\xec\xb3\xfc\x34\xe3\x11\x85\x62\x3c\x89\x7e\x41\xdd\xbf\x37\
-\xe0\x39\xcb\x0a\x9f\x9d\x2f\xc6\x6f\xd9\x69\x7d\x40\xb3\xd2\x6e\
-\x76\x16\x16\x14\x1a\x1d\x51\x6d\xdc\x38\x3c\xbe\x1d\x09\xf5\xa5\
-\x74\x6d\x02\x45\x31\xef\xac\xd7\x16\x34\x34\xed\x1b\x4a\x58\xf8\
-\xe5\x3f\x5f\xb4\x44\xd9\xeb\xf1\x2b\x85\x6a\x26\xbb\x59\x59\xf0\
-\x4c\xc4\x69\x1b\x2d\x54\x63\x67\x82\x90\x86\x6a\x13\x18\xc4\x9a\
-\x22\x85\x41\x9b\x1c\x06\x74\x81\xdb\x9b\x09\x78\xd3\x47\x36\xe7\
-\x3d\x2b\x4f\xd0\x71\xaf\xc7\xf4\x75\x7b\xe8\x16\xcd\x48\x3c\xa3\
-\xb0\x69\xd7\xd0\xe6\xa5\x30\x2c\xa1\x9d\x12\x13\x97\xa1\x69\x53\
-\x3c\x51\x10\xc6\x53\xc9\xa6\x76\x8e\xa0\xd6\x42\x49\x5d\x72\x0b\
-\x4f\x12\xdc\x5f\xc1\xae\x5d\xa3\x65\xbe\x79\x32\x0c\xf3\x89\xa2\
-\xe7\x69\xc6\x26\x5a\x42\xc0\xce\x04\xc1\x19\x5a\x2a\x0a\xa5\x51\
-\xd4\x26\xe6\x1b\x30\x92\x70\xad\x43\xc2\xb4\xb3\x47\x61\xd8\x85\
-\x02\x45\x3e\x93\x9d\xd7\x0c\x35\x13\xa9\xb9\xa8\x78\x0e\x6a\x11\
-\xe3\x3a\x37\x4f\xd2\x15\x46\x0d\xa5\x6b\x13\x34\xbb\x36\x7a\xb5\
-\xc4\x7b\xd9\x61\xc5\x40\xf9\xe9\xbc\xf2\xbc\x30\xf3\x44\x33\xff\
-\xe5\xd6\x59\xe6\xd4\x3c\xa4\x66\x62\xf1\x33\x8c\xa4\xd4\x1a\x42\
-\xcd\xd0\xce\x1b\x68\xee\xac\x2e\x52\x30\x94\xbe\xa8\x51\xbe\x45\
-\x3b\x12\xb2\xd3\xb2\x41\x78\xf6\xd9\xeb\xa5\x04\xf7\x7b\xd8\x69\
-\xd5\xa4\xfb\x54\xc5\xb5\x20\x0c\x9e\x36\x9a\xee\x68\x86\xe5\xb9\
-\xc2\x08\x82\x76\xe2\x80\x62\x15\x6d\x6d\x8a\x6b\xdb\xed\x5d\xc9\
-\xcb\x64\xfc\xdc\x75\x47\x16\x86\x51\x28\x08\xb3\xfa\xfe\x87\x3d\
-\xff\xcc\x08\x23\x0c\xc5\xc4\x47\x77\x36\x9a\x16\x04\x25\x0e\xb5\
-\x09\x35\x59\x56\x95\xb3\x90\xa9\x55\x8b\x9f\xaf\xf4\x9f\x2b\x5a\
-\xfc\x4a\x76\x5e\x11\xd4\xec\xa3\xe6\x5f\x71\x78\xf6\xa6\xdb\x52\
-\x6b\x08\x8d\xa1\x64\xbb\x3e\x6c\xbc\xe2\xb1\xcf\x32\x2f\x3d\x24\
-\x4c\xfb\xf0\x16\xfb\xcb\x97\x4a\x67\x1a\xd3\xd0\x2c\xfa\x35\x37\
-\xc0\x6f\xf1\x57\x79\xcd\x30\x69\xea\x3f\x3b\x15\x84\xc6\x40\xb5\
-\x05\x4a\xe5\x7b\x8b\x14\x32\xad\x94\xbf\x69\x9d\x97\x98\xcc\x4e\
-\xf3\x80\x22\x3b\x1c\x44\xc3\xa2\x99\x9f\x62\xe7\x83\x42\x5f\xfc\
-\x11\x8f\xe2\x9d\xe7\x69\xc1\x98\x66\x5c\x3d\x54\x93\x30\x05\xc1\
-\x86\xf6\x7b\x52\xd5\x26\x30\x84\x7f\xd0\x5a\x94\x42\x05\xa5\x12\
-\xbd\xd0\x6d\x91\x94\xb1\xd6\x82\x0c\x14\x35\xd6\xca\x12\xfe\xa5\
-\xd6\x10\x9a\x07\xc7\xda\x04\x1d\x63\x3a\x66\x80\x9d\x96\x3e\x6f\
-\x30\x47\x68\x97\x76\x76\xae\x60\x60\xac\x27\x64\x5e\x04\x03\x7c\
-\xb9\xd0\x1f\x19\xa5\x3d\x75\x7f\x98\xee\xe6\x22\x8c\x70\x68\x47\
-\x0f\x18\x0a\xed\x07\x95\xa7\xb8\x90\xdd\xde\x90\xf1\x6d\x9a\x32\
-\x0e\x05\x76\xfc\x82\x4e\xd2\xaa\x25\x94\x7d\x10\x7b\xe8\x36\x6c\
-\xfc\x5a\xe5\x07\xb5\xc6\x3a\x9a\xca\xcf\x4e\x05\xa1\x39\xa1\x05\
-\x47\xde\xb0\x79\x57\x09\x25\x7e\x8a\xbe\xc6\x2b\xef\xe5\x89\x31\
-\x87\x83\x4b\x43\x43\xb7\x9a\xb1\x80\x6a\x88\x42\xb7\x52\x6b\x08\
-\xc3\x12\x87\xda\x64\x50\x81\xd2\xdf\xce\xc1\xd0\xf7\x97\xf7\x23\
-\x9c\x1e\xb5\x3b\xe3\x11\x37\x4e\xb9\x12\x84\x21\xc1\x5e\xbe\x4a\
-\x67\x82\x2b\x94\xdb\x51\x34\x23\xde\x1a\xb1\x0e\x80\x01\x2c\xc1\
-\xef\xa2\xa1\x5b\x6f\xd8\x78\x8d\xa6\xe8\x3b\x9d\x21\x22\x08\xc3\
-\x06\x1a\x95\x42\xb3\xa9\xec\xb3\x48\xa8\x19\x06\xe3\x50\x1d\x1a\
-\x6a\xd7\x1a\xae\xcd\x2a\x16\x84\x66\x81\xf6\x8f\x82\x91\xd0\x31\
-\x07\x45\x4a\x5f\x9e\x18\x3b\x68\x63\x39\xa9\x35\x84\x11\x8d\x5d\
-\x9b\xe4\x9c\xb1\x5e\x96\xc8\x21\x97\xc2\x68\x82\x86\x7b\x7d\xe9\
-\xe3\xa4\xb3\x07\x5a\xaa\x45\x8e\x46\x16\x46\x31\x7c\xae\x86\xb2\
-\xaf\x81\xce\xfd\x43\x52\x6b\x08\xa3\x9e\xec\x1a\x71\xcd\xfc\x1b\
-\x19\x86\x97\x76\x33\x0c\x99\x97\x4a\xad\x21\x08\x05\x54\xb3\xf8\
-\x4a\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\
-\x10\x04\x41\x10\x04\x41\xb0\x19\x33\xe6\xff\x01\x4d\xb4\x5d\xfc\
-\x02\x21\xc5\x0a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x09\x7d\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2e\x00\x00\x00\x20\x08\x06\x00\x00\x00\x6d\xb3\x4a\x47\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xfe\x00\xfe\x00\xfe\xeb\x18\
-\xd4\x82\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x07\x60\x49\x44\x41\x54\x58\
-\xc3\xcd\x58\x5b\x6c\x14\xe7\x19\x3d\xdf\x3f\xb3\xb3\xf7\xf5\xda\
-\x7b\xf3\x05\x0c\xc6\x36\xc6\x80\x6d\x2e\x35\x50\x68\x1c\x52\x08\
-\xa4\x24\x29\xd0\x82\x1a\x89\xaa\xad\x42\xd5\x97\x4a\x89\x90\x90\
-\x2a\xb5\x0f\x4d\x79\x6b\x28\x42\x91\xaa\x22\x50\x25\x92\x87\x28\
-\x41\x69\x13\x5a\x57\x6e\x92\x52\x53\x9c\x50\xea\x34\xa5\x80\xb1\
-\x8b\x0d\x76\x5c\x8c\x05\x36\xbe\xee\xee\xec\xce\xf5\xff\xfa\x60\
-\xbb\x01\xb5\x8a\x50\x62\x6c\xce\xcb\xcc\xc3\x3f\x33\xe7\xbb\x9f\
-\xf9\xe8\xfa\xf5\x1e\x2e\x8a\xc5\xc0\xa4\xb8\x96\x91\xff\x4b\x7a\
-\x72\xf2\x5d\x22\xf2\x10\x11\xe1\x11\x04\x11\x41\xd7\xf5\xcd\xaa\
-\x3b\x71\x13\x23\x37\x5a\x50\xb6\xf2\x71\xab\xa8\x64\x79\xae\xa4\
-\xb8\xd8\x0b\xa0\x05\xc0\x08\x80\x47\x91\xbc\xec\xea\xea\x1a\xa7\
-\x4f\x7a\x7b\xf8\x66\xfb\x69\xd0\x40\x2b\xaa\x1a\x9f\x44\x6c\xd5\
-\xce\x3b\x5a\x61\xc5\x77\x01\xf1\x3e\x20\x05\x00\x39\x65\xa9\x32\
-\xdf\x84\x01\x00\xa7\x4e\x9d\x42\x45\x45\xc5\x5e\x1a\x1a\x1e\xbe\
-\x1a\xf4\x07\xce\x0f\x5c\xbf\xb4\x79\xbc\xeb\xdd\xa5\x7e\xbd\x5b\
-\x2e\x5c\x54\xd1\x51\xd0\xb8\xff\xb2\x5a\xb4\x94\x18\xf8\x08\xc0\
-\x71\x00\xb6\x78\x04\xb2\x67\x86\xb8\x6a\x5b\x56\x67\x30\x91\x38\
-\xbc\x6c\xf5\xa6\xd7\x26\xab\x1a\x0e\xdf\xbc\xda\x56\xdf\xd7\xf9\
-\xdb\x95\xc9\xec\xe1\x86\x54\xfd\x0e\x68\x65\x9b\x16\x51\x20\xf9\
-\x47\x02\xd2\x2c\x39\x07\x20\x07\x80\x49\xcc\xaf\x11\x62\xfa\x6a\
-\x4a\x29\xff\x5a\x10\x0e\xed\xab\x5d\xbf\xe3\xe9\x8a\x5d\x3f\x7f\
-\x6b\x2c\xb6\x6d\xe4\xea\xb9\xdf\x60\xa4\x79\xff\x7a\xbb\xef\x0f\
-\xad\x6c\xe7\x5e\x07\xe1\x38\x08\x0b\x1f\x85\xcc\x57\x67\x6e\xa6\
-\x9b\x48\xbf\x2a\x70\x33\x1e\x8f\xff\x3d\xb8\x71\xf7\xf6\xd1\xc5\
-\xab\x0f\x0c\x5c\x69\x5e\x70\xa7\xf5\x8d\x25\xf1\x68\x4b\x59\x7c\
-\xed\xb7\x0c\xb5\x74\x4d\x17\x79\xc3\x3d\x92\xe5\x08\x81\xfb\xc1\
-\xdc\x4f\x42\xfd\xfc\x0c\xbe\xa0\xc7\xff\x4b\x9e\x88\x24\x80\xbc\
-\x5f\x53\x7f\xbf\x60\x71\xd5\xb6\xfa\xa7\x5f\x7c\x25\xba\xe5\x67\
-\xe6\x80\x5d\xaa\xdc\xf8\xdd\xa1\xe0\x64\xdb\x91\x43\xee\x48\xd7\
-\x1b\x60\x7e\x8f\x21\xbe\xc1\xf3\x54\xb4\xff\xd7\x55\xd3\xde\x97\
-\x92\xa5\xa9\x2a\x74\xb1\xbc\xa2\xea\x70\x51\xea\xa0\x32\xd4\xf7\
-\xb5\x3d\x3d\x97\xde\xa9\x8a\xbc\x71\x80\xca\x1b\x1e\x83\xaf\x7e\
-\xdf\x4e\x25\x5a\xb1\x84\x99\x09\x90\xbd\x0c\xfc\x0a\x80\x21\xe6\
-\xc0\x98\xcf\x8c\xb1\x20\x01\x00\x1f\x32\xf3\x87\xa1\x80\x4f\x0b\
-\xad\x5c\x7b\x36\x5e\xbe\xf4\xc8\x9d\x6b\xed\x35\xdd\x57\xde\x54\
-\x63\x03\x3f\x6d\x4a\x36\x6c\x6f\xf2\x56\x3e\xe5\x90\x3f\xd6\x0e\
-\xa0\x99\x24\x6e\xb3\xcb\x59\x52\x1e\x6e\x21\x88\x07\x39\x34\x15\
-\x01\xb6\x00\x3e\x57\x10\x09\xef\xab\x5e\xb7\xf5\xb9\xf2\x5d\x2f\
-\xbf\x3a\x9a\xda\x91\xb9\xd6\xf6\x16\xee\x36\xff\x50\xb5\xfb\xcf\
-\xac\x60\xc7\x68\x66\x81\xfd\xfc\x40\x6f\x7d\x88\x1e\xbf\x9f\xbc\
-\x00\x00\x0b\x40\x07\x33\x77\xc4\xe3\x45\x1f\x44\x9f\xd8\x1b\x1e\
-\x5d\xbe\x71\xf5\xf0\xd5\x33\x8b\x86\x5a\x7f\x1d\x2d\x2b\x79\x3b\
-\x1a\x59\xb1\x73\xb7\x5a\xfa\x78\xb7\x64\xce\x83\x21\x09\xb8\x02\
-\x60\x72\xb6\xdb\xe7\xe7\x6e\x07\x0c\x39\xaa\x28\xe2\x85\x54\x69\
-\x79\x41\x34\xf1\xbd\x27\xfa\xba\x56\x3e\x37\xd0\xdb\xd2\x14\x6a\
-\x3b\xd6\x94\xac\xbc\xb2\x21\x58\xbb\x8b\x45\x41\xe5\x24\x93\x78\
-\x06\xc0\xc7\xf3\xe6\xf1\x7b\x31\x5d\xbc\x2c\x25\xdf\x61\x60\xc8\
-\xeb\x11\xdd\xb5\x0d\xeb\xfa\x8c\x65\xab\xf2\x03\x3d\xff\x5c\xf6\
-\xaf\x8e\x53\xe5\x89\xbe\x17\x44\x71\xfd\x5e\xf2\x55\x3e\xfb\x63\
-\x0a\x24\x9a\x99\xf9\x35\x09\x48\x65\x96\xa6\xef\x17\x6a\xc0\x62\
-\x2a\xfc\xcc\xec\x02\x40\xab\xcf\xab\xb5\x55\xd5\xad\xff\xfe\x58\
-\x69\xe5\xf6\xd1\xfe\x7f\x6c\xbb\x71\xad\xc5\x1b\x9b\xc4\xee\xc2\
-\xc5\x9b\x56\x69\xa9\xc5\x85\xaa\x47\xfb\x13\x33\x77\x02\x90\x00\
-\x0b\x00\x61\x00\x69\x00\x3c\x9d\x8a\xf7\x81\x59\xce\x70\x64\x00\
-\xee\xbd\x67\x66\x65\x72\x4c\x0b\x30\x87\x99\x1d\x62\xb4\xc6\x62\
-\xf1\x0f\x8a\x8a\xb6\x5f\x18\x5e\xd0\xb0\x63\xb0\xfb\xd2\xea\xb1\
-\xde\xde\x8a\x85\x5a\xf0\x48\x28\xe8\x6f\x87\xe2\xed\x12\xaa\x2f\
-\x2f\x54\xd5\x02\x50\xeb\xda\xb9\xeb\xae\x9d\x55\xac\xcc\x1d\x90\
-\xc7\x2f\x15\x4f\x70\x82\x84\x12\xc0\x54\x3d\x85\x01\x64\x00\x3e\
-\x09\xa0\x7b\xd6\x3c\xfe\xbf\x06\x10\x00\x74\x31\x33\x88\x70\x39\
-\x95\x2a\x6e\x29\x8a\x6d\xfd\xe5\xd8\xd8\xd8\x9a\x7f\x0f\x7c\xa2\
-\x2a\x43\xdd\xeb\xfd\xed\xad\xeb\x61\xa9\xf0\x2e\xad\xb3\xa2\x1b\
-\x97\x7b\xdc\xec\x95\xed\x0a\x72\x00\x7b\x20\x55\x3f\x48\x8d\x48\
-\x11\x28\x11\xf0\xc5\xa5\x1a\x2e\x11\x8a\x16\x1e\x14\x84\x0b\x42\
-\x8b\x4c\x30\xb3\x02\x40\x74\x76\x76\xc6\x1f\xca\xac\x26\x22\xc8\
-\xa9\xf4\xb9\xa6\xaa\xea\xc1\x54\x32\xa9\x79\xbc\xfe\x25\xc3\x46\
-\xf6\xe0\x64\x6f\xcf\x8a\xc2\xdb\x1f\x03\x3d\x71\xcd\xf1\x6d\x82\
-\x52\x1a\x80\x16\x0a\xc1\xb4\x04\x48\x77\x91\xcf\x59\x42\x3a\x06\
-\x4c\xcb\x15\x86\xeb\x85\xe2\xf1\x96\xba\xae\x38\xa1\xf8\xa3\x13\
-\x9e\xf0\x02\x0a\x96\xd4\x79\xe3\x89\x9a\xc0\x43\x13\x19\xd3\xd3\
-\xd3\x00\xf0\x37\x66\xc6\xb9\xf7\xdf\x6b\x7b\x76\xcf\x9e\xca\xfe\
-\xbc\x5e\x9a\x7b\xe5\x40\x61\x79\x63\x31\xd4\xda\x6a\x18\x7a\x16\
-\x8a\xea\x83\xe3\xb8\xa0\x7c\x16\xae\x6d\x81\x8d\x49\x38\x79\x07\
-\x66\x26\x0d\x01\x87\x6c\xdb\x4d\x5a\xae\x9b\xb4\x4c\x03\x5c\x58\
-\x8f\x92\x2d\x2f\xcd\x6e\xaa\x7c\x56\x04\x98\x19\x00\x5e\x4e\xac\
-\xfb\xea\x47\x43\xcf\xbf\x78\xd2\xf4\x76\xc4\x58\x0b\xc0\xaf\xa9\
-\x70\xa5\x07\x9a\x6a\xc2\xf2\x11\xbc\xae\x85\x5c\x9e\xc1\xd2\x86\
-\xe6\x61\x48\x56\xa1\x4a\x0b\x8e\x6d\x43\x31\x75\x98\x8e\x84\xc3\
-\x3c\x37\xc4\xef\x21\x9f\x29\x88\x84\x2e\x8a\xa6\xaf\x8f\xdb\x37\
-\x46\x62\x01\x9f\x02\x3b\x47\x70\x5d\x09\x85\x04\x84\x4a\x80\x47\
-\x85\xe2\x0f\x02\x0e\x81\x1d\x1b\x8a\x74\xc1\xec\xc0\xef\xd7\x10\
-\x54\x83\x30\x93\x29\xf8\xfd\xc1\x07\x1b\xf9\xb3\x05\x09\x06\x00\
-\xe1\x8f\x24\x05\xf9\x16\x42\x9a\x12\x8e\x1a\x86\x10\x04\xcb\x75\
-\xe0\xa5\x1c\xdc\x5c\x06\x1a\x1b\xf0\x08\x86\xd7\x1f\x82\xf0\x68\
-\xb0\xf2\x26\xec\xcc\x28\x6c\xe1\x45\x3a\x50\xc7\x9a\xe6\x9b\x0b\
-\x55\xf1\x29\xa6\x3e\xc6\x8e\xea\x09\xdc\x94\xd1\x55\xfa\xb8\xae\
-\x80\x73\x79\x48\x87\xe0\x51\x09\x70\x5d\xa8\x1e\x15\xd2\x21\x90\
-\x95\x87\x95\x19\x81\x9d\x4d\xc3\xa3\x0a\x08\x02\x6e\x79\xd6\x20\
-\x55\xb3\xf9\xa2\x22\xe8\xec\x9c\x12\x9f\x9a\x23\xd0\x01\xbe\x16\
-\x48\xae\xb8\x91\xe5\x4a\xce\xa7\xd3\xb0\x73\x3a\x54\x53\x87\x6b\
-\xbb\x60\xb6\xe0\xba\x3a\x00\x07\x8a\xaa\xc0\xc8\xea\x60\xd3\x04\
-\xf9\x23\x28\x5a\xf6\x24\x2a\x2a\xab\xcf\xde\xba\x35\x70\x7c\x6e\
-\x89\xb3\x00\x24\x65\x00\xfe\x91\xdf\x1f\x38\x96\xaa\xd9\x6a\x64\
-\x50\x06\xe4\xc7\x90\x1d\x1d\x43\x2e\xa3\xc3\xb1\x25\x88\x09\xcc\
-\x36\xd8\x98\x40\x40\xb3\xe0\x0f\x06\x90\x4e\x3e\x85\xf2\x65\x5f\
-\x61\xaf\x2a\x5c\xd7\x75\xdd\x39\x25\x4e\x82\x40\x0a\x31\x43\xa4\
-\x01\x9c\x09\x46\x0a\x8f\x06\x17\x3e\xd6\x99\x36\x43\xd0\x75\x1d\
-\x7a\xce\x80\x91\x4d\x83\x6d\x1d\x6c\xeb\x70\xad\x3c\xd8\xce\xc1\
-\xf0\x46\x21\x52\x6b\xcd\x44\xaa\xe4\x2c\x80\xf3\x60\xcc\x6d\x8e\
-\xcf\x20\x0d\x60\x12\xe8\x4d\x4f\x66\x7e\x92\xa8\x58\xfb\x67\xcf\
-\xa2\x1d\xb0\x4d\x1b\xe6\xc4\x5d\xe4\x74\x03\x99\xb4\x0d\xd7\xb4\
-\x01\xdb\x80\xf0\xf8\x30\x1c\xd9\x8c\x58\x79\x63\x87\xa6\xaa\xdf\
-\x26\xa2\x66\x12\x24\xe6\x85\x78\x94\x08\x51\x22\x14\x44\xc2\x50\
-\x05\x4e\x16\x2e\x6e\x7c\x47\x96\x6c\x91\xd2\x96\xb0\x0c\x13\x86\
-\x91\x87\x61\x4a\xb8\x6a\x08\x03\x5a\x1d\x02\xe5\x1b\xfb\xaa\xab\
-\x2b\x7f\x01\x60\xf8\xf4\xe9\xd3\x53\xc1\x9b\x0f\xe2\x33\x20\x41\
-\x90\xcc\x97\x82\xa1\x82\x43\x89\x86\x3d\xb7\x9c\x48\x0d\xd8\x9c\
-\x80\x94\x2e\x1c\x87\x31\xe6\xaf\x85\xa8\xfd\x81\x59\xb9\x6c\xc3\
-\xeb\x02\x78\x9b\x99\x5d\xd3\x34\x01\x3c\xe0\xaf\xdb\xc3\xc4\xb4\
-\x32\x1e\x88\x26\xca\x5a\xa2\x6b\xbe\x93\x31\x51\x08\x8f\x6b\xe2\
-\xae\x58\x84\x6c\xe9\x5e\xfb\x4b\x1b\x36\x9f\x48\x24\x62\x27\x66\
-\xb4\xf3\xa7\xcf\x4d\x0b\xfb\xf9\x5b\xce\x12\x00\xb2\x09\x30\x8b\
-\xab\x37\x9e\x0f\xaf\x7d\x7e\x62\x30\xf8\x65\x28\xb5\xfb\x32\x8d\
-\x4d\xcf\xbc\x1a\x09\x87\x8e\x32\xf3\x2d\x22\x92\x42\x88\x99\x15\
-\x0a\xe8\xf2\xe5\xcb\x67\x87\x87\x87\x5f\xba\x70\xe1\xc2\xa0\xa6\
-\x69\xf3\xb6\xa3\x2a\x28\x88\x6a\xf5\xf5\x75\xe5\xc9\x54\xf2\xe8\
-\xf8\xd8\x78\x4d\x30\x18\x3e\x75\xfb\xf6\xe0\xb1\xf6\xf6\xf6\x41\
-\x45\xb9\x6f\x65\xc0\x0d\x0d\x0d\xdf\xfc\x0f\x6a\x4c\x3f\x3e\xbe\
-\xd2\x48\x1f\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\
-\x63\x72\x65\x61\x74\x65\x00\x32\x30\x30\x39\x2d\x31\x31\x2d\x30\
-\x38\x54\x31\x33\x3a\x31\x39\x3a\x35\x37\x2b\x30\x31\x3a\x30\x30\
-\xa6\x52\xfd\xb7\x00\x00\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\
-\x3a\x6d\x6f\x64\x69\x66\x79\x00\x32\x30\x30\x39\x2d\x31\x31\x2d\
-\x30\x31\x54\x31\x35\x3a\x35\x31\x3a\x30\x39\x2b\x30\x31\x3a\x30\
-\x30\x11\x40\xd2\x47\x00\x00\x00\x4d\x74\x45\x58\x74\x73\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x49\x6d\x61\x67\x65\x4d\x61\x67\x69\x63\
-\x6b\x20\x36\x2e\x35\x2e\x35\x2d\x33\x20\x32\x30\x30\x39\x2d\x30\
-\x38\x2d\x32\x37\x20\x51\x31\x36\x20\x4f\x70\x65\x6e\x4d\x50\x20\
-\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6d\x61\x67\x65\
-\x6d\x61\x67\x69\x63\x6b\x2e\x6f\x72\x67\x4e\x3f\x93\xf8\x00\x00\
-\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x44\x6f\x63\
-\x75\x6d\x65\x6e\x74\x3a\x3a\x50\x61\x67\x65\x73\x00\x31\xa7\xff\
-\xbb\x2f\x00\x00\x00\x18\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\
-\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x68\x65\x69\x67\x68\x74\x00\x31\
-\x34\x30\x54\xa0\x6d\xe4\x00\x00\x00\x17\x74\x45\x58\x74\x54\x68\
-\x75\x6d\x62\x3a\x3a\x49\x6d\x61\x67\x65\x3a\x3a\x57\x69\x64\x74\
-\x68\x00\x32\x30\x30\xee\x26\x45\x34\x00\x00\x00\x19\x74\x45\x58\
-\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x69\x6d\x65\x74\x79\x70\x65\
-\x00\x69\x6d\x61\x67\x65\x2f\x70\x6e\x67\x3f\xb2\x56\x4e\x00\x00\
-\x00\x17\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x4d\x54\x69\
-\x6d\x65\x00\x31\x32\x35\x37\x30\x38\x37\x30\x36\x39\x50\x85\x72\
-\xdf\x00\x00\x00\x12\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\
-\x53\x69\x7a\x65\x00\x31\x33\x2e\x39\x6b\x62\x56\xb5\x17\x9d\x00\
-\x00\x00\x25\x74\x45\x58\x74\x54\x68\x75\x6d\x62\x3a\x3a\x55\x52\
-\x49\x00\x66\x69\x6c\x65\x3a\x2f\x2f\x2f\x76\x2e\x63\x6c\x65\x61\
-\x6e\x2e\x62\x70\x6f\x6c\x2e\x31\x2e\x70\x6e\x67\x6c\x98\x9c\x21\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x09\xd6\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\xc8\x00\x00\x00\xc8\x08\x06\x00\x00\x00\xad\x58\xae\x9e\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x09\x6b\x49\x44\x41\x54\x78\x5e\xed\x9d\x5b\x88\
-\x24\x57\x19\x80\x77\xb3\x2a\x4a\x54\x34\x10\x11\x2f\x89\x28\xb2\
-\x9b\x88\x0a\x1b\x15\x1f\xd4\xc4\xe0\x0d\x1f\xbc\xe4\xc1\xbb\x86\
-\x44\x23\x42\x7c\x52\x02\xa2\xe0\x80\x06\x05\x11\x7c\x88\x78\x41\
-\x30\xba\xba\xd3\xa7\x7a\xd7\x0b\x32\x4c\xd7\xa9\xd9\x65\x74\x2f\
-\xd3\xa7\x7a\x66\xe3\xae\x8e\x06\x05\x13\x43\x7c\x48\x8c\x42\x16\
-\x75\x23\xbb\x24\xed\x39\x33\xff\xc3\x3a\x73\xe6\x9f\xe9\x9e\xaa\
-\xea\xae\xaa\xef\x83\x8f\x65\x77\xeb\xd2\x73\xce\xf9\xba\xbb\xe8\
-\xcb\xec\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x80\xb6\xd2\x9d\xcb\x5f\x98\xa4\xee\xf6\x8e\xcd\x7f\xdc\xb1\
-\x6e\x90\x64\xf9\x23\x26\xcb\xcf\xfb\x3f\x87\x98\x0f\x8d\xcd\xe7\
-\x64\xa8\xa0\x4d\x24\xd6\xdd\x1c\x26\x3f\xb1\xf9\xa5\xd8\xc2\xc0\
-\x75\x09\xa4\x65\x24\xc7\x96\x5e\xec\x1f\x31\x7e\x15\x5b\x0c\xb8\
-\x59\x02\x69\x11\x87\x17\xfa\x6f\xf2\x13\xfe\x48\x6c\x21\x60\x5c\
-\x02\x69\x09\xe1\x3a\xc3\x58\x77\x31\xb6\x08\x70\x6b\x09\xa4\x05\
-\x24\x69\xfe\x2e\xae\x35\xc6\x73\xbb\x40\x92\x74\xf5\xaa\x6e\x77\
-\xb8\x4f\xfe\x0a\x75\xa3\x93\x9d\xb9\xce\x3f\x72\x3c\x1e\x9b\x7c\
-\xdc\xde\x6d\x03\xc9\x06\x37\x1a\xdb\x9f\x25\x92\x1a\xd2\xed\x76\
-\xf7\xf9\x47\x8e\x33\xb1\x89\xc7\x9d\xb9\x93\x40\xd6\xb6\xb5\xee\
-\x87\x33\x33\x33\x57\xc8\x3f\x43\x1d\x48\xd2\xfe\x1d\x1b\x27\x1c\
-\x47\x73\xc7\x81\x78\x3b\xd6\xfd\x60\xcf\x70\xb8\x57\xfe\x0b\xa6\
-\x99\xf0\xe8\x61\xd2\xfc\x81\xcb\x27\x1b\x47\x77\x94\x40\x64\xfb\
-\x7b\x88\xa4\x06\xcc\xa6\xfd\xb7\x5f\x3e\x71\x38\x9e\xa3\x06\x12\
-\xec\xf4\xdc\x37\xe5\xbf\x61\x5a\x31\x99\xfb\xce\xc6\x89\xc3\xd1\
-\x1d\x27\x10\xf1\x6b\xb2\x09\x4c\x23\x3e\x90\xfb\x23\x93\x86\x23\
-\xba\x8b\x40\x86\x7e\x0e\x66\x64\x33\x98\x26\xbe\xbf\xb2\xf2\xf4\
-\x24\xe3\x45\xc1\x22\xdc\x4d\x20\xc1\x4e\xda\xff\x82\x6c\x0a\xd3\
-\xc2\xda\xfb\xad\x22\x93\x85\xa3\xbb\xdb\x40\x82\x1d\x9b\x7f\x4e\
-\x36\x87\x69\x20\x39\x3e\xd8\x1f\x9b\x28\x1c\xdd\x22\x02\x31\xd6\
-\x3d\x95\xf4\xdc\x9d\xb2\x0b\x4c\x9a\xe4\x98\xbb\x3e\x36\x51\x38\
-\xba\x45\x04\x12\x0c\x91\x98\x5e\xfe\x29\xd9\x0d\x26\x09\x81\x14\
-\x67\x51\x81\xac\xeb\x9e\x4c\x6c\x7e\xab\xec\x0a\x93\x82\x40\x8a\
-\xb3\xd8\x40\xbc\x36\xbf\x64\x6c\xff\x43\xb2\x3b\x4c\x02\x02\x29\
-\xce\xc2\x03\x09\x86\x77\x56\xdb\xfc\xfd\x72\x08\xa8\x1a\x02\x29\
-\xce\x52\x02\xf1\xae\x7f\x36\x67\xf0\x1e\x39\x0c\x54\x09\x81\x14\
-\x67\x59\x81\xac\x69\xf3\x27\x4c\x96\xbf\x53\x0e\x05\x55\x41\x20\
-\xc5\x59\x6a\x20\xc1\x10\x49\xba\xfc\x56\x39\x1c\x54\x01\x81\x14\
-\x67\xe9\x81\xac\xfb\xef\x4e\xaf\x7f\x93\x1c\x12\xca\x86\x40\x8a\
-\xb3\xa2\x40\x82\xe7\x4d\xe6\xde\x28\x87\x85\x32\x21\x90\xe2\xac\
-\x30\x90\xe0\xf9\xae\x75\x37\xc8\xa1\x41\xa3\xbb\x70\xf2\x9a\x4e\
-\xe6\x3e\x6b\xd2\xfe\x11\x3f\x49\xbf\x4b\x32\xf7\xd8\xc6\x01\xf5\
-\x0f\xcb\x2f\x93\xcd\xff\x0f\x02\x29\xce\x8a\x03\x19\xfa\x8b\xf6\
-\x7f\x9a\xde\xd2\x41\x39\x3c\x6c\xe4\x88\x5d\x7e\x47\x62\xdd\xb1\
-\xb5\x57\x5d\x23\x03\x78\xb9\x04\x52\xbe\x55\x07\x12\x34\xa9\x7b\
-\xf4\x48\x2f\x7f\x95\x9c\x02\x02\x61\xb1\x9b\xac\x6f\x63\x03\xb6\
-\x95\x04\x52\xbe\x93\x08\x24\x18\x22\x49\x7a\xa7\xf6\xcb\x69\xda\
-\xcd\xda\x20\xdb\xcd\x4f\xa1\xb6\x93\x40\xca\x77\x52\x81\x04\xfd\
-\xb9\xff\x76\x38\xeb\xbf\x52\x4e\xd5\x4e\xfc\x35\xc6\x6d\xe3\x7e\
-\xb8\x89\x40\xca\x77\x92\x81\x04\x8d\x75\x7f\x3d\x7a\xfc\xcc\xb5\
-\x72\xba\x76\x11\x5e\x45\x5d\x7b\x5f\x4e\x64\x60\x76\x22\x81\x94\
-\xef\xa4\x03\x59\xd3\xba\x07\x7f\x36\xef\x5e\x22\xa7\x6c\x07\x47\
-\xd3\x95\x03\xbb\xfd\xc6\x43\x02\x29\xdf\xa9\x08\xc4\xeb\xd7\xca\
-\x9f\x67\xb3\x33\x2f\x92\xd3\x36\x9b\xb5\xef\xac\xb2\x2e\x8f\x0d\
-\xc4\x28\x12\x48\xf9\x4e\x4b\x20\x41\x7f\x5b\xfe\x70\xc8\x9e\x7e\
-\x81\x9c\xba\xb9\x74\xb2\xfc\x23\xb1\x01\x18\x55\x02\x29\xdf\x69\
-\x0a\x64\x5d\xf7\xfb\xf0\x85\xd9\x72\xfa\x06\x32\x1c\xee\xf5\xcf\
-\x29\xff\x18\xff\xe1\x47\x93\x40\xca\x77\xfa\x02\xf1\x86\xef\x5b\
-\x4e\x97\x9a\x19\x49\xa7\xe7\xde\x1c\xfd\xa1\xc7\x90\x40\xca\x77\
-\x2a\x03\xf1\x86\xa7\xe8\x3f\x99\x77\xcf\x95\x9b\xd1\x1c\x7c\xfd\
-\xdf\x8a\xfd\xc0\xe3\x48\x20\xe5\x3b\xad\x81\x04\x4d\xe6\x96\xac\
-\x3d\x7b\xa5\xdc\x94\x66\xe0\x9f\x5e\xdd\x17\xfb\x61\xc7\x91\x40\
-\xca\x77\xbb\x40\xc2\x0b\x79\x26\xcb\xbf\x3d\x29\xfd\x6d\xfc\x80\
-\xdc\x94\xfa\x13\x7e\x7f\x84\x1f\xf0\x0b\x1b\x27\x61\x5c\x09\xa4\
-\x7c\xb7\x0b\x04\x0a\xe4\x17\x8b\xbf\x7d\x5e\x6c\x12\xc6\x95\x40\
-\xca\x97\x40\x2a\xa4\xbb\xb0\x72\x4d\x6c\x12\xc6\x95\x40\xca\x97\
-\x40\x2a\x24\x2c\xe8\xd8\x24\x8c\x2b\x81\x94\x2f\x81\x54\x08\x81\
-\xd4\x4f\x02\xa9\x10\x02\xa9\x9f\x04\x52\x21\x04\x52\x3f\x09\xa4\
-\x42\x08\xa4\x7e\xfa\x40\x7e\xbd\x36\x9e\x65\x98\x2e\xbd\x61\xfd\
-\x85\xc6\xe2\x3d\x64\x6d\xfd\x5e\x40\x24\x10\xac\x4c\xbf\x06\x64\
-\x39\xd4\x07\x02\xc1\xca\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\
-\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\
-\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\
-\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\
-\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\
-\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\
-\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\
-\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\
-\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\
-\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\
-\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\
-\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\
-\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\
-\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\
-\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\
-\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\
-\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\
-\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\
-\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\
-\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\
-\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\
-\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\
-\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\
-\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\x10\x54\
-\x24\x10\x02\x41\x45\x02\x21\x10\x54\x24\x10\x02\x41\x45\x02\x21\
-\x10\x54\x24\x10\x02\x41\x45\x02\xd9\x3a\x90\x4e\xd6\xbf\x2e\xb6\
-\x3d\xb6\x48\x02\x51\x02\x49\x07\x2f\x8d\x6d\x8f\xed\xb1\x73\x7c\
-\xf9\x15\xb2\x1c\xea\x43\x55\x81\xdc\xbb\xb8\xf8\xcc\x24\x73\x4f\
-\xc6\xf6\xc1\xe6\x6b\xac\x7b\xaa\xbb\xb8\xfa\x6c\x59\x0e\xf5\xa1\
-\xe8\x40\x0e\xcf\x9d\x7c\xb9\x1c\x7a\x13\xc6\xe6\x0f\xc6\xf6\xc1\
-\x56\xf8\xb0\x2c\x83\x7a\x51\x74\x20\xb3\xf3\xfd\xd7\xc8\xa1\x37\
-\x61\x52\xf7\xa3\xd8\x3e\xd8\x7c\xfd\x9d\xe3\xac\x2c\x83\x7a\x51\
-\x74\x20\xa6\xb7\xf4\x36\x39\xf4\x26\xfc\xb9\x6e\x89\xed\x83\x2d\
-\x30\x1d\x7c\x50\x96\x41\xbd\x28\x3a\x90\x8e\x75\x9f\x96\x43\x6f\
-\xa2\xdb\x5d\x7d\x86\xc9\xf2\xbf\xc7\xf6\xc3\xe6\xea\xaf\x3f\xfe\
-\x11\xae\x41\x65\x19\xd4\x8b\xa2\x03\x49\xb2\xfe\xf7\xe4\xd0\x51\
-\x3a\x99\xfb\x62\x7c\x3f\x6c\xaa\x61\xce\x65\xfa\xeb\x47\xf1\x81\
-\xe4\xe7\xe4\xd0\x51\x92\x64\xe9\x59\xfe\x1e\xe5\x2f\x91\xfd\xb0\
-\x81\xfa\xb9\x7e\xc8\xda\xb3\x57\xca\xf4\xd7\x8f\x12\x02\x19\xfe\
-\x74\xee\xf4\xb5\x72\xf8\x28\xe6\x78\xfe\x16\x3f\x70\x17\x63\xfb\
-\x62\x93\x74\x17\x67\xad\xbb\x59\xa6\xbd\x9e\x94\x11\x48\x62\xdd\
-\x5d\x72\xf8\x2d\x49\x52\x77\x7b\x74\x5f\x6c\x8c\xda\xf5\x68\x6d\
-\x28\x25\x90\xcc\xfd\x69\xcf\x70\xb8\x57\x4e\xb1\x25\x7e\xbb\x2f\
-\xc7\xf7\xc7\xba\xdb\x49\xdd\x57\x65\x9a\xeb\x4d\x39\x81\xf8\x01\
-\x5a\x70\xef\x95\x53\xa8\xcc\x66\xee\xc3\xc6\xe6\x17\x62\xc7\xc0\
-\xfa\x69\x32\xf7\x5f\x7f\xc7\xf7\x71\x99\xde\xfa\x53\x56\x20\xfe\
-\x1a\xe3\xbe\x6e\xb7\xbb\x4f\x4e\xa3\x62\x8e\x2d\x1f\xf4\xdb\x9f\
-\x8b\x1d\x07\xeb\xa3\x8f\x63\xd5\x2c\x0c\x5e\x2f\xd3\xda\x0c\xca\
-\x0a\x24\x68\xd2\xfe\xe7\xe5\x34\xdb\xd2\xed\x0e\xf7\x99\x6c\x70\
-\x9b\x0f\x65\x35\x76\x2c\x9c\x5e\x7d\x18\xf7\xfb\xeb\x8d\x4f\x2e\
-\x2e\x2e\x3e\x4d\xa6\xb3\x39\x94\x1a\x48\xe6\xfe\x33\xce\x3b\x38\
-\x67\xb3\xfc\x75\x7e\xdf\xaf\xf8\xa7\x5e\x27\xfc\x71\x1e\xdd\x78\
-\x5c\x9c\xac\xe1\xc5\xde\x30\x37\xfe\xce\xec\xee\xc6\x3d\x62\x6c\
-\xa4\xcc\x40\x82\xfe\x62\xed\x37\xbb\xbd\x67\x09\x4f\xd5\x92\xf9\
-\x13\x57\xe3\xe4\xdd\xe9\xd3\xe6\xc6\x50\x76\x20\x41\x7f\x4f\xf3\
-\x5d\x39\x1d\x40\xbd\xa8\x22\x90\xa0\x49\xf3\x6f\xc8\x29\x01\xea\
-\x43\x55\x81\x04\xfd\xf3\xd6\x43\xb5\x7d\xd3\x1a\xb4\x93\x2a\x03\
-\x11\xcf\x99\xde\xd2\x41\x39\x3d\xc0\x74\x33\x81\x40\x86\x89\xcd\
-\x2f\x99\xcc\xdd\x9b\xf4\x4e\xed\x97\x9b\x01\x30\x9d\x4c\x24\x90\
-\xcb\xec\x58\x37\xf0\x17\xf1\x5f\xf7\xd7\x28\x1f\x3d\xb2\xb0\x7c\
-\x53\x92\x0d\x6e\xc4\x6a\xfd\xe5\xa9\x53\xcf\x91\xe5\x00\x1b\x99\
-\x74\x20\x38\x79\xcd\x7c\xc3\x5f\xcb\xd8\x0d\x04\x82\x04\xa2\x40\
-\x20\x48\x20\x0a\xe1\xc3\x4d\xb1\x41\xc3\xf6\x48\x20\x0a\x73\x73\
-\x27\x9f\x1f\x1b\x34\x6c\x93\x4b\xaf\x96\xe5\x00\x1b\x99\x99\x99\
-\xb9\xc2\x58\xf7\x44\x7c\xe0\xb0\x15\xce\x9f\xb8\x5a\x96\x03\xc4\
-\xf0\x83\xc4\x67\x31\x5a\xab\x7b\x4c\x96\x01\x6c\x85\xb1\xf9\x3d\
-\xf1\xc1\xc3\xa6\x6b\x32\xf7\x73\x59\x06\xb0\x15\xe1\xdb\x10\x63\
-\x83\x87\x2d\xd0\xe6\xb7\xca\x32\x80\xad\x08\xef\xf1\x37\x69\xfe\
-\x40\x74\x00\xb1\xb1\x9a\x05\xf7\xf8\xa1\x3a\x7f\x67\x55\x95\x24\
-\x69\xff\x8e\xd8\x20\x62\x83\xb5\xee\x6e\x99\x7e\xd8\x8e\xf0\xa9\
-\x3f\x3f\x68\x5c\xac\xb7\xc7\x87\x6b\xf9\xfb\x3a\x26\x49\x78\x1b\
-\xba\xbf\x60\xff\x57\x64\x30\xb1\x49\x86\x77\x53\x2f\x6c\xfd\x2d\
-\xfc\xa0\x60\x52\xf7\xbe\x84\xdf\x04\xd5\x74\x3f\x23\xd3\x0d\xe3\
-\x30\xdb\x73\x77\x12\x49\x33\x0d\xdf\x16\x23\xd3\x0c\xbb\xc1\x64\
-\xfd\x77\xfb\x01\x3d\xbf\x71\x80\xb1\x9e\xfa\xa7\xce\x17\x12\x3b\
-\xf8\x98\x4c\x2f\x14\xc1\xd1\x74\xe5\x80\x7f\x24\x39\x1d\x1b\x70\
-\xac\x8f\xc6\xba\x73\x5d\xeb\x6e\x90\x69\x85\x42\x19\x0e\xf7\x76\
-\x7a\x83\x5b\xfc\x85\x5d\x3f\x36\xf8\x38\xc5\xda\xfc\xac\xbf\xa6\
-\xfc\x44\xf8\xd6\x4a\x99\x4d\x28\x93\xc3\xe9\xe9\x03\xc9\x82\xbb\
-\xcb\xd8\xfe\x9c\xc9\xc2\x0b\x8b\x5c\xa7\x4c\x93\xfe\x91\xe2\x21\
-\x93\xe6\xb6\x93\xe6\x5f\xf2\x61\xbc\x56\xa6\x0d\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x5a\xc6\x9e\x3d\xff\
-\x03\xe0\x01\x12\x90\x6d\x54\x58\x89\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x11\x02\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\xc8\x00\x00\x00\xc8\x08\x06\x00\x00\x00\xad\x58\xae\x9e\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x10\x97\x49\x44\x41\x54\x78\x5e\xed\x9d\x79\x90\
-\x1c\x55\x1d\xc7\x13\x14\x91\x43\x62\x92\xed\xee\xd9\x10\x88\x01\
-\x44\x4c\x09\x85\xa8\x25\x54\x29\x58\x20\xa7\x14\xc8\x91\x42\x73\
-\xec\xbc\x9e\xc4\x05\x03\x21\x02\x25\x2a\x16\xae\x22\x85\x55\x08\
-\x0a\x12\x43\x96\xec\xf4\xeb\x49\x82\x25\x01\x0d\x22\xff\x10\x39\
-\x4a\x50\x0e\x0d\xa7\xc8\x8d\x44\xa5\x44\x28\xd1\x20\xa7\x21\x04\
-\x7f\xbf\xdd\x17\x6a\xb3\xf3\x7b\xb3\x33\xbb\x7d\xbc\x9e\xf9\x7e\
-\xab\x3e\x55\xc9\xce\xbc\xee\xdf\xeb\xee\xcf\xf4\xdd\x3d\x01\x41\
-\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\
-\x04\x41\x10\x04\x41\x90\x4e\x88\xd7\x13\xef\x15\x84\xfa\x06\x5f\
-\xe9\x8d\x41\x18\xbf\x03\x1c\x40\xc5\xaf\xd0\xfc\xb8\x27\x28\xeb\
-\xcf\x99\xd9\x84\xe4\x91\x52\x65\x60\x06\xc9\xf1\xb2\x38\x93\x80\
-\x03\xe8\x2d\x5e\x59\x9f\x61\x66\x17\x92\x75\x02\x15\xad\x96\x67\
-\x0c\x70\x07\x48\x92\x5b\x68\x35\xfe\xa8\x3c\x53\x80\x5b\x40\x92\
-\x5c\xe2\x87\xf1\xb3\xf2\x0c\x01\xee\x01\x49\x32\x0f\x04\x71\x0d\
-\xbd\xce\x57\xf1\x92\x40\xe9\x07\x2d\x9f\x43\x92\x2c\x03\x41\xdc\
-\x81\xe6\xc5\xfa\x09\x7d\x7d\xdb\xf1\x7c\x99\x32\x77\xd5\xae\x24\
-\xc9\x5d\xd2\xf7\x20\x49\x86\x81\x20\xee\x40\xfb\x83\x35\x33\x5b\
-\x06\x03\x49\x1c\x08\x04\x71\x07\xda\xb4\xd2\x66\xb6\xbc\x1b\x48\
-\x92\x73\x20\x88\x3b\x48\x82\x70\x20\x49\x8e\x81\x20\xee\x60\x13\
-\x84\xc3\x92\xd0\x26\xd8\xbd\x52\x3b\x48\x92\x62\x20\x88\x3b\x34\
-\x12\x84\x33\x7d\xc1\x8a\x29\x34\xbf\xee\x93\xda\x42\x92\x94\x02\
-\x41\xdc\x61\x34\x41\x38\x90\x24\xe3\x40\x10\x77\x68\x46\x10\x0e\
-\x24\xc9\x30\x10\xc4\x1d\x9a\x15\x84\x03\x49\x32\x0a\x04\x71\x87\
-\x56\x04\xe1\xb0\x24\x81\xd2\x0f\x49\xc3\x82\x24\x09\x05\x82\xb8\
-\x43\xab\x82\x70\x82\x79\xcb\x7c\x6a\xf7\x27\x69\x78\x90\x24\x81\
-\x40\x10\x77\x18\x8b\x20\x1c\x48\x92\x62\x20\x88\x3b\x8c\x55\x10\
-\x0e\x24\x49\x29\x10\xc4\x1d\xc6\x23\x08\x07\x92\xa4\x10\x08\xe2\
-\x0e\xe3\x15\x84\x33\x24\x89\x7e\x42\x1a\x3e\x24\x19\x43\x20\x88\
-\x3b\x24\x21\x08\x67\x6a\x65\x60\x1a\xc9\xf0\xa4\x34\x0e\x48\xd2\
-\x62\x20\x88\x3b\x24\x25\x08\x07\x92\x24\x14\x08\xe2\x0e\x49\x0a\
-\xc2\x81\x24\x09\x04\x82\xb8\x43\xd2\x82\x70\x20\xc9\x38\x03\x41\
-\xdc\x21\x0d\x41\x38\xd3\x7b\xe2\xdd\xec\xf3\x99\x24\x51\xd1\x22\
-\xf3\x55\x64\x64\x20\x88\x3b\xa4\x25\x08\xa7\x54\x59\x3d\xc3\x3a\
-\xaf\x55\xfc\x76\x29\xac\x1d\x6a\xbe\x8a\x0c\x0f\x04\x71\x87\x34\
-\x05\xe1\x0c\x4a\xa2\xf4\x06\x69\xdc\x81\xd2\x3f\x33\x5f\x43\x86\
-\x07\x82\xb8\x43\xda\x82\x70\x68\x9f\xe3\x68\xcb\xb8\x6f\x37\x5f\
-\x41\x86\x07\x82\xb8\x83\x1f\x46\xa9\x2f\xa4\xdd\x2a\xfa\xac\x38\
-\x6e\x08\x22\x07\x82\xb8\x85\x1f\xea\x0b\xe8\x57\xfe\x80\x52\x58\
-\x9d\x95\x34\x7e\x45\x1f\x4e\xc3\x7f\x44\x1c\x2f\x04\x91\x03\x41\
-\x00\x03\x41\x2c\x81\x20\x80\x81\x20\x96\x40\x10\xc0\x40\x10\x4b\
-\x20\x08\x60\x20\x88\x25\x10\x04\x30\x10\xc4\x12\x08\x02\x18\x08\
-\x62\x09\x04\x01\x0c\x04\xb1\x04\x82\x00\x06\x82\x58\x02\x41\x00\
-\x03\x41\x2c\x81\x20\x80\x81\x20\x96\x40\x10\xc0\x40\x10\x4b\x3c\
-\x15\x5d\xe8\x85\xfa\xbb\x5e\x59\x9f\xc7\x37\xce\x30\x81\x8a\xbf\
-\x41\x13\xac\x8f\x58\x4a\x02\x5d\x1f\x28\x7d\x3f\xfd\xfb\x35\x69\
-\xc2\x82\xf6\x00\x82\x24\x90\xd2\x9c\x81\x19\x5e\x4f\x7c\xa4\x1f\
-\xea\x73\x89\x1b\x49\x9c\x97\xa5\x89\x0d\x8a\x07\x04\x49\x23\xb3\
-\xd7\xbc\xa7\xa4\xa2\x4f\x0d\xae\x71\x42\xdb\xdb\x8f\x40\x11\x80\
-\x20\x19\xa4\xbb\xac\xf7\x25\x59\x2e\xa2\xcd\xb2\xbf\x49\x33\x01\
-\xb8\x0b\x04\xc9\x32\x7d\x7d\xdb\xd1\x9a\xe5\x58\x92\xe5\x4e\x69\
-\x66\x00\xf7\x80\x20\x39\xa5\x54\x89\x0f\xa1\x7d\x95\x9b\xa5\x99\
-\x02\xdc\x01\x82\xe4\x1c\xbf\x52\x3b\xd8\x0f\xa3\x07\xa4\x99\x03\
-\xf2\x07\x82\x8c\xc8\xde\x8b\xaf\xd8\xa1\x6b\x7e\x6d\x9f\xae\xb0\
-\x76\xa8\xa7\xa2\xa3\x4a\x4a\xcf\x0e\xca\x7a\x01\xf1\x25\xbf\xa2\
-\xbf\xc8\x7f\x2f\x55\x06\x3e\x19\xcc\x5b\xe9\x9b\x26\xe3\x0f\xed\
-\xd4\x07\xa1\x3e\x8b\xc0\xd1\x2f\xc7\xe8\x68\x41\xbc\x45\x6b\x76\
-\x29\x85\xf1\x31\x7e\xa8\x2f\xa6\x09\x71\x13\x2d\xa0\x4f\x13\x9b\
-\xa5\x09\x25\xe1\x2b\xfd\x6f\xda\x4c\xba\x8b\x76\xbe\xab\xd4\xfe\
-\xb4\xa9\x95\x81\x8f\x98\x41\x8f\x29\x5d\x73\x97\x77\xd3\xf0\x7e\
-\x29\x8d\x0b\xe4\x43\xc7\x09\x12\x2c\x5c\x39\x93\x84\xf8\x0e\x75\
-\xfe\x6e\xea\xfc\xa6\x91\x13\x64\xbc\xd0\xb0\x9f\xf3\x54\xbc\xda\
-\xaf\xc4\xc7\x4f\xe8\xbb\xfd\xbd\x66\xb4\x2d\x85\xd6\x56\x8b\x69\
-\x38\xff\x93\x86\x0f\xb2\xa5\x23\x04\xa1\xcd\xa1\x9d\xa9\xa3\x0b\
-\x69\xa1\xbb\x83\x1f\x29\x29\x4d\x88\x34\xa0\x35\xcc\x0b\x34\xbe\
-\xcb\x7d\x15\xed\x67\x4a\x69\x3a\xdd\xe5\xf8\x13\xb4\x36\x79\x46\
-\x1a\x2e\xc8\x8e\xb6\x16\x64\x72\x6f\xff\x24\x5a\x38\xcf\xa7\x4e\
-\xbe\x28\x75\x3e\x3b\xf4\x16\xda\x0c\xbb\xc9\x2f\xeb\x83\x4c\x69\
-\x4d\x65\xa8\x7e\x1c\xe9\xca\x93\xb6\x14\x64\xfa\x29\x97\xed\x48\
-\x6b\x8b\x0b\x68\xa1\xfc\x8f\xd4\xe9\x9c\xb9\x85\xcf\xb2\x9b\x52\
-\x47\x4f\x6f\xff\xf6\x24\xd8\x35\xc2\x70\x40\x06\xb4\x9d\x20\x41\
-\x58\x3d\x8e\x7e\x75\xff\x22\x75\xd6\x1d\xf4\xe6\x40\xc5\x57\x4d\
-\x9a\xb3\x6c\xb2\x29\xbb\x71\xfa\xfa\xb6\xe3\x4d\x35\x79\x58\x20\
-\x4d\xda\x46\x10\xaf\xac\x4b\xb4\xcd\xfe\x2b\xa9\x93\xae\x42\x22\
-\xbf\xc8\x87\x8f\x4d\x17\x46\x0d\xed\xfc\x7f\x4f\x1a\x0e\x48\x8f\
-\xb6\x10\x24\x50\xd1\x61\xd4\x99\xe7\x47\x76\xae\x30\x28\xdd\xcf\
-\x9b\x85\xa6\x3b\x0d\x43\x33\x6c\xa9\x38\x0c\x90\x0a\xc5\x16\x84\
-\x36\x3d\xa8\x03\x7d\x83\x9b\x2c\x42\xe7\x8a\x85\x7e\xa8\x6b\xfe\
-\xd5\xfb\x98\x9e\xd9\x33\xd8\x67\x7d\xad\x3c\x0c\x90\x34\x85\x15\
-\x84\xcf\x78\xb7\xdb\x82\xe2\x87\xfa\x5f\x7c\xe9\x89\xe9\xa2\x35\
-\x83\x7d\x0f\xf5\xad\xd2\x30\x40\xb2\x14\x52\x90\x29\x73\x57\xed\
-\x4a\x3b\xb9\xb7\x48\x1d\x2a\x3a\xb4\xe0\xbf\x1a\x94\x07\xbe\x60\
-\xba\x6a\x4d\x29\xac\x7a\xf4\xdd\xe7\xa4\x61\x80\xe4\x28\x9c\x20\
-\x7b\xcc\x59\x36\xd9\x0f\xe3\xfb\xa4\xce\xb4\x0b\x34\x53\x36\xd1\
-\x7e\xd5\xa9\xa6\xcb\xd6\x74\xf5\x0c\x1c\x42\xdf\x7f\x6b\x64\x7b\
-\x90\x1c\x85\x12\x64\x46\x59\xbf\x9f\x36\xab\x3a\xe3\x5e\x0a\x92\
-\xc4\x57\xd1\x11\xa6\xeb\xd6\xf0\x89\x50\xb1\x3d\x48\x84\xe2\x08\
-\x32\x74\xc5\xeb\x0d\x52\x27\xda\x98\x57\x46\x3d\xa9\xc8\x3b\xed\
-\x61\x8c\xfd\x91\x94\x28\x8c\x20\x54\xe8\x15\x52\x07\xda\x1d\x3e\
-\x57\x32\x59\x45\xbb\x9b\xc9\x20\x86\x2f\xcf\xa7\xfd\x11\x5c\xdc\
-\x98\x02\x85\x10\xa4\x14\xc6\xa7\x48\xc5\x77\x0a\xb4\xf0\xff\x7e\
-\xb4\x2b\x83\x83\x4a\x7c\x91\xd4\x16\x8c\x0f\xe7\x05\xf1\x7a\xe2\
-\xbd\x68\xd3\xaa\xe3\x6f\x24\xa2\x7d\x8d\x4b\xcc\x24\x11\xd3\xdd\
-\xdb\xbf\x13\x6d\x6a\xe1\x61\x77\x09\xe3\xb6\x20\xb4\xdf\x41\x33\
-\xfd\x0f\x52\xe1\x19\x72\xb7\xa7\xe2\x4b\x3d\xa5\x57\xd1\xe6\xce\
-\x46\xe1\xf3\x8c\xe0\x2b\x82\xab\x9f\x37\x53\x46\x8c\xa7\xa2\x93\
-\xe4\xb6\x60\xac\x38\x2d\x48\xa0\xa2\x33\xa5\xa2\xb3\x81\x16\x48\
-\x15\x2d\x34\xa5\x0c\x66\x6a\x65\x60\x1a\x49\x92\xdb\x73\xae\xe8\
-\xc7\xe2\x49\x3e\x92\x67\xca\xa9\xcf\xe0\x0e\x7b\xf4\x98\xd4\x16\
-\x8c\x0d\x67\x05\xf1\x17\xac\x08\x68\x81\xc8\xed\x72\x75\xaf\xac\
-\x97\x9b\x52\xb6\x49\x97\x8a\x3e\x4c\x92\xbc\x29\xb5\xc9\x02\x9a\
-\x61\x7d\xa6\x14\x31\x24\xf5\x1c\xa9\x1d\x18\x1b\xee\x0a\xa2\x74\
-\x4d\x2a\x38\x2b\x1a\xdd\xdc\x44\x9f\xe7\x76\x16\x9f\x7e\x34\xde\
-\xf0\x16\xac\xd8\xdb\x94\x52\x9f\xa1\xcd\xd2\xc7\xa5\xb6\xa0\x75\
-\x9c\x14\x84\x1f\x7e\x40\x9b\x38\xf9\x5e\x80\x38\xef\xea\x99\xa6\
-\x9c\xba\xd0\x02\xb8\x46\x6c\x93\x15\x65\xbd\xca\x94\x22\x86\x66\
-\xea\x69\x62\x3b\xd0\x32\x4e\x0a\x12\xa8\x78\xb5\x54\x6c\xa6\x94\
-\xf5\x87\x4c\x39\x75\xc9\x5d\x10\xbe\x14\xa5\x41\x7d\xf4\x03\xf3\
-\x01\x9a\xb1\x78\xea\x7c\x02\x38\x27\x88\x39\xac\x9b\xff\xe5\xeb\
-\x2e\x0b\xc2\x58\xf6\x91\xb6\x26\x28\xc7\xb8\x4d\x37\x01\x9c\x13\
-\xc4\x0f\x6b\x57\x4a\x85\x66\x8e\xe3\x82\xf8\xa1\x7e\x7d\xfa\x82\
-\x15\x53\x4c\x49\x75\xf1\x54\xed\x28\xa9\x1d\x68\x0d\xa7\x04\x19\
-\xba\xc7\x23\x7e\x49\x2a\x34\x73\x5c\x5f\x83\x10\xfc\x52\x1f\x53\
-\x52\x7d\xf8\xda\x35\xa5\xff\x21\xb5\x03\xcd\xe3\x94\x20\x5e\x59\
-\x9f\x2c\x15\x99\x0b\x05\x10\xc4\x57\xfa\x1e\x53\x92\x18\xfa\x3c\
-\x92\xda\x81\xe6\x71\x4a\x10\xbf\xac\x6f\x94\x8a\xcc\x85\x02\x08\
-\xc2\xf0\xbb\x47\x4c\x59\x75\xc1\x39\x91\xf1\xe3\x8c\x20\x7c\x2d\
-\xd1\xe0\xd1\x19\xa1\xc8\x5c\x28\x88\x20\x34\xcd\xbe\x65\xca\xaa\
-\x0b\x9f\xf9\x17\xdb\x80\xa6\x71\x46\x10\xfa\xb5\x3b\x42\x2a\x30\
-\x37\x8a\x22\x48\xa8\xd7\x99\xb2\xc4\xd0\xe7\x4f\xc8\xed\x40\x33\
-\x38\x23\x08\xfd\x12\xba\x75\xb9\x76\x41\x04\xe1\xa3\x59\x8d\xae\
-\xcf\xa2\x19\x3c\x20\xb5\x03\xcd\xe1\x8e\x20\x61\xfc\xbb\x91\xc5\
-\xe5\x4a\x61\xd6\x20\xf1\x3b\xfc\xce\x12\x53\x5a\x5d\x68\xbf\xee\
-\x6b\x52\x1b\xd0\x1c\x6e\x08\x32\xf4\x7c\x2b\xb7\xce\xfc\x16\x48\
-\x10\xaa\xe7\x6c\x53\x5a\x5d\xba\xc2\xf8\x18\xa9\x0d\x68\x0e\x27\
-\x04\xe1\x85\x51\x2a\x2e\x57\x0a\x24\x08\xed\x67\x58\xcf\xaa\xfb\
-\x61\x75\x4f\xb9\x0d\x68\x06\x27\x04\xf1\x2a\xf1\x91\x52\x71\xb9\
-\x52\xa4\x35\x88\xd2\xb7\x99\xd2\xea\x33\x74\x75\xef\x1b\x52\x3b\
-\x30\x3a\x4e\x08\x42\x45\x2c\x91\x8a\xcb\x95\x42\x6d\x62\xe9\xe7\
-\x4c\x69\x62\xe8\x73\x1c\xc9\x1a\x23\x6e\x08\x12\xea\x8b\xa5\xe2\
-\x72\xa5\x50\x9b\x58\xf1\x5b\xa6\x34\x31\x81\x72\xec\x00\x48\x81\
-\x70\x65\x0d\xf2\x13\xa9\xb8\x5c\x29\x96\x20\xef\x34\x3a\xd4\x4b\
-\xfb\x28\x85\x7a\x2d\x84\x4b\x38\x22\x48\xbe\x77\x0f\x8a\x14\x4c\
-\x10\xbe\x45\xd9\x94\x57\x17\x17\xeb\x2d\x0a\x8e\x6c\x62\xc5\xbf\
-\x90\x8a\xcb\x95\x82\x09\xc2\xf7\xd1\x98\xf2\xea\x42\x33\x79\xa5\
-\xd4\x06\x8c\x8e\x13\x82\x04\x15\x07\xdf\x0d\x5e\x34\x41\x1a\xdc\
-\xa7\xee\xe4\x1a\xba\x20\x38\xb2\x89\xe5\xe0\x2f\x5c\xd1\x04\x29\
-\xeb\x92\x29\xaf\x2e\xd8\xc4\x1a\x3b\xae\x08\xe2\xde\x6b\xc5\x0a\
-\x26\x08\x5f\x0d\x6d\xca\xab\x0b\x7d\xbe\x76\xe4\xf7\x41\x73\x38\
-\x22\x48\xf4\x03\xa9\xb8\x34\xa0\x0e\xbf\x48\xfc\xd9\x1f\xed\x61\
-\xcf\xe3\x11\x44\xe9\xa7\x82\x50\x3f\x2d\x7e\x96\x0a\x7a\xb3\x29\
-\x4d\x0c\x4d\x5f\x1c\xe6\x1d\x23\xae\x08\x72\x8e\x54\x5c\xb2\xe8\
-\x97\x4b\x4a\xcf\xe6\x33\xcb\x3c\x4e\x7e\xf2\x07\x2d\xc8\x3f\x92\
-\xbf\x4b\x8c\x41\x10\xbe\xc3\x8f\x1f\x59\x64\xbe\x36\x61\x4a\x58\
-\x9d\x45\x7f\xfb\xa3\xf4\xdd\x84\x79\xde\x8c\x52\x0c\xd5\x8b\xa7\
-\x2d\x8e\x11\x27\x04\xe9\x52\xd1\xb1\x52\x71\x49\x42\x12\x9e\x60\
-\x46\xb7\x4d\xe8\xef\x4b\x48\x9e\x2d\x75\x6d\x5a\x14\x84\xf6\x01\
-\xd6\x05\xf3\x56\xee\x6c\xbe\xf2\x6e\xa6\xcd\xaf\x4d\xa5\xcf\x53\
-\x7d\x03\xaf\x5f\xd6\x77\x98\xd1\xd5\xc7\xc5\x0b\x41\x0b\x84\x13\
-\x82\x0c\x3d\xea\x47\x2e\x30\x19\xf4\xd3\x66\x54\x62\xbc\x30\xee\
-\xa1\xef\x6d\xfb\x2a\xb3\x16\x04\xf1\xc2\x68\x6d\xc3\x7b\x32\xca\
-\xfa\x87\xc3\xbf\x9f\x3c\x7a\x85\x19\x55\x5d\x4a\x95\x81\x19\x72\
-\x1b\xd0\x0c\x4e\x08\x92\xf6\x05\x75\xb4\x99\xf3\x5b\x33\x26\x6b\
-\x68\xfc\x27\x6e\x53\x43\xb3\x82\x28\xbd\x6a\xeb\x66\x9b\x2d\x34\
-\xac\xc5\xef\x7e\x3f\x0d\xca\xfa\xeb\x66\x54\x75\xf1\x7a\x06\xdc\
-\xbb\x10\xb4\x40\xb8\x21\x08\x85\x76\x9a\xd3\x7c\xcd\xc1\xf3\xa3\
-\x2d\xc4\x1c\xfa\xa5\x3f\x9c\xbe\xfb\xca\x60\x9b\x66\x04\x51\xd1\
-\x55\xbc\x09\x63\xfe\x6c\x0d\x49\xd4\x6f\xea\x48\x05\xda\x4c\xb4\
-\xbe\xcb\x30\x28\x57\xcf\x92\xda\x80\xe6\x70\x47\x10\x15\x5d\x22\
-\x15\x98\x14\xb4\x50\x5b\x6f\x2a\x1a\x9e\x20\xac\x7e\x9a\x26\xca\
-\x4b\xa3\x09\xc2\xf5\xd2\x3f\x27\x0e\xfd\xc5\x9e\xa9\x65\xbd\x2f\
-\xc9\xff\xba\x54\x53\x22\xa8\x78\x53\xe3\x43\xbc\x7a\xb9\xd8\x0e\
-\x34\x85\x33\x82\x94\xd2\xdf\x51\x7f\x8b\x76\xa4\x95\x19\x5d\xc3\
-\x04\x95\x95\x1f\xeb\xee\xbd\xa6\xcb\xfc\xb7\x2e\xb4\xa6\xb1\x3e\
-\xf9\x7d\x78\x8c\x1c\xa9\xbe\xcb\x9c\x64\x6d\x38\x03\x69\xfc\x8f\
-\x48\xed\x40\x73\x38\x23\xc8\x94\xb9\xab\x76\xa5\x82\x52\x7e\xe7\
-\x37\xbf\xa5\xa9\xb9\x35\xc9\x78\xd3\xad\xa2\x03\x69\xdf\xe7\x05\
-\xb9\x8e\xe4\xa0\x19\x68\x7d\x5f\x48\x30\x6f\x99\x2f\x1e\xa1\x03\
-\x4d\xe3\x8c\x20\x1c\x2a\x68\xdd\xc8\x02\x53\x41\x45\x17\x99\x51\
-\xa6\x12\xbf\x52\x3b\x98\x44\xcc\xe4\xe5\x3f\xb4\x56\x3c\xc0\x8c\
-\xb6\x2e\x5e\x87\xbf\xfc\x34\x09\x9c\x12\x84\x66\xf6\x7c\xa9\xc8\
-\x34\xa0\x8e\x2f\x6d\x66\x07\xbb\xd5\xf0\x7b\x04\x69\xb3\xe6\x55\
-\x69\x9c\xc9\xa3\x1f\x36\xa3\x15\x83\xfd\x8f\xf1\xe3\x94\x20\x83\
-\x4f\x57\xcc\xf2\x8d\xb6\x7c\x88\xb6\xb7\x7f\x7b\x33\xfa\x71\xc7\
-\xaf\xc4\xc7\xd3\x9a\x23\xb3\xfb\xbf\x7d\x15\x9d\x63\x46\x5d\x9f\
-\xa1\x13\x84\x1b\xa4\x76\xa0\x79\x9c\x12\x84\xe3\x97\xe3\xaa\x54\
-\x68\x5a\xd0\x02\x7d\x63\xc3\x17\x63\x36\x19\x5f\xd5\xf8\x39\xb8\
-\x29\xef\x43\x0d\x43\xc5\x9b\xba\xe6\x2e\xef\x36\xa3\xaf\x4b\x29\
-\xac\x1d\x2a\xb6\x03\x2d\xe1\x9e\x20\x2a\xda\x2f\xeb\x1d\x4b\x3e\
-\x91\xc8\x07\x09\x4c\x09\x2d\x87\x24\xeb\xa5\x05\xf6\x6d\x69\xd8\
-\xa9\xa1\xa2\x95\x66\xf4\x62\xb2\xfe\xa1\x69\x57\x9c\x13\x84\x13\
-\x84\x51\xe6\x97\x67\xd3\x42\xbe\xbe\x14\x56\x3d\x53\x42\xd3\xe1\
-\xb3\xd8\xd9\x1f\x29\xd2\x9b\x87\x5f\x14\x39\x32\xd3\xcf\xbe\x76\
-\xc7\x4c\x37\x55\xdb\x18\x27\x05\xe9\x52\xd1\x81\x52\xb1\x69\x43\
-\x92\x3c\x36\x59\x45\xbb\x9b\x32\x46\x0d\x2d\x84\xdf\x97\x86\x93\
-\x3e\xd1\x5a\x53\x82\x18\xaf\x92\xdd\xc1\x8e\x76\xc7\x49\x41\x38\
-\xb4\xf0\xe5\xf2\x24\x0e\x9a\x20\x1b\xba\xe6\xd7\xf6\x31\x65\xd8\
-\x32\x91\xea\xbb\x5c\x6a\x9f\x3e\x7a\xb3\xdf\xb3\x62\x7f\x53\x87\
-\x94\x89\x24\xfa\x03\x72\x5b\xd0\x2a\xee\x0a\x32\xef\xea\x99\xa9\
-\x5e\xa2\xd1\x00\x3e\xc1\x37\x6d\xfe\xc0\xc7\x4d\x29\xdb\x86\x2f\
-\xac\xcc\xf3\x89\xe9\x2a\xfe\xb1\xa9\x44\x0c\xed\xc3\x9d\x20\xb6\
-\x03\x63\xc2\x59\x41\x38\x7e\x58\xfd\xb6\x54\x74\x36\xe8\x97\x69\
-\x61\xdb\xe6\x22\xc0\x49\x65\xfd\x41\x9a\x60\xd7\xcb\xdf\xcf\x02\
-\xfd\xdc\x68\x07\x13\x02\xa5\xef\x92\xdb\x82\xb1\xe0\xb4\x20\x83\
-\x2f\xf5\xcc\xfb\x6e\x38\x45\x9b\x7a\x65\x7d\x9e\xa7\xa2\x4b\xe9\
-\xdf\xff\x14\xbf\x93\x11\x5e\x58\x3d\xc5\x4c\x1a\x31\x2c\xb4\xd4\
-\x0e\x8c\x1d\xa7\x05\xe1\xf8\x3d\xf1\xfe\x79\x6d\x6a\x39\x85\xd2\
-\xfd\x66\x92\xc8\xe9\xed\xdf\x9e\xbe\xf7\x70\x5d\x3b\x30\x2e\x9c\
-\x17\x84\x43\xbf\x9c\x5f\x95\x8a\xef\x14\xf8\x8a\xdc\x46\x97\xb4\
-\x73\xfc\xb2\x3e\x57\x6a\x0b\xc6\x47\x21\x04\xe1\xd0\x42\xf2\x73\
-\xa9\x03\x1d\xc0\x2b\xa5\xb0\x3a\xcb\x4c\x06\x31\x53\x16\xae\x9a\
-\x4e\x3b\xef\xff\x15\xda\x82\x71\x52\x18\x41\xf8\x72\x10\x5f\xe9\
-\x3b\xa5\x4e\xb4\x2d\x2a\xde\x34\xf2\x40\x81\x14\x9a\x89\x39\x1e\
-\x38\x68\x6f\x0a\x23\x08\x67\x8f\x39\xcb\x26\x53\xd1\x9d\xb1\x9d\
-\xad\xe2\xb7\x69\xb3\x69\xae\xe9\xba\x35\x34\x03\x17\x8a\xed\x41\
-\x22\x14\x4a\x10\xce\xf4\x9e\x78\x37\x5a\x78\x9e\x91\x3a\xd3\x3e\
-\xe8\x2d\xb4\xe6\x58\x62\xba\x6c\x0d\x0e\x60\xa4\x4f\xe1\x04\xe1\
-\xf0\x73\x68\x03\xa5\x1f\x94\x3a\xd4\x06\xbc\x15\xa8\xa8\x62\xba\
-\x6a\x8d\xb7\x68\xcd\x2e\xb4\xc9\xf9\xb8\xd0\x1e\x24\x48\x21\x05\
-\xe1\x4c\xee\xed\x9f\x44\x0b\xc8\x6d\x52\xa7\x8a\x0a\xcd\x8c\xd7\
-\x82\xb0\x76\x9c\xe9\xa2\x3d\x83\xf7\x7a\xe8\xeb\xa4\x61\x80\x64\
-\x29\xac\x20\x1c\xde\x71\xe7\xf3\x03\x52\xc7\x8a\x06\x6d\x2a\xfd\
-\xb5\xd9\x87\x41\xd0\x77\x7f\x2a\x0d\x03\x24\x4f\xa1\x05\xd9\x1a\
-\xda\x5e\x9f\x53\xe4\xc3\x9c\xb4\x36\xf8\xf5\xf4\x05\x2b\xa6\x98\
-\xee\x34\x0c\xcd\xb0\x3e\x69\x18\x20\x1d\xda\x42\x10\x0e\xdf\x1f\
-\x41\xbf\xac\x69\x3e\x7c\x2e\x71\x78\x93\x8a\xe4\xe6\xdb\x66\x47\
-\x7d\xbe\x16\x27\x48\xfb\x09\x8d\xa0\x8e\xb6\x11\x64\x30\xbc\x6d\
-\x1e\xc6\xbd\xd4\xa9\x97\xa4\xce\x3a\xc5\xd0\x35\x5e\xd6\x87\xd3\
-\x8d\x4c\x10\xea\x6f\xf2\xd1\x2d\x71\x58\x20\x35\xda\x4b\x10\x13\
-\x7e\xe8\x1b\x2d\x4c\xcb\xf9\x44\x9b\xd4\xe9\x3c\xa1\xb5\xdc\xa3\
-\x41\x58\x1d\x7d\x47\x7c\x6b\x48\x7a\x92\xc9\xfe\x9a\x06\x90\x2a\
-\x6d\x29\xc8\xd6\xf0\x93\xcd\xa9\x83\x4b\x69\x1b\xff\x4d\xa9\xf3\
-\x59\x42\x35\xdc\xef\x55\xf4\xc9\xad\x3c\x6a\x68\xd6\xec\x35\xef\
-\x23\x39\x56\x49\xc3\x03\xd9\xd0\xd6\x82\x6c\x0d\x3f\xfd\x83\x3a\
-\xda\x47\x0b\xdb\x53\xd2\x44\x48\x0b\x16\x93\xd6\x18\x6b\xbc\xb2\
-\x3e\xda\x94\xd2\x74\x82\x85\x2b\x67\x52\xcd\xeb\xa5\xe1\x82\xec\
-\xe8\x08\x41\x86\x65\x62\x77\x58\xfb\x8c\xa7\x74\x3f\x1f\x56\x95\
-\x26\xc8\x78\x31\x52\xdc\xea\x57\xf4\xe9\x7c\x69\x8c\x19\x6f\x4b\
-\xf1\x54\x74\x12\xc9\xbc\x51\x1a\x3e\xc8\x96\x4e\x13\x64\x9b\xf8\
-\x61\x75\x4f\x9a\x00\x7c\x2d\xd3\x4a\x5a\x20\xef\xa7\x7f\xb7\xfc\
-\x26\x26\x12\x62\x03\xb5\xbd\x39\x50\xd1\x85\xc4\x61\x7c\x93\x97\
-\x19\x7c\xcb\x19\x3c\x3b\x1e\xea\x2b\xa5\xf1\x80\x7c\xe8\x68\x41\
-\xa4\x94\xe6\x0c\xcc\xa0\x5f\xf0\xa3\xf8\x7d\x86\x7e\x59\x7f\x85\
-\x16\xfa\x33\x69\x22\xf5\xd1\x66\x12\xdf\x55\xb8\xc8\x0f\xe3\x2f\
-\x13\x27\xf2\x33\x71\x47\xbb\x47\xa3\x95\x04\xaa\x76\x6a\xa0\xe2\
-\xbf\x4b\x33\x09\xe4\x07\x04\xc9\x39\xfc\x8a\x04\x5a\x03\xfd\x46\
-\x9a\x39\x20\x7f\x20\x48\x4e\x31\x62\xf0\x11\xaa\xec\x1e\x57\x0a\
-\x5a\x06\x82\x64\x1c\x6f\xa1\x3e\x80\x8f\x6c\xf1\xfd\x1e\xd2\x0c\
-\x01\x6e\x01\x41\x32\xc8\xd0\xab\xa0\xf5\x19\xb4\x43\x7f\xaf\x34\
-\x13\x80\xbb\x40\x90\x94\x32\xb5\x32\x30\xcd\xbc\xef\x64\xad\x8b\
-\x67\xf4\x41\x73\x40\x90\x04\xc2\x67\xbc\x4b\x0b\x6a\x1f\x35\x47\
-\xa2\xae\xa2\xb5\xc5\x13\xd2\xc4\x06\xc5\x03\x82\x58\x32\x78\x48\
-\xb7\xac\x4f\xe7\xc3\xbd\xc3\x19\xba\x18\x32\x3a\xdf\x0b\xe3\xcb\
-\x68\xe2\xdd\x44\xff\x7f\x92\x26\x24\x76\xb4\xdb\x14\x08\x62\x09\
-\x2d\xf8\xcf\x4a\x13\x0c\x74\x16\x10\xc4\x12\x08\x02\x18\x08\x62\
-\x09\x04\x01\x0c\x04\xb1\x04\x82\x00\x06\x82\x58\x02\x41\x00\x03\
-\x41\x2c\x81\x20\x80\x81\x20\x96\x40\x10\xc0\x40\x10\x4b\x20\x08\
-\x60\x20\x88\x25\x10\x04\x30\x10\xc4\x12\x08\x02\x18\x08\x62\x09\
-\x04\x01\x0c\x04\xb1\x04\x82\x00\x06\x82\x58\x02\x41\x00\x03\x41\
-\x2c\x81\x20\x80\x81\x20\x96\x40\x10\xc0\x40\x10\x4b\x20\x08\x60\
-\x20\x88\x25\x10\x04\x30\x10\xc4\x12\x08\x02\x18\x08\x62\x09\x04\
-\x01\x0c\x04\xb1\x04\x82\x00\x06\x82\x58\x02\x41\x00\x03\x41\x2c\
-\x81\x20\x80\x81\x20\x96\x40\x10\xc0\x40\x10\x4b\x20\x08\x60\x20\
-\x88\x25\x10\x04\x30\x10\xc4\x12\x08\x02\x18\x08\x62\x09\x04\x01\
-\x0c\x04\xb1\x04\x82\x00\x06\x82\x58\x02\x41\x00\x03\x41\x2c\x81\
-\x20\x80\x81\x20\x96\x40\x10\xc0\x40\x10\x4b\x20\x08\x60\x20\x88\
-\x25\x10\x04\x30\x10\xc4\x12\x08\x02\x18\x08\x62\x09\x04\x01\x0c\
-\x04\xb1\x04\x82\x00\x06\x82\x58\x02\x41\x00\x03\x41\x2c\x81\x20\
-\x80\x81\x20\x96\x04\x0a\xef\x3a\x07\x2c\x88\xbe\xcd\x2c\x12\xc8\
-\xf0\xf8\xaa\x76\x9d\x34\xc1\x40\x87\xa1\xf4\x32\xb3\x48\x20\xc3\
-\x53\x0a\xab\xb3\xe8\xd7\xe3\x4d\x71\xa2\x81\x8e\x80\xe6\xff\xc6\
-\x69\x2a\xda\xdd\x2c\x12\xc8\xc8\xf8\x65\x7d\x10\xed\x8b\xac\x97\
-\x26\x1e\x68\x67\xf4\x16\x3f\xd4\x77\xf8\x2a\xda\xcf\x2c\x0a\x48\
-\xa3\x74\xf7\xf6\xef\x44\x6b\x14\x0f\x74\x06\x7b\x2f\xbe\x62\x07\
-\x33\xeb\x11\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\
-\x41\x10\x04\x41\x10\x04\x41\xc6\x92\x09\x13\xfe\x0f\xc8\xe1\x14\
-\x85\x4f\xc1\xad\xb8\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x19\xb8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\xc8\x00\x00\x00\xc8\x08\x06\x00\x00\x00\xad\x58\xae\x9e\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x19\x4d\x49\x44\x41\x54\x78\x5e\xed\x9d\x09\x94\
-\x24\x45\x99\xc7\x59\xf1\x60\x55\x04\x2f\x94\x45\x11\x56\x57\xc1\
-\xe3\x39\x5e\xa8\xf0\x74\xd9\xc5\x0b\x57\xf1\x80\x51\x70\x8e\xee\
-\x8c\xa8\x6e\x64\x64\x44\x56\x64\x7d\x2a\xcc\x22\xde\xe0\xa2\x80\
-\xb8\xab\x30\xe0\x82\x8b\x0c\xa0\x82\xba\x20\xac\x8e\x2c\x30\x74\
-\x65\x64\x75\x55\xe7\xd1\x3d\x33\xb0\x0e\xc8\x21\x87\xa8\x20\x1e\
-\x30\x03\xb3\xff\x2f\xfb\xeb\x9e\x3a\xa2\xbb\x32\xab\xb2\xba\x33\
-\xab\xbe\xdf\x7b\xff\xd7\x5d\x99\x51\x51\x19\x11\x5f\x64\x44\x64\
-\x46\xc4\xb7\x93\x20\x08\x82\x20\x08\x82\x20\x08\x82\x20\x08\x82\
-\x20\x08\x82\x20\x08\x82\x20\x08\x82\x20\x08\x82\x20\x08\x0d\x4c\
-\xdd\xa0\x76\x1d\x1f\x77\x9e\xcd\x1f\x05\x41\xa8\xc7\x37\xc3\x6f\
-\x8d\x4c\xe9\x3d\xfc\x51\xe8\x43\xc2\x70\xd5\x53\x03\x77\xf8\xc0\
-\xc9\x71\xe7\xef\xc3\x6a\x69\x49\x18\x2e\x7d\x22\x9f\x12\xda\x11\
-\x18\x75\x4a\xe0\xaa\xd3\xf9\xa3\xd0\x47\x84\xe5\xd2\x92\xc0\xe8\
-\x1f\x84\x46\x3d\x12\x7a\x7a\xfb\xac\x8c\xfa\x6d\xe0\xe9\xaf\x56\
-\xd7\x0f\xed\xce\x41\x85\xb9\x40\x05\xf9\x19\x34\xc6\x1f\x85\x3e\
-\x21\xa8\xe8\x13\x5b\x2a\x46\x93\x50\x79\x6e\x8b\x6e\x1a\xfe\x3b\
-\xfe\x8a\xd0\x8c\xe7\x8d\x3e\x21\x34\xfa\x21\x54\x90\x47\xee\xf4\
-\x46\x9f\xcc\x87\x85\x82\x83\x8a\xf1\xcf\xb6\x0a\x61\x13\x2a\xc9\
-\xad\x53\x53\x6a\x57\xfe\xaa\x50\x0f\x2a\xc7\x01\x75\x19\x75\x30\
-\x1f\x16\x0a\x4c\x64\x86\xdf\x89\x1b\xde\xa3\xf5\x95\xa0\x9d\x7c\
-\xa3\xbf\xc2\x5f\x17\xea\xa9\xbf\xd3\xf8\xc6\x39\x89\x0f\x0b\x05\
-\x65\xb2\x5c\x7a\x71\xe0\xa9\xdf\xd7\x1b\x7f\x22\x19\x7d\xef\xf6\
-\xf5\x6b\x1e\xcf\xd1\x08\x33\xc4\x03\x38\xce\x24\x0c\xd4\xaf\xe1\
-\xc3\x42\x01\xd9\x3c\xb6\xec\x69\xb8\xe1\x4d\x36\x18\x7e\x1a\x8d\
-\x3b\x2f\xe5\xa8\x04\x62\xfb\xf6\x9d\xfe\x2a\xf4\xd4\xdd\x33\x19\
-\x84\x66\xf9\x81\xed\xdb\x97\xee\xcc\xa7\x85\x02\xb1\x66\xcd\x9a\
-\xc7\xa1\x0c\x7f\x38\x6b\xec\x1d\x88\x1e\x01\x73\x74\x02\x51\x43\
-\x73\xdc\x92\x51\xd5\xa1\x25\x7c\x5a\x28\x10\xb8\xb9\x9d\xd2\x52\
-\x96\x29\x35\xe9\x95\xde\xc0\xd1\x09\x44\x60\x1c\xdd\x92\x51\x15\
-\xb5\x9a\x4f\x0b\x05\x21\xf2\xd4\x7b\xd1\x55\x7e\xac\xa5\x2c\xd3\
-\x69\x1b\xbd\x4c\xe4\x28\x05\x02\x99\x7a\x7e\x4b\x46\x55\xf4\x25\
-\x7c\x5a\x28\x00\x34\x6e\x40\xb9\x3d\xd8\x52\x8e\xa9\xa5\x7e\xc2\
-\x51\x0a\x33\x20\x53\x36\xb5\x64\x94\xd1\x77\xf0\x69\x21\xe7\x6c\
-\xa9\x0e\xed\x8e\x32\xdb\xdc\x52\x86\x29\x45\xad\x4f\xe4\x95\xde\
-\xc4\xd1\x0e\x2e\x93\xe5\x15\xcf\x0c\x5d\x75\x98\x6f\xf4\x69\xa8\
-\x08\x1b\x6c\x99\x15\xcb\x28\x97\xa6\x21\xf8\x9e\xf3\x3e\x99\xc4\
-\x98\x4f\xd6\xad\x5b\xba\x33\xc6\x1d\x57\x59\xcb\x2f\xa5\x10\xcf\
-\xd7\x39\xda\xc1\x22\x30\x23\x2f\x9c\x34\xa5\x95\xb8\x43\x7c\x0b\
-\x8a\x6c\x99\x93\x44\xf8\xee\x46\xfc\x3d\x17\xdd\x2f\x87\x06\xf6\
-\x1c\xbd\xb0\x88\x04\xae\xf3\xa5\xe6\x72\xea\x44\x28\xdb\xeb\x07\
-\x62\xe2\x22\x3d\x9e\x8d\x5c\xf5\xaa\xd0\x94\x56\xe3\xee\xbf\x0e\
-\x77\x85\xbb\x6c\x19\x92\x85\x10\xf7\x3d\x81\xa7\x2e\x0d\x3c\xe7\
-\x63\x7e\x59\xbd\x56\x5e\x30\x2d\x2c\x41\x45\x7f\x90\xba\x45\xb6\
-\xb2\x49\x27\x75\xbb\x7f\x93\x7e\x0e\x47\xdb\xdf\x44\xe5\xd2\xcb\
-\xd0\x6d\x3a\x1e\xdd\xa3\xcb\x91\x79\xf7\xda\x33\x24\x43\x19\x75\
-\x1f\x2a\xc9\x0f\xa1\x13\x82\x31\xe7\x95\x7c\x19\x42\x8f\x09\xcb\
-\x43\x4b\x50\xce\x0f\x59\xcb\x24\x85\x70\x13\xfd\x73\xe0\x8e\xbc\
-\x8e\xa3\x1d\x3c\x26\x5c\xf5\x12\x7a\x8c\x0b\x03\x5e\x6b\x1d\x8c\
-\xa7\x95\x51\xb7\x20\x9e\xef\xf8\xae\x33\x8a\x3b\xd8\xfe\xfc\x33\
-\xc2\x02\x42\x63\x48\xb4\xde\x5b\xac\xe5\x93\x56\x46\x0f\x71\xb4\
-\x02\x51\xbb\x71\xf9\x1e\x81\xab\x0e\x47\x85\xf9\x37\x64\x90\x0b\
-\x83\x9f\x6f\x1a\xf4\x56\xb4\x42\x15\x1a\xbc\xf9\x9e\x5e\x1a\x96\
-\x57\x3d\x97\xa3\x11\x16\x09\xea\x42\xa3\x3c\x7e\x66\x29\xab\xd4\
-\xf2\x8d\xfe\x1a\x47\x2b\xcc\x45\xad\xb6\xfc\x29\x68\x11\x66\xa7\
-\x99\xcc\x08\x85\xf0\x00\xcd\xe9\xe1\x60\x42\x4e\xc0\x1d\xff\x8c\
-\xe6\xb2\xea\x44\x54\xc9\x64\xcc\x98\x10\x64\xd6\xf7\x5b\x32\xd1\
-\xd5\x3f\xe5\xd3\x42\x4e\x88\x5c\xb5\xa2\xa5\x9c\x3a\x10\x7a\x05\
-\xb7\x6e\xf4\x46\x9f\xc5\xd1\x0a\xed\x40\x37\xab\x65\x51\x8d\x4c\
-\x79\xcf\x17\x7e\x45\xbd\x96\x06\xd4\xcd\xe5\x94\x5a\x46\xfd\x91\
-\x06\xf8\x1c\xad\x90\x04\x34\xdb\xb3\x8b\xa5\x66\x84\xbb\x8c\x2c\
-\x9a\xca\x09\xf4\x08\x16\x65\xf2\xab\xe6\x32\x4a\x2b\x7a\x24\x1c\
-\x54\xd4\x91\x1c\xad\x90\x94\x99\xe5\xb6\x3b\x32\x52\x96\xdd\xe6\
-\x05\x2a\x1b\x18\xf5\xff\xd6\x1b\x7a\xc7\x32\x8e\xac\x16\xec\x94\
-\xfa\x27\x23\xf8\x5f\x36\x6e\xc8\x09\xe8\x12\x9d\xd3\x60\xe4\x9d\
-\xca\xa8\xab\x69\x5a\x0a\x47\x2b\xa4\x05\x95\xe2\xb3\x33\x99\x19\
-\x19\xd9\xfa\x27\x0f\xa0\x4b\x54\x6a\x30\xf2\xce\xb5\xf9\x36\xff\
-\x98\xa7\x73\xb4\x42\x27\xd0\xa6\x71\x33\x19\x2a\x9b\xc7\x2d\x3e\
-\x93\x15\xf5\x46\xdc\xb4\x1e\xae\x33\xf2\x4e\xf5\x60\xcd\x55\x2f\
-\xe7\x68\x85\x4e\x89\xd7\x31\x4f\xbf\x18\x7c\xac\x56\x5b\xbe\x07\
-\x1f\x5e\x30\xe8\x7d\x0c\xff\x3b\xf0\x4c\x55\xd4\xdf\xa0\x72\x74\
-\x3d\x87\x8e\xca\x92\x66\x62\x73\xb4\x42\xb7\xa0\x50\x2a\x61\x45\
-\x4d\xf1\xc7\x05\x25\x34\xfa\x58\xfe\x77\xa0\xd9\xbc\x79\xf5\x93\
-\x68\x0c\x68\x33\xf8\xb4\xa2\x6e\x33\x47\x2b\x64\x01\x06\x72\x5f\
-\xf7\x5d\x75\x2e\x7f\x5c\x50\xf0\xdb\xb7\x78\xf2\xe4\x8c\xc6\x1d\
-\xe7\xd9\x8c\x3d\xbd\xd4\x95\xb4\x81\x03\x47\x2b\x64\x41\x38\x5e\
-\x3a\x62\x31\x26\xaf\x85\xde\x8a\xbd\xa9\x50\x07\x7d\x37\x0d\x1f\
-\xad\x68\xab\xa1\x77\x20\xa3\xa7\x64\x9a\x50\x0f\xa0\xbe\xef\x62\
-\xec\xcf\x8a\x02\xfd\x10\x15\x2c\xee\x9e\x9f\xe6\x43\x03\x47\x54\
-\x51\x6f\x46\x2b\x3a\xef\xfe\xb9\x49\x14\x78\xea\xf7\x34\x83\x9b\
-\xa3\x15\xfa\x81\xa0\xa2\xce\x8e\x0b\xd8\xa8\xab\xf9\xd0\x40\x11\
-\x7a\xa3\xd4\x82\xde\x53\x6f\xe8\x9d\x08\x63\x8e\x47\x83\x72\xe9\
-\x5d\x1c\xad\x50\xad\xae\xdc\x8b\x36\x7d\xe3\x8f\x85\x05\x2d\x48\
-\x8d\x0b\x78\xe0\x36\xac\xdb\xb0\xe1\x88\xbf\x46\xfa\x2b\xcd\xc6\
-\xde\x89\x02\xe3\x0c\x6c\x0b\x6c\x25\x2c\xab\x91\xa2\x6f\x59\x8f\
-\x81\xf9\x6e\x74\xe7\x9b\x2d\xe4\xf1\xc1\x5a\x95\x88\x6e\xe5\x45\
-\xf5\x46\xde\xa9\xd0\xb5\xba\xb4\x1f\x6e\x96\x99\x82\x41\xdd\x7f\
-\xfa\xae\x52\xfc\xb1\x90\x84\x15\xfd\x8e\xfa\x82\xf6\xcd\xe0\x6c\
-\x58\x87\x96\xe3\xe3\xf5\x69\xef\x58\x46\xf9\xb2\xd9\x9b\x05\x64\
-\xcc\x2f\x23\xa3\xd6\xf2\xc7\x42\x12\x7a\xea\x73\x8d\x05\xae\xbe\
-\xc7\xa7\xfa\x1a\x9e\xb9\xb0\xb5\x31\xed\xe9\x85\x96\xe3\x7e\xdf\
-\x75\xfe\x96\xa3\x15\x66\xa0\x27\x4e\xd3\x99\xa4\x36\xf1\xa1\xc2\
-\x40\x63\xa7\xc8\x73\x3e\x80\xae\xd5\xd9\xa8\xe4\xcd\xab\x19\x1f\
-\xc4\xb1\x6f\x23\x5d\xc3\x68\x5d\x5e\xc4\x5f\xe9\x2b\xc8\xa0\xc9\
-\xb0\x9b\xd2\xdd\x89\xb6\x06\x63\xea\x6d\x1c\xad\x50\x4f\x44\x6b\
-\xc4\x39\xa3\x16\x63\x6a\x48\x52\xe2\x9d\xe3\x69\x5b\xcc\x4a\x69\
-\x14\x15\xe2\x42\x6a\xf5\xea\x0a\xb8\xad\xf0\x9d\xbb\xa9\x7f\x1d\
-\x19\xfd\x51\xbf\x52\x7a\x4d\xd1\x07\xf1\xd4\x15\x42\x1e\x4c\xd8\
-\xd2\x9a\x56\x91\xa7\x4e\xe0\x68\x85\x66\x02\xcf\x39\x73\x26\xa3\
-\x82\x8a\x7e\x3f\x1f\xce\x0d\xd3\x53\x26\xe2\x4d\xb1\x69\xb3\xb9\
-\x96\xc2\xed\x54\x18\xd4\xde\x89\x0a\xf3\x89\x22\xf6\xb9\xe9\x66\
-\x41\x7b\x95\xd9\xd2\x95\x56\xb8\x71\x7c\x97\xa3\x15\x6c\x20\x83\
-\xaa\xb3\x19\x66\xf4\x19\x7c\x38\x97\xd0\xf6\x40\x13\x9e\x1a\x81\
-\x61\x5f\x80\xeb\xbe\xb9\xbe\xa0\xdb\x09\xe1\xef\x80\x2e\x41\x1a\
-\x8f\xa5\x0d\xf1\x8a\xdc\x82\xd0\x63\x58\x5b\x1a\x53\xcb\xe8\x8a\
-\x4c\xcb\x99\x87\x99\x99\xb7\x3b\x32\x4c\xb9\x7c\xaa\x10\xc4\x4b\
-\x48\x8d\x73\x04\xae\xfb\x0c\x18\x7f\xf3\xac\x55\x1a\x83\x9c\xe3\
-\xbb\x7a\xf9\x54\xf5\xe8\x7d\xf8\x2b\x85\xc7\x37\xea\x9f\x90\xd6\
-\x54\xfe\x02\xe7\xd0\xbd\xd1\x8d\xea\x05\x1c\xad\x60\x23\x28\x0f\
-\xbf\xbd\x29\xd3\xb6\x16\x75\x89\x6c\x50\xd9\xb1\x50\x8b\x75\x31\
-\x9f\xea\x1b\x3a\xf6\x17\xd8\x2c\xa3\x1e\x99\x1c\x1f\x11\xef\x4f\
-\xed\x40\x66\x9d\xda\x9c\x79\xbe\xeb\xbc\x85\x4f\x17\x8a\xd6\xca\
-\xee\x7c\x84\x4f\xf5\x05\xd3\xfe\x02\xf5\x54\x63\x1a\x3b\xd3\x20\
-\xbd\x23\xea\x8a\xd0\x53\xeb\x5b\x33\x50\xad\xe1\xd3\x85\x82\x0c\
-\xa8\xbe\xeb\xd1\x4f\x6f\xd2\x69\xba\x39\x06\xe5\x57\x34\x96\x53\
-\x67\x0a\x5c\x7d\x3e\x47\x2b\xcc\x47\xf3\x0e\x24\x3b\x32\xb0\xb8\
-\x9e\x69\x51\x41\xe2\x07\x0e\xf8\xfb\x40\x3f\x6d\x2c\x80\xf4\x74\
-\xed\x2f\x90\x84\xb2\x2d\xd3\x53\x41\x8e\x56\x98\x8f\xc8\x38\xaf\
-\xb7\x66\xa2\xd1\x7f\x28\xea\x13\x9e\x99\xd9\xbc\x30\xa8\xab\xf8\
-\x50\xe1\xa1\xa5\xae\x28\x93\xae\x5d\x13\x20\x4f\xee\xda\x54\x5d\
-\xb9\x17\x47\x2b\xb4\x03\x77\x93\x13\x6c\x19\x49\x22\x1f\x1d\x1c\
-\xac\x50\x84\xc6\x39\x8a\xae\x1f\x69\xfb\x14\x1f\x2a\x34\xb1\x0b\
-\x8a\x0c\xfc\x05\xa2\x72\x3c\x8c\x4a\x76\x10\x47\x2b\x24\x01\x19\
-\x36\xeb\xf0\xbf\x59\x81\xa7\x8e\xe3\x60\x85\x22\x70\x87\x9f\x4f\
-\xd7\xdf\x0f\x2b\x0a\xb3\xf2\x17\x38\x2d\x35\xc2\xd1\x0a\x49\x98\
-\x76\xf8\x3f\xb7\x53\x1c\x9a\x92\xc1\x41\x0b\x47\x68\xd4\x2d\xb4\
-\x36\x82\x3f\x16\x12\x1a\x3f\x21\x1d\x57\xdb\xca\x26\xad\x02\xd7\
-\xf9\x26\x47\x2b\x24\xc5\xf7\x46\xf7\xb3\x65\xe6\x8c\x02\x4f\xff\
-\x9a\x83\x16\x8e\x7e\x78\xbc\x1b\xba\xea\xcb\xb6\x72\x49\x2b\xf4\
-\x12\x06\xc3\x5f\x60\xd6\xd0\x02\x29\x5b\x86\xd6\xab\xa8\x0b\xa8\
-\x8a\xbe\x2f\x96\xf8\x0b\x5c\x04\xe8\xed\x38\x06\x6a\xff\x80\x8c\
-\x3b\x19\x7f\xaf\x45\x0b\xd1\x76\xe0\x87\x70\xbf\xa6\xae\x56\xbf\
-\xcc\x7e\x2d\x02\xd3\xfe\x02\xd5\x1f\x6d\xe5\x91\x46\xe4\xde\x60\
-\xa0\xfd\x05\xb6\x23\xa5\x7b\xb4\x44\x42\x5c\x7f\xc0\xdf\x6b\xe9\
-\x45\x62\x54\x51\x87\xc8\x0e\x86\xd9\x42\x8e\x68\x70\x53\x12\x7f\
-\x81\xbd\xc0\xf7\x86\xf6\x9b\x71\xb0\x89\xbb\x47\x46\x4f\x3e\xda\
-\x8a\x26\x39\x1a\x14\xc6\xd7\x68\xc2\xa0\x34\xe7\x9d\x43\xad\x33\
-\x2a\x87\xf8\x0b\xcc\x02\x7a\x03\x5e\x33\xce\xeb\x7d\xe3\x7c\x1c\
-\x2d\xc3\xf7\x61\xa0\xbd\x77\xd1\x9c\x50\x28\xe4\x9b\x51\x49\x2f\
-\x40\x1f\xba\x44\x95\x96\x2f\x59\x68\x03\x19\xb5\x2d\x3f\xd3\x8a\
-\x2a\xd9\xc0\x76\x85\x69\x3e\x8e\x5f\xd6\x4b\x91\x09\x63\x50\x16\
-\xd3\x9d\x7b\x2a\x5c\xe3\x5f\x50\x81\x2f\x47\x05\x3e\x80\x93\x20\
-\x58\x08\x4c\x69\xa5\x2d\xff\xd2\x0a\xf9\xbd\x45\xfc\x05\x32\xd5\
-\xea\xd0\xee\xd1\xb8\x73\x68\x58\xd1\x9f\xc7\xdd\xfa\xba\xd8\x18\
-\x2d\x99\xb6\x90\x42\xcb\x71\xbf\x6f\xd4\x8f\x82\x8a\x3e\x11\xd7\
-\x74\x90\x3c\x5e\x6c\x8f\xf8\x0b\x5c\x20\xc8\x18\xc9\x28\xc9\x38\
-\x63\x23\xcd\x66\x21\xff\xbc\xc2\xef\xdd\x8a\x82\xb9\x30\x32\xea\
-\xc3\x34\x25\x42\xf6\x52\x4a\xc7\xb4\xbf\x40\x75\xbb\x2d\x6f\xd3\
-\x08\xe5\xf0\x18\x3d\x1a\xe6\x68\x85\x24\x90\xb1\x92\xd1\x92\xf1\
-\x92\x11\xc7\xc6\x6c\xc9\xdc\xa4\xa2\x2e\x1d\x34\x81\xbe\xf2\x37\
-\x02\x57\x1d\x39\x31\x56\x7a\x1e\xff\x94\xd0\x01\xf1\x0d\x2d\x2b\
-\x7f\x81\xae\xfa\x32\x47\x2b\x74\x03\x19\x35\x19\x77\x6c\xe4\x46\
-\xdd\x66\xcd\xec\x46\x19\xea\xc2\x51\x57\x8e\xba\x74\x1c\x8d\x90\
-\x01\xb8\x69\x89\xbf\xc0\x3c\xe3\x7b\x6a\x99\x35\xc3\xeb\x44\x7b\
-\x4e\x71\x70\x21\x43\x68\xe2\xa0\x2d\xbf\x3b\xd0\x66\x9a\xd0\xc8\
-\xd1\x0a\x59\x52\xbd\x69\x68\x1f\x4b\x86\xcf\x8a\x9e\x88\x70\x50\
-\x21\x43\x02\x77\xf8\x40\xe4\x6d\x26\xfe\x02\xa9\x0b\xcd\xd1\x0a\
-\xbd\x00\xcd\xf3\xdc\x03\x44\x53\xba\x90\x83\x09\x19\x21\xfe\x02\
-\x0b\x46\xe0\xa9\xff\xb2\x15\x40\x2c\xb7\x34\xca\xc1\x84\x0c\x88\
-\x37\xbf\x73\x55\xd9\x9a\xd7\x29\x85\x4a\x76\x0a\x47\x2b\xf4\x12\
-\x54\x90\x55\xb6\x02\x88\x35\xee\xbc\x94\x83\x09\x19\x00\xa3\x5e\
-\x6b\xcd\xe7\x94\x0a\x3c\x7d\x85\xf8\x0b\x5c\x20\x68\xd7\x0f\x7b\
-\x21\xa8\xfb\xa5\x10\xb2\xc3\x17\x7f\x81\xc5\x64\x7a\x2b\x19\xcb\
-\x26\x64\x46\x5d\xc9\x41\x84\x2e\xa1\xcd\xd9\x90\x9f\x99\xf8\x0b\
-\xa4\x4d\xe3\x38\x5a\x61\xa1\x08\x3d\xf5\x93\x96\xc2\x30\xce\x89\
-\x7c\x5a\xe8\x02\xda\xd6\x13\xf9\x99\x89\xbf\x40\xda\x6e\x94\xa3\
-\x15\x16\x12\xda\xfd\xa3\xa5\x40\xdc\x91\x03\xf9\xb4\xd0\x21\xe2\
-\x2f\xb0\x4f\x88\xbc\xd2\x9b\x1a\x0a\x83\x26\xce\xc9\x24\xc3\xae\
-\xc1\x5d\xff\xbb\xf5\xf9\xda\xa9\x50\x1e\xeb\x64\x8e\xdb\x22\xb2\
-\x7e\xfd\xd0\x2e\x68\xbe\x67\x5f\x5c\x05\x46\x5f\xc7\xa7\x84\x0e\
-\x41\xcb\x91\x95\xbf\xc0\x09\xf1\x17\x98\x03\x30\x0e\xb9\x61\x47\
-\xc1\xa8\xcf\xf1\x61\xa1\x03\xc4\x5f\x60\x1f\x52\xbf\xc5\x4c\xe4\
-\x3a\x87\xf2\x61\x21\x25\x59\xfa\x0b\xa4\x8a\xc6\xd1\x0a\x8b\x4d\
-\xcd\xd5\xef\xa6\x82\xa1\xa7\x25\xe4\x6b\x9c\x0f\x0b\x29\xc8\xd2\
-\x5f\x20\x75\xd1\x38\x5a\x21\x0f\x84\x1b\xf4\x33\xa8\x72\x40\x55\
-\x3e\x24\xa4\x40\xfc\x05\x0e\x00\xe8\x1a\x84\xb4\x33\x3a\x7f\x14\
-\x52\x90\xa5\xbf\xc0\xa2\x6f\x99\xda\xb7\x04\xae\xfa\x77\x54\x90\
-\x23\xf9\xa3\x90\x10\xf2\xc6\x45\xad\xaf\xd5\xe0\xd3\xe9\x1e\xf1\
-\x17\x98\x63\x68\x01\x95\x2c\x90\x4a\x07\xdd\xed\xbb\x5d\xca\x1c\
-\x4b\xfc\x05\xe6\x1f\x59\x52\x9b\x1e\x74\x89\x86\xac\x06\x9f\x52\
-\x34\x99\x91\xa3\x14\x84\xfe\x01\xad\xc7\x9c\xfe\x55\x92\x0a\xdd\
-\xb3\xb5\x1c\x9d\x20\xf4\x17\xbe\x71\x6e\xb6\x19\x7d\x52\xd1\x02\
-\x2a\xf1\x17\x28\xf4\x2d\xb8\xfb\x77\xbc\xd1\x34\xbe\x7b\x17\x2d\
-\xc1\xe5\xa8\x04\x21\x7f\x6c\x59\x3f\xb4\x0b\x8d\x23\x60\xac\x57\
-\x05\x9e\xfe\x0d\x1b\xee\xdd\xf1\x12\x00\xe3\x1c\xd5\x6e\x3b\x1d\
-\x7c\x77\x43\xb3\xe1\x27\x11\x7e\xe3\x61\xda\xbc\x81\xa3\x11\x84\
-\xfc\x31\x69\x86\x5f\x1d\x1a\x35\xaf\x53\x7e\xdf\x28\xd7\xbf\x71\
-\xee\x0d\xb8\x51\x91\x3a\xf4\x02\x25\xfe\x02\x85\x1c\x43\x3b\xe3\
-\x07\x9e\x7a\xc0\x6e\xbc\x8d\xa2\x70\x41\x45\xbf\x9b\xbf\xda\x00\
-\x79\xe0\x42\x6b\x90\x6e\xb5\xa0\x51\xe7\xf0\xd7\x05\x21\x7f\x74\
-\xb2\xf5\x0e\xc2\x3f\x8a\x2e\xd7\x49\xb6\x75\x19\x38\x7f\x72\x73\
-\xf8\xb9\x84\x78\xae\x92\xb5\x36\x42\x6e\x89\xb7\xde\x31\x6a\xcc\
-\x66\xbc\x89\x44\xae\x1c\x9a\xd6\x67\xc4\xf3\xb0\xdc\xd8\x8b\x97\
-\xfd\x3b\xac\xc0\xe8\x8b\x68\xcc\xc3\x5f\x13\x84\xfc\x01\x23\x3d\
-\xcf\x66\xbc\x69\x44\x73\xd6\x6c\xce\x4d\x43\x6f\xf8\x1f\x31\xb6\
-\xb8\x06\x61\xb6\xcd\x86\x45\xf7\x0b\xe1\xaf\xf1\x8d\x7e\x27\x07\
-\x13\x84\x7c\x92\xd9\xd6\x3b\x24\xa3\x7e\x3b\x69\xd4\xdb\x38\xea\
-\x06\x3c\x72\x96\x5a\xd1\xfb\xd3\xbe\x62\x32\xf1\x50\x28\x04\x13\
-\x65\xf5\x66\x9a\xef\x64\x35\xf6\xce\xb5\x8d\x7c\xb1\xc8\x7a\x71\
-\xa1\xd0\xd0\x5d\xdc\x4f\xe6\xea\xa1\x23\xa1\x1b\x75\x09\xb5\x1a\
-\xfc\x73\x82\x50\x2c\x42\xd7\xf9\x88\xcd\xb0\xb3\x14\xc6\x19\x55\
-\xda\x2d\x9f\x7f\x52\x10\x8a\x03\xba\x56\xd9\x78\x71\x6a\x27\xa3\
-\xee\x9b\xa8\xa8\x43\xf8\x67\x05\xa1\x18\xc0\x70\xff\x68\x35\xe8\
-\xde\x68\x2b\x5a\x93\xe3\xf8\xa7\x05\x21\xdf\xd0\x00\xda\x62\xc4\
-\x3d\x57\xe0\x95\x2e\x90\x27\x58\x42\x21\xc0\x20\xba\xe7\xde\x7e\
-\xe7\x90\x09\xdc\xe1\xe7\xf3\x65\x08\x42\x3e\xf1\x8d\xfe\xa9\xc5\
-\x78\x17\x46\x46\xdf\x61\x7b\xa9\x28\x08\xb9\x20\x2c\x0f\x3d\xd7\
-\x37\xea\x7b\x56\xe3\x5d\x20\xa1\x05\x9b\x92\x29\x26\x3d\x20\x70\
-\xd5\xe1\x81\xd1\x15\x0c\xfa\xfe\x84\x81\xe6\x1d\xa1\x71\x2e\x0b\
-\x2b\xda\x91\x45\x36\xf3\x43\xf3\xad\x90\x57\x47\xa0\x62\xfc\x08\
-\x06\xda\xf5\x16\xa0\x59\x88\x76\xd0\xe7\xcb\x13\xb2\x22\x30\xce\
-\xdd\xb6\xcc\x26\xe1\xae\xe4\xc3\x00\xbe\x4d\xcf\xf8\x51\x89\x0e\
-\xaa\xd5\x96\x3f\x85\xbf\x36\x90\xd4\x6a\x1f\xde\x23\xf4\xd4\x30\
-\x74\x39\xf2\xe7\xc1\xe6\xfc\x5a\x6c\xa1\x8c\x6e\xe5\x4b\x15\xb2\
-\x22\x48\x51\xd0\xa8\x30\xb4\x2b\xe2\xcd\xa8\x34\x57\xc6\xfb\xec\
-\xd2\x6e\x1b\x46\x1f\xd0\xaf\x3b\x95\x84\xde\x8a\xbd\x83\x8a\xfe\
-\x20\xd2\x7c\x76\xdc\xca\x66\xb3\x2f\x55\x4f\x25\x1b\x51\x67\x0c\
-\x0a\xbd\xe3\xf5\xce\x0d\x32\xea\x3e\xc4\x35\x86\xbb\xeb\x77\x50\
-\x69\x4e\xa2\xca\x03\xa3\x3a\x78\x63\xad\xb4\xaf\xe7\x8d\x3e\x81\
-\x7f\x2e\x97\xc4\x13\xff\xc6\x9c\x57\xfa\xae\x5e\x8e\xeb\xff\x32\
-\xd2\x71\x15\xae\xfd\x4e\x6b\x3a\x73\xae\xc9\x71\x47\xf6\xbd\xca\
-\x12\x18\x42\xd7\x5b\xca\xb4\x13\x7e\xe3\x31\x18\xde\xed\xa8\x44\
-\x1e\xfe\xfe\x24\x32\x6a\x2d\x8c\xf0\x8b\x81\xe7\x7c\x0c\xfd\xe6\
-\x15\xf8\xfb\xae\xd8\xf1\x7d\x45\xef\x3f\x3e\xee\x3c\x3b\xab\xae\
-\x9c\x7f\xfd\x87\x9e\x3e\x69\x46\xf6\xac\x96\x87\x96\xe0\xf7\xde\
-\x86\xdf\x5e\x86\x8a\x7b\xfc\x74\xeb\xa7\xbe\x47\xbb\x7d\xe0\xef\
-\x9c\x5d\xcc\x22\xca\xaf\xa8\x37\x72\xf2\x85\x2c\x80\x81\xac\xb6\
-\x65\x74\x1e\x14\x3f\x38\xf0\xd4\x3d\x30\xee\xdb\xf0\x7f\xd8\x4e\
-\x48\xcb\x2d\x71\xf8\xf8\x7b\xf6\x38\xfb\x5d\x93\xe5\x15\xcf\xe4\
-\xa2\x15\xb2\x60\x53\x75\xe5\x5e\xc8\xd8\xd9\xc5\x37\xa2\x22\x4b\
-\xdd\xc8\xc5\x2a\x64\x09\x32\xf7\xb2\xd6\xcc\x16\x15\x4d\x81\xab\
-\xdf\xcf\x45\x9a\x5b\xb6\xaf\x5f\xf3\x78\xfe\xb7\x38\xd0\xc0\xce\
-\x96\xe1\xa2\xe2\x08\xe3\xa9\x4b\xb9\x38\x73\xcd\xb4\x33\xd7\x15\
-\x7b\xf3\xc7\xe2\x80\xe6\xb9\xce\x7f\xa0\xa8\x48\xa2\xf1\xd7\xd4\
-\x94\xda\x95\x8b\x32\xd7\xd0\xcb\xcc\xd0\xe8\x0f\xf1\xc7\xe2\x30\
-\x31\xd6\xe8\xa6\x59\x54\x10\x19\xfd\xbb\x22\xcd\xc3\xc2\xf5\xfe\
-\x18\xfa\x06\x7f\x2c\x16\xf4\xfc\xdf\x5a\x08\xa2\xbc\x6a\x5b\x58\
-\xd6\xef\xe0\xe2\xcb\x3d\x6b\xd6\xac\x79\x1c\x6c\xec\x77\x90\xcf\
-\x87\x8a\x45\x58\x2d\x2d\x99\x7e\x67\x61\x2d\x0c\x51\xee\xe4\x7c\
-\x92\x8b\xae\x10\x4c\x4d\x0c\xbf\x82\xae\x1b\x15\xe4\x51\xf2\x57\
-\xc9\x87\x8b\x05\x9a\xbf\x8b\x5b\x0b\x42\x94\x3f\xa9\x0b\x8b\xb6\
-\xd3\x09\xc6\x4a\xab\x66\xae\x3f\x2a\xea\x1e\x5e\x1b\xc7\x4a\xfb\
-\xa2\x86\x3f\xdc\x58\x18\xa2\x3c\x09\xad\xfc\x79\x79\x9f\xbe\x63\
-\x03\x95\xe2\xa2\x1d\x69\x50\x5f\xe0\xc3\xc5\x23\x70\xd5\xe9\xf5\
-\x05\x22\x5a\x7c\xf1\x74\x9d\x1b\x26\x5c\x75\x18\x17\x53\xe1\x80\
-\x5d\xcd\x6e\x8b\x84\xf4\x5c\xcf\x87\x8b\xc7\x96\xea\xd0\xee\xfd\
-\x36\x47\xa9\x88\xf2\xcd\xf0\x5b\xe9\x1d\xd5\xa4\x57\x7a\x43\xd1\
-\xa7\x90\xd0\xb2\xe0\xfa\xb4\x05\x9e\xfe\xf3\xfa\x22\x2f\xf0\xa2\
-\xb7\xb2\xf5\x09\x12\x2d\xbc\x22\x57\xbd\x8a\x8b\xa3\xf0\xd0\xbb\
-\x8f\xe6\xf4\xa1\x15\x39\x88\x4f\x17\x13\x24\xe2\x9b\xcd\x89\x12\
-\x2d\x9c\xa2\x3e\xda\xff\x2a\xa8\xa8\xb3\x5b\xd3\x58\xac\xa7\x70\
-\x2d\xd0\x40\x10\x5d\x2d\x5a\x3d\xd7\x94\x30\xd1\x42\x08\x5d\xab\
-\xf7\x71\x51\x14\x1e\xb4\x20\xb5\x96\x34\x1a\xfd\x63\x3e\x5d\x5c\
-\xe8\xe5\x0e\x12\x72\x34\x2a\xca\xbc\x6e\xc4\x44\xd9\x2b\x30\x8e\
-\xe6\x62\x28\x34\xb8\xd1\xee\x16\xbf\xfb\x68\x4e\x9f\xa7\xee\x27\
-\xfb\xe2\x60\xc5\x27\xde\x6e\xbf\xa2\x8f\x0e\x5c\x75\x16\x06\x59\
-\xff\x1d\x57\x1a\xa3\x7e\xdb\x9c\x70\x51\x46\x32\xfa\x78\xce\xfa\
-\x42\x13\xb9\xce\xa1\xd6\xf4\x41\x13\x66\xf8\x15\x1c\xac\x7f\xa1\
-\x29\xcc\xc6\x2c\xdb\xb3\xe6\xaa\x97\xc7\x33\x83\x4d\xe9\x88\xd0\
-\x53\xcb\xe2\x17\x43\x46\xfd\x0b\xfe\x5f\x63\x93\xef\xea\x93\x29\
-\x4c\x8b\x8c\x5a\x8b\xcc\x4b\xe4\xdb\xaf\x9f\x85\x7c\x38\x85\xb3\
-\xb8\xd0\xa0\xac\x3f\x67\x4b\x1f\x09\x03\xf5\x63\x38\x98\x30\x1f\
-\xa1\x37\xba\xf7\xf4\x4c\x4f\x35\x69\xcb\xc8\x41\x54\xe4\x39\x5f\
-\xe5\xec\x29\x34\xb8\xe9\xfd\xc2\x96\x3e\x12\xbd\x3c\xe4\x60\x42\
-\x33\xb1\xf7\x56\x4f\x1d\x87\x3b\xcc\x7a\x5b\x1f\x75\xd0\x85\x3c\
-\xf9\x0f\xce\xaa\xc2\x42\x0f\x7a\x50\xc6\x73\x2e\x81\xa6\x97\x87\
-\x1c\x54\xa0\xcd\x18\x02\x57\xbf\x1b\xad\xc4\x39\xc8\x9c\xff\x6b\
-\xce\x2c\x51\xa3\x50\x41\xbe\xcb\x59\x57\x58\xfc\xb2\x7a\xa3\x2d\
-\x6d\x8d\x2a\xe0\x02\xaa\xac\xa0\x97\x5d\x91\x51\x5f\xc0\x5d\x84\
-\x76\x10\xc9\xda\x3d\x59\x5f\x2b\xf2\xf4\x15\x9c\x8d\x85\x23\x2c\
-\xaf\x7a\xae\xef\xe9\xa5\xf4\x28\xd7\x96\xb6\x7a\xd1\x8d\x20\x74\
-\xd5\x61\x03\xb5\xe1\xc4\xf4\xd4\x82\xd8\x1b\xab\x35\x53\x44\x09\
-\x64\xf4\xcf\x39\x3b\x73\x8f\xef\x0d\xed\x87\x01\x77\x09\x37\xc2\
-\x0b\x60\xf0\x37\x5b\xd3\x93\x40\x88\x23\xa2\xae\x65\x60\x9c\x95\
-\xb4\xa7\x1a\x47\xdf\x5f\x44\xe5\xd2\xcb\xd0\x5a\xdc\x67\xcb\x00\
-\x51\x0a\x19\xe5\x72\x96\xe6\x0a\x1a\x57\xd0\xfc\x30\x54\x86\x13\
-\xa0\x1f\xa2\x22\xdf\x6b\xbd\xfe\x0c\x84\x0a\x73\x27\x2a\xcc\x25\
-\xf8\x8d\x63\x69\xbd\xd2\xba\x75\x4b\x77\xe6\xcb\x28\x26\xc8\xbc\
-\x27\xa3\xe5\xd8\x64\x4b\xac\x28\x9d\x02\x4f\x07\x9c\xad\x8b\xca\
-\xe6\xb1\x65\x4f\x23\x77\xd4\xa1\xab\x4f\x8d\x1f\xa8\x2c\xe2\xbe\
-\x63\xf8\xed\x07\x70\xe3\xb8\x1a\x95\xe6\x33\xa8\x3c\x07\x17\xce\
-\x81\x10\xbd\x48\xb4\x25\x4c\x94\x5e\x30\x86\xcd\x9c\xad\x0b\x0a\
-\x2d\xc4\x8a\xc6\x9d\x43\xf9\x85\xf0\x38\xae\x25\xb7\xfb\xa6\xa1\
-\xa2\x3c\x82\xd6\x65\x83\x6f\xf4\x69\xd1\xd8\xf0\x9b\x38\x09\xf9\
-\x05\xb5\xfa\x0a\x5b\x42\x44\xe9\xe5\x1b\xf5\x2b\xce\xd6\x05\x67\
-\xfb\xf6\xa5\x3b\xfb\x95\xd2\x6b\x22\xa3\x3f\x8a\x8a\x7a\x29\x0c\
-\xf1\x2e\xdb\x35\x2e\xa6\x60\x6b\xb7\xa2\x35\xb9\x30\x32\xea\xc3\
-\xd4\xad\x2f\xc4\x0a\x4b\x64\xe4\x4d\xb6\xc4\x88\x3a\x91\xba\x87\
-\xb3\x35\x17\x04\x66\xe4\x85\x93\xa6\xb4\x32\x76\x89\xb1\xc0\x2f\
-\x74\x61\x57\xe4\x59\x60\x02\x2d\xc5\x37\xd0\xb2\x1d\x39\x31\x56\
-\x7a\x1e\x5f\x56\xb1\x40\xc6\x5d\x69\x4b\xa0\x28\xbd\x70\x87\xfc\
-\x03\x67\x6b\x2e\xd9\xe8\x8d\x3e\x2b\xf2\xd4\x7b\x61\xb8\xa7\x43\
-\x63\x50\x66\x8f\xf1\x11\xd7\x5f\x90\xfe\xeb\xd0\x65\xff\x3c\x75\
-\xf7\xfa\xc6\xc5\x06\x12\x74\xac\x2d\xc1\xa2\xf4\x82\x81\x3c\xcc\
-\xd9\x5a\x08\xe8\x01\xcd\x14\x06\xce\xa1\x71\x4e\x62\x9f\x8d\x89\
-\xe7\xd3\xa1\x1b\x77\x3f\x79\xeb\x0a\x2a\xfa\x44\xa4\xfb\xa0\x30\
-\x5c\xfa\x44\x8e\xb6\xbf\x30\xd7\x8d\xec\x89\x56\x64\x21\x7d\x86\
-\xf7\xb5\x38\x5b\x0b\x09\x8d\x63\x30\x80\x3e\xde\x96\xae\x06\x19\
-\xe7\xa8\xa2\xed\xd0\xd2\x15\x81\x29\x7d\xd6\x9a\x11\xa2\xd4\xe2\
-\x2c\x2d\x2c\xe4\xf1\xca\x96\xae\x3a\x6d\xbd\x13\x2d\x0f\x07\x1f\
-\x0c\xa8\x79\xc4\x00\xb3\x80\x7b\xfd\xaa\x6b\xd0\xbc\xe7\xca\xb3\
-\x14\x67\x69\xa1\x99\x37\x4f\x73\xfa\x32\xb4\xe7\x90\x6b\x64\x18\
-\xdc\x84\x35\x53\xf2\x26\x0c\x2e\xd1\x07\xfe\x04\x74\x96\xf5\xfc\
-\x22\xaa\x90\xee\x02\x9a\xc0\xb8\xf4\x12\x5b\xda\x62\x19\x7d\x06\
-\x07\x1b\x3c\xe8\x0d\x6c\xa7\x4f\xb5\x68\x5b\x98\x80\x7c\x05\x7a\
-\x25\x18\xae\xde\x68\x0b\x93\x85\x70\x77\xbb\x95\xa6\x4d\x4c\xfb\
-\x27\xb4\x87\x59\x4c\xf5\x43\xf7\x83\xde\xa5\xd8\xd2\x46\xc2\xa0\
-\x3c\xf7\x3e\x4d\x7a\x4e\xe4\x39\x1f\x80\x21\x56\x6c\x19\x34\x2b\
-\x72\x02\x1a\x4f\x6e\x54\x6b\x68\x37\x0f\x7a\x22\x52\xad\xae\xdc\
-\x8b\x1e\x1f\x5a\xc3\x67\x20\x7a\x01\x46\x7e\x0c\xd1\xda\x2d\xc1\
-\xe7\x5c\xba\x6d\xeb\x87\x0a\x32\x69\x86\x5f\x6d\x4b\x1b\xa9\x56\
-\x5b\xbe\x07\x07\x13\xe2\x55\x83\x5e\xe9\xed\xa8\x2c\x25\x34\xad\
-\x43\x91\xa7\x97\x92\xf3\xce\x4d\xd5\xa3\xf7\xe2\x20\xb3\x4c\x1a\
-\xfd\x56\x54\x8e\x7b\x6c\x99\xda\xb5\xa8\x32\xba\xea\x48\xfa\x9d\
-\x30\xd4\xcf\xc0\xb1\xdc\xae\x4d\xe9\x87\x0a\x12\x3f\xcd\xb2\xba\
-\x1b\x57\x9b\x38\x88\x90\x94\x78\x17\x15\x4f\x9f\x8a\xca\xd1\x9b\
-\x15\x86\x46\x5d\xee\xdf\xa4\x9f\x43\xbf\x45\xb3\x52\x69\x60\x6e\
-\x0d\x97\xa5\xba\x98\xd9\xbc\x65\x4b\x81\x77\x1f\xac\x03\x37\x24\
-\x5b\x3e\x9f\xc7\xa7\x85\x24\x6c\x59\x3f\xb4\x8b\xdf\xab\x37\xf1\
-\x75\xad\x06\x11\x4f\xc8\xab\xe8\xf3\xad\x61\x33\x97\x3a\xd7\x7e\
-\xbc\xbd\xf8\x72\x0b\x0f\xd2\x72\x72\x73\xda\x42\x57\x3b\x7c\x5a\
-\x68\x47\xec\x5c\xc5\xed\x89\xcf\xf6\x6d\x91\xa7\xce\xf2\xfd\x63\
-\x9e\xce\x3f\x15\x83\xe3\xa7\x36\x85\xeb\x8d\x8c\xae\x4d\x18\xe7\
-\x44\xeb\xb9\x36\xa2\xe9\x16\x7c\xb9\x85\x67\xa2\xac\x0e\x69\x4e\
-\x5f\x91\x3c\x63\x2d\x3a\xb8\xcb\x0e\x37\x67\x60\xb7\xa2\xbd\xbb\
-\x6c\xfb\x2e\xe1\xb7\x46\x6c\xe1\x7b\xa1\xc0\x53\xab\x22\xa3\xbe\
-\x68\x3b\xd7\x4e\x18\xab\xe5\x7a\x2e\x56\x1a\x68\x2c\x85\x34\x6d\
-\xdd\x91\x3e\x75\x37\x9f\x12\x92\x80\x3b\xed\x8f\x76\x64\x5e\x97\
-\x32\xce\xcf\x03\x77\xe4\x40\x8e\xba\x81\xa0\xec\xbc\x0b\x61\xea\
-\x0a\xaa\x87\x32\xfa\x21\x8c\x73\x76\xf3\x8d\xf3\x2d\xeb\xf9\xb6\
-\xca\xd7\x6c\xde\x6e\x41\x37\xd7\xad\x4b\xdf\x65\x7c\x58\x48\x02\
-\x4d\x54\xab\xcb\xbc\xf4\xa2\x97\x7d\xe4\xa0\xc5\xe8\x03\x38\xca\
-\x16\x02\x6f\xf8\xed\xf4\x7e\xc5\xfa\xfd\xde\xe8\x5c\xfa\x5d\x7a\
-\x30\x60\x39\x97\x40\xea\xf6\xf8\xc2\xfb\x04\x94\xcd\x19\x33\x69\
-\x43\xcb\x7a\x1c\x1f\x16\x92\x00\x63\x58\xd6\x68\x1c\xc9\x84\x81\
-\xb7\x8f\xbf\x9f\xb4\x3d\x2a\xae\x67\xc2\x75\x0e\x5d\xe0\xca\xb1\
-\x9d\x16\x1c\xd1\x6f\xa3\x82\x78\xb6\xf3\xed\x84\x31\xc8\x96\xf8\
-\xe2\xfb\x04\x94\xd5\xe1\xb3\x69\x73\x87\x5f\xc7\x87\x85\x24\xd0\
-\x53\xa5\xa4\x83\x74\xb4\x14\x11\xfe\x9e\x3a\xe9\xaa\x97\xf3\xd7\
-\xe7\x25\x34\xa5\xa3\x60\x6c\x0b\xba\xe5\x10\x7e\x6f\x8c\x7f\x9e\
-\xe6\x22\xfd\xce\x16\xa6\xad\x8c\xaa\x71\x14\x7d\x01\x3d\x5e\x9f\
-\x4e\x97\x7e\x88\xde\x8d\xf0\x61\x21\x29\x34\xef\x28\x32\xfa\xd3\
-\x30\xa8\x59\x57\x5d\x9c\xa1\xf7\xc2\x58\xae\x46\x5f\xfe\xe3\xb4\
-\xbd\x0c\x07\x4f\x44\xe0\x39\x1f\xeb\xd9\x3b\x95\x79\x14\x98\xd2\
-\x4a\xfa\xfd\xea\xfa\xa1\xdd\x6d\xe7\x93\x08\xd7\xfd\x8b\x38\x11\
-\x7d\x04\x7a\x0a\x9b\x90\xae\x6b\xf9\xa3\xd0\x29\x9b\xc7\x56\x3f\
-\xad\x7a\xd3\xd0\x3e\xcd\x8f\x67\x93\x42\x33\x8a\x51\xd1\xce\xb3\
-\x19\x5e\xcf\x85\x0a\x4d\xef\x74\xe8\x3a\x68\xe3\x3c\x6b\x98\x04\
-\xc2\xf5\xff\x20\x4e\x4c\x1f\x81\x34\x9d\x8f\x4a\xb2\x86\x3f\x0a\
-\x8b\xc1\x54\xf5\xe8\x7d\x70\x97\x5a\xb4\xb5\xf1\x18\xeb\x7c\x89\
-\x2f\x65\xa7\xa8\xa2\x3f\x68\x0b\x93\x50\xf1\x20\xbf\x9f\x08\xca\
-\xba\xe4\xbb\xce\x5b\xf8\xa3\xb0\xd0\x04\x30\xc8\xc0\x53\xbf\xb7\
-\x18\xdb\x42\x69\x5b\x54\x51\x2f\xe0\xcb\xd9\x09\xdd\xc2\xaf\x58\
-\xc2\x24\x52\x64\xd4\xe9\x1c\x4d\xdf\x10\x6e\xd0\x2f\x1a\xb8\x05\
-\x52\x79\x60\x7a\xc6\x68\x0e\xb6\x3a\x35\xfa\x62\xbe\xa4\x98\x6e\
-\xae\x29\x30\xce\xa7\x39\x1a\x41\xe8\x8c\xc8\x38\xaf\x0f\x8d\x43\
-\x1b\x04\x58\x8d\x6c\xa1\x35\x81\x8a\xca\x97\x36\xfd\x64\xce\x53\
-\xf7\xdb\xc2\x25\x11\xfa\xeb\xe2\x5c\x46\xe8\x8c\xe9\x2d\x4e\xf5\
-\xb9\x8b\xf1\x84\x6a\x4e\x19\xfd\x3f\x7c\x79\x31\x09\xd6\x63\xcf\
-\x2b\x72\x15\xc1\x51\x09\x42\x72\xe2\x89\x8d\x46\x5d\x6b\x33\xaa\
-\x45\x55\x45\xbf\x83\x2f\x31\x06\x15\x66\xc8\x1a\x2e\xa1\x06\xc2\
-\x7f\x9f\xd0\x1b\x68\x99\x2c\x0c\x90\xde\xa2\x5b\x8d\x6b\xa1\x85\
-\xee\xd0\x78\xf3\xd6\x35\xa8\xc4\x17\xda\xc2\x26\xd5\xd4\x0d\x6a\
-\x57\x8e\x4a\x10\xd2\x43\xef\x3a\x22\xda\x62\xa8\xfb\xb7\xe4\x5d\
-\x4f\x5e\xc4\x75\xbc\x87\x2f\x2b\x86\x2a\x0b\x2a\xf0\x1d\xb6\xb0\
-\x49\x84\xb1\xcb\x6f\x38\x2a\x41\xe8\x8e\x49\x33\xf2\xea\xd0\x94\
-\x3a\xda\x41\x85\x56\xba\x41\x9f\xb0\x9d\x4b\x2a\xb4\x1e\x1b\x9a\
-\x5b\x8f\x70\xdc\x79\xa9\x2d\x6c\x62\x19\xe5\x71\x54\x82\xd0\x3d\
-\x34\x4d\x05\x5d\x9a\xcf\x40\x0f\x5b\x0d\xce\x26\xa3\x2f\xdb\xbc\
-\x79\xf5\x93\x68\x6d\xbc\xf5\x7c\x42\xd9\x5e\x7c\x75\x5b\xe9\x20\
-\x99\x0e\x2e\x64\x0f\x0d\x6c\x43\x4f\xdd\x68\x31\xb8\x06\xa1\x0b\
-\x73\xc1\xcc\x84\xb9\x6e\x06\xd3\xd4\x02\xc5\x3f\xdc\x04\x5a\x80\
-\xfa\xb5\x0f\xa9\xe5\x1b\xe7\x34\x8e\x4a\x10\xb2\x27\xa8\xea\x83\
-\x03\xe3\x5c\x04\x63\x6b\xdd\x4d\xa3\xa2\x4f\xab\xef\x12\x75\xba\
-\x55\x2a\xba\x56\x8f\xa1\x72\xb5\xac\x3f\xa9\x8d\x2d\xdf\x37\x3e\
-\x67\xf9\x4e\x52\x91\x8f\x3e\x8e\x4e\x10\x7a\x07\xb9\x9e\x46\x85\
-\x38\x1a\x5d\xaf\xdb\xc8\x68\x61\x78\x27\xf2\xa9\x59\xd0\xe2\x74\
-\xb4\xa0\x09\x5d\xb3\x75\x1c\x45\x03\x19\x74\xaf\xb6\xd3\xcc\x00\
-\x8e\x4e\x10\x7a\x0f\x2d\x7d\x25\x5f\x16\xfc\xb1\x01\x54\x9e\x5f\
-\xda\x8c\xb4\x8d\xb6\x4d\xb9\xea\x25\x1c\x45\x03\xc1\xb4\xdb\x32\
-\xdb\x77\x12\x09\xd7\xf3\xc8\x7a\x9e\x0d\x2c\x08\x8b\x0a\x39\x81\
-\xec\xa4\x3b\x04\x23\x5e\xcb\x51\x34\x40\x2b\xe5\x6c\xe1\xd3\x08\
-\x2d\x90\x3c\xc1\x12\xf2\x41\xad\xbc\xe2\xc5\x36\x23\x6d\xa3\x3f\
-\xd5\xcf\xd8\xad\xa7\xf3\x0d\x1a\x76\x08\x5d\xb7\x33\x39\x3a\x41\
-\x58\x5c\x82\x8a\xde\xdf\x66\xa4\xf3\x09\xad\xc7\x29\xfc\xf5\x06\
-\xc2\x70\xd5\x53\xd1\xbd\xb2\x6c\xb1\x99\x52\xc6\x39\x8a\xa3\x14\
-\x84\xc5\x85\x96\xc4\xa6\xea\x62\x19\xbd\x79\x2e\xdf\xdc\xb4\x53\
-\x87\xf5\x3b\x29\x44\xd7\x22\x1b\x3a\x0b\xb9\x02\xdd\xa5\x37\xc3\
-\x30\x7f\x90\x60\xca\xca\xd6\x89\xb1\x92\xd5\x17\xf7\xf4\x3e\xbf\
-\xfa\x57\x4d\xe1\xd3\x6b\x50\x1d\xca\x08\xf9\x87\x76\xdd\xf0\x8d\
-\x5a\x8d\xca\xb2\x01\xdd\xa8\x96\x69\xf4\xe4\xe7\x82\x83\xb6\x10\
-\x18\x47\x37\x87\xef\x44\x68\x85\x3e\xc5\x51\x0a\x42\x7e\x99\x34\
-\x23\x7b\xfa\xae\x52\x30\xda\x8b\x51\x59\xaa\x61\x79\x78\x88\x4f\
-\xb5\xb0\x6e\xdd\xd2\x9d\x11\x66\xaa\xd9\xd8\xd3\x8a\xba\x57\x1b\
-\x6b\xa5\x7d\x39\x5a\x41\xe8\x0f\x7c\xd7\x19\xb5\x19\x7c\x5a\xa1\
-\x82\x34\x2c\xb8\x12\x84\xc2\x53\xfb\xe9\xf2\xa7\xa0\xf5\xb8\xcb\
-\x66\xf0\x69\x25\x2b\x08\x85\xbe\x03\x95\xe3\x33\x36\x63\x4f\x2b\
-\xc4\x73\x7d\xf3\x94\x79\x41\x28\x3c\x34\x5d\x7e\xa3\x37\xba\x5f\
-\xe0\xaa\xc3\x03\xcf\x39\x13\xc6\x1e\x34\x1b\x7f\x3b\xa1\x72\xfc\
-\x25\x2a\x97\x5e\xc6\x51\x0a\x42\x7f\x53\xa9\xa8\x17\x60\x3c\x71\
-\x4c\x68\xf4\x8f\x51\x01\xe6\x75\x0e\x8a\xca\xf1\xc8\x84\x19\x6e\
-\x58\x8d\x28\x08\x03\x43\xbc\x20\xab\xac\x0e\x41\x85\xf9\xd7\xc0\
-\xd3\xeb\x50\x21\xaa\x81\xa7\x42\x7c\xbe\x2e\xf2\xf4\x57\xe9\x4d\
-\x3e\x07\x15\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\
-\x41\x10\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x21\x6f\xec\xb4\
-\xd3\xff\x03\x4a\x22\xb7\x35\x26\x48\x23\x0f\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0a\x9a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\xc8\x00\x00\x00\xc8\x08\x06\x00\x00\x00\xad\x58\xae\x9e\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x0a\x2f\x49\x44\x41\x54\x78\x5e\xed\x9d\x7b\x8c\
-\x5c\x55\x1d\xc7\x17\x15\x9f\x48\x6d\xbb\xf7\xde\xe9\x52\xaa\x46\
-\xc5\xd0\x98\x86\xf8\x40\x02\x18\xa2\xa2\x26\x40\x48\x1a\x5b\xa3\
-\xb4\xbb\xf7\xdc\xd9\xd2\xd8\x1a\xb4\x18\x09\x20\x86\x62\x50\x63\
-\x7c\xa0\x8d\x52\xbb\xdd\xdd\x39\x67\xb6\x16\xe2\x46\x7c\x24\x8d\
-\xc1\xa0\xe9\x1f\x2a\x89\x0f\x14\x51\x63\x11\x4d\x10\x35\x88\xa0\
-\x34\x3e\x79\x55\x3d\xe7\xee\x2c\xb9\xdc\xfe\xf6\xd1\x64\xef\xf9\
-\xcd\x26\x9f\x4f\xf2\x49\x67\xe6\xf7\xc7\xf9\x4d\xf2\xfb\xee\x3d\
-\x77\x3b\x3b\x67\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xfa\x96\x53\x37\x8d\xaf\x4a\x72\
-\x7b\xde\x60\xd1\xbd\xa0\xef\x35\x9d\xd7\xae\xdf\x3c\xfd\xdc\x5e\
-\xeb\x00\xcd\x92\x15\xae\x48\x0b\xf7\x1f\xff\xef\xff\x96\x8d\xc6\
-\xde\xd7\x2a\x26\xd7\xf7\xde\x02\x40\x33\x9c\xde\x9e\x18\x4a\x8d\
-\x7d\x4c\x1c\xc2\x3e\xd7\xf7\xfd\xbd\xde\xdb\x00\x68\x06\xbf\xad\
-\x7a\xa7\x34\x7c\xcb\xc4\x27\x07\xb6\x8f\x9d\xdc\x7b\x2b\x00\x4b\
-\x4f\xcb\x74\x73\x61\xf0\x96\x8d\x6b\xb6\x8f\xbd\xb0\xf7\x56\xfa\
-\x9f\x15\x97\xed\x5d\xe9\xf7\xb2\x1b\x13\xd3\xd9\x89\xcb\xc3\xcc\
-\x74\xa6\xa4\xc1\x5b\x2e\xa6\xb9\xdd\x75\xdc\x7b\x6a\x5b\xe3\xff\
-\x3d\xb7\x37\x96\xfd\x41\x96\xdb\x8b\x53\xe3\x1e\x96\xde\x04\xa2\
-\x86\x7e\x1e\x0f\xad\x6e\x4f\xbc\xb8\x37\xa2\x7a\xac\x6e\xdf\x12\
-\x6e\xf4\x8e\x4a\x4d\x22\x6a\xea\xaf\x30\x37\xf7\xc6\x54\x8f\x2c\
-\x9f\x7c\xbf\xd4\x1c\xa2\xb6\x69\x61\xff\x3d\xb0\x7b\xf7\xb3\x7a\
-\xa3\xaa\x83\xbf\x94\xed\x96\x9a\x43\xec\x07\xd5\x6f\xe4\x5b\xc5\
-\x81\xf5\x2d\x63\x37\x23\x2e\xa5\xfe\xbe\xf6\x2a\xff\xc3\xf7\x88\
-\x34\xf4\x27\xe2\xb2\xfa\x4d\x17\xc0\x89\x10\x3e\x52\xe2\xef\x6f\
-\x3b\xd2\xe0\x2f\xd6\x25\x0f\x48\x56\xd8\x6b\x7c\x72\x0f\x23\x6a\
-\x9a\x19\xf7\xb9\xa1\xe1\xee\xea\x81\xdd\x87\x9f\xe3\x9f\xff\x4c\
-\x1a\xfe\xc5\xb8\xe4\x01\x49\x0b\xf7\xa8\xb4\x10\x62\x6c\xfd\x4d\
-\xf6\xed\x61\x26\x33\xd3\xb9\x5a\xaa\x2f\xc6\x06\x02\x62\xef\x92\
-\x16\x42\x8c\xaf\x7d\x6a\xc0\x6f\xb3\xc2\xff\xb3\xc9\xf5\x85\x6d\
-\xe2\x0a\x72\xab\xb4\x10\xa2\x86\x43\xed\x89\x57\x0f\x0e\xef\x3f\
-\x43\xaa\x2d\xc6\xa5\xbf\x07\xc9\xed\x8d\xd2\x42\x88\x1a\xa6\x23\
-\x13\x97\xf6\xee\x43\x9e\x90\xea\x0b\xd9\xc4\x15\x64\xab\xb4\x10\
-\xa2\x86\x7e\x1e\xaf\x0c\x73\xe9\x1f\xff\xa6\x5e\x5b\x8c\x4b\x1f\
-\x90\xdc\x9e\x23\x2d\x84\xa8\xa3\xdd\x57\xce\x65\xe1\x0e\xc9\xf5\
-\xf9\x5d\xf2\x80\xac\xdb\x71\x70\xa5\xb4\x10\xa2\x8a\xc6\xdd\x11\
-\xe6\xd2\x07\xe5\xf3\x62\x7d\x01\x97\x3c\x20\x81\xb4\xb0\x8f\x48\
-\x8b\x21\xc6\xd6\x5f\x39\x1e\x08\x33\x59\x7e\x94\x5d\xa8\x2f\x64\
-\x23\x01\xc9\x8c\xbd\x53\x5a\x0c\x31\xba\xc6\x1d\x0b\x43\x9e\x9a\
-\xce\xdb\xc4\xfa\x02\x36\x15\x90\xae\xb4\x18\xa2\x86\xe9\xc8\xf8\
-\x86\x2c\xb7\x2f\x93\x6a\x0b\xd9\xcc\x16\x2b\xb7\xd7\x49\x8b\x21\
-\x6a\x18\xfe\x76\x3e\x7c\x6c\xdd\x6f\xb7\x4e\xf8\xdb\x57\x1a\x09\
-\x48\xcb\x4c\x6d\x96\x16\x43\x54\xd1\xb8\x6b\xc3\x5c\xa6\xc6\xfe\
-\x42\xac\xcf\x63\x23\x01\xf1\x89\x3d\x4b\x5a\x0c\x51\xc3\xf0\x89\
-\xde\x30\x97\x7e\xeb\xff\x35\xa9\x3e\x9f\xcd\x04\x64\xe7\xf4\x29\
-\x59\x61\xff\x2b\x2d\x88\x18\x5d\xe3\xca\xef\xc0\xf2\x5b\xff\x4f\
-\x8a\xf5\x79\x6c\x24\x20\x01\x9f\xd6\x3f\x49\x0b\x22\xc6\x36\x2d\
-\xec\x43\xe5\x4c\xe6\x76\x54\xaa\xcf\x67\x63\x01\x29\x3f\x93\x2f\
-\x2c\x88\xa8\xe1\x8a\xdc\xbe\x64\xd0\x74\xde\x24\xd5\xe6\xb3\xc1\
-\x2b\x48\x67\xbf\xb4\x20\xa2\x86\x2d\xd3\x79\xc3\xe0\x96\x7d\x6b\
-\xa4\xda\x7c\x36\x17\x90\xdc\x5e\x25\x2d\x88\xa8\xa1\xbf\xff\xd8\
-\x12\xe6\x32\x2d\xdc\x09\x7d\xc5\x54\x73\x5b\xac\xb6\xbb\x54\x5a\
-\x10\x51\xc3\x24\xb7\x37\x94\x73\x69\xdc\x4f\xa4\xfa\x5c\x36\x16\
-\x90\xd6\x68\xf7\x4c\x69\x41\x44\x1d\xed\xc1\x30\x97\x99\xb1\xb7\
-\xc8\x75\xd9\xc6\x02\x32\x70\xc5\x9e\xe7\x85\x3f\x79\x94\x16\x45\
-\x8c\xad\xdf\x5a\xfd\x28\x8c\x65\x66\xdc\x47\xa5\xfa\x5c\x36\x17\
-\x10\x8f\x4f\xeb\xef\xa4\x45\x11\xa3\x6b\xec\xd1\x30\x93\xe1\x5e\
-\x44\xac\xcf\x61\xd3\x01\xf9\xb6\xb4\x28\xa2\x86\xe9\xe8\x78\x96\
-\x8d\xba\xb3\xa5\xda\x5c\x36\x1a\x10\x9f\xd6\x2f\x48\x8b\x22\x6a\
-\x98\x14\xdd\xf3\xc3\x31\x1b\x52\x6d\x2e\x9b\xbd\x82\xf0\xc5\xd4\
-\xd8\x4f\x9a\x4e\x3b\xcc\x65\x6a\xdc\x5f\xc4\xba\x60\xa3\x01\x49\
-\x4c\xf7\x1d\xd2\xa2\x88\x1a\xa6\x85\xfd\x44\x98\xcb\xac\xb0\x3f\
-\x90\xea\x92\xcd\x06\x64\xc4\xbd\x42\x5a\x14\x51\x47\x7b\x5b\x98\
-\x4b\x7f\x05\xb1\x72\xfd\x78\x1b\x0d\xc8\xc0\xe6\xe9\x67\xfb\xd4\
-\x3e\x2e\x2d\x8c\x18\xdd\xdc\xde\x13\xc6\x32\x35\x9d\x0f\x8b\x75\
-\xc1\x66\x03\xe2\x49\x0b\xf7\x6b\x69\x61\xc4\xd8\xfa\x1f\xd6\xe5\
-\x81\x38\xe5\xf1\x08\x42\x5d\xb2\xf1\x80\x64\xc6\x7e\x53\x5a\x18\
-\x51\xc3\x35\xc3\x63\xeb\xd2\x51\xb7\x41\xaa\x49\x36\x1e\x90\xc4\
-\xb8\xcf\x48\x0b\x23\x6a\x98\x16\xdd\x0b\xb3\xad\x53\x2f\x5a\xec\
-\x1f\xf4\xc5\xd8\x62\x6d\x97\x16\x46\xd4\x30\x29\xdc\x8e\x30\x97\
-\xfe\xf1\x1f\xea\x35\xc9\xe6\xb7\x58\x6d\xf7\x66\x69\x61\x44\x15\
-\x8d\xbd\x29\xcc\xa5\xbf\x1f\xf9\xae\x58\xaf\xd9\x78\x40\x56\x8d\
-\xb8\xd3\xa4\x85\x11\x35\xf4\x3b\x9a\x43\x61\x2e\xfd\x16\x6b\x9f\
-\x54\xaf\xdb\x78\x40\x3c\x27\xf9\xb4\xfe\x53\x5a\x1c\x31\xbe\xf6\
-\xde\x30\x94\xa9\xe9\x7c\x50\xae\x3f\xd3\x18\x01\x09\xbf\xc9\xba\
-\x5b\x5a\x1c\x31\xb6\xe1\x9c\x90\xf2\xbc\x90\x91\x89\x45\xfd\x41\
-\x5f\x94\x80\xf8\xcb\xda\xb4\xb4\x38\xa2\x86\xe1\xc4\xa9\x70\xf2\
-\x94\x54\xab\x1b\xe9\x0a\xe2\x3e\x26\x2d\x8e\xa8\x62\x6e\x2f\x2e\
-\xcf\x2e\x2c\xdc\x93\xc7\xd5\x6a\x46\x09\x48\xcb\x74\x73\x69\x71\
-\x44\x0d\xd3\xdc\xee\x0a\x73\xe9\x7f\x70\xdf\x27\xd5\xab\x46\x09\
-\x48\x62\x3a\xe7\x4a\x8b\x23\xaa\x68\xec\xde\x30\x97\xa9\xb1\xdf\
-\x12\xeb\x15\xe3\x5c\x41\x8a\xc9\x44\x5a\x1c\x51\xc5\x13\x38\x75\
-\x2a\x4a\x40\x02\x69\x61\xff\x26\x35\x80\x18\x5b\x3f\x8b\xbf\x0f\
-\x33\x99\xe4\xf6\x7d\x52\xbd\x6a\xbc\x80\x18\xfb\x43\xa9\x01\xc4\
-\xe8\x1a\x77\x6c\xed\xa6\xcf\xbe\x20\x19\x99\x78\xbb\x58\xaf\x18\
-\x2d\x20\x99\xe9\x1e\x90\x1a\x40\xd4\x70\xb1\xa7\x4e\xc5\xbb\x82\
-\xe4\x93\xd7\x4b\x0d\x20\x6a\x98\x16\x6e\x63\xf9\x07\x7d\xc6\x3e\
-\x26\xd5\x67\x8d\x77\x05\xc9\xed\xbb\xa5\x06\x10\x75\xb4\xd7\x84\
-\xb9\xf4\xf7\x23\xbf\x94\xeb\x33\x46\x0b\xc8\x9a\xdc\xbd\x4e\x6a\
-\x00\x51\xc3\xd4\xb8\x89\x30\x97\xfe\x7e\xe4\xeb\x52\x7d\xd6\x68\
-\x01\x59\xb5\x65\xcf\xa9\x52\x03\x88\x1a\xfa\xad\xd5\xcc\xa9\x53\
-\xa6\xf3\x29\xa9\x3e\x6b\xb4\x80\x04\xfc\x82\x0f\xd6\x1b\x40\x54\
-\xd1\xd8\x3f\x87\x99\xf4\x57\x92\x6d\x62\xbd\x67\xd4\x80\x84\xd4\
-\x4a\x4d\x20\x6a\xb8\x72\xfb\xd8\x8a\x56\x31\x79\x81\x54\x9b\x35\
-\xf2\x15\xa4\x3b\x2e\x35\x81\xa8\x61\xab\x3d\xf1\xfa\xc1\xcb\x0f\
-\xcc\x7b\xea\x54\xd4\x80\x24\xc6\x5d\x2d\x35\x81\xa8\x61\x5a\xb8\
-\xf7\x84\xb9\xf4\x37\xea\x7f\x97\xea\xc1\xb8\x5b\xac\xc2\x6d\x94\
-\x9a\x40\xd4\xd0\xdf\x7f\xec\x9e\x99\x4b\x7b\x97\x54\x0f\xc6\xdd\
-\x62\xb5\xa7\x5e\x23\x35\x81\xa8\xe4\x97\xc3\x5c\xfa\x1f\xdc\xb7\
-\x0a\xb5\xd2\xa8\x01\x79\x69\x6e\x9f\x1f\x3e\x07\x23\x35\x82\x18\
-\xdb\x34\xb7\x33\xa7\x4e\xe5\xf6\x46\xa9\x1e\x8c\x1a\x90\x80\x4f\
-\xeb\xfd\x52\x23\x88\xd1\x9d\x3d\x75\xaa\x70\x5b\xc5\xba\x37\x7a\
-\x40\x7c\x53\x77\x48\x8d\x20\xaa\xb8\x75\x2a\xcd\x8a\xa9\x37\x8a\
-\x35\x6f\xfc\x80\xe4\xee\x66\xa9\x11\x44\x0d\x93\xdc\x9e\xb7\x6e\
-\xc7\xc1\x39\x4f\x9d\x8a\xbf\xc5\xca\xed\x2e\xa9\x11\x44\x25\x8b\
-\x72\x2e\x0b\xf7\xb0\x50\x8b\x1f\x90\x41\xd3\xb9\x48\x6a\x04\x51\
-\xc3\x74\x81\x53\xa7\x34\x02\xf2\x2a\xa9\x11\x44\x25\xbf\x1a\xe6\
-\xd2\x07\xc4\x09\xb5\xf8\x01\x29\xbf\xd5\xce\xb8\x27\xa4\x66\x10\
-\xa3\x6b\xec\xcf\xc3\x58\xfa\xad\xff\x75\x52\x3d\x7e\x40\x3c\x99\
-\x71\x47\xa4\x66\x10\x63\xeb\xb7\x58\xf3\x9e\x3a\xa5\x12\x10\x7f\
-\x43\x74\x48\x6a\x06\x51\xc3\x21\xd3\x39\x3d\xc9\xed\x59\x52\x4d\
-\xe9\x0a\x62\x6f\x92\x9a\x41\xd4\xd0\x6f\xaf\xde\x3a\xd7\xa9\x53\
-\x2a\x01\x09\xa7\xfc\xd4\x1b\x41\xd4\xd2\x07\xe4\xbd\x61\x2e\xfd\
-\x76\xeb\x8f\xf5\x9a\xd2\x16\xab\x7b\x61\xbd\x11\x44\x35\x67\x4f\
-\x9d\x32\xee\x70\xbd\xa6\x12\x90\x70\xd2\x68\xbd\x11\x44\x2d\x53\
-\xd3\x99\x39\x75\xca\xd8\xb1\x7a\x4d\x25\x20\xe1\xb7\x06\xe1\xb7\
-\x07\xf5\x66\x10\x55\x34\xee\x48\x18\xcb\xc4\x74\x3e\x54\xaf\xe9\
-\x04\xc4\x93\xe5\xf6\x9e\x7a\x33\x88\x1a\xfa\x1f\xd6\x8f\x97\xff\
-\x3f\xd7\x76\xc7\x9d\x3a\xa5\x17\x90\xc2\xde\x56\x6f\x06\x51\xcb\
-\x64\x74\xea\x95\xad\xe1\xf1\x33\xeb\xaf\xab\x05\x24\x7c\x06\xa6\
-\xde\x0c\xa2\x96\xe1\x33\x82\x33\xa7\x4e\xd9\xa7\xaa\xaf\x6b\x6e\
-\xb1\x46\xab\x8d\x20\x6a\x9a\x1a\xf7\x81\x72\x2e\x0b\xfb\xdb\xea\
-\xeb\x6a\x01\x49\x8a\xee\xf9\xd5\x46\x10\x35\xf5\x01\xf9\x62\x98\
-\x4b\x1f\x90\xdb\xab\xaf\xeb\x05\x24\xb7\xad\x6a\x23\x88\xaa\x1a\
-\x5b\x9e\x3a\xe5\x83\xb2\xa7\xfa\xba\x5a\x40\x02\x69\xe1\x8e\x56\
-\x9b\x41\xd4\x32\x35\xf6\xfe\x30\x93\x7e\xeb\x7f\x45\xf5\x75\xdd\
-\x80\x18\xf7\xe3\x6a\x33\x88\x6a\x1a\x77\x2c\x7c\xeb\x4e\xd2\x76\
-\xcf\x38\x75\x4a\x35\x20\x7e\xbf\x77\xb0\xda\x0c\xa2\xaa\xe1\x7b\
-\xdb\xb6\x4d\xbd\xbc\xfa\x9a\x6a\x40\xfc\x7d\xc8\x0d\xd5\x66\x10\
-\x35\xf5\x5b\xfe\xe3\x4e\x9d\xd2\xdd\x62\xe5\x76\x4b\xb5\x41\x44\
-\x4d\xc3\x77\x47\x97\x73\x69\xdc\xaf\x66\x5f\xd3\xdd\x62\x8d\xb8\
-\xb3\xab\x0d\x22\xea\xda\x1d\x2f\xe7\xb2\xb0\xdf\x98\x7d\x4d\x35\
-\x20\x2b\x2e\xdb\x3b\xe7\xf7\x11\x21\xc6\x56\x3a\x75\x4a\x35\x20\
-\x81\xb4\xb0\x0f\x55\x9b\x44\x54\xf4\xc1\x72\x26\x73\x7b\xf9\xec\
-\x6b\xea\x01\xc9\x8c\xfb\x7e\xa5\x41\x44\x55\xc3\x59\x9a\xad\xa2\
-\xfb\xf4\xa9\x53\xfa\x57\x10\xe3\x6c\xb5\x41\x44\x4d\xc3\x69\xcc\
-\xab\xdb\x13\x43\x4f\x3f\xef\x83\x2b\xc8\xb5\xd5\x06\x11\x35\x4d\
-\x67\x4e\x9d\x3a\xc9\x3f\xfe\x47\x78\xae\x1e\x90\xa4\x98\xdc\x54\
-\x6d\x10\x51\x53\x7f\x4f\x7c\x7d\x98\x4b\x7f\xc3\xfe\xd3\xf0\x5c\
-\x7f\x8b\x35\xea\x36\xd4\x9b\x44\x54\xd3\x74\x0f\x94\x73\x69\xec\
-\x57\xc2\x73\xf5\x80\x84\x06\x32\xe1\xfb\x88\x10\x35\x4c\x67\x4f\
-\x9d\x2a\xba\xe5\xa9\x53\xea\x01\x09\xf8\x7d\xdf\x03\xf5\x46\x11\
-\x35\xf4\xb3\xf8\x68\x98\xc9\x64\x64\x72\x24\x3c\xef\x8b\x80\xf8\
-\x1b\xf5\xef\xd4\x1b\x45\xd4\xb2\x55\x4c\x26\xfe\x4a\x72\x4e\x78\
-\xdc\x2f\x01\xf9\x52\xbd\x49\x44\x2d\xc3\xa9\x53\x6b\x47\xc7\x57\
-\x85\xc7\xfd\xb2\xc5\xba\xb2\xde\x24\xa2\x9a\xb9\x35\xe5\x5c\x1a\
-\xfb\xd7\xfe\xb8\x82\x14\xdd\x4b\xc4\x46\x11\x55\xb4\x1f\x2f\xe7\
-\xd2\xd8\x3b\xfb\x22\x20\x83\xc3\xfb\xcf\x90\x1b\x45\x8c\x6f\xab\
-\x70\xd3\x61\x2e\x33\xd3\x99\xea\x8b\x80\x0c\x6c\x1f\x3b\x39\xe5\
-\xd4\x29\xec\x17\x8d\xbd\x3b\x8c\xa5\x9f\xc9\x8f\xf4\x47\x40\x3c\
-\xfe\xb2\x76\xaf\xd8\x2c\x62\x64\x7d\x30\xfe\xe5\x47\x32\x7c\xdc\
-\xe4\x5d\x7d\x13\x10\x7f\xa3\xce\xa9\x53\xd8\x37\x9e\xb6\xed\xc0\
-\xda\x70\xea\x54\xff\x04\x24\xb7\x9f\x96\x1a\x45\x54\xd1\x74\xde\
-\x92\xec\x9c\x3e\xa5\x6f\x02\x12\x6e\xd4\xd3\xc2\x3e\x22\x36\x8b\
-\x18\xdd\xc9\x4b\x7a\xa3\xd9\x3f\x0c\x0d\x77\x57\xfb\xad\xd6\xc6\
-\x70\xe2\x28\xa2\x9e\xdd\x8b\xc2\x19\x36\xbd\xb1\x04\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xe5\
-\xc0\xc0\xc0\xff\x01\xab\xda\x5e\x46\xeb\x39\xd2\x5c\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x07\
-\x07\x3b\xe0\xb3\
-\x00\x70\
-\x00\x6c\x00\x75\x00\x67\x00\x69\x00\x6e\x00\x73\
-\x00\x15\
-\x0c\x11\x69\xa2\
-\x00\x76\
-\x00\x65\x00\x72\x00\x74\x00\x69\x00\x63\x00\x61\x00\x6c\x00\x5f\x00\x70\x00\x68\x00\x6f\x00\x74\x00\x6f\x00\x5f\x00\x70\x00\x6c\
-\x00\x61\x00\x63\x00\x65\x00\x72\
-\x00\x03\
-\x00\x00\x68\x70\
-\x00\x61\
-\x00\x70\x00\x70\
-\x00\x08\
-\x0a\x61\x5a\xa7\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x05\
-\x00\x6a\x2b\x7e\
-\x00\x63\
-\x00\x6c\x00\x65\x00\x61\x00\x6e\
-\x00\x09\
-\x08\x06\x5e\x65\
-\x00\x63\
-\x00\x6f\x00\x70\x00\x79\x00\x70\x00\x61\x00\x73\x00\x74\x00\x65\
-\x00\x0a\
-\x08\x83\xf3\x02\
-\x00\x73\
-\x00\x61\x00\x76\x00\x65\x00\x32\x00\x66\x00\x69\x00\x6c\x00\x65\x00\x32\
-\x00\x05\
-\x00\x6c\x88\x95\
-\x00\x65\
-\x00\x72\x00\x61\x00\x73\x00\x65\
-\x00\x09\
-\x0c\x88\x3f\x25\
-\x00\x73\
-\x00\x61\x00\x76\x00\x65\x00\x32\x00\x66\x00\x69\x00\x6c\x00\x65\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x07\x00\x00\x00\x03\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x3a\x8a\
-\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x5e\xeb\
-\x00\x00\x00\x76\x00\x00\x00\x00\x00\x01\x00\x00\x44\x0b\
-\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x4d\xe5\
-\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x1d\x45\
-\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x78\xa7\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x14\x00\x02\x00\x00\x00\x07\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x74\x4c\x90\x5c\x97\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\x3a\x8a\
-\x00\x00\x01\x4c\x14\xed\x7a\x90\
-\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x5e\xeb\
-\x00\x00\x01\x74\x4c\x8b\xb9\x09\
-\x00\x00\x00\x76\x00\x00\x00\x00\x00\x01\x00\x00\x44\x0b\
-\x00\x00\x01\x74\x4c\x89\xed\x39\
-\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x4d\xe5\
-\x00\x00\x01\x74\x5d\x00\x5d\x86\
-\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x1d\x45\
-\x00\x00\x01\x74\x4c\x90\x5c\x97\
-\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x78\xa7\
-\x00\x00\x01\x74\x4c\x80\xd8\x34\
-"
-
-qt_version = QtCore.qVersion().split('.')
-if qt_version < ['5', '8', '0']:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
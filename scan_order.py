@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import os
+import struct
+from os.path import isfile, join, realpath
+
+try:
+    import fcntl
+except ImportError:
+    # not available on Windows
+    fcntl = None
+
+# scan orders of the photos, see scanOrder
+SCAN_ORDERS = ('auto', 'none', 'inode', 'extent')
+
+# _IOWR('f', 11, struct fiemap)
+_FS_IOC_FIEMAP = 0xC020660B
+# struct fiemap header, then struct fiemap_extent
+_FIEMAP_HEADER = '=QQIIII'
+_FIEMAP_EXTENT_SIZE = 56
+
+
+def isRotational(path):
+    """
+    Tell whether a file or folder is on a rotational device (hard disk, most USB card readers), from sysfs.
+
+    Parameters
+    ----------
+    path : string
+        Full path to a file or folder.
+
+    Returns
+    -------
+    rotational : boolean or None
+        None if unknown, e.g. not on Linux or on a network share.
+
+    """
+
+    try:
+        st = os.stat(path)
+        device = realpath('/sys/dev/block/{0}:{1}'.format(os.major(st.st_dev), os.minor(st.st_dev)))
+    except (OSError, AttributeError):
+        return None
+
+    # a partition has no queue, its disk is the parent folder
+    for base in (device, join(device, '..')):
+        flag = join(base, 'queue', 'rotational')
+        if isfile(flag):
+            try:
+                with open(flag) as fh:
+                    return fh.read().strip() == '1'
+            except OSError:
+                return None
+    return None
+
+def physicalOffset(path):
+    """
+    Get the position on the device of the first extent of a file, with the FIEMAP ioctl.
+
+    Parameters
+    ----------
+    path : string
+        Full path to the file.
+
+    Raises
+    ------
+    OSError
+        FIEMAP is not supported, e.g. not on Linux or by the file system.
+
+    Returns
+    -------
+    offset : int or None
+        Physical byte offset, None if the file has no extent (empty, or data inline).
+
+    """
+
+    if fcntl is None:
+        raise OSError('FIEMAP is not supported on this platform')
+
+    header = struct.pack(_FIEMAP_HEADER, 0, 0xFFFFFFFFFFFFFFFF, 0, 0, 1, 0)
+    buf = bytearray(header + bytes(_FIEMAP_EXTENT_SIZE))
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        fcntl.ioctl(fd, _FS_IOC_FIEMAP, buf, True)
+    finally:
+        os.close(fd)
+
+    mapped = struct.unpack_from('=I', buf, 20)[0]
+    if not mapped:
+        return None
+    return struct.unpack_from('=Q', buf, struct.calcsize(_FIEMAP_HEADER) + 8)[0]
+
+def resolveScanOrder(folder, mode='auto'):
+    """
+    Turn a scan order mode into the order used for the photos of a folder.
+
+    Parameters
+    ----------
+    folder : string
+        Full path to the folder containing photos.
+    mode : string, optional
+        One of SCAN_ORDERS. The default is 'auto', 'extent' on rotational devices and
+        'none' elsewhere, where seeks cost nothing.
+
+    Returns
+    -------
+    mode : string
+        'none', 'inode' or 'extent'.
+
+    """
+
+    if mode not in SCAN_ORDERS:
+        raise ValueError('Unknown scan order: {0}'.format(mode))
+    if mode != 'auto':
+        return mode
+    return 'extent' if isRotational(folder) else 'none'
+
+def scanWorkers(mode, workers):
+    """
+    Number of processes reading the photos in a resolved scan order.
+
+    Parameters
+    ----------
+    mode : string
+        'none', 'inode' or 'extent', see resolveScanOrder.
+    workers : int or None
+        Processes asked for, None is one per CPU.
+
+    Returns
+    -------
+    workers : int or None
+        workers for 'none', else 1: processes reading chunks of their own would make
+        the device seek between them and undo the sorting.
+
+    """
+
+    return workers if mode == 'none' else 1
+
+def scanOrder(entries, mode='none'):
+    """
+    Order in which to read photos, so a disk head sweeps the device once instead of seeking back and forth.
+
+    Parameters
+    ----------
+    entries : 1D list
+        os.DirEntry of the photos, their inode() is already known from the directory listing.
+    mode : string, optional
+        'none' keeps the listing order. 'inode' sorts by inode number, which most file
+        systems allocate close to the data. 'extent' sorts by the physical position of
+        the data (FIEMAP), looked up in inode order, and falls back to 'inode' where FIEMAP
+        is not supported. The default is 'none'.
+
+    Returns
+    -------
+    order : 1D list
+        Indices of entries, in reading order.
+
+    """
+
+    order = list(range(len(entries)))
+    if mode == 'none' or not entries:
+        return order
+
+    order.sort(key=lambda i: entries[i].inode())
+    if mode != 'extent':
+        return order
+
+    offsets = dict()
+    for i in order:
+        try:
+            offsets[i] = physicalOffset(entries[i].path)
+        except OSError:
+            # no FIEMAP here, inode order is the best guess
+            return order
+
+    # files without extent keep their inode order, after the others
+    order.sort(key=lambda i: (offsets[i] is None, offsets[i] or 0))
+    return order
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import json
+from os import fsync, remove, replace
+from os.path import exists, isdir, join
+
+# state file written in the input folder by incremental separations
+STATE_NAME = '.flight_separator.state'
+
+# format version of the state file
+STATE_VERSION = 1
+
+
+class SeparationState(object):
+    '''
+    What earlier incremental separations left in a folder, so a new run only reads new photos.
+
+    The state is a JSON file holding the time span of each flight folder and, when
+    photos are kept in the input folder, the photos already separated:
+
+        {"version": 1,
+         "flights": [{"folder": "FL_0...", "start": 1622534400, "stop": 1622535300, "count": 412}, ...],
+         "known": {"DCIM/DJI_0001.JPG": [size, mtime_ns], ...}}
+
+    Times are seconds from timestamp_cache.dateToSeconds, paths are relative to the folder.
+
+    A session separating one flight at a time appends what each flight changed as a
+    line of its own with saveChanges, instead of rewriting the file:
+
+        {"flights": [{"folder": "FL_3...", ...}], "known": {...}}
+
+    load() applies these lines in order; the next save() writes them all as one again.
+
+    :param folder: Full path to the folder containing photos.
+    :type folder: string
+
+    '''
+
+    def __init__(self, folder):
+        self.folder = str(folder)
+        self.path = join(self.folder, STATE_NAME)
+        self.flights = list()
+        self.known = dict()
+
+        self._changed_flights = set()
+        self._changed_known = dict()
+
+    def load(self):
+        """
+        Read the state of the folder, if any. Flights whose folder was deleted are dropped.
+
+        Returns
+        -------
+        found : boolean
+            True if a state file of this version was found.
+
+        """
+
+        if not exists(self.path):
+            return False
+
+        with open(self.path, 'r', encoding='utf-8') as fh:
+            try:
+                state = json.loads(fh.readline())
+            except ValueError:
+                return False
+            if state.get('version') != STATE_VERSION:
+                return False
+            flights = {f['folder']: f for f in state['flights']}
+            known = state.get('known', dict())
+            for line in fh:
+                try:
+                    change = json.loads(line)
+                except ValueError:
+                    # last line cut by a crash, the lines before it are valid
+                    break
+                flights.update((f['folder'], f) for f in change['flights'])
+                known.update(change['known'])
+
+        self.flights = [f for f in flights.values() if isdir(join(self.folder, f['folder']))]
+        self.known = known
+        self._changed_flights = set()
+        self._changed_known = dict()
+        return True
+
+    def save(self):
+        """
+        Write the state, replacing the previous file only once the new one is on disk.
+        """
+
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            fh.write(json.dumps({'version': STATE_VERSION, 'flights': self.flights, 'known': self.known},
+                                separators=(',', ':')) + '\n')
+            fh.flush()
+            fsync(fh.fileno())
+        replace(tmp, self.path)
+        self._changed_flights = set()
+        self._changed_known = dict()
+
+    def saveChanges(self):
+        """
+        Append the flights and photos changed since the last load or save to the file, synced.
+
+        The cost depends on the changes only, not on the size of the state. Without a
+        state file yet, the whole state is saved.
+        """
+
+        if not exists(self.path):
+            self.save()
+            return
+        if not self._changed_flights and not self._changed_known:
+            return
+
+        change = {'flights': [f for f in self.flights if f['folder'] in self._changed_flights],
+                  'known': self._changed_known}
+        with open(self.path, 'a', encoding='utf-8') as fh:
+            fh.write(json.dumps(change, separators=(',', ':')) + '\n')
+            fh.flush()
+            fsync(fh.fileno())
+        self._changed_flights = set()
+        self._changed_known = dict()
+
+    def clear(self):
+        """
+        Delete the state file, the next incremental run rebuilds it from the flight folders.
+        """
+
+        self.flights = list()
+        self.known = dict()
+        self._changed_flights = set()
+        self._changed_known = dict()
+        if exists(self.path):
+            remove(self.path)
+
+    def isKnown(self, relpath, st):
+        """
+        True if the photo, with this stat() result, was separated by an earlier run.
+        """
+
+        known = self.known.get(relpath)
+        return known is not None and known[0] == st.st_size and known[1] == st.st_mtime_ns
+
+    def addFlight(self, folder, start, stop, count):
+        """
+        Add a flight folder, or widen the span of an existing one.
+        """
+
+        self._changed_flights.add(folder)
+        for f in self.flights:
+            if f['folder'] == folder:
+                f['start'] = min(f['start'], start)
+                f['stop'] = max(f['stop'], stop)
+                f['count'] = f['count'] + count
+                return
+        self.flights.append({'folder': folder, 'start': start, 'stop': stop, 'count': count})
+
+    def addKnown(self, relpath, st):
+        self.known[relpath] = self._changed_known[relpath] = [st.st_size, st.st_mtime_ns]
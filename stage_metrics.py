@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+
+def peakMemory():
+    """
+    Get the peak resident memory of this process.
+
+    Returns
+    -------
+    nbytes : int or None
+        Peak memory in bytes, None if it cannot be measured on this platform.
+
+    """
+
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+    if sys.platform.startswith('win'):
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize
+
+    return None
+
+
+class StageMetrics(object):
+    '''
+    Timing and throughput of the processing stages of a separation.
+
+    Usage:
+
+        metrics = StageMetrics()
+        with metrics.stage('exif') as stage:
+            ...
+            stage['files'] = n_photos
+            stage['bytes'] = n_bytes_read
+
+    '''
+
+    def __init__(self):
+        self.stages = list()
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time a stage. The yielded dict takes the 'files' and 'bytes' processed.
+        """
+
+        record = {'name': name, 'files': 0, 'bytes': 0}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            record['files_per_sec'] = record['files'] / record['seconds'] if record['seconds'] > 0 else 0.0
+            record['bytes_per_sec'] = record['bytes'] / record['seconds'] if record['seconds'] > 0 else 0.0
+            record['peak_memory'] = peakMemory()
+            self.stages.append(record)
+
+    def report(self):
+        """
+        Get the metrics as a JSON serializable dict.
+
+        Returns
+        -------
+        report : dict
+            Contains the elements:
+                - stages: one dict per stage with name, seconds, files, bytes,
+                  files_per_sec, bytes_per_sec and peak_memory (bytes, so far).
+                - total_seconds: time since the metrics were created.
+                - peak_memory: peak memory of the whole run in bytes.
+
+        """
+
+        return {'stages': self.stages,
+                'total_seconds': time.perf_counter() - self._start,
+                'peak_memory': peakMemory()}
+
+    def summary(self):
+        """
+        Format the metrics as a log section.
+        """
+
+        report = self.report()
+        log = ["Performance summary:"]
+        for s in report['stages']:
+            log.append("  {0:<10} {1:8.3f} s  {2:8d} files  {3:10.1f} files/s  {4:8.1f} MB".format(
+                s['name'], s['seconds'], s['files'], s['files_per_sec'], s['bytes'] / 1048576.0))
+        log.append("  {0:<10} {1:8.3f} s".format('total', report['total_seconds']))
+        if report['peak_memory'] is not None:
+            log.append("  peak memory: {0:.1f} MB".format(report['peak_memory'] / 1048576.0))
+
+        return "\n".join(log) + "\n"
+
+    def writeReport(self, path):
+        """
+        Write the metrics to a JSON file.
+        """
+
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(self.report(), fh, indent=1)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+"""
+Tests of the file copy and move fallbacks.
+
+Run with:
+    python -m unittest discover tests
+"""
+
+import errno
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from os.path import abspath, dirname, exists, join
+
+sys.path.insert(0, join(dirname(abspath(__file__)), '..'))
+
+import file_transfer
+from file_transfer import copyFileData, moveFile
+
+
+class FileTransferTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix='fs_test_')
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+        self.src = join(self.folder, 'src.JPG')
+        self.dst = join(self.folder, 'dst.JPG')
+        self.data = os.urandom(100000)
+        with open(self.src, 'wb') as fh:
+            fh.write(self.data)
+
+    def patch(self, module, name, value):
+        self.addCleanup(setattr, module, name, getattr(module, name))
+        setattr(module, name, value)
+
+    def testCopyRangeCopyingNothing(self):
+        # reports end of file at once, as on filesystems not supporting it
+        self.patch(os, 'copy_file_range', lambda *args: 0)
+        copyFileData(self.src, self.dst)
+        with open(self.dst, 'rb') as fh:
+            self.assertEqual(fh.read(), self.data)
+
+    def testMoveAcrossDevicesKeepsSourceOfShortCopy(self):
+        def crossDevice(src, dst):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV), src)
+
+        def shortCopy(src, dst, progress=None):
+            with open(dst, 'wb') as fh:
+                fh.write(self.data[:1000])
+
+        self.patch(file_transfer, 'rename', crossDevice)
+        self.patch(file_transfer, 'copyFileData', shortCopy)
+        with self.assertRaises(OSError):
+            moveFile(self.src, self.dst)
+        self.assertTrue(exists(self.src))
+        self.assertFalse(exists(self.dst))
+
+    def testMoveAcrossDevices(self):
+        def crossDevice(src, dst):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV), src)
+
+        self.patch(file_transfer, 'rename', crossDevice)
+        moveFile(self.src, self.dst)
+        self.assertFalse(exists(self.src))
+        with open(self.dst, 'rb') as fh:
+            self.assertEqual(fh.read(), self.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
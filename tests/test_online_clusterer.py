@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+"""
+Tests of the online clustering of photos arriving one at a time.
+
+Run with:
+    python -m unittest discover tests
+"""
+
+import sys
+import unittest
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(abspath(__file__)), '..'))
+
+from online_clusterer import OnlineClusterer, streamFlights
+
+
+class OnlineClustererTest(unittest.TestCase):
+
+    def testLatePhotosGatheredInOneFlight(self):
+        photos = [('a{0}'.format(i), 1000 + 3 * i) for i in range(300)]
+        photos += [('late{0}'.format(i), 10 + 3 * i) for i in range(50)]
+        photos += [('b{0}'.format(i), 5000 + 3 * i) for i in range(100)]
+        flights = list(streamFlights(photos, 60))
+        self.assertEqual([len(f) for f in flights], [300, 50, 100])
+        self.assertEqual(flights[1].timestamps[0], 10)
+
+    def testOlderPhotosAfterFlush(self):
+        # a second memory card with older photos, offloaded after the first one
+        clusterer = OnlineClusterer(60)
+        closed = list()
+        for i in range(200):
+            closed.extend(clusterer.push('new{0}'.format(i), 100000 + 3 * i))
+        closed.extend(clusterer.flush())
+        for i in range(200):
+            closed.extend(clusterer.push('old{0}'.format(i), 1000 + 3 * i))
+        closed.extend(clusterer.flush())
+        self.assertEqual([len(f) for f in closed], [200, 200])
+
+
+if __name__ == '__main__':
+    unittest.main()
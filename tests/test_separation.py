@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+"""
+Regression tests of the separation runs on small synthetic photo folders.
+
+Run with:
+    python -m unittest discover tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from os.path import abspath, dirname, join
+
+sys.path.insert(0, join(dirname(abspath(__file__)), '..'))
+sys.path.insert(0, join(dirname(abspath(__file__)), '..', 'benchmarks'))
+
+import flight_separator
+from flight_separator import flightSeparator, streamSeparation, FLIGHT_PREFIX
+from job_control import CancelToken
+from synthetic_photos import generateCorpus
+
+
+def flightFolders(folder):
+    return sorted(f for f in os.listdir(folder) if f.startswith(FLIGHT_PREFIX))
+
+
+class SeparationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix='fs_test_')
+        self.addCleanup(shutil.rmtree, self.folder, ignore_errors=True)
+
+    def testStreamAfterBatchKeepsFlights(self):
+        generateCorpus(self.folder, 1000, 3)
+        # half of the photos of every flight arrive after the first run
+        later = tempfile.mkdtemp(prefix='fs_test_later_')
+        self.addCleanup(shutil.rmtree, later, ignore_errors=True)
+        names = sorted(f for f in os.listdir(self.folder) if f.endswith('.JPG'))
+        for name in names[1::2]:
+            os.rename(join(self.folder, name), join(later, name))
+
+        flightSeparator(self.folder, ('.jpg',), 60, False, None, workers=1)
+        before = flightFolders(self.folder)
+        for name in os.listdir(later):
+            os.rename(join(later, name), join(self.folder, name))
+        result = streamSeparation(self.folder, ('.jpg',), 60, False, workers=1)
+
+        self.assertFalse(result['cancelled'])
+        self.assertEqual(flightFolders(self.folder), before)
+        self.assertEqual(sum(len(os.listdir(join(self.folder, f))) for f in before), len(names))
+
+    def testResumeWithEveryPhotoMissing(self):
+        generateCorpus(self.folder, 200, 2)
+        names = [f for f in os.listdir(self.folder) if f.endswith('.JPG')]
+
+        # cancel the first run at its first photo, leaving a journal with no photo done
+        token = CancelToken()
+        move = flight_separator.moveFile
+
+        def cancelOnMove(*args, **kwargs):
+            token.cancel()
+            token.checkpoint()
+
+        flight_separator.moveFile = cancelOnMove
+        try:
+            result = flightSeparator(self.folder, ('.jpg',), 60, False, None, workers=1, transfer_workers=1,
+                                     cancel_token=token)
+        finally:
+            flight_separator.moveFile = move
+        self.assertTrue(result['cancelled'])
+
+        for name in names:
+            os.remove(join(self.folder, name))
+
+        result = flightSeparator(self.folder, ('.jpg',), 60, False, None, workers=1)
+        self.assertTrue(result['resumed'])
+        self.assertEqual(result['skipped'], len(names))
+        self.assertIn("{0} photos of the plan were no longer".format(len(names)), result['msg'])
+        self.assertIn("Number of flights detected: 0", result['msg'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+/******************************************************************************************
+ Flight Separator
+                                 A Standalone Desktop Application
+ This tool detects and separates drone photos in a folder taken in
+ different flights based on timestamps.
+                              -------------------
+        begin                : 2020-09-01
+        copyright            : (C) 2019-2021 by Chubu University and
+               National Research Institute for Earth Science and Disaster Resilience (NIED)
+        email                : chuc92man@gmail.com
+ ******************************************************************************************/
+
+/******************************************************************************************
+ *   This file is part of Flight Separator.                                               *
+ *                                                                                        *
+ *   This program is free software; you can redistribute it and/or modify                 *
+ *   it under the terms of the GNU General Public License as published by                 *
+ *   the Free Software Foundation, version 3 of the License.                              *
+ *                                                                                        *
+ *   Flight Separator is distributed in the hope that it will be useful,                  *
+ *   but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or    *
+ *   FITNESS FOR A PARTICULAR PURPOSE.                                                    *
+ *   See the GNU General Public License for more details.                                 *
+ *                                                                                        *
+ *   You should have received a copy of the GNU General Public License along with         *
+ *   Flight Separator. If not, see <http://www.gnu.org/licenses/>.                        *
+ ******************************************************************************************/
+"""
+
+import sqlite3
+import sys
+import time
+from os import environ, makedirs
+from os.path import dirname, exists, expanduser, join
+from datetime import datetime, timedelta
+
+# maximum number of photos remembered, the least recently used ones are evicted first
+MAX_ENTRIES = 1000000
+
+# SQLite limits the number of parameters of a query, look paths up in batches
+_LOOKUP_BATCH = 500
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def defaultCachePath():
+    """
+    Get the default location of the timestamp cache in the user cache directory.
+
+    Returns
+    -------
+    path : string
+        Full path to the cache database.
+
+    """
+
+    if sys.platform.startswith('win'):
+        base = environ.get('LOCALAPPDATA', expanduser('~'))
+    elif sys.platform == 'darwin':
+        base = join(expanduser('~'), 'Library', 'Caches')
+    else:
+        base = environ.get('XDG_CACHE_HOME', join(expanduser('~'), '.cache'))
+
+    return join(base, 'FlightSeparator', 'timestamps.sqlite')
+
+def dateToSeconds(date):
+    """
+    Convert a naive capture date to integer seconds, without any timezone conversion.
+    """
+
+    return int((date - _EPOCH).total_seconds())
+
+def secondsToDate(seconds):
+    """
+    Convert integer seconds from dateToSeconds back to a naive capture date.
+    """
+
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+class TimestampCache(object):
+    '''
+    Persistent cache of photo capture dates.
+
+    A photo is identified by its full path, size and modification time (ns), so an
+    edited or replaced file is read again.
+
+    :param path: Full path to the cache database. Defaults to defaultCachePath().
+    :type path: string
+    :param max_entries: Number of photos kept when evicting.
+    :type max_entries: int
+
+    '''
+
+    def __init__(self, path=None, max_entries=MAX_ENTRIES):
+        if path is None:
+            path = defaultCachePath()
+        if dirname(path) and not exists(dirname(path)):
+            makedirs(dirname(path))
+
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS photos ("
+                          "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+                          "taken INTEGER, last_used INTEGER)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS photos_last_used ON photos (last_used)")
+        self.conn.commit()
+
+    def lookup(self, keys):
+        """
+        Look up cached dates of many photos.
+
+        Parameters
+        ----------
+        keys : 1D list
+            Contains (path, size, mtime_ns) of each photo.
+
+        Returns
+        -------
+        dates : dict
+            Date of each photo found in the cache, keyed by path.
+
+        """
+
+        wanted = {k[0]: (k[1], k[2]) for k in keys}
+        paths = list(wanted)
+        dates = dict()
+        for i in range(0, len(paths), _LOOKUP_BATCH):
+            batch = paths[i:i + _LOOKUP_BATCH]
+            rows = self.conn.execute(
+                "SELECT path, size, mtime_ns, taken FROM photos WHERE path IN ({0})".format(
+                    ",".join("?" * len(batch))), batch)
+            for path, size, mtime_ns, taken in rows:
+                if wanted[path] == (size, mtime_ns):
+                    dates[path] = secondsToDate(taken)
+
+        if dates:
+            now = int(time.time())
+            self.conn.executemany("UPDATE photos SET last_used = ? WHERE path = ?",
+                                  ((now, p) for p in dates))
+            self.conn.commit()
+
+        self.hits = self.hits + len(dates)
+        self.misses = self.misses + len(paths) - len(dates)
+        return dates
+
+    def store(self, items):
+        """
+        Store dates of many photos, then evict old entries if the cache is full.
+
+        Parameters
+        ----------
+        items : 1D list
+            Contains (path, size, mtime_ns, date) of each photo.
+
+        Returns
+        -------
+        None.
+
+        """
+
+        now = int(time.time())
+        self.conn.executemany("INSERT OR REPLACE INTO photos VALUES (?, ?, ?, ?, ?)",
+                              ((p, s, m, dateToSeconds(d), now) for p, s, m, d in items))
+        self.conn.commit()
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used photos above max_entries.
+
+        Returns
+        -------
+        n_evicted : int
+            Number of photos removed.
+
+        """
+
+        n_entries = self.conn.execute("SELECT COUNT(*) FROM photos").fetchone()[0]
+        n_evicted = n_entries - self.max_entries
+        if n_evicted <= 0:
+            return 0
+
+        self.conn.execute("DELETE FROM photos WHERE path IN "
+                          "(SELECT path FROM photos ORDER BY last_used LIMIT ?)", (n_evicted,))
+        self.conn.commit()
+        return n_evicted
+
+    def close(self):
+        self.conn.close()